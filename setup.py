@@ -3,6 +3,7 @@ from setuptools.command.build_ext import build_ext
 from setuptools.command.develop import develop
 from distutils.command.clean import clean
 from glob import glob
+import os
 import sys
 
 
@@ -26,6 +27,10 @@ class BuildExt(build_ext):
                     "-Wno-sign-compare",
                     "-Wno-comment",
                 ]
+                # Share the derivatives among iNumThreads threads
+                if os.environ.get("VPLANET_OPENMP"):
+                    ext.extra_compile_args += ["-fopenmp"]
+                    ext.extra_link_args = ["-fopenmp"]
         build_ext.build_extensions(self)
 
 
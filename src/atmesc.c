@@ -1527,6 +1527,16 @@ void fnForceBehaviorAtmEsc(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
   }
 }
 
+void CheckpointAtmEsc(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                      CHECKPOINT *ckpt, int iBody) {
+  /* The escape regime, which carries over from one step to the next, and
+     when the envelope and the water were lost */
+  CheckpointInts(ckpt, &body[iBody].iHEscapeRegime, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dEnvMassDt, 1);
+  CheckpointInts(ckpt, &body[iBody].bEnvelopeLostMessage, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dRGDuration, 1);
+}
+
 
 /**
 Initializes several helper variables and properties used in the integration.
@@ -1956,7 +1966,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
       fprintf(stderr, "\tbUseBondiLimited = %d\n",
               body[iBody].bUseBondiLimited);
       fprintf(stderr, "\tbAtmEscAuto = %d\n", body[iBody].bAtmEscAuto);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else if (iRegimeCounter == 0) {
       fprintf(stderr, "WARNING: No H envelope escape regime set for body %s!\n",
               body[iBody].cName);
@@ -1995,7 +2005,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               options[OPT_ENVELOPEMASS].cName, options[OPT_MASS].cName,
               files->Infile[iBody + 1].cIn);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   // Initialize rg duration
@@ -2016,7 +2026,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
             "ERROR: More than one module is trying to set dRadius for body %d!",
             iBody);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   // Setup radius and other radii of interest
@@ -3268,6 +3278,7 @@ void AddModuleAtmEsc(CONTROL *control, MODULE *module, int iBody, int iModule) {
   module->fnCountHalts[iBody][iModule]        = &CountHaltsAtmEsc;
   module->fnReadOptions[iBody][iModule]       = &ReadOptionsAtmEsc;
   module->fnLogBody[iBody][iModule]           = &LogBodyAtmEsc;
+  module->fnCheckpoint[iBody][iModule]        = &CheckpointAtmEsc;
   module->fnVerify[iBody][iModule]            = &VerifyAtmEsc;
   module->fnAssignDerivatives[iBody][iModule] = &AssignAtmEscDerivatives;
   module->fnNullDerivatives[iBody][iModule]   = &NullAtmEscDerivatives;
@@ -3892,6 +3903,6 @@ void fvAtmEscRegimeChangeOutput(int iRegimeOld, int iRegimeNew, double dTime) {
   } else {
     fprintf(stderr, "ERROR: unknown initial atmospheric escape regime: %d\n",
             iRegimeOld);
-    exit(1);
+    ExitVplanet(1);
   }
 }
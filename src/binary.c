@@ -724,7 +724,7 @@ void VerifyBinary(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "iBody: %d iBodyType: %d\n", iBody,
                 body[iBody].iBodyType);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   } else { // planets
     if (body[iBody].iBodyType != 0) {
@@ -735,7 +735,7 @@ void VerifyBinary(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "iBody: %d iBodyType: %d\n", iBody,
                 body[iBody].iBodyType);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 
@@ -748,7 +748,7 @@ void VerifyBinary(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 "ERROR: In binary, all bodies must have bBinary == 1.\n");
         fprintf(stderr, "body[i].bBinary == 0: %d\n", i);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 
@@ -768,7 +768,7 @@ void VerifyBinary(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "ERROR: The circumbinary planet cannot have dLL13PhiAB "
                         "set as that is the BINARY's initial mean anomaly.\n");
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 
@@ -786,7 +786,7 @@ void VerifyBinary(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                   "ERROR: In binary, binary orbital element information can "
                   "ONLY be in the secondary star (iBody == 1).\n");
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     } else { // Secondary
       // Was dCBPM0, dCBPZeta, dCBPPsi set for one of the stars?
@@ -796,7 +796,7 @@ void VerifyBinary(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
           fprintf(stderr, "ERROR: In binary, only the CBP can have dCBPM0, "
                           "dCBPZeta, or dCBPPsi set.\n");
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     }
   }
@@ -1805,7 +1805,7 @@ double fndMeanToEccentric(double M, double e) {
             "ERROR: in fndMeanToEccentric (binary), eccentricity must be "
             "within [0,1). e: %e\n",
             e);
-    exit(1);
+    ExitVplanet(1);
   }
 
   double E0 = M / (1.0 - e) -
@@ -1829,7 +1829,7 @@ double fndMeanToEccentric(double M, double e) {
                       "solve Kepler Equation\n");
       fprintf(stderr, "Iteration number: %d.  Eccentric anomaly: %lf.\n", count,
               E);
-      exit(1);
+      ExitVplanet(1);
     }
   }
 
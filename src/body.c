@@ -408,7 +408,7 @@ double fdMassToRad(double dMass, int iRelation) {
   /* Whoops! */
   fprintf(stderr, "ERROR: Unknown mass-radius relationship.\n");
   fprintf(stderr, "Mass: %.3e, Relationship: %d\n", dMass, iRelation);
-  exit(EXIT_UNITS);
+  ExitVplanet(EXIT_UNITS);
 }
 
 // Assign mass from radius and published relationship
@@ -425,7 +425,7 @@ double fdRadToMass(double dMass, int iRelation) {
   } else {
     /* Whoops! */
     fprintf(stderr, "ERROR: Unknown mass-radius relation.\n");
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -1386,13 +1386,69 @@ fdBaraffeInterpolate(int iMLEN, int iALEN, double const xarr[STELLAR_BAR_MLEN],
   }
 }
 
+/* The most recent interpolations over the Baraffe grid. Within one
+   evaluation of the derivatives, the luminosity, radius, temperature and
+   radius of gyration of a star, and their finite-difference derivatives, are
+   requested several times at the same (age, mass), e.g. fdDRadiusDtStellar by
+   each of the energy and rotation derivatives, so each result is kept until a
+   request for a different age or mass pushes it out. The grid never changes,
+   so a kept result is always valid, and the cache is THREADLOCAL, like the
+   rest of the per-run state, so that threads never share it. */
+#define BARAFFEMEMO 16
+
+typedef struct {
+  int iParam;
+  int iOrder;
+  double dAge;
+  double dMass;
+  double dValue;
+  int iError;
+} BARAFFEMEMOENTRY;
+
+static THREADLOCAL BARAFFEMEMOENTRY saBaraffeMemo[BARAFFEMEMO];
+static THREADLOCAL int iNumBaraffeMemo  = 0;
+static THREADLOCAL int iNextBaraffeMemo = 0;
+
 /**
   Returns the stellar T, L, or R by interpolating over the Baraffe grid
   using either a bilinear (iOrder = 1) or a bicubic (iOrder = 3) interpolation.
+  Repeated requests for the same parameter at the same age and mass return
+  the kept result of the first.
 
   What are the arguments?
 */
 double fdBaraffe(int iParam, double A, double M, int iOrder, int *iError) {
+  BARAFFEMEMOENTRY *memo;
+  int iMemo;
+
+  for (iMemo = 0; iMemo < iNumBaraffeMemo; iMemo++) {
+    memo = &saBaraffeMemo[iMemo];
+    if (memo->iParam == iParam && memo->dAge == A && memo->dMass == M &&
+        memo->iOrder == iOrder) {
+      *iError = memo->iError;
+      return memo->dValue;
+    }
+  }
+
+  memo = &saBaraffeMemo[iNextBaraffeMemo];
+  iNextBaraffeMemo = (iNextBaraffeMemo + 1) % BARAFFEMEMO;
+  if (iNumBaraffeMemo < BARAFFEMEMO) {
+    iNumBaraffeMemo++;
+  }
+  memo->iParam  = iParam;
+  memo->iOrder  = iOrder;
+  memo->dAge    = A;
+  memo->dMass   = M;
+  memo->dValue  = fdBaraffeGrid(iParam, A, M, iOrder, &memo->iError);
+  *iError       = memo->iError;
+  return memo->dValue;
+}
+
+/**
+  Interpolates the stellar T, L, R or radius of gyration over the Baraffe
+  grid for fdBaraffe.
+*/
+double fdBaraffeGrid(int iParam, double A, double M, int iOrder, int *iError) {
   double res;
 
   if (iParam == STELLAR_T) {
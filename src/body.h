@@ -3750,6 +3750,7 @@ static double const daLopezRadius[MASSLEN][COMPLEN][FLUXLEN][METLEN][TIMELEN] =
 
 // Baraffe stellar evolution grid
 double fdBaraffe(int, double, double, int, int *);
+double fdBaraffeGrid(int, double, double, int, int *);
 
 /* @endcond */
 
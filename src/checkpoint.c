@@ -0,0 +1,456 @@
+/**
+  @file checkpoint.c
+
+  @brief Snapshots of an integration, from which it can be restarted.
+
+  Every dCheckpointInterval of simulated time, or dCheckpointWallTime seconds,
+  Evolve writes everything that the rest of the integration depends on to
+  sCheckpointFile: the primary variables, the derivatives and stages of the
+  integrator, the functions ForceBehavior swapped in, the state of the modules
+  and the length of the output files. "vplanet --restart <file> vpl.in" reads
+  the same input files, replaces the initial conditions with the snapshot and
+  carries on, so that the output is the same as that of an uninterrupted run.
+
+  The snapshot is binary, and only the build of VPLanet that wrote it can read
+  it.
+
+  @author Rory Barnes ([RoryBarnes](https://github.com/RoryBarnes/))
+
+  @date Oct 2026
+
+*/
+
+#include "vplanet.h"
+#ifdef _WIN32
+#include <fcntl.h>
+#include <io.h>
+#endif
+
+#define CHECKPOINTMAGIC "VPLCKPT1"
+
+void CheckpointData(CHECKPOINT *ckpt, void *ptr, size_t iSize, int iNum) {
+  /* Write iNum items of iSize bytes at ptr to the checkpoint, or read them
+   * back. Every piece of state goes through here, in the same order either
+   * way. */
+  if (iNum <= 0) {
+    return;
+  }
+  if (!ckpt->bRead) {
+    fwrite(ptr, iSize, iNum, ckpt->fp);
+  } else if (fread(ptr, iSize, iNum, ckpt->fp) != (size_t)iNum) {
+    fprintf(stderr, "ERROR: Checkpoint file %s is truncated.\n", ckpt->cFile);
+    ExitVplanet(EXIT_INPUT);
+  }
+}
+
+void CheckpointDoubles(CHECKPOINT *ckpt, double *daValue, int iNum) {
+  CheckpointData(ckpt, daValue, sizeof(double), iNum);
+}
+
+void CheckpointInts(CHECKPOINT *ckpt, int *iaValue, int iNum) {
+  CheckpointData(ckpt, iaValue, sizeof(int), iNum);
+}
+
+void CheckpointLongs(CHECKPOINT *ckpt, long *iaValue, int iNum) {
+  CheckpointData(ckpt, iaValue, sizeof(long), iNum);
+}
+
+void CheckpointUpdateFunction(CHECKPOINT *ckpt, fnUpdateVariable *pfnUpdate) {
+  /* A derivative function, which ForceBehavior may have swapped. Its address
+   * changes from run to run, but not its distance from
+   * fndUpdateFunctionTiny. */
+  long long iOffset = 0;
+  int bNull;
+
+  bNull = (*pfnUpdate == NULL);
+  if (!bNull) {
+    iOffset = (long long)((intptr_t)*pfnUpdate -
+                          (intptr_t)&fndUpdateFunctionTiny);
+  }
+  CheckpointInts(ckpt, &bNull, 1);
+  CheckpointData(ckpt, &iOffset, sizeof(long long), 1);
+  if (ckpt->bRead) {
+    if (bNull) {
+      *pfnUpdate = NULL;
+    } else {
+      *pfnUpdate = (fnUpdateVariable)((intptr_t)&fndUpdateFunctionTiny +
+                                      (intptr_t)iOffset);
+    }
+  }
+}
+
+void TruncateFile(const char *cFile, long long iSize) {
+  /* Cut the file cFile back to iSize bytes, or delete it if iSize is
+   * negative */
+  char cPath[PATHLEN];
+  int iStatus;
+
+  RunPath(cFile, cPath);
+  if (iSize < 0) {
+    unlink(cPath);
+    return;
+  }
+#ifdef _WIN32
+  {
+    int iFd = _open(cPath, _O_RDWR | _O_BINARY);
+    iStatus = -1;
+    if (iFd >= 0) {
+      iStatus = _chsize_s(iFd, iSize);
+      _close(iFd);
+    }
+  }
+#else
+  iStatus = truncate(cPath, (off_t)iSize);
+#endif
+  if (iStatus != 0) {
+    fprintf(stderr, "ERROR: Unable to restore %s from the checkpoint.\n",
+            cFile);
+    ExitVplanet(EXIT_OUTPUT);
+  }
+}
+
+void CheckpointFileSize(CHECKPOINT *ckpt, const char *cFile) {
+  /* The length of an output file when the checkpoint was written, or -1 if
+   * it did not exist. What was written after is removed on restart, so that
+   * it is not written twice. Its stream must have been flushed. */
+  char cPath[PATHLEN];
+  struct stat st;
+  long long iSize = -1;
+
+  if (!ckpt->bRead) {
+    RunPath(cFile, cPath);
+    if (stat(cPath, &st) == 0) {
+      iSize = (long long)st.st_size;
+    }
+  }
+  CheckpointData(ckpt, &iSize, sizeof(long long), 1);
+  if (ckpt->bRead) {
+    TruncateFile(cFile, iSize);
+  }
+}
+
+void CheckpointNULL(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                    CHECKPOINT *ckpt, int iBody) {
+  // Nothing
+}
+
+int bCheckpointDue(CONTROL *control) {
+  /* Is it time for a checkpoint, at the end of the current step? */
+  EVOLVE *evolve = &(control->Evolve);
+  int bDue       = 0;
+
+  if (evolve->dCheckpointInterval > 0 &&
+      evolve->dTime >= evolve->dNextCheckpoint) {
+    while (evolve->dNextCheckpoint <= evolve->dTime) {
+      evolve->dNextCheckpoint += evolve->dCheckpointInterval;
+    }
+    bDue = 1;
+  }
+  if (evolve->dCheckpointWallTime > 0 &&
+      difftime(time(NULL), (time_t)evolve->dLastCheckpointWall) >=
+            evolve->dCheckpointWallTime) {
+    bDue = 1;
+  }
+  return bDue;
+}
+
+void CheckpointSignature(CONTROL *control, CHECKPOINT *ckpt) {
+  /* What identifies the build of VPLanet: a checkpoint holds raw structs and
+   * the offsets of functions, which another build would misread */
+  char cMagic[8], cVersion[64];
+  long long iaSignature[9];
+  int iSig;
+  long long iaBuild[9] = {
+        (long long)sizeof(BODY),
+        (long long)sizeof(CONTROL),
+        (long long)sizeof(SYSTEM),
+        (long long)sizeof(UPDATE),
+        (long long)sizeof(long),
+        (long long)((intptr_t)&Evolve - (intptr_t)&fndUpdateFunctionTiny),
+        (long long)((intptr_t)&WriteOutput - (intptr_t)&fndUpdateFunctionTiny),
+        (long long)((intptr_t)&ForceBehaviorEqtide -
+                    (intptr_t)&fndUpdateFunctionTiny),
+        (long long)((intptr_t)&ForceBehaviorPoise -
+                    (intptr_t)&fndUpdateFunctionTiny)};
+
+  memcpy(cMagic, CHECKPOINTMAGIC, 8);
+  memset(cVersion, 0, 64);
+  snprintf(cVersion, 64, "%s", control->sGitVersion);
+  memcpy(iaSignature, iaBuild, sizeof(iaBuild));
+
+  CheckpointData(ckpt, cMagic, 1, 8);
+  if (ckpt->bRead && memcmp(cMagic, CHECKPOINTMAGIC, 8) != 0) {
+    fprintf(stderr, "ERROR: %s is not a VPLanet checkpoint.\n", ckpt->cFile);
+    ExitVplanet(EXIT_INPUT);
+  }
+  CheckpointData(ckpt, cVersion, 1, 64);
+  CheckpointData(ckpt, iaSignature, sizeof(long long), 9);
+  if (ckpt->bRead) {
+    for (iSig = 0; iSig < 9; iSig++) {
+      if (iaSignature[iSig] != iaBuild[iSig]) {
+        break;
+      }
+    }
+    if (iSig < 9 || strncmp(cVersion, control->sGitVersion, 63) != 0) {
+      fprintf(stderr,
+              "ERROR: Checkpoint file %s was written by a different build of "
+              "VPLanet (%s).\n",
+              ckpt->cFile, cVersion);
+      ExitVplanet(EXIT_INPUT);
+    }
+  }
+}
+
+void CheckpointShape(CONTROL *control, UPDATE *update, CHECKPOINT *ckpt) {
+  /* The numbers of bodies, primary variables and processes, which must be
+   * those of the input files on restart */
+  int iBody, iVar, iValue, bMatch = 1;
+  EVOLVE *evolve = &(control->Evolve);
+
+  iValue = evolve->iNumBodies;
+  CheckpointInts(ckpt, &iValue, 1);
+  bMatch = (iValue == evolve->iNumBodies);
+  for (iBody = 0; iBody < evolve->iNumBodies && bMatch; iBody++) {
+    iValue = update[iBody].iNumVars;
+    CheckpointInts(ckpt, &iValue, 1);
+    bMatch = (iValue == update[iBody].iNumVars);
+    for (iVar = 0; iVar < update[iBody].iNumVars && bMatch; iVar++) {
+      iValue = update[iBody].iNumEqns[iVar];
+      CheckpointInts(ckpt, &iValue, 1);
+      bMatch = (iValue == update[iBody].iNumEqns[iVar]);
+    }
+  }
+  iValue = evolve->iOneStep;
+  CheckpointInts(ckpt, &iValue, 1);
+  bMatch = bMatch && (iValue == evolve->iOneStep);
+  if (!bMatch) {
+    fprintf(stderr,
+            "ERROR: Checkpoint file %s does not match the input files.\n",
+            ckpt->cFile);
+    ExitVplanet(EXIT_INPUT);
+  }
+}
+
+void CheckpointModules(BODY *body, EVOLVE *evolve, MODULE *module,
+                       SYSTEM *system, CHECKPOINT *ckpt) {
+  int iBody, iModule;
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iModule = 0; iModule < module->iNumModules[iBody]; iModule++) {
+      module->fnCheckpoint[iBody][iModule](body, evolve, system, ckpt, iBody);
+    }
+  }
+}
+
+void CheckpointState(BODY *body, CONTROL *control, FILES *files,
+                     MODULE *module, SYSTEM *system, UPDATE *update,
+                     fnUpdateVariable ***fnUpdate, CHECKPOINT *ckpt,
+                     double *dDt, int *nSteps) {
+  /* Everything the rest of the integration depends on, written or read in
+   * the same order */
+  int iBody, iVar, iEqn, iStage;
+  EVOLVE *evolve = &(control->Evolve);
+  IO *io         = &(control->Io);
+  char cPoiseGrid[3 * NAMELEN];
+
+  CheckpointSignature(control, ckpt);
+  CheckpointShape(control, update, ckpt);
+
+  /* Integration */
+  CheckpointDoubles(ckpt, &evolve->dTime, 1);
+  CheckpointDoubles(ckpt, dDt, 1);
+  CheckpointInts(ckpt, nSteps, 1);
+  CheckpointInts(ckpt, &evolve->nSteps, 1);
+  CheckpointInts(ckpt, &evolve->bFirstStep, 1);
+  CheckpointInts(ckpt, &evolve->bUpdateCurrent, 1);
+  CheckpointLongs(ckpt, &evolve->iNumDerivEvals, 1);
+  CheckpointLongs(ckpt, &evolve->iNumDerivReused, 1);
+  CheckpointDoubles(ckpt, &evolve->dCurrentDt, 1);
+  CheckpointDoubles(ckpt, &evolve->dNextDt, 1);
+  CheckpointInts(ckpt, &evolve->bFSAL, 1);
+  CheckpointData(ckpt, &evolve->iFSALUpdates, sizeof(size_t), 1);
+  CheckpointDoubles(ckpt, &evolve->dNextCheckpoint, 1);
+  CheckpointDoubles(ckpt, &io->dNextOutput, 1);
+  CheckpointInts(ckpt, &io->bDeltaTimeMessage, 1);
+  CheckpointInts(ckpt, &io->bMutualIncMessage, 1);
+  CheckpointInts(ckpt, io->baRocheMessage, evolve->iNumBodies);
+  CheckpointInts(ckpt, io->baCassiniOneMessage, evolve->iNumBodies);
+  CheckpointInts(ckpt, io->baCassiniTwoMessage, evolve->iNumBodies);
+  CheckpointInts(ckpt, io->baEnterHZMessage, evolve->iNumBodies);
+
+  /* Primary variables, their derivatives and derivative functions, in the
+     bodies and in the temporary bodies of the last stage */
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    CheckpointDoubles(ckpt, &body[iBody].dAge, 1);
+    CheckpointDoubles(ckpt, &evolve->tmpBody[iBody].dAge, 1);
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      CheckpointDoubles(ckpt, update[iBody].pdVar[iVar], 1);
+      CheckpointDoubles(ckpt, evolve->tmpUpdate[iBody].pdVar[iVar], 1);
+      CheckpointDoubles(ckpt, &update[iBody].daDeriv[iVar], 1);
+      CheckpointDoubles(ckpt, &evolve->tmpUpdate[iBody].daDeriv[iVar], 1);
+      CheckpointDoubles(ckpt, update[iBody].daDerivProc[iVar],
+                        update[iBody].iNumEqns[iVar]);
+      CheckpointDoubles(ckpt, evolve->tmpUpdate[iBody].daDerivProc[iVar],
+                        update[iBody].iNumEqns[iVar]);
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        CheckpointUpdateFunction(ckpt, &fnUpdate[iBody][iVar][iEqn]);
+      }
+    }
+  }
+
+  /* Stages of the Runge-Kutta and Rosenbrock methods */
+  if (bRungeKutta(control)) {
+    for (iStage = 0; iStage < fiNumStages(control); iStage++) {
+      CheckpointDoubles(ckpt, evolve->daStateDeriv[iStage],
+                        evolve->iNumStates);
+    }
+  }
+  if (bAdaptive(control)) {
+    for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+      CheckpointDoubles(ckpt, evolve->daErrorScale[iBody],
+                        update[iBody].iNumVars);
+    }
+  }
+
+  /* Multi-rate */
+  if (evolve->bMultiRate) {
+    CheckpointDoubles(ckpt, evolve->daEquationValue, evolve->iNumEquations);
+    CheckpointDoubles(ckpt, evolve->daEquationPrev, evolve->iNumEquations);
+    CheckpointDoubles(ckpt, evolve->daEquationHeld, evolve->iNumEquations);
+    CheckpointDoubles(ckpt, evolve->daEquationScale, evolve->iNumEquations);
+    CheckpointInts(ckpt, evolve->baRateClassHeld, evolve->iNumRateClasses);
+    CheckpointInts(ckpt, evolve->baRateClassPrev, evolve->iNumRateClasses);
+    CheckpointDoubles(ckpt, evolve->daRateClassTime, evolve->iNumRateClasses);
+    CheckpointDoubles(ckpt, evolve->daRateClassPeriod,
+                      evolve->iNumRateClasses);
+    CheckpointDoubles(ckpt, evolve->daRateClassNext, evolve->iNumRateClasses);
+    CheckpointLongs(ckpt, evolve->iaRateClassEvals, evolve->iNumRateClasses);
+    CheckpointData(ckpt, &evolve->iRateClassUpdates, sizeof(size_t), 1);
+  }
+
+  /* Frozen variables */
+  if (evolve->dFreezeTol > 0) {
+    CheckpointInts(ckpt, &evolve->iNumFrozen, 1);
+    for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+      CheckpointInts(ckpt, evolve->iaFreezeCount[iBody],
+                     update[iBody].iNumVars);
+      CheckpointInts(ckpt, evolve->baFrozen[iBody], update[iBody].iNumVars);
+      CheckpointDoubles(ckpt, evolve->daQuiescentTime[iBody],
+                        update[iBody].iNumVars);
+      CheckpointDoubles(ckpt, evolve->daThawTime[iBody],
+                        update[iBody].iNumVars);
+      CheckpointInts(ckpt, evolve->iaFreezes[iBody], update[iBody].iNumVars);
+      CheckpointDoubles(ckpt, evolve->daFrozenTime[iBody],
+                        update[iBody].iNumVars);
+      for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          CheckpointUpdateFunction(ckpt,
+                                   &evolve->fnFrozenUpdate[iBody][iVar][iEqn]);
+        }
+      }
+    }
+  }
+
+  /* The state of the modules that is not in the primary variables */
+  ckpt->lModules = ftell(ckpt->fp);
+  CheckpointModules(body, evolve, module, system, ckpt);
+
+  /* Output files */
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    if (files->Outfile[iBody].fp != NULL) {
+      fflush(files->Outfile[iBody].fp);
+    }
+    if (files->Outfile[iBody].cOut[0] != '\0') {
+      CheckpointFileSize(ckpt, files->Outfile[iBody].cOut);
+    }
+    if (body[iBody].bPoise) {
+      if (files->Outfile[iBody].fpGrid != NULL) {
+        fflush(files->Outfile[iBody].fpGrid);
+      }
+      sprintf(cPoiseGrid, "%s.%s.Climate", system->cName, body[iBody].cName);
+      CheckpointFileSize(ckpt, cPoiseGrid);
+    }
+  }
+}
+
+void WriteCheckpoint(BODY *body, CONTROL *control, FILES *files,
+                     MODULE *module, SYSTEM *system, UPDATE *update,
+                     fnUpdateVariable ***fnUpdate, double dDt, int nSteps) {
+  /* Write the snapshot to a temporary file, and only then move it over the
+   * previous one, so that a crash leaves one or the other intact */
+  CHECKPOINT ckpt;
+  char cTmp[NAMELEN + 4], cPath[PATHLEN], cTmpPath[PATHLEN];
+
+  sprintf(cTmp, "%s.tmp", files->cCheckpoint);
+  ckpt.fp = fopen(cTmp, "wb");
+  if (ckpt.fp == NULL) {
+    fprintf(stderr, "ERROR: Unable to write checkpoint file %s.\n", cTmp);
+    ExitVplanet(EXIT_OUTPUT);
+  }
+  ckpt.bRead = 0;
+  strcpy(ckpt.cFile, files->cCheckpoint);
+
+  CheckpointState(body, control, files, module, system, update, fnUpdate,
+                  &ckpt, &dDt, &nSteps);
+
+  if (fflush(ckpt.fp) != 0 || ferror(ckpt.fp)) {
+    fprintf(stderr, "ERROR: Unable to write checkpoint file %s.\n", cTmp);
+    ExitVplanet(EXIT_OUTPUT);
+  }
+#ifdef _WIN32
+  _commit(_fileno(ckpt.fp));
+#else
+  fsync(fileno(ckpt.fp));
+#endif
+  fclose(ckpt.fp);
+
+  RunPath(cTmp, cTmpPath);
+  RunPath(files->cCheckpoint, cPath);
+#ifdef _WIN32
+  remove(cPath);
+#endif
+  if (rename(cTmpPath, cPath) != 0) {
+    fprintf(stderr, "ERROR: Unable to write checkpoint file %s.\n",
+            files->cCheckpoint);
+    ExitVplanet(EXIT_OUTPUT);
+  }
+
+  control->Evolve.dLastCheckpointWall = (double)time(NULL);
+  if (control->Io.iVerbose >= VERBPROG) {
+    printf("Checkpoint written to %s.\n", files->cCheckpoint);
+  }
+}
+
+void ReadCheckpoint(BODY *body, CONTROL *control, FILES *files, MODULE *module,
+                    SYSTEM *system, UPDATE *update,
+                    fnUpdateVariable ***fnUpdate, double *dDt, int *nSteps) {
+  /* Replace the initial conditions with the snapshot in files->cRestart */
+  CHECKPOINT ckpt;
+
+  ckpt.fp = fopen(files->cRestart, "rb");
+  if (ckpt.fp == NULL) {
+    fprintf(stderr, "ERROR: Unable to open checkpoint file %s.\n",
+            files->cRestart);
+    ExitVplanet(EXIT_INPUT);
+  }
+  ckpt.bRead = 1;
+  strcpy(ckpt.cFile, files->cRestart);
+
+  CheckpointState(body, control, files, module, system, update, fnUpdate,
+                  &ckpt, dDt, nSteps);
+
+  /* The auxiliary properties follow from the primary variables and the
+   * modules' state, but some modules iterate on theirs from the values of
+   * the previous call, so restore those once more afterwards. */
+  PropertiesAuxiliary(body, control, system, update);
+  fseek(ckpt.fp, ckpt.lModules, SEEK_SET);
+  CheckpointModules(body, &control->Evolve, module, system, &ckpt);
+  fclose(ckpt.fp);
+
+  if (control->Io.iVerbose >= VERBPROG) {
+    printf("Restarted from %s at ", files->cRestart);
+    fprintd(stdout, control->Evolve.dTime / fdUnitsTime(control->Units[0].iTime),
+            control->Io.iSciNot, control->Io.iDigits);
+    printf(".\n");
+  }
+}
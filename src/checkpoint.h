@@ -0,0 +1,34 @@
+/**
+  @file checkpoint.h
+
+  @brief Snapshots of an integration, from which it can be restarted.
+
+  @author Rory Barnes ([RoryBarnes](https://github.com/RoryBarnes/))
+
+  @date Oct 2026
+
+*/
+
+/* @cond DOXYGEN_OVERRIDE */
+
+void CheckpointData(CHECKPOINT *, void *, size_t, int);
+void CheckpointDoubles(CHECKPOINT *, double *, int);
+void CheckpointInts(CHECKPOINT *, int *, int);
+void CheckpointLongs(CHECKPOINT *, long *, int);
+void CheckpointUpdateFunction(CHECKPOINT *, fnUpdateVariable *);
+void TruncateFile(const char *, long long);
+void CheckpointFileSize(CHECKPOINT *, const char *);
+void CheckpointNULL(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *, int);
+
+int bCheckpointDue(CONTROL *);
+void CheckpointSignature(CONTROL *, CHECKPOINT *);
+void CheckpointShape(CONTROL *, UPDATE *, CHECKPOINT *);
+void CheckpointModules(BODY *, EVOLVE *, MODULE *, SYSTEM *, CHECKPOINT *);
+void CheckpointState(BODY *, CONTROL *, FILES *, MODULE *, SYSTEM *, UPDATE *,
+                     fnUpdateVariable ***, CHECKPOINT *, double *, int *);
+void WriteCheckpoint(BODY *, CONTROL *, FILES *, MODULE *, SYSTEM *, UPDATE *,
+                     fnUpdateVariable ***, double, int);
+void ReadCheckpoint(BODY *, CONTROL *, FILES *, MODULE *, SYSTEM *, UPDATE *,
+                    fnUpdateVariable ***, double *, int *);
+
+/* @endcond */
@@ -176,14 +176,30 @@ void InitializeControlEvolve(BODY *body, CONTROL *control, MODULE *module,
     }
   }
 
-  /* Currently this only matters for RK4 integration. This should
+  /* Currently this only matters for Runge-Kutta integration. This should
      be generalized for any integration method. */
-  if (control->Evolve.iOneStep == RUNGEKUTTA) {
-    control->Evolve.daDeriv = malloc(4 * sizeof(double **));
-    for (iSubStep = 0; iSubStep < 4; iSubStep++) {
+  if (bRungeKutta(control)) {
+    control->Evolve.daDeriv = malloc(fiNumStages(control) * sizeof(double **));
+    for (iSubStep = 0; iSubStep < fiNumStages(control); iSubStep++) {
       control->Evolve.daDeriv[iSubStep] =
             malloc(control->Evolve.iNumBodies * sizeof(double *));
     }
+    if (bAdaptive(control)) {
+      control->Evolve.daErrorScale =
+            malloc(control->Evolve.iNumBodies * sizeof(double *));
+    }
+    if (control->Io.bDenseOutput) {
+      control->Evolve.daDenseAge =
+            malloc(control->Evolve.iNumBodies * sizeof(double));
+      control->Evolve.daDenseStart =
+            malloc(control->Evolve.iNumBodies * sizeof(double *));
+      control->Evolve.daDenseEnd =
+            malloc(control->Evolve.iNumBodies * sizeof(double *));
+      control->Evolve.daDenseBodyAge =
+            malloc(control->Evolve.iNumBodies * sizeof(double));
+      control->Evolve.daDenseBody =
+            malloc(control->Evolve.iNumBodies * sizeof(double *));
+    }
   }
 
   // Default to no orbiting bodies
@@ -456,7 +472,7 @@ void WriteHelpOption(OPTIONS *options, int bLong) {
       } else {
         fprintf(stderr, "ERROR: Unknown value for typestr in "
                         "control.c:WriteHelpOption.\n");
-        exit(EXIT_UNITS);
+        ExitVplanet(EXIT_UNITS);
       }
       printf("| Type            || %s", typestr);
       for (typelen = 0; typelen < (iMaxChars - strlen(typestr)); typelen++) {
@@ -705,7 +721,342 @@ void Help(OPTIONS *options, OUTPUT *output, char exe[], int bLong) {
          options[OPT_OUTPUTORDER].cName);
   HelpOutput(output, bLong);
 
-  exit(0);
+  ExitVplanet(0);
+}
+
+/*
+ * RUN MANAGEMENT
+ *
+ * A run must be able to end anywhere, e.g. on an input error deep inside a
+ * module's Read or Verify function, and still return to main_impl so that
+ * vplanet can be called repeatedly from Python. Fatal errors therefore call
+ * ExitVplanet, which jumps back to the exit point set in main_impl. Every
+ * block of memory and every file opened during the run is recorded (see the
+ * malloc, free, fopen and fclose macros in vplanet.h) so that EndRun can
+ * release them, whether the run finished or not.
+ *
+ * The state of a run is kept in a RUNSTATE: the blocks of memory and the
+ * files it holds, the directory it reads and writes its files in, the stream
+ * its errors go to, the input files it was given in memory and, if its output
+ * is kept in memory, where that output goes. Each thread has its own, so that
+ * different threads can run different simulations at the same time. The
+ * OpenMP threads that evaluate the derivatives of a run join the RUNSTATE of
+ * the thread that started it (see JoinRun), so that whatever they allocate or
+ * print belongs to the run. Exit points are not shared, since a thread can
+ * only jump back to one of its own setjmps (see SetExitPoint).
+ */
+
+/* Header placed in front of each tracked block of memory. The union keeps
+   the block that follows it aligned for any type. */
+typedef union MEMBLOCK {
+  struct {
+    union MEMBLOCK *pPrev;
+    union MEMBLOCK *pNext;
+  } link;
+  long double dAlign;
+  void *pAlign;
+} MEMBLOCK;
+
+struct RUNSTATE {
+  MEMBLOCK *pMemHead;
+  FILE **fpaOpen;
+  int iNumOpen;
+  int iMaxOpen;
+  const char *cRunDir;
+  FILE *fpErrorStream;
+  MEMORYINPUT *pInput;
+  MEMORYOUTPUT *pMemory;
+};
+
+static THREADLOCAL RUNSTATE runOwn;
+static THREADLOCAL RUNSTATE *pRun      = NULL;
+static THREADLOCAL jmp_buf *pExitPoint = NULL;
+static THREADLOCAL int iExitStatus     = 0;
+
+/* The run of the calling thread: its own, unless it joined another. */
+static RUNSTATE *Run() {
+  return pRun != NULL ? pRun : &runOwn;
+}
+
+/* The lists of blocks and files of a run that OpenMP threads share are only
+   changed in the vplanet_run critical section. */
+void *TrackedMalloc(size_t iSize) {
+  RUNSTATE *run = Run();
+  MEMBLOCK *pBlock;
+
+  pBlock = (malloc)(sizeof(MEMBLOCK) + iSize);
+  if (pBlock == NULL) {
+    fprintf(stderr, "ERROR: Unable to allocate %lu bytes.\n",
+            (unsigned long)iSize);
+    ExitVplanet(EXIT_EXE);
+  }
+  pBlock->link.pPrev = NULL;
+#pragma omp critical(vplanet_run)
+  {
+    pBlock->link.pNext = run->pMemHead;
+    if (run->pMemHead != NULL) {
+      run->pMemHead->link.pPrev = pBlock;
+    }
+    run->pMemHead = pBlock;
+  }
+
+  return pBlock + 1;
+}
+
+void TrackedFree(void *ptr) {
+  RUNSTATE *run = Run();
+  MEMBLOCK *pBlock;
+
+  if (ptr == NULL) {
+    return;
+  }
+  pBlock = (MEMBLOCK *)ptr - 1;
+#pragma omp critical(vplanet_run)
+  {
+    if (pBlock->link.pPrev != NULL) {
+      pBlock->link.pPrev->link.pNext = pBlock->link.pNext;
+    } else {
+      run->pMemHead = pBlock->link.pNext;
+    }
+    if (pBlock->link.pNext != NULL) {
+      pBlock->link.pNext->link.pPrev = pBlock->link.pPrev;
+    }
+  }
+  (free)(pBlock);
+}
+
+/* Where the run's file cFile really is: relative paths are taken from the
+   run's directory, if main_impl was given one. */
+void RunPath(const char *cFile, char cPath[]) {
+  const char *cRunDir = Run()->cRunDir;
+  int bAbsolute       = (cFile[0] == '/');
+#ifdef _WIN32
+  bAbsolute = bAbsolute || cFile[0] == '\\' || (cFile[0] && cFile[1] == ':');
+#endif
+
+  if (cRunDir == NULL || cRunDir[0] == '\0' || bAbsolute) {
+    snprintf(cPath, PATHLEN, "%s", cFile);
+  } else {
+    snprintf(cPath, PATHLEN, "%s/%s", cRunDir, cFile);
+  }
+}
+
+/* Create the directory cDir, relative to the run's directory, if it does not
+   exist yet. */
+void MakeRunDirectory(const char *cDir) {
+  char cPath[PATHLEN];
+  struct stat st = {0};
+
+  RunPath(cDir, cPath);
+  if (stat(cPath, &st) == -1) {
+#ifdef _WIN32
+    mkdir(cPath);
+#else
+    mkdir(cPath, 0700);
+#endif
+  }
+}
+
+/* A stream that writes to a buffer in memory. After FlushMemoryStream,
+   *pcBuffer holds everything written so far, and *piSize its length. The
+   buffer is not tracked: release it with (free) once the stream is closed
+   with (fclose). */
+FILE *OpenMemoryStream(char **pcBuffer, size_t *piSize) {
+  *pcBuffer = NULL;
+  *piSize   = 0;
+#ifdef _WIN32
+  /* No open_memstream here, so the text takes a detour through a temporary
+     file that is deleted when it is closed. */
+  return tmpfile();
+#else
+  return open_memstream(pcBuffer, piSize);
+#endif
+}
+
+void FlushMemoryStream(FILE *fp, char **pcBuffer, size_t *piSize) {
+#ifdef _WIN32
+  char *cBuffer;
+  long lSize;
+#endif
+
+  fflush(fp);
+#ifdef _WIN32
+  /* If the buffer cannot grow, it keeps what it held before */
+  lSize   = ftell(fp);
+  cBuffer = (realloc)(*pcBuffer, lSize + 1);
+  if (cBuffer == NULL) {
+    return;
+  }
+  *pcBuffer = cBuffer;
+  rewind(fp);
+  *piSize          = fread(cBuffer, 1, lSize, fp);
+  cBuffer[*piSize] = '\0';
+  fseek(fp, 0, SEEK_END);
+#endif
+}
+
+/* The text of the run's input file cFile, if it was given in memory, or
+   NULL if cFile is to be read from disk. */
+const char *MemoryInputText(const char *cFile) {
+  MEMORYINPUT *pInput = Run()->pInput;
+  int iFile;
+
+  if (pInput == NULL) {
+    return NULL;
+  }
+  for (iFile = 0; iFile < pInput->iNumFiles; iFile++) {
+    if (strcmp(pInput->saFile[iFile], cFile) == 0) {
+      return pInput->saText[iFile];
+    }
+  }
+  return NULL;
+}
+
+/* Where the run's output goes if it is kept in memory, or NULL if the
+   output is written to disk. */
+MEMORYOUTPUT *MemoryOutput() {
+  return Run()->pMemory;
+}
+
+FILE *ErrorStream() {
+  FILE *fpErrorStream = Run()->fpErrorStream;
+
+  if (fpErrorStream == NULL) {
+    return StandardError();
+  }
+  return fpErrorStream;
+}
+
+/* Open a file of the run and record it. The table of open files starts with
+   room for MAXFILES and doubles whenever it is full. */
+FILE *TrackedFopen(const char *cFile, const char *cMode) {
+  RUNSTATE *run = Run();
+  FILE *fp, **fpaGrown;
+  char cPath[PATHLEN];
+  int iMax, bTracked = 1;
+
+  RunPath(cFile, cPath);
+  fp = (fopen)(cPath, cMode);
+  if (fp == NULL) {
+    return NULL;
+  }
+#pragma omp critical(vplanet_run)
+  {
+    if (run->iNumOpen == run->iMaxOpen) {
+      iMax     = run->iMaxOpen > 0 ? 2 * run->iMaxOpen : MAXFILES;
+      fpaGrown = (realloc)(run->fpaOpen, iMax * sizeof(FILE *));
+      if (fpaGrown != NULL) {
+        run->fpaOpen  = fpaGrown;
+        run->iMaxOpen = iMax;
+      }
+    }
+    if (run->iNumOpen < run->iMaxOpen) {
+      run->fpaOpen[run->iNumOpen] = fp;
+      run->iNumOpen++;
+    } else {
+      bTracked = 0;
+    }
+  }
+  if (!bTracked) {
+    (fclose)(fp);
+    fprintf(stderr, "ERROR: Unable to keep track of more than %d open files.\n",
+            run->iMaxOpen);
+    ExitVplanet(EXIT_EXE);
+  }
+  return fp;
+}
+
+int TrackedFclose(FILE *fp) {
+  RUNSTATE *run = Run();
+  int iFile;
+
+#pragma omp critical(vplanet_run)
+  for (iFile = 0; iFile < run->iNumOpen; iFile++) {
+    if (run->fpaOpen[iFile] == fp) {
+      run->iNumOpen--;
+      run->fpaOpen[iFile] = run->fpaOpen[run->iNumOpen];
+      break;
+    }
+  }
+  return (fclose)(fp);
+}
+
+/* Called by main_impl right after setjmp: fatal errors return here. Files
+   are read and written in cDirectory, errors are written to fpError, the
+   input files in input are read from memory rather than disk and, if memory
+   is not NULL, the log and output files are kept there instead of being
+   written. NULL means the current working directory, stderr, and input and
+   output on disk. */
+void BeginRun(jmp_buf *pJump, const char *cDirectory, FILE *fpError,
+              MEMORYINPUT *input, MEMORYOUTPUT *memory) {
+  pRun                 = NULL;
+  pExitPoint           = pJump;
+  iExitStatus          = 0;
+  runOwn.cRunDir       = cDirectory;
+  runOwn.fpErrorStream = fpError;
+  runOwn.pInput        = input;
+  runOwn.pMemory       = memory;
+}
+
+/* Release everything the run allocated or opened, and return its status. */
+int EndRun() {
+  FreeInputTables();
+
+  while (runOwn.iNumOpen > 0) {
+    TrackedFclose(runOwn.fpaOpen[runOwn.iNumOpen - 1]);
+  }
+  (free)(runOwn.fpaOpen);
+  runOwn.fpaOpen  = NULL;
+  runOwn.iMaxOpen = 0;
+  while (runOwn.pMemHead != NULL) {
+    TrackedFree(runOwn.pMemHead + 1);
+  }
+  fflush(stdout);
+  fflush(stderr);
+
+  pExitPoint           = NULL;
+  runOwn.cRunDir       = NULL;
+  runOwn.fpErrorStream = NULL;
+  runOwn.pInput        = NULL;
+  runOwn.pMemory       = NULL;
+  return iExitStatus;
+}
+
+/* The run of the calling thread, for other threads to join. */
+RUNSTATE *CurrentRun() {
+  return Run();
+}
+
+/* Make run, which another thread started, the run of the calling thread,
+   e.g. of an OpenMP thread that evaluates its derivatives, until JoinRun is
+   called again with NULL. */
+void JoinRun(RUNSTATE *run) {
+  pRun = run;
+}
+
+/* Make *pJump the exit point of the calling thread, and return the one it
+   replaces. A thread other than that of main_impl must have its own exit
+   point while it works on a run, or a fatal error ends the process. */
+jmp_buf *SetExitPoint(jmp_buf *pJump) {
+  jmp_buf *pPrevious = pExitPoint;
+
+  pExitPoint = pJump;
+  return pPrevious;
+}
+
+/* The EXIT_* status of the last ExitVplanet of the calling thread. */
+int ExitStatus() {
+  return iExitStatus;
+}
+
+/* Terminate the run with an EXIT_* status. Outside of main_impl, e.g. in a
+   program that links the functions directly, this is just exit(). */
+void ExitVplanet(int iStatus) {
+  if (pExitPoint == NULL) {
+    exit(iStatus);
+  }
+  iExitStatus = iStatus;
+  longjmp(*pExitPoint, 1);
 }
 
 /*
@@ -714,7 +1065,7 @@ void Help(OPTIONS *options, OUTPUT *output, char exe[], int bLong) {
 
 void LineExit(char cFile[], int iLine) {
   fprintf(stderr, "\t%s: Line %d\n", cFile, iLine + 1);
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
 char *sLower(char cString[]) {
@@ -860,7 +1211,7 @@ double fdUnitsLength(int iType) {
     return AUM;
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitLength %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -881,7 +1232,7 @@ void fsUnitsLength(int iType, char cUnit[]) {
     sprintf(cUnit, "au");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitLength %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -899,7 +1250,7 @@ double fdUnitsTime(int iType) {
     return 1e9 * YEARSEC;
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTime: %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -916,7 +1267,7 @@ void fsUnitsTime(int iType, char cUnit[]) {
     sprintf(cUnit, "Gyr");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTime: %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -935,7 +1286,7 @@ double fdUnitsMass(int iType) {
     return MNEP;
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitMass: %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -952,7 +1303,7 @@ void fsUnitsMass(int iType, char cUnit[]) {
     sprintf(cUnit, "Mjupiter");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitMass: %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -963,7 +1314,7 @@ double fdUnitsAngle(int iType) {
     return DEGRAD;
   } else {
     fprintf(stderr, "ERROR: Unknown Angle type %d\n.", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -974,7 +1325,7 @@ void fsUnitsAngle(int iType, char cUnit[]) {
     sprintf(cUnit, "deg");
   } else {
     fprintf(stderr, "ERROR: Unknown Angle type %d\n.", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -1103,7 +1454,7 @@ double fdUnitsTemp(double dTemp, int iOldType, int iNewType) {
       return dTemp;
     } else {
       fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iNewType);
-      exit(EXIT_UNITS);
+      ExitVplanet(EXIT_UNITS);
     }
   } else if (iOldType == CELSIUS) {
     if (iNewType == KELVIN) {
@@ -1116,7 +1467,7 @@ double fdUnitsTemp(double dTemp, int iOldType, int iNewType) {
       return dTemp;
     } else {
       fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iNewType);
-      exit(EXIT_UNITS);
+      ExitVplanet(EXIT_UNITS);
     }
   } else if (iOldType == FARENHEIT) {
     if (iNewType == KELVIN) {
@@ -1129,11 +1480,11 @@ double fdUnitsTemp(double dTemp, int iOldType, int iNewType) {
       return dTemp;
     } else {
       fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iNewType);
-      exit(EXIT_UNITS);
+      ExitVplanet(EXIT_UNITS);
     }
   } else {
     fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iOldType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -1146,7 +1497,7 @@ void fsUnitsTemp(int iType, char cUnit[]) {
     sprintf(cUnit, "F");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTemp %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
@@ -1159,7 +1510,7 @@ void fsUnitsTempRate(int iType, char cUnit[]) {
     sprintf(cUnit, "F/s");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTempRate %d.\n", iType);
-    exit(EXIT_UNITS);
+    ExitVplanet(EXIT_UNITS);
   }
 }
 
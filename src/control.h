@@ -23,7 +23,26 @@ void HelpOptions(OPTIONS *, int);
 void HelpOutput(OUTPUT *, int);
 void Help(OPTIONS *, OUTPUT *, char[], int);
 
-void LineExit(char[], int);
+void *TrackedMalloc(size_t);
+void TrackedFree(void *);
+void RunPath(const char *, char[]);
+void MakeRunDirectory(const char *);
+FILE *OpenMemoryStream(char **, size_t *);
+void FlushMemoryStream(FILE *, char **, size_t *);
+const char *MemoryInputText(const char *);
+MEMORYOUTPUT *MemoryOutput();
+FILE *ErrorStream();
+FILE *TrackedFopen(const char *, const char *);
+int TrackedFclose(FILE *);
+void BeginRun(jmp_buf *, const char *, FILE *, MEMORYINPUT *,
+              MEMORYOUTPUT *);
+int EndRun();
+RUNSTATE *CurrentRun();
+void JoinRun(RUNSTATE *);
+jmp_buf *SetExitPoint(jmp_buf *);
+int ExitStatus();
+NORETURN void ExitVplanet(int);
+NORETURN void LineExit(char[], int);
 char *sLower(char[]);
 void fprintd(FILE *, double, int, int);
 
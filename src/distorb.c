@@ -495,7 +495,7 @@ void VerifyOrbitModel(CONTROL *control, FILES *files, OPTIONS *options) {
         }
       }
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   if (iFound == 0) {
@@ -542,7 +542,7 @@ void VerifyPericenter(BODY *body, CONTROL *control, OPTIONS *options,
               options[OPT_LONGA].cName, options[OPT_LONGP].cName,
               options[OPT_ARGP].cName, cFile);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* At least 2 must be set */
@@ -557,7 +557,7 @@ void VerifyPericenter(BODY *body, CONTROL *control, OPTIONS *options,
               options[OPT_LONGA].cName, options[OPT_LONGP].cName,
               options[OPT_ARGP].cName, cFile);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* Were all set? */
@@ -569,7 +569,7 @@ void VerifyPericenter(BODY *body, CONTROL *control, OPTIONS *options,
                      options[OPT_LONGA].iLine[iBody + 1],
                      options[OPT_LONGP].iLine[iBody + 1],
                      options[OPT_ARGP].iLine[iBody + 1], cFile, iVerbose);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* Was LONGA set? */
@@ -751,7 +751,7 @@ void VerifyPerturbersDistOrbRD4(BODY *body, int iNumBodies, int iBody) {
     if (j != iBody) {
       if (body[j].bDistOrb == 0) {
         fprintf(stderr, "ERROR: DistOrb must be the called for all planets\n");
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
       body[iBody].iaGravPerts[iPert] = j;
       iPert++;
@@ -868,7 +868,7 @@ void VerifyPerturbersDistOrbLL2(BODY *body, int iNumBodies, int iBody) {
   for (j = 1; j < iNumBodies; j++) {
     if (body[j].bDistOrb == 0) {
       fprintf(stderr, "ERROR: DistOrb must be the called for all planets\n");
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
     body[iBody].iaGravPerts[iPert] = j;
     iPert++;
@@ -882,7 +882,7 @@ void VerifyGRCorrLL2(BODY *body, int iNumBodies) {
     if (body[iBody].bGRCorr != body[1].bGRCorr) {
       fprintf(stderr, "ERROR: bGRCorr must be the same for all planets in "
                       "DistOrb LL2 model\n");
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 }
@@ -2280,6 +2280,7 @@ void AddModuleDistOrb(CONTROL *control, MODULE *module, int iBody,
         &InitializeUpdateTmpBodyDistOrb;
   module->fnCountHalts[iBody][iModule] = &CountHaltsDistOrb;
   module->fnLogBody[iBody][iModule]    = &LogBodyDistOrb;
+  module->fnCheckpoint[iBody][iModule] = &CheckpointDistOrb;
 
   module->fnReadOptions[iBody][iModule]       = &ReadOptionsDistOrb;
   module->fnVerify[iBody][iModule]            = &VerifyDistOrb;
@@ -2320,6 +2321,42 @@ void ForceBehaviorDistOrb(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
                           int iModule) {
 }
 
+void CheckpointDistOrb(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                       CHECKPOINT *ckpt, int iBody) {
+  /* The semi-major axis functions, which RecalcLaplace and RecalcEigenVals
+     update as the orbits change, and the Laplace-Lagrange eigenvectors. They
+     belong to the system, which body 1 checkpoints. */
+  int i, iNumPairs, iNumPlanets = evolve->iNumBodies - 1;
+
+  if (iBody != 1) {
+    return;
+  }
+  iNumPairs = fniNchoosek(iNumPlanets, 2);
+  if (evolve->iDistOrbModel == RD4) {
+    for (i = 0; i < iNumPairs; i++) {
+      CheckpointDoubles(ckpt, system->daLaplaceC[0][i], LAPLNUM);
+      CheckpointDoubles(ckpt, system->daLaplaceD[0][i], LAPLNUM);
+      CheckpointDoubles(ckpt, system->daAlpha0[0][i], LAPLNUM);
+    }
+  } else if (evolve->iDistOrbModel == LL2) {
+    for (i = 0; i < iNumPairs; i++) {
+      CheckpointDoubles(ckpt, system->daLaplaceD[0][i], 2);
+      CheckpointDoubles(ckpt, system->daAlpha0[0][i], 1);
+    }
+    for (i = 0; i < 2; i++) {
+      CheckpointDoubles(ckpt, system->daEigenValEcc[i], iNumPlanets);
+      CheckpointDoubles(ckpt, system->daEigenValInc[i], iNumPlanets);
+      CheckpointDoubles(ckpt, system->daEigenPhase[i], iNumPlanets);
+    }
+    for (i = 0; i < iNumPlanets; i++) {
+      CheckpointDoubles(ckpt, system->daEigenVecEcc[i], iNumPlanets);
+      CheckpointDoubles(ckpt, system->daEigenVecInc[i], iNumPlanets);
+    }
+    CheckpointDoubles(ckpt, system->daS, iNumPlanets);
+    CheckpointDoubles(ckpt, system->daT, iNumPlanets);
+  }
+}
+
 /* Factorial function. Nuff sed. */
 unsigned long int fniFactorial(unsigned int n) {
   unsigned long int result;
@@ -2386,7 +2423,7 @@ double fndABmatrix(BODY *body, int j, int jBody, int kBody) {
     fprintf(stderr,
             "ERROR: Body %s and body %s have the same semi-major axis.\n",
             body[kBody].cName, body[jBody].cName);
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 
   n = KGAUSS * sqrt((body[0].dMass + body[jBody].dMass) / MSUN /
@@ -2503,7 +2540,7 @@ void HessEigen(double **amat, int origsize, double real[], double imag[]) {
         } else {
           if (iterations == 30) {
             fprintf(stderr, "Too many iterations in HessEigen routine\n");
-            exit(EXIT_INPUT);
+            ExitVplanet(EXIT_INPUT);
           }
           if (iterations == 10 || iterations == 20) {
             exshift += lrcorner;
@@ -2740,7 +2777,7 @@ void LUDecomp(double **amat, double **copy, double *scale, int *rowswap,
     }
     if (scale[i] == 0.0) {
       fprintf(stderr, "Singular matrix in routine LUDecomp");
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
     for (j = 0; j < size; j++) {
       copy[i][j] = amat[i][j];
@@ -199,6 +199,7 @@ void cart2osc(BODY *, int);
 void PropsAuxDistOrb(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void ForceBehaviorDistOrb(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *, UPDATE *,
                           fnUpdateVariable ***, int, int);
+void CheckpointDistOrb(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *, int);
 
 double fndXinit(BODY *, int);
 double fndYinit(BODY *, int);
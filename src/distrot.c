@@ -406,12 +406,12 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
       fprintf(stderr, "ERROR: Must set %s if using %s for file %s\n",
               options[OPT_FILEORBITDATA].cName,
               options[OPT_READORBITDATA].cName, body[iBody].cName);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else {
       fileorb = fopen(body[iBody].cFileOrbitData, "r");
       if (fileorb == NULL) {
         printf("ERROR: File %s not found.\n", body[iBody].cFileOrbitData);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
       iNLines = 0;
       while ((c = getc(fileorb)) != EOF) {
@@ -478,7 +478,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
       fprintf(stderr,
               "ERROR: Cannot use variable time step (%s = 1) if %s = 1\n",
               options[OPT_VARDT].cName, options[OPT_READORBITDATA].cName);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
     if (control->Evolve.bDoForward) {
       if (body[iBody].daTimeSeries[1] != control->Evolve.dTimeStep) {
@@ -486,7 +486,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
                 "ERROR: Time step size (%s = 1) must match orbital data if %s "
                 "= 1\n",
                 options[OPT_TIMESTEP].cName, options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     } else if (control->Evolve.bDoBackward) {
       if (body[iBody].daTimeSeries[1] != -1 * control->Evolve.dTimeStep) {
@@ -494,7 +494,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
                 "ERROR: Time step size (%s = 1) must match orbital data if %s "
                 "= 1\n",
                 options[OPT_TIMESTEP].cName, options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     }
     if (iNLines < (control->Evolve.dStopTime / control->Evolve.dTimeStep + 1)) {
@@ -502,7 +502,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
               "ERROR: Input orbit data must at least as long as vplanet "
               "integration (%f years)\n",
               control->Evolve.dStopTime / YEARSEC);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 }
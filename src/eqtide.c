@@ -1284,7 +1284,7 @@ void VerifyCTL(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 "%s.\n",
                 options[OPT_TIDALQ].cName, files->Infile[iBody + 1].cIn);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 
@@ -1504,7 +1504,7 @@ void VerifyCPL(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 "%s.\n",
                 options[OPT_TIDALTAU].cName, files->Infile[iBody + 1].cIn);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
 
     /* Verify output contains no CTL-specific parameters */
@@ -1590,7 +1590,7 @@ void VerifyCPL(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
 void VerifyPerturbersEqtide(BODY *body, FILES *files, OPTIONS *options,
                             UPDATE *update, int iNumBodies, int iBody) {
   int iPert, iBodyPert, iVar, ok;
-  int *bFound = malloc(iNumBodies);
+  int *bFound = malloc(iNumBodies * sizeof(int));
 
   for (iBody = 0; iBody < iNumBodies; iBody++) {
 
@@ -1668,7 +1668,7 @@ void VerifyPerturbersEqtide(BODY *body, FILES *files, OPTIONS *options,
       }
 
       if (!ok) {
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     }
   }
@@ -1703,7 +1703,7 @@ void VerifyPerturbersEqtide(BODY *body, FILES *files, OPTIONS *options,
           fprintf(stderr, "\tFile: %s, Line: %d\n",
                   files->Infile[body[iBody].iaTidePerts[iPert] + 1].cIn,
                   options[OPT_TIDEPERTS].iLine[iPert + 1]);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
       }
     }
@@ -1745,7 +1745,7 @@ int fiGetModuleIntEqtide(MODULE *module, int iBody) {
   }
 
   fprintf(stderr, "ERROR: Eqtide not found for body #%d.\n", iBody);
-  exit(1);
+  ExitVplanet(1);
 }
 
 void VerifyTideModel(CONTROL *control, FILES *files, OPTIONS *options) {
@@ -1769,7 +1769,7 @@ void VerifyTideModel(CONTROL *control, FILES *files, OPTIONS *options) {
         }
       }
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   if (iFound == 0) {
@@ -1805,7 +1805,7 @@ void AssignEqtideDerivatives(BODY *body, EVOLVE *evolve, UPDATE *update,
           &fndUpdateFunctionTiny;
   } else {
     fprintf(stderr, "ERROR: Must choose CPL, CTL of DB15 tidal model!\n");
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   for (iPert = 0; iPert < body[iBody].iTidePerts; iPert++) {
@@ -2224,7 +2224,7 @@ void VerifyHaltEqtide(BODY *body, CONTROL *control, OPTIONS *options, int iBody,
                      options[OPT_HALTDBLSYNC].cFile[iBody + 1],
                      options[OPT_BODYFILES].iLine[0],
                      options[OPT_HALTDBLSYNC].iLine[iBody + 1]);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else {
       control->fnHalt[iBody][(*iHalt)++] = &HaltDblSync;
     }
@@ -2239,7 +2239,7 @@ void VerifyHaltEqtide(BODY *body, CONTROL *control, OPTIONS *options, int iBody,
                      options[OPT_HALTTIDELOCK].cFile[iBody + 1],
                      options[OPT_BODYFILES].iLine[0],
                      options[OPT_HALTTIDELOCK].iLine[iBody + 1]);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else {
       control->fnHalt[iBody][(*iHalt)++] = &HaltTideLock;
     }
@@ -2254,7 +2254,7 @@ void VerifyHaltEqtide(BODY *body, CONTROL *control, OPTIONS *options, int iBody,
                      options[OPT_HALTSYNCROT].cFile[iBody + 1],
                      options[OPT_BODYFILES].iLine[0],
                      options[OPT_HALTSYNCROT].iLine[iBody + 1]);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else {
       control->fnHalt[iBody][(*iHalt)++] = &HaltSyncRot;
     }
@@ -3492,6 +3492,7 @@ void AddModuleEqtide(CONTROL *control, MODULE *module, int iBody, int iModule) {
         &InitializeUpdateTmpBodyEqtide;
   module->fnCountHalts[iBody][iModule] = &CountHaltsEqtide;
   module->fnLogBody[iBody][iModule]    = &LogBodyEqtide;
+  module->fnCheckpoint[iBody][iModule] = &CheckpointEqtide;
 
   module->fnReadOptions[iBody][iModule]       = &ReadOptionsEqtide;
   module->fnVerify[iBody][iModule]            = &VerifyEqtide;
@@ -3937,6 +3938,22 @@ void ForceBehaviorEqtide(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
   }
 }
 
+void CheckpointEqtide(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                      CHECKPOINT *ckpt, int iBody) {
+  /* Whether, and when, the body locked, the derivative of the eccentricity
+     the last evaluation found, and which layers are still there to be
+     tidally heated */
+  CheckpointInts(ckpt, &evolve->bForceEqSpin[iBody], 1);
+  CheckpointInts(ckpt, &body[iBody].bTideLock, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dLockTime, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dDeccDtEqtide, 1);
+  CheckpointInts(ckpt, &body[iBody].bEnv, 1);
+  CheckpointInts(ckpt, &body[iBody].bOcean, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dImK2Env, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dImK2Ocean, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dImK2, 1);
+}
+
 /*
  ************************ CPL Functions ******************
  */
@@ -273,6 +273,7 @@ double fdTidePower(BODY *, int, int);
 double fdSurfEnFluxEqtide(BODY *, SYSTEM *, UPDATE *, int, int);
 void ForceBehaviorEqtide(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *, UPDATE *,
                          fnUpdateVariable ***, int, int);
+void CheckpointEqtide(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *, int);
 
 void PropsAuxEqtide(BODY *, EVOLVE *, IO *, UPDATE *, int);
 
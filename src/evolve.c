@@ -9,7 +9,6 @@
   @date May 2014
 
 */
-#define NUM_THREADS 4
 
 #include "vplanet.h"
 
@@ -108,6 +107,30 @@ void CheckProgress(BODY *body, CONTROL *control, SYSTEM *system,
  * Integration Control
  */
 
+int bRungeKutta(CONTROL *control) {
+  /* Does the integration method use the Runge-Kutta stage arrays? Rosenbrock
+   * methods are linearly implicit Runge-Kutta methods. */
+  return (control->Evolve.iOneStep == RUNGEKUTTA ||
+          control->Evolve.iOneStep == RUNGEKUTTA45 ||
+          control->Evolve.iOneStep == ROSENBROCK);
+}
+
+int bAdaptive(CONTROL *control) {
+  /* Does the integration method control the error of each step? */
+  return (control->Evolve.iOneStep == RUNGEKUTTA45 ||
+          control->Evolve.iOneStep == ROSENBROCK);
+}
+
+int fiNumStages(CONTROL *control) {
+  /* Number of derivative evaluations in one Runge-Kutta step. ROSENBROCK
+   * keeps those at the start, the midpoint and the end of the step, and one
+   * for each evaluation of the Jacobian. */
+  if (control->Evolve.iOneStep == RUNGEKUTTA45) {
+    return 7;
+  }
+  return 4;
+}
+
 double AssignDt(double dMin, double dNextOutput, double dEta) {
   /* Compute the next timestep, dt, making sure it's not larger than the output
    * cadence */
@@ -119,6 +142,15 @@ double AssignDt(double dMin, double dNextOutput, double dEta) {
   return dMin;
 }
 
+double fdTimeToOutput(CONTROL *control) {
+  /* The time until the step must end: the next output, or with dense output,
+   * which is interpolated between the steps, the end of the integration */
+  if (control->Io.bDenseOutput) {
+    return control->Evolve.dStopTime - control->Evolve.dTime;
+  }
+  return control->Io.dNextOutput - control->Evolve.dTime;
+}
+
 double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
                      UPDATE *update, fnUpdateVariable ***fnUpdate) {
   /* Fills the Update arrays with the derivatives
@@ -126,7 +158,41 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
    * in variable timestepping. Uses either a 4th order Runge-Kutte integrator or
    * an Euler step.
    */
+  EvaluateEquations(body, control, system, update, fnUpdate, 1);
+
+  return fdMinTimeScale(body, control, update);
+}
+
+double fdFirstStageTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
+                            UPDATE *update, fnUpdateVariable ***fnUpdate) {
+  /* fdGetTimeStep into tmpUpdate at the start of a Runge-Kutta step. Evolve
+   * finds the derivatives at the end of each step, after ForceBehavior and
+   * PropertiesAuxiliary, so unless the bodies have changed since, those are
+   * the derivatives at the start of this step, and those that fdGetTimeStep
+   * evaluates are reused. */
+
+  int iEquation, iBody, iVar, iEqn;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->bUpdateCurrent) {
+    for (iEquation = 0; iEquation < evolve->iNumEquations; iEquation++) {
+      iBody = evolve->iaEquationBody[iEquation];
+      iVar  = evolve->iaEquationVar[iEquation];
+      iEqn  = evolve->iaEquationEqn[iEquation];
+      if (bTimeStepEquation(control, update, iBody, iVar, iEqn)) {
+        evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn] =
+              update[iBody].daDerivProc[iVar][iEqn];
+      }
+    }
+    evolve->iNumDerivReused++;
+    return fdMinTimeScale(body, control, update);
+  }
+  return fdGetTimeStep(body, control, system, evolve->tmpUpdate, fnUpdate);
+}
 
+double fdMinTimeScale(BODY *body, CONTROL *control, UPDATE *update) {
+  /* The smallest timescale of the derivatives in the Update arrays, for use
+   * in variable timestepping */
   int iBody, iVar, iEqn; // Dummy counting variables
   EVOLVE
   integr; // Dummy EVOLVE struct so we don't have to dereference control a lot
@@ -149,10 +215,6 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
         */
         if (update[iBody].iaType[iVar][0] == 0) {
           dVarNow = *update[iBody].pdVar[iVar];
-          for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
-            update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                  body, system, update[iBody].iaBody[iVar][iEqn]);
-          }
           if (control->Evolve.bFirstStep) {
             dMin                       = integr.dTimeStep;
             control->Evolve.bFirstStep = 0;
@@ -180,10 +242,6 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
          */
         } else if (update[iBody].iaType[iVar][0] == 5) {
           // continue;
-          for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
-            update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                  body, system, update[iBody].iaBody[iVar][iEqn]);
-          }
           /* Integration for binary, where parameters can be computed via
          derivatives, or as an explicit function of age */
         } else if (update[iBody].iaType[iVar][0] == 10) {
@@ -199,10 +257,6 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
             (e.g. h,k,p,q in DistOrb) */
         } else if (update[iBody].iaType[iVar][0] == 3) {
           dVarNow = *update[iBody].pdVar[iVar];
-          for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
-            update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                  body, system, update[iBody].iaBody[iVar][iEqn]);
-          }
           if (control->Evolve.bFirstStep) {
             dMin                       = integr.dTimeStep;
             control->Evolve.bFirstStep = 0;
@@ -225,46 +279,13 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
         } else {
           for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
             if (update[iBody].iaType[iVar][iEqn] == 2) {
-              update[iBody].daDerivProc[iVar][iEqn] =
-                    fnUpdate[iBody][iVar][iEqn](
-                          body, system, update[iBody].iaBody[iVar][iEqn]);
-              // if (update[iBody].daDerivProc[iVar][iEqn] != 0 &&
-              // *(update[iBody].pdVar[iVar]) != 0) {
-              if (update[iBody].daDerivProc[iVar][iEqn] != 0) {
-                /* ?Obl require special treatment because they can
-                    overconstrain obliquity and PrecA */
-                if (iVar == update[iBody].iXobl ||
-                    iVar == update[iBody].iYobl ||
-                    iVar == update[iBody].iZobl) {
-                  if (body[iBody].dObliquity != 0) {
-                    dMinNow = fabs(sin(body[iBody].dObliquity) /
-                                   update[iBody].daDerivProc[iVar][iEqn]);
-                  } else { // Obliquity is 0, so its evolution shouldn't impact
-                           // the timestep
-                    dMinNow = dHUGE;
-                  }
-                } else if (iVar == update[iBody].iHecc ||
-                           iVar == update[iBody].iKecc) {
-                  if (body[iBody].dEcc != 0) {
-                    dMinNow = fabs(body[iBody].dEcc /
-                                   update[iBody].daDerivProc[iVar][iEqn]);
-                  } else { // Eccentricity is 0, so its evolution shouldn't
-                           // impact the timestep
-                    dMinNow = dHUGE;
-                  }
-                } else {
-                  dMinNow = fabs(1.0 / update[iBody].daDerivProc[iVar][iEqn]);
-                }
-                if (dMinNow < dMin) {
-                  dMin = dMinNow;
-                }
+              dMinNow = fdEquationTimeScale(body, update, iBody, iVar, iEqn);
+              if (dMinNow < dMin) {
+                dMin = dMinNow;
               }
               // enforce a minimum step size for ice sheets, otherwise dDt -> 0
               // real fast
             } else if (update[iBody].iaType[iVar][iEqn] == 9) {
-              update[iBody].daDerivProc[iVar][iEqn] =
-                    fnUpdate[iBody][iVar][iEqn](
-                          body, system, update[iBody].iaBody[iVar][iEqn]);
               if (update[iBody].daDerivProc[iVar][iEqn] != 0 &&
                   *(update[iBody].pdVar[iVar]) != 0) {
                 dMinNow = fabs((*(update[iBody].pdVar[iVar])) /
@@ -288,9 +309,6 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
             } else if (update[iBody].iaType[iVar][iEqn] == 7) {
               if ((control->Evolve.bSpiNBodyDistOrb == 0) ||
                   (control->Evolve.bUsingSpiNBody == 1)) {
-                update[iBody].daDerivProc[iVar][iEqn] =
-                      fnUpdate[iBody][iVar][iEqn](
-                            body, system, update[iBody].iaBody[iVar][iEqn]);
                 dMinNow =
                       sqrt((body[iBody].dPositionX * body[iBody].dPositionX +
                             body[iBody].dPositionY * body[iBody].dPositionY +
@@ -304,17 +322,9 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
               }
             } else {
               // The parameter is controlled by a time derivative
-              update[iBody].daDerivProc[iVar][iEqn] =
-                    fnUpdate[iBody][iVar][iEqn](
-                          body, system, update[iBody].iaBody[iVar][iEqn]);
-              if (!bFloatComparison(update[iBody].daDerivProc[iVar][iEqn],
-                                    0.0) &&
-                  !bFloatComparison(*(update[iBody].pdVar[iVar]), 0.0)) {
-                dMinNow = fabs((*(update[iBody].pdVar[iVar])) /
-                               update[iBody].daDerivProc[iVar][iEqn]);
-                if (dMinNow < dMin) {
-                  dMin = dMinNow;
-                }
+              dMinNow = fdEquationTimeScale(body, update, iBody, iVar, iEqn);
+              if (dMinNow < dMin) {
+                dMin = dMinNow;
               }
             }
           } // for loop
@@ -326,37 +336,542 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
   return dMin;
 }
 
+double fdEquationTimeScale(BODY *body, UPDATE *update, int iBody, int iVar,
+                           int iEqn) {
+  /* The timescale of one process of a primary variable with a time
+   * derivative, dHUGE if it does not change the variable */
+  if (update[iBody].iaType[iVar][iEqn] == 2) {
+    // if (update[iBody].daDerivProc[iVar][iEqn] != 0 &&
+    // *(update[iBody].pdVar[iVar]) != 0) {
+    if (update[iBody].daDerivProc[iVar][iEqn] != 0) {
+      /* ?Obl require special treatment because they can
+          overconstrain obliquity and PrecA */
+      if (iVar == update[iBody].iXobl || iVar == update[iBody].iYobl ||
+          iVar == update[iBody].iZobl) {
+        if (body[iBody].dObliquity != 0) {
+          return fabs(sin(body[iBody].dObliquity) /
+                      update[iBody].daDerivProc[iVar][iEqn]);
+        }
+        // Obliquity is 0, so its evolution shouldn't impact the timestep
+        return dHUGE;
+      }
+      if (iVar == update[iBody].iHecc || iVar == update[iBody].iKecc) {
+        if (body[iBody].dEcc != 0) {
+          return fabs(body[iBody].dEcc / update[iBody].daDerivProc[iVar][iEqn]);
+        }
+        // Eccentricity is 0, so its evolution shouldn't impact the timestep
+        return dHUGE;
+      }
+      return fabs(1.0 / update[iBody].daDerivProc[iVar][iEqn]);
+    }
+    return dHUGE;
+  }
+  if (!bFloatComparison(update[iBody].daDerivProc[iVar][iEqn], 0.0) &&
+      !bFloatComparison(*(update[iBody].pdVar[iVar]), 0.0)) {
+    return fabs((*(update[iBody].pdVar[iVar])) /
+                update[iBody].daDerivProc[iVar][iEqn]);
+  }
+  return dHUGE;
+}
 
 void fdGetUpdateInfo(BODY *body, CONTROL *control, SYSTEM *system,
                      UPDATE *update, fnUpdateVariable ***fnUpdate) {
   /* Fills the Update arrays with the derivatives
    * or new values..
    */
+  EvaluateEquations(body, control, system, update, fnUpdate, 0);
+}
 
-  int iBody, iVar, iEqn, iNumBodies, iNumVars,
-        iNumEqns; // Dummy counting variables
-  EVOLVE
-  integr; // Dummy EVOLVE struct so we don't have to dereference control a lot
-  double dVarNow, dMinNow, dMin = dHUGE,
-                           dVarTotal; // Intermediate storage variables
+int bTimeStepEquation(CONTROL *control, UPDATE *update, int iBody, int iVar,
+                      int iEqn) {
+  /* Does fdGetTimeStep evaluate the equation? Explicit functions of time that
+     are not in the matrix are not, and neither are the SpiNBody equations
+     when DistOrb integrates the orbits instead. */
+  if (update[iBody].iaType[iVar][0] == 10) {
+    return 0;
+  }
+  if (update[iBody].iaType[iVar][0] == 0 || update[iBody].iaType[iVar][0] == 3 ||
+      update[iBody].iaType[iVar][0] == 5) {
+    return 1;
+  }
+  if (update[iBody].iaType[iVar][iEqn] == 7) {
+    return (control->Evolve.bSpiNBodyDistOrb == 0 ||
+            control->Evolve.bUsingSpiNBody == 1);
+  }
+  return 1;
+}
 
-  integr = control->Evolve;
+static void EvaluateEquation(BODY *body, CONTROL *control, SYSTEM *system,
+                             UPDATE *update, fnUpdateVariable ***fnUpdate,
+                             int bTimeStep, int iEquation) {
+  /* Evaluate process iEquation for EvaluateEquations. */
+  int iBody, iVar, iEqn, iClass;
+  EVOLVE *evolve = &(control->Evolve);
+
+  iBody = evolve->iaEquationBody[iEquation];
+  iVar  = evolve->iaEquationVar[iEquation];
+  iEqn  = evolve->iaEquationEqn[iEquation];
+  if (bTimeStep && !bTimeStepEquation(control, update, iBody, iVar, iEqn)) {
+    return;
+  }
+  iClass = evolve->iNumRateClasses ? evolve->iaEquationClass[iEquation] : -1;
+  if (iClass >= 0 && evolve->baRateClassHeld[iClass]) {
+    update[iBody].daDerivProc[iVar][iEqn] = evolve->daEquationHeld[iEquation];
+  } else {
+    update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
+          body, system, update[iBody].iaBody[iVar][iEqn]);
+    if (iClass >= 0) {
+      evolve->daEquationValue[iEquation] =
+            update[iBody].daDerivProc[iVar][iEqn];
+    }
+  }
+}
 
-  iNumBodies = control->Evolve.iNumBodies;
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    if (update[iBody].iNumVars > 0) {
-      iNumVars = update[iBody].iNumVars;
-      for (iVar = 0; iVar < iNumVars; iVar++) {
-        iNumEqns = update[iBody].iNumEqns[iVar];
-        for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-          update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                body, system, update[iBody].iaBody[iVar][iEqn]);
+static int iTryEquation(BODY *body, CONTROL *control, SYSTEM *system,
+                        UPDATE *update, fnUpdateVariable ***fnUpdate,
+                        int bTimeStep, int iEquation) {
+  /* Evaluate process iEquation on an OpenMP thread. A fatal error in the
+     process must not jump out of the parallel region, let alone from another
+     thread to main_impl, so it jumps back here instead, and its EXIT_* status
+     is returned; 0 if there was none. */
+  jmp_buf jExitPoint;
+  jmp_buf *pPrevious;
+  int iStatus = 0;
+
+  pPrevious = SetExitPoint(&jExitPoint);
+  if (setjmp(jExitPoint) == 0) {
+    EvaluateEquation(body, control, system, update, fnUpdate, bTimeStep,
+                     iEquation);
+  } else {
+    iStatus = ExitStatus();
+  }
+  SetExitPoint(pPrevious);
+  return iStatus;
+}
+
+void EvaluateEquations(BODY *body, CONTROL *control, SYSTEM *system,
+                       UPDATE *update, fnUpdateVariable ***fnUpdate,
+                       int bTimeStep) {
+  /* Evaluate the processes of all bodies into the daDerivProc arrays, with
+     bTimeStep only those that fdGetTimeStep evaluates. The processes only read
+     the bodies, whose auxiliary properties PropertiesAuxiliary has already
+     set, and each writes its own element of daDerivProc, so with iNumThreads
+     above 1 they are evaluated in parallel. The results do not depend on the
+     number of threads. With bMultiRate, the processes of a rate class whose
+     derivatives are held take their last values instead.
+
+     The threads join the run of this one, so that what they allocate and
+     print belongs to it. A fatal error on any of them stops the evaluation,
+     and is raised again here once the threads are done. */
+  int iEquation, iClass, iError, iStatus = 0;
+  EVOLVE *evolve = &(control->Evolve);
+  RUNSTATE *run;
+
+  evolve->iNumDerivEvals++;
+  if (evolve->iNumThreads > 1) {
+    run = CurrentRun();
+#pragma omp parallel num_threads(evolve->iNumThreads) private(iError)
+    {
+      JoinRun(run);
+#pragma omp for schedule(dynamic)
+      for (iEquation = 0; iEquation < evolve->iNumEquations; iEquation++) {
+#pragma omp atomic read
+        iError = iStatus;
+        if (!iError) {
+          iError = iTryEquation(body, control, system, update, fnUpdate,
+                                bTimeStep, iEquation);
+          if (iError) {
+#pragma omp atomic write
+            iStatus = iError;
+          }
+        }
+      }
+      JoinRun(NULL);
+    }
+    if (iStatus) {
+      ExitVplanet(iStatus);
+    }
+  } else {
+    for (iEquation = 0; iEquation < evolve->iNumEquations; iEquation++) {
+      EvaluateEquation(body, control, system, update, fnUpdate, bTimeStep,
+                       iEquation);
+    }
+  }
+
+  for (iClass = 0; iClass < evolve->iNumRateClasses; iClass++) {
+    if (!evolve->baRateClassHeld[iClass]) {
+      evolve->iaRateClassEvals[iClass]++;
+    }
+  }
+}
+
+/*
+ * Multi-rate integration
+ */
+
+int bRateClassEquation(UPDATE *update, int iBody, int iVar, int iEqn) {
+  /* May the process be held between the evaluations of its module? Only
+     time derivatives may: explicit functions of time, derived quantities and
+     the N-body equations are evaluated every time. */
+  return ((update[iBody].iaType[iVar][0] == 1 ||
+           update[iBody].iaType[iVar][0] == 2) &&
+          (update[iBody].iaType[iVar][iEqn] == 1 ||
+           update[iBody].iaType[iVar][iEqn] == 2));
+}
+
+void InitializeRateClasses(CONTROL *control, UPDATE *update,
+                           fnUpdateVariable ***fnUpdate) {
+  /* Group the processes that may be held by module, from iaModule, into rate
+   * classes. They are evaluated until ScheduleRateClasses first holds them.
+   * The types of the processes are only known once the modules are verified.
+   */
+  int iEquation, iBody, iVar, iEqn, iClass, iModule;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (!evolve->bMultiRate) {
+    return;
+  }
+
+  evolve->iaEquationClass   = malloc(evolve->iNumEquations * sizeof(int));
+  evolve->daEquationValue   = malloc(evolve->iNumEquations * sizeof(double));
+  evolve->daEquationPrev    = malloc(evolve->iNumEquations * sizeof(double));
+  evolve->daEquationHeld    = malloc(evolve->iNumEquations * sizeof(double));
+  evolve->daEquationScale   = malloc(evolve->iNumEquations * sizeof(double));
+  evolve->iaRateClassModule = malloc(evolve->iNumEquations * sizeof(int));
+  for (iEquation = 0; iEquation < evolve->iNumEquations; iEquation++) {
+    iBody = evolve->iaEquationBody[iEquation];
+    iVar  = evolve->iaEquationVar[iEquation];
+    iEqn  = evolve->iaEquationEqn[iEquation];
+    evolve->iaEquationClass[iEquation] = -1;
+    evolve->daEquationValue[iEquation] = 0;
+    evolve->daEquationPrev[iEquation]  = 0;
+    evolve->daEquationHeld[iEquation]  = 0;
+    evolve->daEquationScale[iEquation] = 0;
+    if (!bRateClassEquation(update, iBody, iVar, iEqn)) {
+      continue;
+    }
+    iModule = update[iBody].iaModule[iVar][iEqn];
+    for (iClass = 0; iClass < evolve->iNumRateClasses; iClass++) {
+      if (evolve->iaRateClassModule[iClass] == iModule) {
+        break;
+      }
+    }
+    if (iClass == evolve->iNumRateClasses) {
+      evolve->iaRateClassModule[evolve->iNumRateClasses++] = iModule;
+    }
+    evolve->iaEquationClass[iEquation] = iClass;
+  }
+
+  evolve->baRateClassHeld   = malloc(evolve->iNumRateClasses * sizeof(int));
+  evolve->baRateClassPrev   = malloc(evolve->iNumRateClasses * sizeof(int));
+  evolve->daRateClassTime   = malloc(evolve->iNumRateClasses * sizeof(double));
+  evolve->daRateClassPeriod = malloc(evolve->iNumRateClasses * sizeof(double));
+  evolve->daRateClassNext   = malloc(evolve->iNumRateClasses * sizeof(double));
+  evolve->iaRateClassEvals  = malloc(evolve->iNumRateClasses * sizeof(long));
+  for (iClass = 0; iClass < evolve->iNumRateClasses; iClass++) {
+    evolve->baRateClassHeld[iClass]   = 0;
+    evolve->baRateClassPrev[iClass]   = 0;
+    evolve->daRateClassTime[iClass]   = 0;
+    evolve->daRateClassPeriod[iClass] = 0;
+    evolve->daRateClassNext[iClass]   = 0;
+    evolve->iaRateClassEvals[iClass]  = 0;
+  }
+  evolve->iRateClassUpdates = fiUpdateFingerprint(control, update, fnUpdate);
+}
+
+void SelectRateClasses(CONTROL *control, UPDATE *update,
+                       fnUpdateVariable ***fnUpdate, double dTime) {
+  /* Which held rate classes are evaluated at dTime, the end of the current
+   * step? Those whose time has come, and all of them if ForceBehavior swapped
+   * any derivative function, in which case the derivatives before say
+   * nothing about those after. */
+  int iClass, bSwapped;
+  size_t iFingerprint;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (!evolve->iNumRateClasses) {
+    return;
+  }
+  iFingerprint = fiUpdateFingerprint(control, update, fnUpdate);
+  bSwapped     = (iFingerprint != evolve->iRateClassUpdates);
+  for (iClass = 0; iClass < evolve->iNumRateClasses; iClass++) {
+    if (bSwapped || dTime >= evolve->daRateClassNext[iClass]) {
+      evolve->baRateClassHeld[iClass] = 0;
+    }
+    if (bSwapped) {
+      evolve->baRateClassPrev[iClass] = 0;
+    }
+  }
+  evolve->iRateClassUpdates = iFingerprint;
+}
+
+void ScheduleRateClasses(BODY *body, CONTROL *control, UPDATE *update,
+                         double dTime, double dDt) {
+  /* After the derivatives at dTime are found, set the period of each rate
+   * class that was evaluated to dEta times the shortest timescale of its
+   * primary variables, and of its derivatives as they changed since its last
+   * evaluation, relative to the largest magnitude of any process of the same
+   * variable, but at most dOutputTime. The classes whose period is shorter
+   * than 2 steps of dDt are evaluated in every stage. The others are held
+   * until dTime plus their period, at their values
+   * extrapolated linearly to the middle of the period, so each is integrated
+   * to second order in its own period, as by Adams-Bashforth, while the other
+   * modules see its primary variables change linearly with time. */
+  int iEquation, iFirst, iNext, iBody, iVar, iClass;
+  double dTimeScale, dChange, dScale, dSlope;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iClass = 0; iClass < evolve->iNumRateClasses; iClass++) {
+    if (evolve->baRateClassHeld[iClass]) {
+      continue;
+    }
+    if (dTime <= evolve->daRateClassTime[iClass]) {
+      evolve->baRateClassPrev[iClass] = 0;
+    }
+    /* The processes of each primary variable are consecutive, and their
+       changes are measured against the largest of them */
+    dTimeScale = dHUGE;
+    for (iFirst = 0; iFirst < evolve->iNumEquations; iFirst = iNext) {
+      iBody = evolve->iaEquationBody[iFirst];
+      iVar  = evolve->iaEquationVar[iFirst];
+      iNext = iFirst + 1;
+      while (iNext < evolve->iNumEquations &&
+             evolve->iaEquationBody[iNext] == iBody &&
+             evolve->iaEquationVar[iNext] == iVar) {
+        iNext++;
+      }
+      dScale = 0;
+      for (iEquation = iFirst; iEquation < iNext; iEquation++) {
+        if (evolve->iaEquationClass[iEquation] == iClass) {
+          dScale = fmax(dScale, fmax(evolve->daEquationScale[iEquation],
+                                     fabs(evolve->daEquationValue[iEquation])));
+        }
+      }
+      for (iEquation = iFirst; iEquation < iNext; iEquation++) {
+        if (evolve->iaEquationClass[iEquation] != iClass) {
+          continue;
+        }
+        evolve->daEquationScale[iEquation] = dScale;
+        dTimeScale = fmin(dTimeScale,
+                          fdEquationTimeScale(body, update, iBody, iVar,
+                                              evolve->iaEquationEqn[iEquation]));
+        dChange = fabs(evolve->daEquationValue[iEquation] -
+                       evolve->daEquationPrev[iEquation]);
+        if (evolve->baRateClassPrev[iClass] && dChange > 0) {
+          dTimeScale = fmin(dTimeScale,
+                            (dTime - evolve->daRateClassTime[iClass]) * dScale /
+                                  dChange);
+        }
+      }
+    }
+    evolve->daRateClassPeriod[iClass] =
+          fmin(evolve->dEta * dTimeScale, control->Io.dOutputTime);
+    evolve->daRateClassNext[iClass] =
+          dTime + evolve->daRateClassPeriod[iClass];
+
+    for (iEquation = 0; iEquation < evolve->iNumEquations; iEquation++) {
+      if (evolve->iaEquationClass[iEquation] == iClass) {
+        dSlope = 0;
+        if (evolve->baRateClassPrev[iClass]) {
+          dSlope = (evolve->daEquationValue[iEquation] -
+                    evolve->daEquationPrev[iEquation]) /
+                   (dTime - evolve->daRateClassTime[iClass]);
+        }
+        evolve->daEquationHeld[iEquation] =
+              evolve->daEquationValue[iEquation] +
+              0.5 * evolve->daRateClassPeriod[iClass] * dSlope;
+        evolve->daEquationPrev[iEquation] = evolve->daEquationValue[iEquation];
+      }
+    }
+    evolve->baRateClassHeld[iClass] =
+          (evolve->baRateClassPrev[iClass] &&
+           evolve->daRateClassPeriod[iClass] > 2 * dDt);
+    evolve->daRateClassTime[iClass] = dTime;
+    evolve->baRateClassPrev[iClass] = 1;
+
+    // The next step may start from the derivatives in update
+    if (evolve->baRateClassHeld[iClass]) {
+      for (iEquation = 0; iEquation < evolve->iNumEquations; iEquation++) {
+        if (evolve->iaEquationClass[iEquation] == iClass) {
+          update[evolve->iaEquationBody[iEquation]]
+                .daDerivProc[evolve->iaEquationVar[iEquation]]
+                            [evolve->iaEquationEqn[iEquation]] =
+                evolve->daEquationHeld[iEquation];
+        }
+      }
+    }
+  }
+}
+
+/*
+ * Freezing quiescent primary variables
+ */
+
+int bFreezableVariable(UPDATE *update, fnUpdateVariable ***fnUpdate,
+                       int iBody, int iVar) {
+  /* May the primary variable be frozen? Only if all of its processes are time
+     derivatives, and some module has not already replaced them all with
+     fndUpdateFunctionTiny. Not those of RADHEAT and THERMINT either, as their
+     auxiliary properties, e.g. the radiogenic power, are the derivatives. */
+  int iEqn, bLive = 0;
+
+  for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+    if (update[iBody].iaType[iVar][iEqn] != 1 ||
+        (update[iBody].iaModule[iVar][iEqn] & (RADHEAT | THERMINT))) {
+      return 0;
+    }
+    if (fnUpdate[iBody][iVar][iEqn] != &fndUpdateFunctionTiny) {
+      bLive = 1;
+    }
+  }
+  return bLive;
+}
+
+void FreezeVariable(CONTROL *control, UPDATE *update,
+                    fnUpdateVariable ***fnUpdate, int iBody, int iVar,
+                    double dTime) {
+  /* Keep the derivative functions of the primary variable and replace them
+     with fndUpdateFunctionTiny, for as long as it has been quiescent */
+  int iEqn;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+    evolve->fnFrozenUpdate[iBody][iVar][iEqn] = fnUpdate[iBody][iVar][iEqn];
+    fnUpdate[iBody][iVar][iEqn]               = &fndUpdateFunctionTiny;
+  }
+  evolve->baFrozen[iBody][iVar] = 1;
+  evolve->daThawTime[iBody][iVar] =
+        2 * dTime - evolve->daQuiescentTime[iBody][iVar];
+  evolve->iaFreezes[iBody][iVar]++;
+  evolve->iNumFrozen++;
+}
+
+void ThawVariable(CONTROL *control, UPDATE *update,
+                  fnUpdateVariable ***fnUpdate, int iBody, int iVar) {
+  int iEqn;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+    fnUpdate[iBody][iVar][iEqn] = evolve->fnFrozenUpdate[iBody][iVar][iEqn];
+  }
+  evolve->baFrozen[iBody][iVar] = 0;
+  evolve->iNumFrozen--;
+}
+
+void RestoreFrozenVariables(CONTROL *control, UPDATE *update,
+                            fnUpdateVariable ***fnUpdate) {
+  /* Put back the derivative functions of the frozen variables, so that
+   * ForceBehavior sees, and may swap, those of the modules. They stay frozen
+   * unless it does, see RefreezeVariables. */
+  int iBody, iVar, iEqn;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->iNumFrozen == 0) {
+    return;
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (evolve->baFrozen[iBody][iVar]) {
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          fnUpdate[iBody][iVar][iEqn] =
+                evolve->fnFrozenUpdate[iBody][iVar][iEqn];
+        }
+      }
+    }
+  }
+  evolve->iFreezeUpdates = fiUpdateFingerprint(control, update, fnUpdate);
+}
+
+void RefreezeVariables(CONTROL *control, UPDATE *update,
+                       fnUpdateVariable ***fnUpdate) {
+  /* Freeze the variables again after ForceBehavior. If it swapped any
+   * derivative function, the regime of the system changed, e.g. a body
+   * tidally locked, so they are all thawed instead, and must be quiescent for
+   * iFreezeWindow steps again. */
+  int iBody, iVar, iEqn, bSwapped;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->iNumFrozen == 0) {
+    return;
+  }
+  bSwapped = (fiUpdateFingerprint(control, update, fnUpdate) !=
+              evolve->iFreezeUpdates);
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (!evolve->baFrozen[iBody][iVar]) {
+        continue;
+      }
+      if (bSwapped) {
+        evolve->baFrozen[iBody][iVar]      = 0;
+        evolve->iaFreezeCount[iBody][iVar] = 0;
+      } else {
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          fnUpdate[iBody][iVar][iEqn] = &fndUpdateFunctionTiny;
         }
       }
     }
   }
+  if (bSwapped) {
+    evolve->iNumFrozen = 0;
+  }
 }
 
+void FreezeVariables(CONTROL *control, UPDATE *update,
+                     fnUpdateVariable ***fnUpdate, double dTime, double dDt) {
+  /* After the derivatives at dTime, the end of a step of dDt, are found,
+   * freeze the primary variables that have been quiescent for iFreezeWindow
+   * steps: their derivatives would change them by less than dFreezeTol times
+   * their magnitude until dStopTime. A variable stays
+   * frozen for as long as it had been quiescent, then is thawed for a step,
+   * and frozen again if it still is, so the periods double. The steps may
+   * lengthen while it is frozen, so they are measured in time. */
+  int iBody, iVar, iEqn, bChanged = 0;
+  double dRate;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->dFreezeTol == 0) {
+    return;
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (evolve->baFrozen[iBody][iVar]) {
+        evolve->daFrozenTime[iBody][iVar] += dDt;
+        if (dTime >= evolve->daThawTime[iBody][iVar]) {
+          ThawVariable(control, update, fnUpdate, iBody, iVar);
+          evolve->iaFreezeCount[iBody][iVar] = evolve->iFreezeWindow - 1;
+          bChanged                           = 1;
+        }
+        continue;
+      }
+      if (!bFreezableVariable(update, fnUpdate, iBody, iVar)) {
+        evolve->iaFreezeCount[iBody][iVar] = 0;
+        continue;
+      }
+
+      dRate = 0;
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        dRate += fabs(update[iBody].daDerivProc[iVar][iEqn]);
+      }
+      if (dRate * (evolve->dStopTime - dTime) >=
+          evolve->dFreezeTol * fabs(*(update[iBody].pdVar[iVar]))) {
+        evolve->iaFreezeCount[iBody][iVar] = 0;
+        continue;
+      }
+      if (evolve->iaFreezeCount[iBody][iVar] == 0) {
+        evolve->daQuiescentTime[iBody][iVar] = dTime - dDt;
+      }
+      if (++evolve->iaFreezeCount[iBody][iVar] >= evolve->iFreezeWindow) {
+        FreezeVariable(control, update, fnUpdate, iBody, iVar, dTime);
+        bChanged = 1;
+      }
+    }
+  }
+
+  // The derivatives in update are no longer those the next step would find
+  if (bChanged) {
+    evolve->bUpdateCurrent = 0;
+  }
+}
 
 void EulerStep(BODY *body, CONTROL *control, SYSTEM *system, UPDATE *update,
                fnUpdateVariable ***fnUpdate, double *dDt, int iDir) {
@@ -368,9 +883,13 @@ void EulerStep(BODY *body, CONTROL *control, SYSTEM *system, UPDATE *update,
   /* Adjust dt? */
   if (control->Evolve.bVarDt) {
     /* dDt is the dynamical timescale */
-    *dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
-    *dDt = AssignDt(*dDt, (control->Io.dNextOutput - control->Evolve.dTime),
-                    control->Evolve.dEta);
+    if (control->Evolve.bUpdateCurrent) {
+      control->Evolve.iNumDerivReused++;
+      *dDt = fdMinTimeScale(body, control, update);
+    } else {
+      *dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
+    }
+    *dDt = AssignDt(*dDt, fdTimeToOutput(control), control->Evolve.dEta);
   }
 
   for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
@@ -391,68 +910,51 @@ void EulerStep(BODY *body, CONTROL *control, SYSTEM *system, UPDATE *update,
 void RungeKutta4Step(BODY *body, CONTROL *control, SYSTEM *system,
                      UPDATE *update, fnUpdateVariable ***fnUpdate, double *dDt,
                      int iDir) {
-  /* Compute and apply a 4th order Runge-Kutta update step a given parameter. */
-  int iBody, iVar, iEqn, iSubStep, iNumBodies, iNumVars, iNumEqns;
-  double dFoo, dDelta;
+  /* Compute and apply a 4th order Runge-Kutta update step a given parameter.
+   * The stages are computed on the state vector, see InitializeStateVector. */
+  int iBody, iVar, iState, iEqn, iNumStates;
+  double dDerivVar;
 
   EVOLVE *evolve = &(
         control->Evolve); // Save Evolve as a variable for speed and legibility
+  double **daDeriv = evolve->daStateDeriv;
 
   /* Create a copy of BODY array */
   BodyCopy(evolve->tmpBody, body, &control->Evolve);
 
   /* Derivatives at start */
-  *dDt = fdGetTimeStep(body, control, system, control->Evolve.tmpUpdate,
-                       fnUpdate);
+  *dDt = fdFirstStageTimeStep(body, control, system, update, fnUpdate);
 
   /* Adjust dt? */
   if (evolve->bVarDt) {
     /*  This is minimum dynamical timescale */
-    *dDt = AssignDt(*dDt, (control->Io.dNextOutput - evolve->dTime),
-                    evolve->dEta);
+    *dDt = AssignDt(*dDt, fdTimeToOutput(control), evolve->dEta);
   } else {
     *dDt = evolve->dTimeStep;
   }
 
   evolve->dCurrentDt = *dDt;
-  iNumBodies         = evolve->iNumBodies;
-#pragma omp parallel for num_threads(NUM_THREADS) private(iNumVars, iNumEqns,  \
-                                                          iVar, iEqn)
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    // int thread_num = omp_get_thread_num();
-    // int cpu_num = sched_getcpu();
-    // printf("Thread %3d is running on CPU %3d\n", thread_num, cpu_num);
-    double daDerivVar;
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      iNumEqns   = update[iBody].iNumEqns[iVar];
-      for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-        daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-      }
-      evolve->daDeriv[0][iBody][iVar] = daDerivVar;
+  iNumStates         = evolve->iNumStates;
+  for (iState = 0; iState < iNumStates; iState++) {
+    dDerivVar = 0;
+    for (iEqn = 0; iEqn < evolve->iaStateNumEqns[iState]; iEqn++) {
+      dDerivVar += iDir * evolve->daStateDerivProc[iState][iEqn];
     }
+    daDeriv[0][iState] = dDerivVar;
   }
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest These values are updated in the
-        // tmpUpdate struct so that equations which are dependent upon them will
-        // be evaluated with higher accuracy
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              evolve->daDeriv[0][iBody][iVar];
-      } else {
-        /* While we're in this loop, move each parameter to the midpoint of the
-         * timestep */
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              *(update[iBody].pdVar[iVar]) +
-              0.5 * (*dDt) * evolve->daDeriv[0][iBody][iVar];
-      }
+  for (iState = 0; iState < iNumStates; iState++) {
+    if (evolve->baStateExplicit[iState]) {
+      // LUGER: Note that this is the VALUE of the variable getting passed,
+      // contrary to what the names suggest These values are updated in the
+      // tmpUpdate struct so that equations which are dependent upon them will
+      // be evaluated with higher accuracy
+      *(evolve->pdTmpState[iState]) = daDeriv[0][iState];
+    } else {
+      /* While we're in this loop, move each parameter to the midpoint of the
+       * timestep */
+      *(evolve->pdTmpState[iState]) =
+            *(evolve->pdState[iState]) + 0.5 * (*dDt) * daDeriv[0][iState];
     }
   }
 
@@ -462,43 +964,22 @@ void RungeKutta4Step(BODY *body, CONTROL *control, SYSTEM *system,
   fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
                   fnUpdate);
 
-#pragma omp parallel for num_threads(NUM_THREADS) private(iNumVars, iNumEqns,  \
-                                                          iVar, iEqn)
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    double daDerivVar;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      iNumEqns   = update[iBody].iNumEqns[iVar];
-      for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-        daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        // evolve->daTmpVal[0][iBody][iVar] +=
-        // (*dDt)*iDir*evolve->tmpUpdate[iBody].daDeriv[iVar][iEqn];
-      }
-      evolve->daDeriv[1][iBody][iVar] = daDerivVar;
+  for (iState = 0; iState < iNumStates; iState++) {
+    dDerivVar = 0;
+    for (iEqn = 0; iEqn < evolve->iaStateNumEqns[iState]; iEqn++) {
+      dDerivVar += iDir * evolve->daStateDerivProc[iState][iEqn];
     }
+    daDeriv[1][iState] = dDerivVar;
   }
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest These values are updated in the
-        // tmpUpdate struct so that equations which are dependent upon them will
-        // be evaluated with higher accuracy
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              evolve->daDeriv[1][iBody][iVar];
-      } else {
-        /* While we're in this loop, move each parameter to the midpoint
-        of the timestep based on the midpoint derivative. */
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              *(update[iBody].pdVar[iVar]) +
-              0.5 * (*dDt) * evolve->daDeriv[1][iBody][iVar];
-      }
+  for (iState = 0; iState < iNumStates; iState++) {
+    if (evolve->baStateExplicit[iState]) {
+      *(evolve->pdTmpState[iState]) = daDeriv[1][iState];
+    } else {
+      /* While we're in this loop, move each parameter to the midpoint
+      of the timestep based on the midpoint derivative. */
+      *(evolve->pdTmpState[iState]) =
+            *(evolve->pdState[iState]) + 0.5 * (*dDt) * daDeriv[1][iState];
     }
   }
 
@@ -508,43 +989,22 @@ void RungeKutta4Step(BODY *body, CONTROL *control, SYSTEM *system,
   fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
                   fnUpdate);
 
-#pragma omp parallel for num_threads(NUM_THREADS) private(iNumVars, iNumEqns,  \
-                                                          iVar, iEqn)
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    double daDerivVar;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      iNumEqns   = update[iBody].iNumEqns[iVar];
-      for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-        daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        // evolve->daTmpVal[0][iBody][iVar] +=
-        // (*dDt)*iDir*evolve->tmpUpdate[iBody].daDeriv[iVar][iEqn];
-      }
-      evolve->daDeriv[2][iBody][iVar] = daDerivVar;
+  for (iState = 0; iState < iNumStates; iState++) {
+    dDerivVar = 0;
+    for (iEqn = 0; iEqn < evolve->iaStateNumEqns[iState]; iEqn++) {
+      dDerivVar += iDir * evolve->daStateDerivProc[iState][iEqn];
     }
+    daDeriv[2][iState] = dDerivVar;
   }
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest These values are updated in the
-        // tmpUpdate struct so that equations which are dependent upon them will
-        // be evaluated with higher accuracy
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              evolve->daDeriv[2][iBody][iVar];
-      } else {
-        /* While we're in this loop, move each parameter to the end of
-        the timestep based on the second midpoint derivative. */
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              *(update[iBody].pdVar[iVar]) +
-              *dDt * evolve->daDeriv[2][iBody][iVar];
-      }
+  for (iState = 0; iState < iNumStates; iState++) {
+    if (evolve->baStateExplicit[iState]) {
+      *(evolve->pdTmpState[iState]) = daDeriv[2][iState];
+    } else {
+      /* While we're in this loop, move each parameter to the end of
+      the timestep based on the second midpoint derivative. */
+      *(evolve->pdTmpState[iState]) =
+            *(evolve->pdState[iState]) + *dDt * daDeriv[2][iState];
     }
   }
 
@@ -554,107 +1014,1202 @@ void RungeKutta4Step(BODY *body, CONTROL *control, SYSTEM *system,
   fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
                   fnUpdate);
 
-#pragma omp parallel for num_threads(NUM_THREADS) private(iNumVars, iNumEqns,  \
-                                                          iVar, iEqn)
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    double daDerivVar;
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // NOTHING!
-      } else {
-        evolve->daDeriv[3][iBody][iVar] = 0;
-        iNumEqns                        = update[iBody].iNumEqns[iVar];
-        for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-          daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        }
-        evolve->daDeriv[3][iBody][iVar] = daDerivVar;
+  for (iState = 0; iState < iNumStates; iState++) {
+    // Explicit variables keep their value from the last stage
+    if (!evolve->baStateExplicit[iState]) {
+      dDerivVar = 0;
+      for (iEqn = 0; iEqn < evolve->iaStateNumEqns[iState]; iEqn++) {
+        dDerivVar += iDir * evolve->daStateDerivProc[iState][iEqn];
       }
+      daDeriv[3][iState] = dDerivVar;
     }
   }
+
   /* Now do the update -- Note the pointer to the home of the actual
    * variables!!! */
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      update[iBody].daDeriv[iVar] = 1. / 6 *
-                                    (evolve->daDeriv[0][iBody][iVar] +
-                                     2 * evolve->daDeriv[1][iBody][iVar] +
-                                     2 * evolve->daDeriv[2][iBody][iVar] +
-                                     evolve->daDeriv[3][iBody][iVar]);
-
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
+  iState = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++, iState++) {
+      update[iBody].daDeriv[iVar] =
+            1. / 6 *
+            (daDeriv[0][iState] + 2 * daDeriv[1][iState] +
+             2 * daDeriv[2][iState] + daDeriv[3][iState]);
+
+      if (evolve->baStateExplicit[iState]) {
         // LUGER: Note that this is the VALUE of the variable getting passed,
         // contrary to what the names suggest
-        *(update[iBody].pdVar[iVar]) = evolve->daDeriv[0][iBody][iVar];
+        *(evolve->pdState[iState]) = daDeriv[0][iState];
       } else {
-        *(update[iBody].pdVar[iVar]) += update[iBody].daDeriv[iVar] * (*dDt);
+        *(evolve->pdState[iState]) += update[iBody].daDeriv[iVar] * (*dDt);
       }
     }
   }
 }
 
-/*
- * Evolution Subroutine
- */
-
-void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
-            OUTPUT *output, SYSTEM *system, UPDATE *update,
-            fnUpdateVariable ***fnUpdate, fnWriteOutput *fnWrite,
-            fnIntegrate fnOneStep) {
-  /* Master evolution routine that controls the simulation integration. */
-  int iDir, iBody, iModule, nSteps; // Dummy counting variables
-  double dDt, dFoo;                 // Next timestep, dummy variable
-  double dEqSpinRate;               // Store the equilibrium spin rate
-
-  nSteps = 0;
+/* Dormand & Prince (1980) coefficients for RUNGEKUTTA45: the fraction of the
+ * step at which each stage is evaluated, the weights of the earlier stages in
+ * the state of each stage, and the weights that give the difference between
+ * the 5th and embedded 4th order solutions. The last stage is evaluated at the
+ * 5th order solution, so its derivatives are those at the start of the next
+ * step ("First Same As Last"). */
+static const double daRK45Node[7] = {0, 1. / 5, 3. / 10, 4. / 5, 8. / 9, 1, 1};
+static const double daRK45Coeff[7][6] = {
+      {0},
+      {1. / 5},
+      {3. / 40, 9. / 40},
+      {44. / 45, -56. / 15, 32. / 9},
+      {19372. / 6561, -25360. / 2187, 64448. / 6561, -212. / 729},
+      {9017. / 3168, -355. / 33, 46732. / 5247, 49. / 176, -5103. / 18656},
+      {35. / 384, 0, 500. / 1113, 125. / 192, -2187. / 6784, 11. / 84}};
+static const double daRK45Error[7] = {71. / 57600,      0,
+                                      -71. / 16695,     71. / 1920,
+                                      -17253. / 339200, 22. / 525,
+                                      -1. / 40};
+
+/* Shampine & Reichelt (1997) coefficients for ROSENBROCK, the L-stable
+ * Rosenbrock 2(3) pair of MATLAB's ode23s */
+static const double dRosenbrockD   = 0.29289321881345248; // 1/(2 + sqrt(2))
+static const double dRosenbrockE32 = 7.4142135623730950;  // 6 + sqrt(2)
+
+int bExplicitVariable(UPDATE *update, int iBody, int iVar) {
+  /* Is the primary variable an explicit function of time, i.e. are its
+   * "derivatives" actually its value? */
+  return (update[iBody].iaType[iVar][0] == 0 ||
+          update[iBody].iaType[iVar][0] == 3 ||
+          update[iBody].iaType[iVar][0] == 10);
+}
 
-  if (control->Evolve.bDoForward) {
-    iDir = 1;
-  } else {
-    iDir = -1;
+void InitializeStateVector(CONTROL *control, UPDATE *update) {
+  /* Gather the primary variables of all bodies, in order, into one state
+   * vector: the addresses of each in the bodies and the temporary bodies, and
+   * its processes in tmpUpdate. The derivatives of each stage are one
+   * contiguous array, which daDeriv[iStage][iBody] points into, so the stages
+   * are simple loops over the state. */
+  int iBody, iVar, iStage, iState;
+  EVOLVE *evolve = &(control->Evolve);
+
+  evolve->iNumStates = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->iNumStates += update[iBody].iNumVars;
+  }
+  evolve->pdState    = malloc(evolve->iNumStates * sizeof(double *));
+  evolve->pdTmpState = malloc(evolve->iNumStates * sizeof(double *));
+  evolve->daStateDerivProc = malloc(evolve->iNumStates * sizeof(double *));
+  evolve->iaStateNumEqns   = malloc(evolve->iNumStates * sizeof(int));
+  evolve->baStateExplicit  = malloc(evolve->iNumStates * sizeof(int));
+  evolve->daStateDeriv = malloc(fiNumStages(control) * sizeof(double *));
+
+  for (iStage = 0; iStage < fiNumStages(control); iStage++) {
+    evolve->daStateDeriv[iStage] = malloc(evolve->iNumStates * sizeof(double));
+    iState                       = 0;
+    for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+      evolve->daDeriv[iStage][iBody] = evolve->daStateDeriv[iStage] + iState;
+      iState += update[iBody].iNumVars;
+    }
+    for (iState = 0; iState < evolve->iNumStates; iState++) {
+      evolve->daStateDeriv[iStage][iState] = 0;
+    }
   }
 
-  PropertiesAuxiliary(body, control, system, update);
-  control->Io.dNextOutput = control->Evolve.dTime + control->Io.dOutputTime;
+  iState = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++, iState++) {
+      evolve->pdState[iState]    = update[iBody].pdVar[iVar];
+      evolve->pdTmpState[iState] = evolve->tmpUpdate[iBody].pdVar[iVar];
+      evolve->daStateDerivProc[iState] =
+            evolve->tmpUpdate[iBody].daDerivProc[iVar];
+      evolve->iaStateNumEqns[iState]  = update[iBody].iNumEqns[iVar];
+      evolve->baStateExplicit[iState] = bExplicitVariable(update, iBody, iVar);
+    }
+  }
+}
 
-  // Get derivatives at start, useful for logging
-  dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
+void StageDerivatives(CONTROL *control, UPDATE *update, int iStage, int iDir) {
+  /* Sum the processes of each primary variable in tmpUpdate into the
+   * derivative of stage iStage */
+  int iState, iEqn;
+  double dDerivVar;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iState = 0; iState < evolve->iNumStates; iState++) {
+    dDerivVar = 0;
+    for (iEqn = 0; iEqn < evolve->iaStateNumEqns[iState]; iEqn++) {
+      dDerivVar += evolve->daStateDerivProc[iState][iEqn];
+    }
+    if (!evolve->baStateExplicit[iState]) {
+      dDerivVar *= iDir;
+    }
+    evolve->daStateDeriv[iStage][iState] = dDerivVar;
+  }
+}
 
+void StageExplicitVariables(CONTROL *control, SYSTEM *system, UPDATE *update,
+                            fnUpdateVariable ***fnUpdate) {
+  /* Unlike RungeKutta4Step, which passes the value from the previous stage,
+     evaluate explicit functions of time at the age of the temporary bodies,
+     or the long steps of the adaptive methods lag them behind. */
+  int iBody, iVar, iEqn;
+  double dSum;
+  EVOLVE *evolve = &(control->Evolve);
 
-  /* Adjust dt? */
-  if (control->Evolve.bVarDt) {
-    /* Now choose the correct timestep */
-    dDt = AssignDt(dDt, (control->Io.dNextOutput - control->Evolve.dTime),
-                   control->Evolve.dEta);
-  } else {
-    dDt = control->Evolve.dTimeStep;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (bExplicitVariable(update, iBody, iVar)) {
+        dSum = 0;
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          dSum += fnUpdate[iBody][iVar][iEqn](
+                evolve->tmpBody, system, update[iBody].iaBody[iVar][iEqn]);
+        }
+        *(evolve->tmpUpdate[iBody].pdVar[iVar]) = dSum;
+      }
+    }
   }
+}
 
-  /* Write out initial conditions */
-  WriteOutput(body, control, files, output, system, update, fnWrite,
-              control->Evolve.dTime, dDt);
-
-  /* If Runge-Kutta need to copy actual update to that in
-     control->Evolve. This transfer all the meta-data about the
-     struct. */
-  UpdateCopy(control->Evolve.tmpUpdate, update, control->Evolve.iNumBodies);
+void EvaluateStage(CONTROL *control, SYSTEM *system, UPDATE *update,
+                   fnUpdateVariable ***fnUpdate, int iStage, int iDir) {
+  /* The derivatives of stage iStage, at the state of the temporary bodies */
+  EVOLVE *evolve = &(control->Evolve);
 
-  /*
-   *
+  StageExplicitVariables(control, system, update, fnUpdate);
+  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+  fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
+                  fnUpdate);
+  StageDerivatives(control, update, iStage, iDir);
+}
+
+void RK45StageState(BODY *body, CONTROL *control, UPDATE *update, int iStage,
+                    double dDt, int iDir) {
+  /* Move the temporary bodies to the state at which stage iStage is
+   * evaluated */
+  int iBody, iVar, iPrev;
+  double dSum;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->tmpBody[iBody].dAge =
+          body[iBody].dAge + iDir * daRK45Node[iStage] * dDt;
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (!bExplicitVariable(update, iBody, iVar)) {
+        dSum = 0;
+        for (iPrev = 0; iPrev < iStage; iPrev++) {
+          dSum += daRK45Coeff[iStage][iPrev] *
+                  evolve->daDeriv[iPrev][iBody][iVar];
+        }
+        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
+              *(update[iBody].pdVar[iVar]) + dDt * dSum;
+      }
+    }
+  }
+}
+
+double fdErrorRatio(CONTROL *control, UPDATE *update, int iBody, int iVar,
+                    double dErr) {
+  /* The error dErr of a primary variable over a step that ends at the state
+   * in tmpUpdate, relative to the tolerance on it */
+  double dScale, dValue;
+  EVOLVE *evolve = &(control->Evolve);
+
+  // A stage left the domain of the derivatives
+  if (!isfinite(dErr)) {
+    return dHUGE;
+  }
+  /* Like the dEta timescale of fdGetTimeStep, a step may not take a
+     variable controlled by its derivative through 0, or a ForceBehavior
+     that waits for it to get small, e.g. envelope loss, never fires */
+  if ((update[iBody].iaType[iVar][0] == 1 ||
+       update[iBody].iaType[iVar][0] == 9) &&
+      *(update[iBody].pdVar[iVar]) *
+                  *(evolve->tmpUpdate[iBody].pdVar[iVar]) <
+            0) {
+    return dHUGE;
+  }
+
+  dValue = fmax(fabs(*(update[iBody].pdVar[iVar])),
+                fabs(*(evolve->tmpUpdate[iBody].pdVar[iVar])));
+  dScale = evolve->dRelTol * dValue +
+           evolve->dAbsTol * evolve->daErrorScale[iBody][iVar];
+  if (dScale > 0) {
+    return fabs(dErr) / dScale;
+  }
+  return 0;
+}
+
+double fdRK45Error(CONTROL *control, UPDATE *update, double dDt) {
+  /* The largest error of a primary variable over the step, relative to the
+   * tolerance on it. The step is accurate enough if this is at most 1. */
+  int iBody, iVar, iStage;
+  double dErr, dMaxErr = 0;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      // Variables that are not integrated have no truncation error
+      if (bExplicitVariable(update, iBody, iVar) ||
+          update[iBody].iaType[iVar][0] == 5) {
+        continue;
+      }
+      dErr = 0;
+      for (iStage = 0; iStage < 7; iStage++) {
+        dErr += daRK45Error[iStage] * evolve->daDeriv[iStage][iBody][iVar];
+      }
+      dMaxErr = fmax(dMaxErr,
+                     fdErrorRatio(control, update, iBody, iVar, dDt * dErr));
+    }
+  }
+  return dMaxErr;
+}
+
+double fdMinAdaptiveDt(BODY *body, CONTROL *control, UPDATE *update) {
+  /* The smallest step the adaptive methods take: dEta times the shortest
+   * timescale of the processes at the start of the step, as in fdGetTimeStep,
+   * so never longer than the step RungeKutta4Step would take. Without it, the
+   * error control grinds to a halt where a derivative is discontinuous, e.g.
+   * when a CPL rotation rate sits on a resonance. */
+  int iBody, iVar, iEqn;
+  double dDeriv, dMinNow, dMin = dHUGE;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (bExplicitVariable(update, iBody, iVar) ||
+          update[iBody].iaType[iVar][0] == 5) {
+        continue;
+      }
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        dDeriv = evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
+        if (bFloatComparison(dDeriv, 0.0)) {
+          continue;
+        }
+        dMinNow = dHUGE;
+        if (update[iBody].iaType[iVar][iEqn] == 2) {
+          if (iVar == update[iBody].iXobl || iVar == update[iBody].iYobl ||
+              iVar == update[iBody].iZobl) {
+            if (body[iBody].dObliquity != 0) {
+              dMinNow = fabs(sin(body[iBody].dObliquity) / dDeriv);
+            }
+          } else if (iVar == update[iBody].iHecc ||
+                     iVar == update[iBody].iKecc) {
+            if (body[iBody].dEcc != 0) {
+              dMinNow = fabs(body[iBody].dEcc / dDeriv);
+            }
+          } else {
+            dMinNow = fabs(1.0 / dDeriv);
+          }
+        } else if (!bFloatComparison(*(update[iBody].pdVar[iVar]), 0.0)) {
+          dMinNow = fabs(*(update[iBody].pdVar[iVar]) / dDeriv);
+        }
+        dMin = fmin(dMin, dMinNow);
+      }
+    }
+  }
+  return evolve->dEta * dMin;
+}
+
+size_t fiUpdateFingerprint(CONTROL *control, UPDATE *update,
+                           fnUpdateVariable ***fnUpdate) {
+  /* A hash of the derivative functions, which ForceBehavior may swap between
+   * steps. They are hashed by their distance from fndUpdateFunctionTiny, so
+   * that the hash is the same in a run restarted from a checkpoint. */
+  int iBody, iVar, iEqn;
+  size_t iHash = 14695981039346656037ULL;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        iHash = (iHash ^ (size_t)((intptr_t)fnUpdate[iBody][iVar][iEqn] -
+                                  (intptr_t)&fndUpdateFunctionTiny)) *
+                1099511628211ULL;
+      }
+    }
+  }
+  return iHash;
+}
+
+int bReuseLastStage(BODY *body, CONTROL *control, UPDATE *update,
+                    size_t iFingerprint) {
+  /* Are the derivatives of the last stage of the previous step still those at
+   * the start of this one? Not if a halt, ForceBehavior or CheckProgress
+   * changed a primary variable or derivative function since. */
+  int iBody, iVar;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (!evolve->bFSAL || iFingerprint != evolve->iFSALUpdates) {
+    return 0;
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    if (body[iBody].dAge != evolve->tmpBody[iBody].dAge) {
+      return 0;
+    }
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (!bExplicitVariable(update, iBody, iVar) &&
+          *(update[iBody].pdVar[iVar]) !=
+                *(evolve->tmpUpdate[iBody].pdVar[iVar])) {
+        return 0;
+      }
+    }
+  }
+  return 1;
+}
+
+void FirstStageDerivatives(BODY *body, CONTROL *control, SYSTEM *system,
+                           UPDATE *update, fnUpdateVariable ***fnUpdate,
+                           size_t iFingerprint, int iLastStage, int iDir) {
+  /* The derivatives at the start of the step, in stage 0: those of the last
+   * stage of the previous step if they still hold, else evaluated anew */
+  double **daFirstSameAsLast, *daStateFirstSameAsLast;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (bReuseLastStage(body, control, update, iFingerprint)) {
+    daFirstSameAsLast           = evolve->daDeriv[0];
+    evolve->daDeriv[0]          = evolve->daDeriv[iLastStage];
+    evolve->daDeriv[iLastStage] = daFirstSameAsLast;
+    daStateFirstSameAsLast           = evolve->daStateDeriv[0];
+    evolve->daStateDeriv[0]          = evolve->daStateDeriv[iLastStage];
+    evolve->daStateDeriv[iLastStage] = daStateFirstSameAsLast;
+    BodyCopy(evolve->tmpBody, body, &control->Evolve);
+  } else {
+    BodyCopy(evolve->tmpBody, body, &control->Evolve);
+    fdFirstStageTimeStep(body, control, system, update, fnUpdate);
+    StageDerivatives(control, update, 0, iDir);
+    /* A regime change swapped the equations, so the last error says nothing
+       about the next step: start over from the smallest one */
+    if (iFingerprint != evolve->iFSALUpdates) {
+      evolve->dNextDt = 0;
+    }
+  }
+}
+
+void AdaptiveDt(BODY *body, CONTROL *control, UPDATE *update, double *dDt,
+                double *dMinDt, int *bClipped) {
+  /* Choose the first dt to try, and update the typical magnitude of each
+   * variable, for the absolute tolerance. bClipped is set if the next output
+   * cut the step short. */
+  int iBody, iVar;
+  double dNextDt;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->bVarDt) {
+    /* The step is at least dEta times the shortest timescale, which is also
+       the first step, and accepted whatever its error */
+    *dMinDt   = fmax(fdMinAdaptiveDt(body, control, update),
+                     16 * DBL_EPSILON * fabs(evolve->dTime));
+    dNextDt   = fmax(evolve->dNextDt, *dMinDt);
+    *dDt      = AssignDt(dNextDt, fdTimeToOutput(control), 1);
+    *bClipped = (*dDt < dNextDt);
+  } else {
+    *dDt      = evolve->dTimeStep;
+    *bClipped = 0;
+  }
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->daErrorScale[iBody][iVar] =
+            fmax(evolve->daErrorScale[iBody][iVar],
+                 fabs(*(update[iBody].pdVar[iVar])));
+    }
+  }
+}
+
+double fdShrinkDt(double dDt, double dError, double dExponent) {
+  /* The dt to retry a step with, whose error relative to the tolerance was
+   * dError */
+  return dDt * fmax(DTMINFACTOR, DTSAFETY * pow(dError, -dExponent));
+}
+
+void NextAdaptiveDt(CONTROL *control, double dDt, double dError,
+                    double dExponent, int bClipped, int bRejected) {
+  /* Propose the dt of the next step from the error of the accepted one. The
+   * error of the lower order solution scales as dt^(1/dExponent). */
+  double dNextDt;
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (!evolve->bVarDt) {
+    return;
+  }
+  if (dError > 0) {
+    dNextDt = fmin(DTMAXFACTOR, DTSAFETY * pow(dError, -dExponent));
+    dNextDt = dDt * fmax(DTMINFACTOR, dNextDt);
+  } else {
+    dNextDt = dDt * DTMAXFACTOR;
+  }
+  // A step cut short by an output says nothing against the longer one
+  if (bClipped && !bRejected) {
+    dNextDt = fmax(dNextDt, evolve->dNextDt);
+  }
+  evolve->dNextDt = dNextDt;
+}
+
+void RungeKutta45Step(BODY *body, CONTROL *control, SYSTEM *system,
+                      UPDATE *update, fnUpdateVariable ***fnUpdate, double *dDt,
+                      int iDir) {
+  /* Compute and apply a 5th order Runge-Kutta step with an embedded 4th order
+   * error estimate (Dormand-Prince). With variable timestepping, a step whose
+   * error exceeds the tolerances is retried with a smaller dt, and the next dt
+   * is chosen from the error of this one. */
+  int iBody, iVar, iStage, bClipped, bRejected = 0;
+  double dError = 0, dMinDt = 0, dSum;
+  size_t iFingerprint;
+
+  EVOLVE *evolve = &(control->Evolve);
+
+  iFingerprint = fiUpdateFingerprint(control, update, fnUpdate);
+  FirstStageDerivatives(body, control, system, update, fnUpdate, iFingerprint,
+                        6, iDir);
+  AdaptiveDt(body, control, update, dDt, &dMinDt, &bClipped);
+
+  while (1) {
+    for (iStage = 1; iStage < 7; iStage++) {
+      RK45StageState(body, control, update, iStage, *dDt, iDir);
+      EvaluateStage(control, system, update, fnUpdate, iStage, iDir);
+    }
+
+    if (!evolve->bVarDt) {
+      break;
+    }
+    dError = fdRK45Error(control, update, *dDt);
+    if (dError <= 1 || *dDt <= dMinDt) {
+      break;
+    }
+
+    /* Rejected: shrink dt and start over. The start derivatives still hold. */
+    *dDt      = fmax(fdShrinkDt(*dDt, dError, 0.2), dMinDt);
+    bRejected = 1;
+    BodyCopy(evolve->tmpBody, body, &control->Evolve);
+  }
+
+  NextAdaptiveDt(control, *dDt, dError, 0.2, bClipped, bRejected);
+  evolve->dCurrentDt = *dDt;
+
+  /* Now do the update -- with the same arithmetic as the last stage, so that
+   * its derivatives can start the next step */
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (bExplicitVariable(update, iBody, iVar)) {
+        update[iBody].daDeriv[iVar]  = evolve->daDeriv[6][iBody][iVar];
+        *(update[iBody].pdVar[iVar]) = evolve->daDeriv[6][iBody][iVar];
+      } else {
+        dSum = 0;
+        for (iStage = 0; iStage < 6; iStage++) {
+          dSum += daRK45Coeff[6][iStage] * evolve->daDeriv[iStage][iBody][iVar];
+        }
+        update[iBody].daDeriv[iVar]  = dSum;
+        *(update[iBody].pdVar[iVar]) =
+              *(update[iBody].pdVar[iVar]) + (*dDt) * dSum;
+      }
+    }
+  }
+
+  evolve->bFSAL        = 1;
+  evolve->iFSALUpdates = iFingerprint;
+}
+
+int bJacobianDepends(UPDATE *update, int iBody, int iVar, int iBodyCol) {
+  /* May the derivatives of primary variable iVar of body iBody depend on the
+   * primary variables of body iBodyCol? Only if it is the same body, or one of
+   * the bodies of one of its processes. */
+  int iEqn, iOther;
+
+  if (iBody == iBodyCol) {
+    return 1;
+  }
+  for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+    for (iOther = 0; iOther < update[iBody].iNumBodies[iVar][iEqn]; iOther++) {
+      if (update[iBody].iaBody[iVar][iEqn][iOther] == iBodyCol) {
+        return 1;
+      }
+    }
+  }
+  return 0;
+}
+
+void InitializeJacobian(CONTROL *control, UPDATE *update) {
+  /* Number the integrated primary variables of all bodies, which are the rows
+   * and columns of the Jacobian of ROSENBROCK, and group its columns so that
+   * each group is computed from one evaluation of the derivatives: columns of
+   * different bodies on which no derivative depends together. Derived
+   * quantities (type 5) affect no derivative, so their columns are 0. */
+  int iBody, iOther, iVar, iCol, iPrev, iColor, iNumVars = 0;
+  int **bConflict;
+  EVOLVE *evolve = &(control->Evolve);
+
+  evolve->iaJacobianIndex = malloc(evolve->iNumBodies * sizeof(int *));
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->iaJacobianIndex[iBody] = malloc(update[iBody].iNumVars * sizeof(int));
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (bExplicitVariable(update, iBody, iVar)) {
+        evolve->iaJacobianIndex[iBody][iVar] = -1;
+      } else {
+        evolve->iaJacobianIndex[iBody][iVar] = iNumVars++;
+      }
+    }
+  }
+  evolve->iNumJacobianVars = iNumVars;
+
+  evolve->iaJacobianBody = malloc(iNumVars * sizeof(int));
+  evolve->iaJacobianVar  = malloc(iNumVars * sizeof(int));
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      iCol = evolve->iaJacobianIndex[iBody][iVar];
+      if (iCol >= 0) {
+        evolve->iaJacobianBody[iCol] = iBody;
+        evolve->iaJacobianVar[iCol]  = iVar;
+      }
+    }
+  }
+
+  // Two bodies conflict if a derivative may depend on both
+  bConflict = malloc(evolve->iNumBodies * sizeof(int *));
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    bConflict[iBody] = malloc(evolve->iNumBodies * sizeof(int));
+    for (iOther = 0; iOther < evolve->iNumBodies; iOther++) {
+      bConflict[iBody][iOther] = (iBody == iOther);
+    }
+  }
+  for (iCol = 0; iCol < iNumVars; iCol++) {
+    for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+      for (iOther = 0; iOther < evolve->iNumBodies; iOther++) {
+        if (bJacobianDepends(update, evolve->iaJacobianBody[iCol],
+                             evolve->iaJacobianVar[iCol], iBody) &&
+            bJacobianDepends(update, evolve->iaJacobianBody[iCol],
+                             evolve->iaJacobianVar[iCol], iOther)) {
+          bConflict[iBody][iOther] = 1;
+        }
+      }
+    }
+  }
+
+  // Greedy coloring: each column joins the first group it conflicts with none of
+  evolve->iaJacobianColor    = malloc(iNumVars * sizeof(int));
+  evolve->iNumJacobianColors = 0;
+  for (iCol = 0; iCol < iNumVars; iCol++) {
+    evolve->iaJacobianColor[iCol] = -1;
+    if (update[evolve->iaJacobianBody[iCol]]
+              .iaType[evolve->iaJacobianVar[iCol]][0] == 5) {
+      continue;
+    }
+    for (iColor = 0;; iColor++) {
+      for (iPrev = 0; iPrev < iCol; iPrev++) {
+        if (evolve->iaJacobianColor[iPrev] == iColor &&
+            bConflict[evolve->iaJacobianBody[iPrev]]
+                     [evolve->iaJacobianBody[iCol]]) {
+          break;
+        }
+      }
+      if (iPrev == iCol) {
+        break;
+      }
+    }
+    evolve->iaJacobianColor[iCol] = iColor;
+    evolve->iNumJacobianColors = fmax(evolve->iNumJacobianColors, iColor + 1);
+  }
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    free(bConflict[iBody]);
+  }
+  free(bConflict);
+
+  evolve->daJacobian        = malloc(iNumVars * sizeof(double *));
+  evolve->daIterationMatrix = malloc(iNumVars * sizeof(double *));
+  evolve->daLU              = malloc(iNumVars * sizeof(double *));
+  for (iCol = 0; iCol < iNumVars; iCol++) {
+    evolve->daJacobian[iCol]        = malloc(iNumVars * sizeof(double));
+    evolve->daIterationMatrix[iCol] = malloc(iNumVars * sizeof(double));
+    evolve->daLU[iCol]              = malloc(iNumVars * sizeof(double));
+  }
+  evolve->daLUScale   = malloc(iNumVars * sizeof(double));
+  evolve->iaLURowSwap = malloc(iNumVars * sizeof(int));
+  evolve->daTimeDeriv = malloc(iNumVars * sizeof(double));
+  evolve->daSlope     = malloc(3 * sizeof(double *));
+  for (iColor = 0; iColor < 3; iColor++) {
+    evolve->daSlope[iColor] = malloc(iNumVars * sizeof(double));
+  }
+}
+
+void RosenbrockState(BODY *body, CONTROL *control, UPDATE *update,
+                     double *daSlope, double dDt, double dAge, int iDir) {
+  /* Move the temporary bodies dAge along the step, with the integrated
+   * primary variables dDt along daSlope, or at the start if it is NULL */
+  int iBody, iCol;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->tmpBody[iBody].dAge = body[iBody].dAge + iDir * dAge;
+  }
+  for (iCol = 0; iCol < evolve->iNumJacobianVars; iCol++) {
+    iBody = evolve->iaJacobianBody[iCol];
+    if (daSlope) {
+      *(evolve->tmpUpdate[iBody].pdVar[evolve->iaJacobianVar[iCol]]) =
+            *(update[iBody].pdVar[evolve->iaJacobianVar[iCol]]) +
+            dDt * daSlope[iCol];
+    } else {
+      *(evolve->tmpUpdate[iBody].pdVar[evolve->iaJacobianVar[iCol]]) =
+            *(update[iBody].pdVar[evolve->iaJacobianVar[iCol]]);
+    }
+  }
+}
+
+double fdStageDeriv(CONTROL *control, int iStage, int iCol) {
+  /* The derivative of stage iStage of column iCol of the Jacobian */
+  return control->Evolve.daDeriv[iStage][control->Evolve.iaJacobianBody[iCol]]
+                                [control->Evolve.iaJacobianVar[iCol]];
+}
+
+double fdJacobianStep(CONTROL *control, UPDATE *update, int iCol, double dDt) {
+  /* The perturbation of a primary variable for its column of the Jacobian:
+   * JACOBIANSTEP times the larger of its typical magnitude and its change over
+   * the step, rounded so that it is exactly the change in the variable */
+  double dValue, dStep;
+  int iBody = control->Evolve.iaJacobianBody[iCol];
+  int iVar  = control->Evolve.iaJacobianVar[iCol];
+
+  dValue = *(update[iBody].pdVar[iVar]);
+  dStep  = JACOBIANSTEP *
+          fmax(fmax(fabs(dValue), control->Evolve.daErrorScale[iBody][iVar]),
+               fabs(dDt * fdStageDeriv(control, 0, iCol)));
+  if (dStep == 0) {
+    dStep = JACOBIANSTEP;
+  }
+  return (dValue + dStep) - dValue;
+}
+
+double fdJacobianEntry(CONTROL *control, int iRow, double dStep) {
+  /* The finite difference of the derivative of row iRow between stage 1, the
+   * perturbed state, and stage 2, the state at the start of the step. Some
+   * derivatives come from iterative solutions, so a difference of less than
+   * JACOBIANNOISE of the derivative is noise, not a dependence. Outside the
+   * domain of the derivatives, the term is left explicit. */
+  double dDiff, dBase;
+
+  dBase = fdStageDeriv(control, 2, iRow);
+  dDiff = fdStageDeriv(control, 1, iRow) - dBase;
+  if (!isfinite(dDiff) || fabs(dDiff) <= JACOBIANNOISE * fabs(dBase)) {
+    return 0;
+  }
+  return dDiff / dStep;
+}
+
+void RosenbrockJacobian(BODY *body, CONTROL *control, SYSTEM *system,
+                        UPDATE *update, fnUpdateVariable ***fnUpdate,
+                        double dDt, int iDir) {
+  /* Finite difference the derivatives at the start of the step with respect
+   * to the integrated primary variables and to time. The derivatives of the
+   * start go in stage 2, as those of stage 0 may be left from the last step,
+   * and each perturbed evaluation in stage 1. Some modules carry auxiliary
+   * properties from one evaluation into the next, e.g. the Fe2O3 fraction of
+   * MagmOc only ever grows, so each evaluation starts from a copy of the
+   * bodies, or the differences are mostly theirs. */
+  int iBody, iColor, iCol, iRow;
+  double dStep, dAge = 0;
+  EVOLVE *evolve = &(control->Evolve);
+
+  BodyCopy(evolve->tmpBody, body, &control->Evolve);
+  RosenbrockState(body, control, update, NULL, 0, 0, iDir);
+  EvaluateStage(control, system, update, fnUpdate, 2, iDir);
+
+  for (iColor = 0; iColor < evolve->iNumJacobianColors; iColor++) {
+    BodyCopy(evolve->tmpBody, body, &control->Evolve);
+    RosenbrockState(body, control, update, NULL, 0, 0, iDir);
+    for (iCol = 0; iCol < evolve->iNumJacobianVars; iCol++) {
+      if (evolve->iaJacobianColor[iCol] == iColor) {
+        *(evolve->tmpUpdate[evolve->iaJacobianBody[iCol]]
+                .pdVar[evolve->iaJacobianVar[iCol]]) +=
+              fdJacobianStep(control, update, iCol, dDt);
+      }
+    }
+    EvaluateStage(control, system, update, fnUpdate, 1, iDir);
+
+    for (iCol = 0; iCol < evolve->iNumJacobianVars; iCol++) {
+      if (evolve->iaJacobianColor[iCol] != iColor) {
+        continue;
+      }
+      dStep = fdJacobianStep(control, update, iCol, dDt);
+      for (iRow = 0; iRow < evolve->iNumJacobianVars; iRow++) {
+        if (bJacobianDepends(update, evolve->iaJacobianBody[iRow],
+                             evolve->iaJacobianVar[iRow],
+                             evolve->iaJacobianBody[iCol])) {
+          evolve->daJacobian[iRow][iCol] =
+                fdJacobianEntry(control, iRow, dStep);
+        } else {
+          evolve->daJacobian[iRow][iCol] = 0;
+        }
+      }
+    }
+  }
+  for (iCol = 0; iCol < evolve->iNumJacobianVars; iCol++) {
+    if (evolve->iaJacobianColor[iCol] < 0) {
+      for (iRow = 0; iRow < evolve->iNumJacobianVars; iRow++) {
+        evolve->daJacobian[iRow][iCol] = 0;
+      }
+    }
+  }
+
+  // Time, e.g. through the luminosity of a star
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    dAge = fmax(dAge, fabs(body[iBody].dAge));
+  }
+  dStep = (dAge + JACOBIANSTEP * fmax(dAge, dDt)) - dAge;
+  BodyCopy(evolve->tmpBody, body, &control->Evolve);
+  RosenbrockState(body, control, update, NULL, 0, dStep, iDir);
+  EvaluateStage(control, system, update, fnUpdate, 1, iDir);
+  for (iRow = 0; iRow < evolve->iNumJacobianVars; iRow++) {
+    evolve->daTimeDeriv[iRow] = fdJacobianEntry(control, iRow, dStep);
+  }
+}
+
+void RosenbrockExplicit(CONTROL *control) {
+  /* Zero the Jacobian and the time derivatives, which reduces the step to an
+   * explicit midpoint step */
+  int iRow, iCol;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iRow = 0; iRow < evolve->iNumJacobianVars; iRow++) {
+    for (iCol = 0; iCol < evolve->iNumJacobianVars; iCol++) {
+      evolve->daJacobian[iRow][iCol] = 0;
+    }
+    evolve->daTimeDeriv[iRow] = 0;
+  }
+}
+
+double fdRosenbrockError(CONTROL *control, UPDATE *update, double dDt) {
+  /* The largest error of a primary variable over the step, relative to the
+   * tolerance on it, from the difference of the 2nd and 3rd order solutions */
+  int iCol;
+  double dErr, dMaxErr = 0;
+  EVOLVE *evolve = &(control->Evolve);
+
+  for (iCol = 0; iCol < evolve->iNumJacobianVars; iCol++) {
+    if (evolve->iaJacobianColor[iCol] < 0) {
+      continue;
+    }
+    dErr = dDt / 6 *
+           (evolve->daSlope[0][iCol] - 2 * evolve->daSlope[1][iCol] +
+            evolve->daSlope[2][iCol]);
+    dMaxErr = fmax(dMaxErr, fdErrorRatio(control, update,
+                                         evolve->iaJacobianBody[iCol],
+                                         evolve->iaJacobianVar[iCol], dErr));
+  }
+  return dMaxErr;
+}
+
+void RosenbrockStep(BODY *body, CONTROL *control, SYSTEM *system,
+                    UPDATE *update, fnUpdateVariable ***fnUpdate, double *dDt,
+                    int iDir) {
+  /* Compute and apply a 2nd order Rosenbrock step with an embedded 3rd order
+   * error estimate (Shampine & Reichelt 1997). Each stage solves a linear
+   * system with the Jacobian of the derivatives, so the step is stable however
+   * stiff they are, and only its error limits its size, which is controlled as
+   * in RungeKutta45Step. */
+  int iBody, iVar, iRow, iCol, bClipped, bRejected = 0, bLinear = 1;
+  int iNumVars = control->Evolve.iNumJacobianVars;
+  double dError = 0, dMinDt = 0, dHD;
+  double *daK1, *daK2, *daK3, *daT;
+  size_t iFingerprint;
+
+  EVOLVE *evolve = &(control->Evolve);
+  daK1           = evolve->daSlope[0];
+  daK2           = evolve->daSlope[1];
+  daK3           = evolve->daSlope[2];
+  daT            = evolve->daTimeDeriv;
+
+  iFingerprint = fiUpdateFingerprint(control, update, fnUpdate);
+  FirstStageDerivatives(body, control, system, update, fnUpdate, iFingerprint,
+                        3, iDir);
+  AdaptiveDt(body, control, update, dDt, &dMinDt, &bClipped);
+  RosenbrockJacobian(body, control, system, update, fnUpdate, *dDt, iDir);
+  BodyCopy(evolve->tmpBody, body, &control->Evolve);
+
+  while (1) {
+    dHD = (*dDt) * dRosenbrockD;
+    for (iRow = 0; iRow < iNumVars; iRow++) {
+      for (iCol = 0; iCol < iNumVars; iCol++) {
+        evolve->daIterationMatrix[iRow][iCol] =
+              (iRow == iCol) - dHD * evolve->daJacobian[iRow][iCol];
+      }
+    }
+    LUDecomp(evolve->daIterationMatrix, evolve->daLU, evolve->daLUScale,
+             evolve->iaLURowSwap, iNumVars);
+
+    for (iRow = 0; iRow < iNumVars; iRow++) {
+      daK1[iRow] = fdStageDeriv(control, 0, iRow) + dHD * daT[iRow];
+    }
+    LUSolve(evolve->daLU, daK1, evolve->iaLURowSwap, iNumVars);
+
+    RosenbrockState(body, control, update, daK1, 0.5 * (*dDt), 0.5 * (*dDt),
+                    iDir);
+    EvaluateStage(control, system, update, fnUpdate, 2, iDir);
+    for (iRow = 0; iRow < iNumVars; iRow++) {
+      daK2[iRow] = fdStageDeriv(control, 2, iRow) - daK1[iRow];
+    }
+    LUSolve(evolve->daLU, daK2, evolve->iaLURowSwap, iNumVars);
+    for (iRow = 0; iRow < iNumVars; iRow++) {
+      daK2[iRow] += daK1[iRow];
+    }
+
+    // The 2nd order solution, whose derivatives start the next step
+    RosenbrockState(body, control, update, daK2, *dDt, *dDt, iDir);
+    EvaluateStage(control, system, update, fnUpdate, 3, iDir);
+
+    if (!evolve->bVarDt) {
+      break;
+    }
+    for (iRow = 0; iRow < iNumVars; iRow++) {
+      daK3[iRow] = fdStageDeriv(control, 3, iRow) -
+                   dRosenbrockE32 * (daK2[iRow] - fdStageDeriv(control, 2, iRow)) -
+                   2 * (daK1[iRow] - fdStageDeriv(control, 0, iRow)) +
+                   dHD * daT[iRow];
+    }
+    LUSolve(evolve->daLU, daK3, evolve->iaLURowSwap, iNumVars);
+
+    dError = fdRosenbrockError(control, update, *dDt);
+    if (dError >= dHUGE && *dDt <= dMinDt && bLinear) {
+      /* Where the derivatives are not smooth, e.g. across a switch in a
+         module, the linearization can throw the stages out of their domain.
+         With a zero Jacobian the step is explicit: retry it that way. */
+      RosenbrockExplicit(control);
+      bLinear = 0;
+      BodyCopy(evolve->tmpBody, body, &control->Evolve);
+      continue;
+    }
+    if (dError <= 1 || *dDt <= dMinDt) {
+      break;
+    }
+
+    /* Rejected: shrink dt and start over. The start derivatives and the
+       Jacobian still hold. */
+    *dDt      = fmax(fdShrinkDt(*dDt, dError, 1. / 3), dMinDt);
+    bRejected = 1;
+    BodyCopy(evolve->tmpBody, body, &control->Evolve);
+  }
+
+  NextAdaptiveDt(control, *dDt, dError, 1. / 3, bClipped, bRejected);
+  evolve->dCurrentDt = *dDt;
+
+  /* If even the smallest step failed, the derivatives are not smooth over it,
+   * e.g. a module switches off midway, and the midpoint may never get past the
+   * switch. Take the 1st order solution, which follows the derivatives at the
+   * start, as the first stage of RungeKutta4Step does. */
+  if (dError > 1) {
+    daK2 = daK1;
+  }
+
+  /* Now do the update -- with the same arithmetic as the last stage, so that
+   * its derivatives can start the next step */
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      iCol = evolve->iaJacobianIndex[iBody][iVar];
+      if (iCol < 0) {
+        update[iBody].daDeriv[iVar]  = evolve->daDeriv[3][iBody][iVar];
+        *(update[iBody].pdVar[iVar]) = evolve->daDeriv[3][iBody][iVar];
+      } else {
+        update[iBody].daDeriv[iVar]  = daK2[iCol];
+        *(update[iBody].pdVar[iVar]) =
+              *(update[iBody].pdVar[iVar]) + (*dDt) * daK2[iCol];
+      }
+    }
+  }
+
+  evolve->bFSAL        = (dError <= 1);
+  evolve->iFSALUpdates = iFingerprint;
+}
+
+/*
+ * Dense output
+ */
+
+int bDenseOutputDue(CONTROL *control, double dTime) {
+  /* Is an output due by dTime? An output that rounding leaves a hair past the
+   * end of the last step, e.g. at dStopTime, is due too. */
+  return (control->Io.dNextOutput <=
+          dTime + 16 * DBL_EPSILON * fabs(dTime));
+}
+
+void DenseOutputStart(BODY *body, CONTROL *control, UPDATE *update) {
+  /* Keep the time, the ages and the primary variables at the start of the
+   * step, which the output is interpolated from */
+  int iBody, iVar;
+  EVOLVE *evolve = &(control->Evolve);
+
+  evolve->dDenseTime = evolve->dTime;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->daDenseAge[iBody] = body[iBody].dAge;
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->daDenseStart[iBody][iVar] = *(update[iBody].pdVar[iVar]);
+    }
+  }
+}
+
+void DenseOutputEnd(BODY *body, CONTROL *control, SYSTEM *system,
+                    UPDATE *update, fnUpdateVariable ***fnUpdate, double dDt,
+                    int iDir) {
+  /* Keep the primary variables at the end of the step, before ForceBehavior
+   * changes them, and find their derivatives there: those of the last stage
+   * if it was evaluated at the end, else anew. Those at the start are in stage
+   * 0. Nothing is needed if no output falls within the step. */
+  int iBody, iVar;
+  EVOLVE *evolve = &(control->Evolve);
+
+  evolve->dDenseDt = dDt;
+  if (!bDenseOutputDue(control, evolve->dTime + dDt)) {
+    return;
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->daDenseEnd[iBody][iVar] = *(update[iBody].pdVar[iVar]);
+    }
+  }
+
+  if (evolve->iOneStep == RUNGEKUTTA45) {
+    evolve->iDenseStage = 6;
+  } else if (evolve->iOneStep == ROSENBROCK && evolve->bFSAL) {
+    evolve->iDenseStage = 3;
+  } else {
+    // Stage 1 is free between the steps of RUNGEKUTTA and ROSENBROCK
+    BodyCopy(evolve->tmpBody, body, &control->Evolve);
+    for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+      evolve->tmpBody[iBody].dAge = body[iBody].dAge + iDir * dDt;
+    }
+    EvaluateStage(control, system, update, fnUpdate, 1, iDir);
+    evolve->iDenseStage = 1;
+  }
+}
+
+void DenseOutputState(BODY *body, CONTROL *control, SYSTEM *system,
+                      UPDATE *update, fnUpdateVariable ***fnUpdate,
+                      double dTime, int iDir) {
+  /* Move the bodies to time dTime within the step. The integrated primary
+   * variables follow the cubic that matches their values and derivatives at
+   * both ends of the step, and the explicit ones are evaluated at dTime. A
+   * variable that ForceBehavior changed at the end of the step, e.g. an
+   * envelope that it keeps at 0 once it is gone, takes the value it was
+   * given, as the interpolation would undo it. */
+  int iBody, iVar, iEqn;
+  double dTheta, dSum;
+  double dStart, dEnd, dStartDeriv, dEndDeriv; // Hermite basis functions
+  EVOLVE *evolve = &(control->Evolve);
+
+  dTheta      = (dTime - evolve->dDenseTime) / evolve->dDenseDt;
+  dStart      = (1 + 2 * dTheta) * (1 - dTheta) * (1 - dTheta);
+  dEnd        = dTheta * dTheta * (3 - 2 * dTheta);
+  dStartDeriv = evolve->dDenseDt * dTheta * (1 - dTheta) * (1 - dTheta);
+  dEndDeriv   = evolve->dDenseDt * dTheta * dTheta * (dTheta - 1);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    body[iBody].dAge =
+          evolve->daDenseAge[iBody] + iDir * (dTime - evolve->dDenseTime);
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (evolve->daDenseBody[iBody][iVar] !=
+          evolve->daDenseEnd[iBody][iVar]) {
+        *(update[iBody].pdVar[iVar]) = evolve->daDenseBody[iBody][iVar];
+      } else if (!bExplicitVariable(update, iBody, iVar)) {
+        *(update[iBody].pdVar[iVar]) =
+              dStart * evolve->daDenseStart[iBody][iVar] +
+              dEnd * evolve->daDenseEnd[iBody][iVar] +
+              dStartDeriv * evolve->daDeriv[0][iBody][iVar] +
+              dEndDeriv * evolve->daDeriv[evolve->iDenseStage][iBody][iVar];
+      }
+    }
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (bExplicitVariable(update, iBody, iVar)) {
+        dSum = 0;
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          dSum += fnUpdate[iBody][iVar][iEqn](body, system,
+                                              update[iBody].iaBody[iVar][iEqn]);
+        }
+        *(update[iBody].pdVar[iVar]) = dSum;
+      }
+    }
+  }
+}
+
+void WriteDenseOutput(BODY *body, CONTROL *control, FILES *files,
+                      OUTPUT *output, SYSTEM *system, UPDATE *update,
+                      fnUpdateVariable ***fnUpdate, fnWriteOutput *fnWrite,
+                      double dEndTime, int iDir) {
+  /* Write every output that is due by dEndTime, the end of the step, at the
+   * state interpolated to its time. The bodies are then put back as they
+   * were. */
+  int iBody, iVar;
+  double dTime;
+  EVOLVE *evolve = &(control->Evolve);
+
+  dTime = evolve->dTime;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->daDenseBodyAge[iBody] = body[iBody].dAge;
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->daDenseBody[iBody][iVar] = *(update[iBody].pdVar[iVar]);
+    }
+  }
+
+  while (bDenseOutputDue(control, dEndTime)) {
+    evolve->dTime = control->Io.dNextOutput;
+    DenseOutputState(body, control, system, update, fnUpdate, evolve->dTime,
+                     iDir);
+    PropertiesAuxiliary(body, control, system, update);
+    fdGetUpdateInfo(body, control, system, update, fnUpdate);
+    WriteOutput(body, control, files, output, system, update, fnWrite,
+                evolve->dTime, control->Io.dOutputTime / evolve->nSteps);
+    control->Io.dNextOutput += control->Io.dOutputTime;
+  }
+
+  evolve->dTime = dTime;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    body[iBody].dAge = evolve->daDenseBodyAge[iBody];
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      *(update[iBody].pdVar[iVar]) = evolve->daDenseBody[iBody][iVar];
+    }
+  }
+  PropertiesAuxiliary(body, control, system, update);
+  fdGetUpdateInfo(body, control, system, update, fnUpdate);
+}
+
+void LogDerivativeEvaluations(CONTROL *control, int iNumSteps) {
+  /* Report how many times the derivatives of all bodies were evaluated, and
+   * how many of those the next step reused, see fdFirstStageTimeStep, and
+   * with bMultiRate how many times each rate class was evaluated */
+  int iClass;
+
+  if (control->Io.iVerbose >= VERBPROG && iNumSteps > 0) {
+    printf("Derivative evaluations: %ld in %d steps (%.2f per step), %ld "
+           "reused.\n",
+           control->Evolve.iNumDerivEvals, iNumSteps,
+           (double)control->Evolve.iNumDerivEvals / iNumSteps,
+           control->Evolve.iNumDerivReused);
+    for (iClass = 0; iClass < control->Evolve.iNumRateClasses; iClass++) {
+      printf("  ");
+      PrintModuleList(stdout, control->Evolve.iaRateClassModule[iClass], 0);
+      printf(": %ld evaluations.\n",
+             control->Evolve.iaRateClassEvals[iClass]);
+    }
+  }
+}
+
+/*
+ * Evolution Subroutine
+ */
+
+void FinishStep(BODY *body, CONTROL *control, SYSTEM *system,
+                UPDATE *update) {
+  /* Get auxiliary properties for next step -- first call
+     was prior to loop. */
+  PropertiesAuxiliary(body, control, system, update);
+
+  // If control->Evolve.bFirstStep hasn't been switched off by now, do so.
+  if (control->Evolve.bFirstStep) {
+    control->Evolve.bFirstStep = 0;
+  }
+
+  // Any variables reached an interesting value?
+  CheckProgress(body, control, system, update);
+}
+
+void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
+            OUTPUT *output, SYSTEM *system, UPDATE *update,
+            fnUpdateVariable ***fnUpdate, fnWriteOutput *fnWrite,
+            fnIntegrate fnOneStep) {
+  /* Master evolution routine that controls the simulation integration. */
+  int iDir, iBody, iVar, iModule, nSteps; // Dummy counting variables
+  double dDt, dFoo;                 // Next timestep, dummy variable
+  double dEqSpinRate;               // Store the equilibrium spin rate
+
+  nSteps = 0;
+
+  // No step has been taken for the adaptive methods to build on
+  control->Evolve.bFSAL          = 0;
+  control->Evolve.dNextDt        = 0;
+  control->Evolve.bUpdateCurrent = 0;
+  control->Evolve.bReuseUpdate   = 1;
+  control->Evolve.iNumDerivEvals  = 0;
+  control->Evolve.iNumDerivReused = 0;
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    if (body[iBody].bRadheat || body[iBody].bThermint) {
+      control->Evolve.bReuseUpdate = 0;
+    }
+  }
+
+  if (control->Evolve.bDoForward) {
+    iDir = 1;
+  } else {
+    iDir = -1;
+  }
+
+  PropertiesAuxiliary(body, control, system, update);
+  control->Io.dNextOutput = control->Evolve.dTime + control->Io.dOutputTime;
+  control->Evolve.dNextCheckpoint =
+        control->Evolve.dTime + control->Evolve.dCheckpointInterval;
+  control->Evolve.dLastCheckpointWall = (double)time(NULL);
+  InitializeRateClasses(control, update, fnUpdate);
+
+  // Get derivatives at start, useful for logging
+  dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
+
+
+  /* Adjust dt? */
+  if (control->Evolve.bVarDt) {
+    /* Now choose the correct timestep */
+    dDt = AssignDt(dDt, fdTimeToOutput(control), control->Evolve.dEta);
+  } else {
+    dDt = control->Evolve.dTimeStep;
+  }
+  ScheduleRateClasses(body, control, update, control->Evolve.dTime, dDt);
+
+  /* Write out initial conditions, unless they were when the run that is
+     restarted began */
+  if (files->cRestart[0] == '\0') {
+    WriteOutput(body, control, files, output, system, update, fnWrite,
+                control->Evolve.dTime, dDt);
+  }
+
+  /* If Runge-Kutta need to copy actual update to that in
+     control->Evolve. This transfer all the meta-data about the
+     struct. */
+  UpdateCopy(control->Evolve.tmpUpdate, update, control->Evolve.iNumBodies);
+  if (bRungeKutta(control)) {
+    InitializeStateVector(control, update);
+  }
+
+  if (bAdaptive(control)) {
+    for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+      for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+        /* Polar/sinusoidal quantities are components of vectors of order
+           unity, even when they pass through 0 */
+        if (update[iBody].iaType[iVar][0] == 2) {
+          control->Evolve.daErrorScale[iBody][iVar] = 1;
+        } else {
+          control->Evolve.daErrorScale[iBody][iVar] = 0;
+        }
+      }
+    }
+  }
+  if (control->Evolve.iOneStep == ROSENBROCK) {
+    InitializeJacobian(control, update);
+  }
+
+  /* Continue from the checkpoint instead of the initial conditions */
+  if (files->cRestart[0] != '\0') {
+    ReadCheckpoint(body, control, files, module, system, update, fnUpdate,
+                   &dDt, &nSteps);
+  }
+
+  /*
+   *
    * Main loop begins here
    *
    */
 
   while (control->Evolve.dTime < control->Evolve.dStopTime) {
     /* Take one step */
+    if (control->Io.bDenseOutput) {
+      DenseOutputStart(body, control, update);
+    }
     fnOneStep(body, control, system, update, fnUpdate, &dDt, iDir);
+    if (control->Io.bDenseOutput) {
+      DenseOutputEnd(body, control, system, update, fnUpdate, dDt, iDir);
+    }
 
+    RestoreFrozenVariables(control, update, fnUpdate);
     for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
       for (iModule = 0; iModule < control->Evolve.iNumModules[iBody];
            iModule++) {
@@ -669,27 +2224,62 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
               fnUpdate, iBody, iModule);
       }
     }
-
-    fdGetUpdateInfo(body, control, system, update, fnUpdate);
+    RefreezeVariables(control, update, fnUpdate);
+
+    /* Unless the auxiliary properties depend on the derivatives, as those of
+       RADHEAT and THERMINT do, they are updated before the derivatives at the
+       end of the step, which are then those of the start of the next step */
+    control->Evolve.bUpdateCurrent = 0;
+    SelectRateClasses(control, update, fnUpdate, control->Evolve.dTime + dDt);
+    if (control->Evolve.bReuseUpdate) {
+      for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+        body[iBody].dAge += iDir * dDt;
+      }
+      FinishStep(body, control, system, update);
+      fdGetUpdateInfo(body, control, system, update, fnUpdate);
+      control->Evolve.bUpdateCurrent = 1;
+    } else {
+      fdGetUpdateInfo(body, control, system, update, fnUpdate);
+    }
+    ScheduleRateClasses(body, control, update, control->Evolve.dTime + dDt,
+                        dDt);
+    FreezeVariables(control, update, fnUpdate, control->Evolve.dTime + dDt,
+                    dDt);
 
     /* Halt? */
     if (fbCheckHalt(body, control, update, fnUpdate)) {
-      fdGetUpdateInfo(body, control, system, update, fnUpdate);
+      // The outputs within the step come before the halt
+      if (control->Io.bDenseOutput &&
+          bDenseOutputDue(control, control->Evolve.dTime + dDt)) {
+        WriteDenseOutput(body, control, files, output, system, update,
+                         fnUpdate, fnWrite, control->Evolve.dTime + dDt, iDir);
+      }
       WriteOutput(body, control, files, output, system, update, fnWrite,
                   control->Evolve.dTime,
                   control->Io.dOutputTime / control->Evolve.nSteps);
+      LogDerivativeEvaluations(control, control->Evolve.nSteps + nSteps + 1);
+      RestoreFrozenVariables(control, update, fnUpdate);
       return;
     }
 
-    for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
-      body[iBody].dAge += iDir * dDt;
+    if (!control->Evolve.bReuseUpdate) {
+      for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+        body[iBody].dAge += iDir * dDt;
+      }
     }
 
     control->Evolve.dTime += dDt;
     nSteps++;
 
     /* Time for Output? */
-    if (control->Evolve.dTime >= control->Io.dNextOutput) {
+    if (control->Io.bDenseOutput) {
+      if (bDenseOutputDue(control, control->Evolve.dTime)) {
+        control->Evolve.nSteps += nSteps;
+        WriteDenseOutput(body, control, files, output, system, update,
+                         fnUpdate, fnWrite, control->Evolve.dTime, iDir);
+        nSteps = 0;
+      }
+    } else if (control->Evolve.dTime >= control->Io.dNextOutput) {
       control->Evolve.nSteps += nSteps;
       WriteOutput(body, control, files, output, system, update, fnWrite,
                   control->Evolve.dTime,
@@ -700,21 +2290,21 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
       nSteps = 0;
     }
 
-    /* Get auxiliary properties for next step -- first call
-       was prior to loop. */
-    PropertiesAuxiliary(body, control, system, update);
-
-    // If control->Evolve.bFirstStep hasn't been switched off by now, do so.
-    if (control->Evolve.bFirstStep) {
-      control->Evolve.bFirstStep = 0;
+    if (!control->Evolve.bReuseUpdate) {
+      FinishStep(body, control, system, update);
     }
 
-    // Any variables reached an interesting value?
-    CheckProgress(body, control, system, update);
+    if (bCheckpointDue(control)) {
+      WriteCheckpoint(body, control, files, module, system, update, fnUpdate,
+                      dDt, nSteps);
+    }
   }
 
   if (control->Io.iVerbose >= VERBPROG) {
     printf("Evolution completed.\n");
   }
+  LogDerivativeEvaluations(control, control->Evolve.nSteps + nSteps);
+  // The final log reports the derivatives of the modules
+  RestoreFrozenVariables(control, update, fnUpdate);
   //     printf("%d\n",body[1].iBadImpulse);
 }
@@ -13,17 +13,51 @@
 /* 0 => Not input by user, verify assigns default */
 #define EULER 1
 #define RUNGEKUTTA 2
+#define RUNGEKUTTA45 3
+#define ROSENBROCK 4
+
+/* Step size control for RUNGEKUTTA45 and ROSENBROCK */
+#define DTSAFETY 0.9   /**< Fraction of the optimal step that is taken */
+#define DTMINFACTOR 0.2 /**< Most a step may shrink by */
+#define DTMAXFACTOR 5.0 /**< Most a step may grow by */
+
+/* Finite difference Jacobian of ROSENBROCK */
+#define JACOBIANSTEP 1e-6  /**< Relative perturbation of a variable */
+#define JACOBIANNOISE 1e-7 /**< Relative change of a derivative that is noise */
 
 /* @cond DOXYGEN_OVERRIDE */
 
+int bRungeKutta(CONTROL *);
+int fiNumStages(CONTROL *);
 void PropertiesAuxiliary(BODY *, CONTROL *, SYSTEM *, UPDATE *);
 void fdGetUpdateInfo(BODY *, CONTROL *, SYSTEM *, UPDATE *,
                      fnUpdateVariable ***);
+int bTimeStepEquation(CONTROL *, UPDATE *, int, int, int);
+void EvaluateEquations(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                       fnUpdateVariable ***, int);
 double fdGetTimeStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
                      fnUpdateVariable ***);
+double fdFirstStageTimeStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                            fnUpdateVariable ***);
+double fdMinTimeScale(BODY *, CONTROL *, UPDATE *);
+double fdEquationTimeScale(BODY *, UPDATE *, int, int, int);
+void LogDerivativeEvaluations(CONTROL *, int);
+int bRateClassEquation(UPDATE *, int, int, int);
+void InitializeRateClasses(CONTROL *, UPDATE *, fnUpdateVariable ***);
+void SelectRateClasses(CONTROL *, UPDATE *, fnUpdateVariable ***, double);
+void ScheduleRateClasses(BODY *, CONTROL *, UPDATE *, double, double);
+int bFreezableVariable(UPDATE *, fnUpdateVariable ***, int, int);
+void FreezeVariable(CONTROL *, UPDATE *, fnUpdateVariable ***, int, int,
+                    double);
+void ThawVariable(CONTROL *, UPDATE *, fnUpdateVariable ***, int, int);
+void RestoreFrozenVariables(CONTROL *, UPDATE *, fnUpdateVariable ***);
+void RefreezeVariables(CONTROL *, UPDATE *, fnUpdateVariable ***);
+void FreezeVariables(CONTROL *, UPDATE *, fnUpdateVariable ***, double,
+                     double);
 void CalculateDerivatives(BODY *, SYSTEM *, UPDATE *, fnUpdateVariable ***,
                           int);
 
+void FinishStep(BODY *, CONTROL *, SYSTEM *, UPDATE *);
 void Evolve(BODY *, CONTROL *, FILES *, MODULE *, OUTPUT *, SYSTEM *, UPDATE *,
             fnUpdateVariable ***, fnWriteOutput *, fnIntegrate);
 
@@ -33,4 +67,50 @@ void EulerStep(BODY *, CONTROL *, SYSTEM *, UPDATE *, fnUpdateVariable ***,
 void RungeKutta4Step(BODY *, CONTROL *, SYSTEM *, UPDATE *,
                      fnUpdateVariable ***, double *, int);
 
+int bAdaptive(CONTROL *);
+int bExplicitVariable(UPDATE *, int, int);
+void InitializeStateVector(CONTROL *, UPDATE *);
+void StageDerivatives(CONTROL *, UPDATE *, int, int);
+void StageExplicitVariables(CONTROL *, SYSTEM *, UPDATE *,
+                            fnUpdateVariable ***);
+void EvaluateStage(CONTROL *, SYSTEM *, UPDATE *, fnUpdateVariable ***, int,
+                   int);
+void RK45StageState(BODY *, CONTROL *, UPDATE *, int, double, int);
+double fdErrorRatio(CONTROL *, UPDATE *, int, int, double);
+double fdRK45Error(CONTROL *, UPDATE *, double);
+double fdMinAdaptiveDt(BODY *, CONTROL *, UPDATE *);
+size_t fiUpdateFingerprint(CONTROL *, UPDATE *, fnUpdateVariable ***);
+int bReuseLastStage(BODY *, CONTROL *, UPDATE *, size_t);
+void FirstStageDerivatives(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                           fnUpdateVariable ***, size_t, int, int);
+void AdaptiveDt(BODY *, CONTROL *, UPDATE *, double *, double *, int *);
+double fdShrinkDt(double, double, double);
+void NextAdaptiveDt(CONTROL *, double, double, double, int, int);
+void RungeKutta45Step(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                      fnUpdateVariable ***, double *, int);
+
+int bJacobianDepends(UPDATE *, int, int, int);
+void InitializeJacobian(CONTROL *, UPDATE *);
+void RosenbrockState(BODY *, CONTROL *, UPDATE *, double *, double, double,
+                     int);
+double fdStageDeriv(CONTROL *, int, int);
+double fdJacobianStep(CONTROL *, UPDATE *, int, double);
+double fdJacobianEntry(CONTROL *, int, double);
+void RosenbrockJacobian(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                        fnUpdateVariable ***, double, int);
+void RosenbrockExplicit(CONTROL *);
+double fdRosenbrockError(CONTROL *, UPDATE *, double);
+void RosenbrockStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                    fnUpdateVariable ***, double *, int);
+
+double fdTimeToOutput(CONTROL *);
+int bDenseOutputDue(CONTROL *, double);
+void DenseOutputStart(BODY *, CONTROL *, UPDATE *);
+void DenseOutputEnd(BODY *, CONTROL *, SYSTEM *, UPDATE *, fnUpdateVariable ***,
+                    double, int);
+void DenseOutputState(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                      fnUpdateVariable ***, double, int);
+void WriteDenseOutput(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *, UPDATE *,
+                      fnUpdateVariable ***, fnWriteOutput *, double, int);
+
 /* @endcond */
@@ -960,7 +960,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
               options[OPT_GALACTIDES].cName, options[OPT_HOSTBINARY].cName,
               cFile);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
   if (body[iBody].bHostBinary) {
     if (control->Evolve.iNumBodies != 3) {
@@ -970,7 +970,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
               "ERROR: %s can only be used with exactly 3 bodies in GalHabit\n",
               options[OPT_HOSTBINARY].cName);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
     if (body[1].bHostBinary == 1 && body[2].bHostBinary == 0) {
       if (iVerbose >= VERBERR) {
@@ -979,7 +979,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
                 "GalHabit\n",
                 options[OPT_HOSTBINARY].cName);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else if (body[1].bHostBinary == 0 && body[2].bHostBinary == 1) {
       if (iVerbose >= VERBERR) {
         fprintf(stderr,
@@ -987,7 +987,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
                 "GalHabit\n",
                 options[OPT_HOSTBINARY].cName);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
   if (body[iBody].bGalacTides) {
@@ -1079,7 +1079,7 @@ void VerifyGalHabit(BODY *body, CONTROL *control, FILES *files,
   char cOut[3 * NAMELEN];
   FILE *fOut;
 
-  srand(system->iSeed);
+  SeedRandom(system->iSeed);
 
   VerifyTidesBinary(body, control, options, files->Infile[iBody + 1].cIn, iBody,
                     control->Io.iVerbose);
@@ -1163,7 +1163,8 @@ void VerifyGalHabit(BODY *body, CONTROL *control, FILES *files,
   }
 
   if (iBody >= 1) {
-    if (system->bOutputEnc) {
+    /* A restart appends to the encounters of the run it continues */
+    if (system->bOutputEnc && files->cRestart[0] == '\0') {
       sprintf(cOut, "%s.%s.Encounters", system->cName, body[iBody].cName);
       fOut = fopen(cOut, "w");
       fprintf(fOut,
@@ -1825,6 +1826,7 @@ void AddModuleGalHabit(CONTROL *control, MODULE *module, int iBody,
 
   module->fnCountHalts[iBody][iModule] = &CountHaltsGalHabit;
   module->fnLogBody[iBody][iModule]    = &LogBodyGalHabit;
+  module->fnCheckpoint[iBody][iModule] = &CheckpointGalHabit;
 
   module->fnReadOptions[iBody][iModule]       = &ReadOptionsGalHabit;
   module->fnVerify[iBody][iModule]            = &VerifyGalHabit;
@@ -2176,6 +2178,76 @@ void ForceBehaviorGalHabit(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
   }
 }
 
+void CheckpointGalHabit(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                        CHECKPOINT *ckpt, int iBody) {
+  /* The galactic environment, the last and next stellar encounters, and the
+     random number generator that draws them belong to the system, so the
+     first body carries them. */
+  char cOut[3 * NAMELEN];
+
+  if (iBody < 1) {
+    return;
+  }
+  if (iBody == 1) {
+    CheckpointRandom(ckpt);
+    CheckpointInts(ckpt, &system->bRadialMigr, 1);
+    CheckpointDoubles(ckpt, &system->dScalingFTot, 1);
+    CheckpointDoubles(ckpt, &system->dScalingFStars, 1);
+    CheckpointDoubles(ckpt, &system->dScalingFVelDisp, 1);
+    CheckpointDoubles(ckpt, &system->dEncounterRate, 1);
+    CheckpointDoubles(ckpt, system->daEncounterRateMV, 13);
+    CheckpointDoubles(ckpt, &system->dNextEncT, 1);
+    CheckpointDoubles(ckpt, &system->dLastEncTime, 1);
+    CheckpointDoubles(ckpt, &system->dCloseEncTime, 1);
+    CheckpointDoubles(ckpt, &system->dDeltaTEnc, 1);
+    CheckpointDoubles(ckpt, &system->dEncDT, 1);
+    CheckpointDoubles(ckpt, &system->dTStart, 1);
+    CheckpointInts(ckpt, &system->iNEncounters, 1);
+    CheckpointDoubles(ckpt, &system->dPassingStarMagV, 1);
+    CheckpointDoubles(ckpt, &system->dPassingStarMass, 1);
+    CheckpointDoubles(ckpt, &system->dPassingStarSigma, 1);
+    CheckpointDoubles(ckpt, &system->dPassingStarVRad, 1);
+    CheckpointDoubles(ckpt, &system->dPassingStarRMag, 1);
+    CheckpointDoubles(ckpt, system->daPassingStarR, 3);
+    CheckpointDoubles(ckpt, system->daPassingStarV, 3);
+    CheckpointDoubles(ckpt, system->daPassingStarImpact, 3);
+    CheckpointDoubles(ckpt, &system->dHostApexVelMag, 1);
+    CheckpointDoubles(ckpt, system->daHostApexVel, 3);
+    CheckpointDoubles(ckpt, &system->dRelativeVelMag, 1);
+    CheckpointDoubles(ckpt, &system->dRelativeVelRad, 1);
+    CheckpointDoubles(ckpt, system->daRelativeVel, 3);
+    CheckpointDoubles(ckpt, system->daRelativePos, 3);
+  }
+
+  /* Encounters kick the orbit outside of the primary variables */
+  CheckpointInts(ckpt, &body[iBody].iBadImpulse, 1);
+  CheckpointInts(ckpt, &body[iBody].iDisrupt, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dSemi, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dMeanMotion, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dEcc, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dEccX, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dEccY, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dEccZ, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dAngMX, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dAngMY, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dAngMZ, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dInc, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dSinc, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dArgP, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dLongA, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dLongP, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dEccA, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dMeanA, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dPeriQ, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dCosArgP, 1);
+  CheckpointDoubles(ckpt, body[iBody].daRelativeImpact, 3);
+  CheckpointDoubles(ckpt, body[iBody].daRelativeVel, 3);
+  if (system->bOutputEnc) {
+    sprintf(cOut, "%s.%s.Encounters", system->cName, body[iBody].cName);
+    CheckpointFileSize(ckpt, cOut);
+  }
+}
+
 void Rot2Bin(BODY *body, int iBody) {
   double sinw, cosw;
 
@@ -2287,27 +2359,88 @@ int fniCheck_disrupt(BODY *body, SYSTEM *system, int iBody) {
   }
 }
 
+/* Random numbers come from a generator that belongs to the run's thread, so
+   that runs in different threads neither share nor disturb each other's
+   sequence. It is the additive feedback generator behind the GNU C library's
+   rand(), so a given iSeed still yields the same numbers as it did on Linux
+   (and now yields them on every platform). */
+static THREADLOCAL unsigned int uaRandState[RANDDEGREE];
+static THREADLOCAL int iRandFront = RANDSEP;
+static THREADLOCAL int iRandRear  = 0;
+
+void SeedRandom(int iSeed) {
+  int i;
+  long iWord, iHi, iLo;
+
+  if (iSeed == 0) {
+    iSeed = 1;
+  }
+  uaRandState[0] = (unsigned int)iSeed;
+  iWord          = iSeed;
+  for (i = 1; i < RANDDEGREE; i++) {
+    // 16807 * iWord % 2147483647 without overflowing 31 bits
+    iHi   = iWord / 127773;
+    iLo   = iWord % 127773;
+    iWord = 16807 * iLo - 2836 * iHi;
+    if (iWord < 0) {
+      iWord += 2147483647;
+    }
+    uaRandState[i] = (unsigned int)iWord;
+  }
+  iRandFront = RANDSEP;
+  iRandRear  = 0;
+
+  // Discard the first values, which still remember the seed
+  for (i = 0; i < 10 * RANDDEGREE; i++) {
+    fiRandom();
+  }
+}
+
+/* Uniform on [0, RANDMAX], like rand() */
+int fiRandom() {
+  unsigned int uValue;
+
+  uaRandState[iRandFront] += uaRandState[iRandRear];
+  uValue = uaRandState[iRandFront];
+  iRandFront++;
+  iRandRear++;
+  if (iRandFront >= RANDDEGREE) {
+    iRandFront = 0;
+  } else if (iRandRear >= RANDDEGREE) {
+    iRandRear = 0;
+  }
+
+  return (int)(uValue >> 1);
+}
+
+/* The generator's state, which restarting from a checkpoint must continue */
+void CheckpointRandom(CHECKPOINT *ckpt) {
+  CheckpointData(ckpt, uaRandState, sizeof(unsigned int), RANDDEGREE);
+  CheckpointInts(ckpt, &iRandFront, 1);
+  CheckpointInts(ckpt, &iRandRear, 1);
+}
+
 double fndRandom_double() {
   double n;
 
-  n = (double)rand() / RAND_MAX;
+  n = (double)fiRandom() / RANDMAX;
   return n;
 }
 
 int fniRandom_int(int n) {
-  if ((n - 1) == RAND_MAX) {
-    return rand();
+  if ((n - 1) == RANDMAX) {
+    return fiRandom();
   } else {
     // Chop off all of the values that would cause skew...
-    long end = RAND_MAX / n; // truncate skew
+    long end = RANDMAX / n; // truncate skew
     assert(end > 0L);
     end *= n;
 
-    // ... and ignore results from rand() that fall above that limit.
+    // ... and ignore results from fiRandom() that fall above that limit.
     // (Worst case the loop condition should succeed 50% of the time,
     // so we can expect to bail out of this loop pretty quickly.)
     int r;
-    while ((r = rand()) >= end) {
+    while ((r = fiRandom()) >= end) {
       ;
     }
 
@@ -2414,7 +2547,7 @@ double fndMag2mass(double dMagV) {
     dlogMass = log10(4.0); // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:fndMag2mass.\n");
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 
   return pow(10.0, dlogMass);
@@ -2511,7 +2644,7 @@ void VelocityDisp(SYSTEM *system) {
     dSigma = 41.0; // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:VelocityDisp.\n");
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 
   system->dPassingStarSigma = system->dScalingFVelDisp * dSigma;
@@ -2550,7 +2683,7 @@ void VelocityApex(SYSTEM *system) {
     dVel = 21.0; // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:VelocityApex.\n");
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 
   dVel *= 1000.0;
@@ -2627,7 +2760,7 @@ double fndNearbyStarDist(double dMagV) {
     dNs = 0.43; // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:fndNearbyStarDist.\n");
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 
 
@@ -2666,7 +2799,7 @@ double fndNearbyStarFrEnc(SYSTEM *system, double dMagV) {
   } else {
     fprintf(stderr,
             "ERROR: Unknown object in galhabit.c:fndNearbyStarFrEnc.\n");
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 
   return dFs;
@@ -65,6 +65,11 @@
 #define OUT_DLONGADTGALHTIDAL 2252
 #define OUT_DARGPDTGALHTIDAL 2253
 
+/* Random number generator */
+#define RANDDEGREE 31       /* Number of words of generator state */
+#define RANDSEP 3           /* Separation of the words that are added */
+#define RANDMAX 2147483647  /* Largest value returned by fiRandom */
+
 /* @cond DOXYGEN_OVERRIDE */
 
 void AddModuleGalHabit(CONTROL *, MODULE *, int, int);
@@ -128,6 +133,10 @@ void LogBodyGalHabit(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
 void PropsAuxGalHabit(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void ForceBehaviorGalHabit(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *, UPDATE *,
                            fnUpdateVariable ***, int, int);
+void CheckpointGalHabit(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *, int);
+void SeedRandom(int);
+int fiRandom();
+void CheckpointRandom(CHECKPOINT *);
 double fndRandom_double();
 void testrand(SYSTEM *);
 double fndNearbyStarDist(double);
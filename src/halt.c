@@ -282,7 +282,7 @@ void VerifyHalts(BODY *body, CONTROL *control, MODULE *module,
               "maximum value for the eccentricity of all non-primary body will "
               "be MAXECCDISTORB\n.",
               options[OPT_HALTMAXECC].cName, iNumMaxEcc);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
 
     // Now add 1 to each iNumHalts
@@ -298,7 +298,7 @@ void VerifyHalts(BODY *body, CONTROL *control, MODULE *module,
       fprintf(stderr,
               "ERROR: %s set, but only 1 body present.\n",
               options[OPT_HALTMAXMUTUALINC].cName);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 
@@ -255,7 +255,8 @@ void InitializeModule(BODY *body, CONTROL *control, MODULE *module) {
         malloc(iNumBodies * sizeof(fnFinalizeUpdateCO2MassSolModule));
 
   // Function Pointer Matrices
-  module->fnLogBody = malloc(iNumBodies * sizeof(fnLogBodyModule *));
+  module->fnLogBody    = malloc(iNumBodies * sizeof(fnLogBodyModule *));
+  module->fnCheckpoint = malloc(iNumBodies * sizeof(fnCheckpointModule *));
   module->fnInitializeBody =
         malloc(iNumBodies * sizeof(fnInitializeBodyModule *));
   module->fnInitializeControl =
@@ -335,6 +336,8 @@ void FinalizeModule(BODY *body, CONTROL *control, MODULE *module, int iBody) {
   module->iaModule[iBody]         = malloc(iNumModules * sizeof(int));
 
   module->fnLogBody[iBody] = malloc(iNumModules * sizeof(fnLogBodyModule));
+  module->fnCheckpoint[iBody] =
+        malloc(iNumModules * sizeof(fnCheckpointModule));
   module->fnInitializeControl[iBody] =
         malloc(iNumModules * sizeof(fnInitializeControlModule));
   module->fnInitializeOutput[iBody] =
@@ -510,6 +513,7 @@ void FinalizeModule(BODY *body, CONTROL *control, MODULE *module, int iBody) {
     module->fnInitializeUpdateTmpBody[iBody][iModule] =
           &InitializeUpdateTmpBodyNULL;
     module->fnInitializeBody[iBody][iModule] = &InitializeBodyNULL;
+    module->fnCheckpoint[iBody][iModule]     = &CheckpointNULL;
 
     module->fnFinalizeUpdate26AlNumCore[iBody][iModule]   = &FinalizeUpdateNULL;
     module->fnFinalizeUpdate26AlNumMan[iBody][iModule]    = &FinalizeUpdateNULL;
@@ -944,7 +948,7 @@ void VerifyModuleMultiDistOrbDistRot(BODY *body, UPDATE *update,
                 "ERROR: Module DISTROT selected for %s, but DISTORB not "
                 "selected and bReadOrbitData = 0.\n",
                 body[iBody].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     } else {
       if (body[iBody].bReadOrbitData) {
@@ -952,7 +956,7 @@ void VerifyModuleMultiDistOrbDistRot(BODY *body, UPDATE *update,
                 "ERROR: Cannot set both DISTORB and bReadOrbitData for body "
                 "%s.\n",
                 body[iBody].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     }
   }
@@ -967,7 +971,7 @@ void VerifyModuleMultiEqtideDistRot(BODY *body, UPDATE *update,
       fprintf(stderr,
               "ERROR: Cannot set both EQTIDE and bReadOrbitData for body %s.\n",
               body[iBody].cName);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
 
     control->fnPropsAuxMulti[iBody][(*iModuleProps)++] = &PropsAuxEqtideDistRot;
@@ -992,10 +996,9 @@ void VerifyModuleMultiRadheatThermint(BODY *body, UPDATE *update,
       body[iBody].dRadPowerCore  = 0.;
       body[iBody].dRadPowerCrust = 0.;
       body[iBody].dRadPowerMan   = 0.;
-    } else {
-      control->fnPropsAuxMulti[iBody][(*iModuleProps)++] =
-            &PropsAuxRadheatThermint;
     }
+    /* Otherwise the radiogenic powers that thermint reads are those that
+       fvPropsAuxRadheat sets, which always runs before thermint's. */
   }
 }
 
@@ -1080,7 +1083,7 @@ void VerifyModuleMultiEqtideStellar(BODY *body, UPDATE *update,
                   "and 1 for a binary system!\n",
                   iBody);
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
 
       // If you're using stellar and eqtide and this isn't the primary body, it
@@ -1090,7 +1093,7 @@ void VerifyModuleMultiEqtideStellar(BODY *body, UPDATE *update,
           fprintf(stderr, "ERROR: If both stellar AND eqtide are set and iBody "
                           "> 0, MUST set iBodyType == 1 for stars\n");
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
 
       // Can't have any ocean, envelope tidal parameters set
@@ -1109,28 +1112,28 @@ void VerifyModuleMultiEqtideStellar(BODY *body, UPDATE *update,
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_TIDALQOCEAN].cName);
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
       if (options[OPT_K2OCEAN].iLine[iBody + 1] > -1) {
         if (control->Io.iVerbose >= VERBINPUT) {
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_K2OCEAN].cName);
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
       if (options[OPT_TIDALQENV].iLine[iBody + 1] > -1) {
         if (control->Io.iVerbose >= VERBINPUT) {
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_TIDALQENV].cName);
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
       if (options[OPT_K2ENV].iLine[iBody + 1] > -1) {
         if (control->Io.iVerbose >= VERBINPUT) {
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_K2ENV].cName);
         }
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
 
       // ALl the options are ok! Add in the necessary AuxProps
@@ -1204,19 +1207,19 @@ void VerifyModuleMultiAtmescEqtide(BODY *body, UPDATE *update, CONTROL *control,
         if (!(options[OPT_TIDALQENV].iLine[iBody + 1] > -1)) {
           fprintf(stderr, "ERROR: if bEnvTides == 1, must specify %s.\n",
                   options[OPT_TIDALQENV].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
         // k2env not set
         else if (!(options[OPT_K2ENV].iLine[iBody + 1] > -1)) {
           fprintf(stderr, "ERROR: if bEnvTides == 1, must specify %s.\n",
                   options[OPT_K2ENV].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
         // envmass not set
         else if (!(options[OPT_ENVELOPEMASS].iLine[iBody + 1] > -1)) {
           fprintf(stderr, "ERROR: if bEnvTides == 1, must specify %s.\n",
                   options[OPT_ENVELOPEMASS].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
       }
 
@@ -1227,16 +1230,16 @@ void VerifyModuleMultiAtmescEqtide(BODY *body, UPDATE *update, CONTROL *control,
           fprintf(stderr, "ERROR: if %s == 1, must specify %s.\n",
                   options[OPT_OCEANTIDES].cName,
                   options[OPT_TIDALQOCEAN].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         } else if (options[OPT_SURFACEWATERMASS].iLine[iBody + 1] == -1) {
           fprintf(stderr, "ERROR: if %s == 1, must specify %s.\n",
                   options[OPT_OCEANTIDES].cName,
                   options[OPT_SURFACEWATERMASS].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         } else if (options[OPT_K2OCEAN].iLine[iBody + 1] == -1) {
           fprintf(stderr, "ERROR: if %s == 1, must specify %s.\n",
                   options[OPT_OCEANTIDES].cName, options[OPT_K2OCEAN].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
       }
       // now lets check there's actually an envelope
@@ -1322,7 +1325,7 @@ body[iBody].dTidalQOcean;
               (options[OPT_TIDALRADIUS].iLine[iBody + 1] > -1))) {
           fprintf(stderr, "ERROR: if bTidalRadius == 1, must set %s.\n",
                   options[OPT_TIDALRADIUS].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
       }
 
@@ -1339,7 +1342,7 @@ body[iBody].dTidalQOcean;
                   "not set!\n",
                   options[OPT_RADIUS].cName,
                   options[OPT_PLANETRADIUSMODEL].cName);
-          exit(EXIT_INPUT);
+          ExitVplanet(EXIT_INPUT);
         }
 
         // If dTidalRadius set, warn user since it's not considered
@@ -1377,7 +1380,7 @@ body[iBody].dTidalQOcean;
           !(options[OPT_MASSRAD].iLine[iBody + 1] > -1)) {
         fprintf(stderr, "ERROR: Using EQTIDE but neither %s or %s is set!\n",
                 options[OPT_RADIUS].cName, options[OPT_MASSRAD].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
 
       // If dTidalRadius or bUseTidalRadius set, ignore and warn user as they do
@@ -1425,7 +1428,7 @@ void VerifyModuleMultiAtmescEqtideThermint(BODY *body, UPDATE *update,
                       options[OPT_TIDALQENV].cName, options[OPT_K2ENV].cName);
               fprintf(stderr, "Must both be set when using EQTIDE, THERMINT "
                               "and ATMESC with bEnvTides == True.\n");
-              exit(EXIT_INPUT);
+              ExitVplanet(EXIT_INPUT);
             }
 
             // Otherwise, we're good! set ImK2 for the envelope component
@@ -1439,7 +1442,7 @@ void VerifyModuleMultiAtmescEqtideThermint(BODY *body, UPDATE *update,
               if (control->Io.iVerbose >= VERBINPUT) {
                 fprintf(stderr, "ERROR: %s or %s set, but bEnvTides == 0.\n",
                         options[OPT_TIDALQENV].cName, options[OPT_K2ENV].cName);
-                exit(EXIT_INPUT);
+                ExitVplanet(EXIT_INPUT);
               }
             }
 
@@ -1469,7 +1472,7 @@ void VerifyModuleMultiAtmescEqtideThermint(BODY *body, UPDATE *update,
             if (control->Io.iVerbose >= VERBINPUT) {
               fprintf(stderr, "ERROR: %s or %s set, but bOceanTides == 0.\n",
                       options[OPT_TIDALQENV].cName, options[OPT_K2ENV].cName);
-              exit(EXIT_INPUT);
+              ExitVplanet(EXIT_INPUT);
             }
           }
 
@@ -1845,13 +1848,6 @@ void PropsAuxEqtideThermint(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
   body[iBody].dImK2 = fdImK2Total(body, iBody);
 }
 
-void PropsAuxRadheatThermint(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
-                             int iBody) {
-  body[iBody].dRadPowerCore  = fdRadPowerCore(update, iBody);
-  body[iBody].dRadPowerCrust = fdRadPowerCrust(update, iBody);
-  body[iBody].dRadPowerMan   = fdRadPowerMan(update, iBody);
-}
-
 void PropsAuxEqtideDistorb(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
                            int iBody) {
   body[iBody].dEccSq = body[iBody].dHecc * body[iBody].dHecc +
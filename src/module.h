@@ -42,7 +42,6 @@ void NullEqtideStellarDerivatives(BODY *, EVOLVE *, UPDATE *,
 void PropsAuxEqtideThermint(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void PropsAuxAtmescEqtideThermint(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void PropsAuxDistOrbDistRot(BODY *, EVOLVE *, IO *, UPDATE *, int);
-void PropsAuxRadheatThermint(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void PropsAuxFlareStellar(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void PropsAuxAtmescEqtide(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void PropsAuxEqtideDistorb(BODY *, EVOLVE *, IO *, UPDATE *, int);
@@ -27,10 +27,6 @@ void NotPrimaryInput(int iFile, char cName[], char cFile[], int iLine,
   }
 }
 
-/* Returns the line with the desiried options AND asserts no duplicate
-   entries. cLine is the entire text of the line, iLine is the line
-   number. */
-
 /* Is the first non-white space a #? I so, return 1 */
 int CheckComment(char cLine[], int iLen) {
   int iPos;
@@ -48,88 +44,258 @@ int CheckComment(char cLine[], int iLen) {
   return 0;
 }
 
-void GetLine(char cFile[], char cOption[], char cLine[], int *iLine,
-             int iVerbose) {
-  int iLen, bDone = 0, iLineTmp = 0;
-  char cWord[OPTLEN], cTmp[LINE];
+/*
+ * Input Tables
+ *
+ * Each input file is read from disk once, the first time any option is
+ * requested from it. Its lines are stored in an INPUTTABLE, along with a
+ * hash table (open addressing) keyed by the first word of every line that
+ * is not a comment. Option lookups are then a hash probe instead of a pass
+ * through the file. The tables are freed at the end of ReadOptions. Like
+ * the rest of the run's state, they belong to the thread doing the run.
+ *
+ * An input file may also be given to main_impl as text in memory, in which
+ * case nothing is read from disk. Either way, the file's name is what
+ * appears in error messages.
+ */
+
+static THREADLOCAL INPUTTABLE saInputTable[MAXFILES];
+static THREADLOCAL int iNumInputTables = 0;
+
+/* djb2 string hash */
+unsigned int fuHashWord(char cWord[]) {
+  unsigned int uHash = 5381;
+  int iPos;
+
+  for (iPos = 0; cWord[iPos] != '\0'; iPos++) {
+    uHash = ((uHash << 5) + uHash) + (unsigned char)cWord[iPos];
+  }
+  return uHash;
+}
+
+/* Return the bucket that holds cWord, or the empty bucket where it belongs */
+int fiInputTableBucket(INPUTTABLE *table, char cWord[]) {
+  int iBucket;
+
+  iBucket = fuHashWord(cWord) & (table->iNumBuckets - 1);
+  while (table->iaLine[iBucket] >= 0 &&
+         strcmp(table->saKey[iBucket], cWord) != 0) {
+    iBucket = (iBucket + 1) & (table->iNumBuckets - 1);
+  }
+  return iBucket;
+}
+
+/* Like fgets, but the line is read from the text at *pcText, which is then
+   advanced to the start of the next line. */
+char *sGetTextLine(char cLine[], int iSize, const char **pcText) {
+  int iPos = 0;
+
+  if (**pcText == '\0') {
+    return NULL;
+  }
+  while (iPos < iSize - 1 && (*pcText)[iPos] != '\0') {
+    cLine[iPos] = (*pcText)[iPos];
+    iPos++;
+    if (cLine[iPos - 1] == '\n') {
+      break;
+    }
+  }
+  cLine[iPos] = '\0';
+  *pcText += iPos;
+
+  return cLine;
+}
+
+/* Return the text of cFile: as given to main_impl if it is an input file in
+   memory, else read from disk into *cBuffer, which the caller frees. */
+const char *sInputText(char cFile[], char **cBuffer) {
+  const char *cText;
   FILE *fp;
+  long lSize;
 
-  iLen = strlen(cOption);
+  *cBuffer = NULL;
+  cText    = MemoryInputText(cFile);
+  if (cText != NULL) {
+    return cText;
+  }
 
   fp = fopen(cFile, "r");
-  memset(cLine, '\0', LINE);
-  memset(cTmp, '\0', LINE);
-  memset(cWord, '\0', OPTLEN);
+  if (fp == NULL) {
+    fprintf(stderr, "Unable to open %s.\n", cFile);
+    ExitVplanet(EXIT_INPUT);
+  }
+  fseek(fp, 0, SEEK_END);
+  lSize = ftell(fp);
+  rewind(fp);
+  *cBuffer = malloc(lSize + 1);
+  lSize    = fread(*cBuffer, 1, lSize, fp);
+  (*cBuffer)[lSize] = '\0';
+  fclose(fp);
 
-  while (fgets(cTmp, LINE, fp) != NULL) {
-    if (!CheckComment(cTmp, LINE)) {
-      sscanf(cTmp, "%s", cWord);
-      if (memcmp(cWord, cOption, iLen + 1) == 0) {
-        /* Parameter Found! */
-        if (bDone) {
-          if (iVerbose > VERBINPUT) {
-            fprintf(stderr, "Multiple occurences of parameter %s found.\n",
-                    cOption);
-          }
-          fprintf(stderr, "\t%s, lines: %d and %d\n", cFile, (*iLine + 1),
-                  iLineTmp + 1);
-          exit(1);
+  return *cBuffer;
+}
+
+void BuildInputTable(INPUTTABLE *table, char cFile[]) {
+  int iLine, iBucket;
+  char cLine[LINE], cWord[LINE];
+  char *cBuffer;
+  const char *cText, *cNext;
+
+  cText = sInputText(cFile, &cBuffer);
+
+  strcpy(table->cFile, cFile);
+  table->iNumLines = 0;
+  cNext            = cText;
+  while (sGetTextLine(cLine, LINE, &cNext) != NULL) {
+    table->iNumLines++;
+  }
+
+  table->saLine = malloc(table->iNumLines * sizeof(char *));
+  cNext         = cText;
+  for (iLine = 0; iLine < table->iNumLines; iLine++) {
+    memset(cLine, '\0', LINE);
+    sGetTextLine(cLine, LINE, &cNext);
+    table->saLine[iLine] = malloc((strlen(cLine) + 1) * sizeof(char));
+    strcpy(table->saLine[iLine], cLine);
+  }
+  free(cBuffer);
+
+  /* Keep the table at most half full */
+  table->iNumBuckets = 16;
+  while (table->iNumBuckets < 2 * table->iNumLines) {
+    table->iNumBuckets *= 2;
+  }
+  table->saKey       = malloc(table->iNumBuckets * sizeof(*table->saKey));
+  table->iaLine      = malloc(table->iNumBuckets * sizeof(int));
+  table->iaDuplicate = malloc(table->iNumBuckets * sizeof(int));
+  for (iBucket = 0; iBucket < table->iNumBuckets; iBucket++) {
+    table->iaLine[iBucket]      = -1;
+    table->iaDuplicate[iBucket] = -1;
+  }
+
+  for (iLine = 0; iLine < table->iNumLines; iLine++) {
+    if (!CheckComment(table->saLine[iLine], strlen(table->saLine[iLine]))) {
+      memset(cWord, '\0', LINE);
+      sscanf(table->saLine[iLine], "%s", cWord);
+      if (strlen(cWord) > 0 && strlen(cWord) < OPTLEN) {
+        iBucket = fiInputTableBucket(table, cWord);
+        if (table->iaLine[iBucket] < 0) {
+          strcpy(table->saKey[iBucket], cWord);
+          table->iaLine[iBucket] = iLine;
+        } else if (table->iaDuplicate[iBucket] < 0) {
+          table->iaDuplicate[iBucket] = iLine;
         }
-        strcpy(cLine, cTmp);
-        *iLine = iLineTmp;
-        bDone  = 1;
       }
     }
-    iLineTmp++;
-    memset(cTmp, '\0', LINE);
-    memset(cWord, '\0', OPTLEN);
   }
-  fclose(fp);
 }
 
-/* If the previous line ended in $, must find the next valid line
-   (the next lines could be a # or blank). The search is made
-   recursively, and cLine and *iLine are the line and line number,
-   respectively. */
+/* Return the table for cFile, reading the file if it has not been read */
+INPUTTABLE *GetInputTable(char cFile[]) {
+  int iTable;
 
-void GetNextValidLine(char cFile[], int iStart, char cLine[], int *iLine) {
-  FILE *fp;
-  int iPos, iLineTmp, ok = 1;
+  for (iTable = 0; iTable < iNumInputTables; iTable++) {
+    if (strcmp(saInputTable[iTable].cFile, cFile) == 0) {
+      return &saInputTable[iTable];
+    }
+  }
+
+  if (iNumInputTables >= MAXFILES) {
+    fprintf(stderr,
+            "ERROR: Number of input files exceeds MAXFILES (%d). Increase "
+            "MAXFILES in vplanet.h.\n",
+            MAXFILES);
+    ExitVplanet(EXIT_INPUT);
+  }
+  BuildInputTable(&saInputTable[iNumInputTables], cFile);
+  iNumInputTables++;
+
+  return &saInputTable[iNumInputTables - 1];
+}
 
-  fp     = fopen(cFile, "r");
-  *iLine = 0;
+void FreeInputTables() {
+  int iTable, iLine;
 
-  for (iLineTmp = 0; iLineTmp < iStart; iLineTmp++) {
-    fgets(cLine, LINE, fp);
-    (*iLine)++;
+  for (iTable = 0; iTable < iNumInputTables; iTable++) {
+    for (iLine = 0; iLine < saInputTable[iTable].iNumLines; iLine++) {
+      free(saInputTable[iTable].saLine[iLine]);
+    }
+    free(saInputTable[iTable].saLine);
+    free(saInputTable[iTable].saKey);
+    free(saInputTable[iTable].iaLine);
+    free(saInputTable[iTable].iaDuplicate);
   }
+  iNumInputTables = 0;
+}
 
-  /* If EOF, return */
-  if (fgets(cLine, LINE, fp) == NULL) {
-    sprintf(cLine, "null");
-    fclose(fp);
+/* Returns the line with the desiried options AND asserts no duplicate
+   entries. cLine is the entire text of the line, iLine is the line
+   number. */
+
+void GetLine(char cFile[], char cOption[], char cLine[], int *iLine,
+             int iVerbose) {
+  int iBucket;
+  INPUTTABLE *table;
+
+  table = GetInputTable(cFile);
+  memset(cLine, '\0', LINE);
+
+  if (strlen(cOption) == 0 || strlen(cOption) >= OPTLEN) {
+    return;
+  }
+  iBucket = fiInputTableBucket(table, cOption);
+  if (table->iaLine[iBucket] < 0) {
     return;
   }
 
-  /* Now check for blank line, comment (# = 35), continue ($ = 36)
-     or blank line (line feed = 10). */
+  /* Parameter Found! */
+  if (table->iaDuplicate[iBucket] >= 0) {
+    if (iVerbose > VERBINPUT) {
+      fprintf(stderr, "Multiple occurences of parameter %s found.\n", cOption);
+    }
+    fprintf(stderr, "\t%s, lines: %d and %d\n", cFile,
+            table->iaLine[iBucket] + 1, table->iaDuplicate[iBucket] + 1);
+    ExitVplanet(1);
+  }
+  strcpy(cLine, table->saLine[table->iaLine[iBucket]]);
+  *iLine = table->iaLine[iBucket];
+}
 
-  for (iPos = 0; iPos < LINE; iPos++) {
-    if (cLine[iPos] == 36 || cLine[iPos] == 35 || cLine[iPos] == 10) {
-      /* First character is a $, # or \n: continue */
-      GetNextValidLine(cFile, iStart + 1, cLine, iLine);
-      fclose(fp);
-      return;
+/* If the previous line ended in $, must find the next valid line
+   (the next lines could be a # or blank). Lines are skipped until
+   one is found, and cLine and *iLine are the line and line number,
+   respectively. */
+
+void GetNextValidLine(char cFile[], int iStart, char cLine[], int *iLine) {
+  int iPos, bValid = 0;
+  INPUTTABLE *table;
+
+  table = GetInputTable(cFile);
+
+  for (*iLine = iStart; *iLine < table->iNumLines; (*iLine)++) {
+    memset(cLine, '\0', LINE);
+    strcpy(cLine, table->saLine[*iLine]);
+
+    /* Now check for blank line, comment (# = 35), continue ($ = 36)
+       or blank line (line feed = 10). */
+    for (iPos = 0; iPos < LINE; iPos++) {
+      if (cLine[iPos] == 36 || cLine[iPos] == 35 || cLine[iPos] == 10) {
+        /* First character is a $, # or \n: skip the line */
+        break;
+      }
+      if (!isspace(cLine[iPos])) {
+        /* Found next valid line */
+        bValid = 1;
+        break;
+      }
     }
-    if (!isspace(cLine[iPos])) {
-      /* Found next valid line */
-      fclose(fp);
+    if (bValid) {
       return;
     }
   }
-  /* If made it here, line was blank */
-  GetNextValidLine(cFile, iStart + 1, cLine, iLine);
-  fclose(fp);
+
+  /* If EOF, return */
+  sprintf(cLine, "null");
 }
 
 /* Where is the first non-white-space character in a line? */
@@ -376,16 +542,14 @@ void AddOptionString(char cFile[], char cOption[], char cInput[], int *iLine,
 
 int GetNumOut(char cFile[], char cName[], int iLen, int *iLineNum, int iExit) {
   char cLine[LINE], cWord[NAMELEN];
-  int iPos, j, ok, bDone = 0, iLine = 0, iNumOut;
-  FILE *fp;
+  int iPos, j, ok, bDone = 0, iLine, iNumOut;
+  INPUTTABLE *table;
 
-  fp = fopen(cFile, "r");
-  if (fp == NULL) {
-    fprintf(stderr, "Unable to open %s.\n", cFile);
-    exit(iExit);
-  }
+  table = GetInputTable(cFile);
 
-  while (fgets(cLine, LINE, fp) != NULL) {
+  for (iLine = 0; iLine < table->iNumLines; iLine++) {
+    memset(cLine, '\0', LINE);
+    strcpy(cLine, table->saLine[iLine]);
     /* Check for # sign */
     if (memcmp(cLine, "#", 1) != 0) {
       /* Check for desired parameter */
@@ -396,7 +560,7 @@ int GetNumOut(char cFile[], char cName[], int iLen, int *iLineNum, int iExit) {
           fprintf(stderr, "ERROR: Multiple occurences of parameter %s found.\n",
                   cName);
           fprintf(stderr, "\t%s, lines: %d and %d\n", cFile, *iLineNum, iLine);
-          exit(iExit);
+          ExitVplanet(iExit);
         }
         bDone     = 1;
         *iLineNum = iLine;
@@ -420,10 +584,6 @@ int GetNumOut(char cFile[], char cName[], int iLen, int *iLineNum, int iExit) {
         }
       }
     }
-    iLine++;
-    for (iPos = 0; iPos < LINE; iPos++) {
-      cLine[iPos] = 0;
-    }
   }
   /* Lose the input parameter */
   iNumOut--;
@@ -431,32 +591,26 @@ int GetNumOut(char cFile[], char cName[], int iLen, int *iLineNum, int iExit) {
 }
 
 int iGetNumLines(char cFile[]) {
-  int iNumLines = 0, iChar, bFileOK = 1;
+  int iLine, iChar, bFileOK = 1;
   int bComment, bReturn;
-  FILE *fp;
-  char cLine[LINE];
-
-  fp = fopen(cFile, "r");
-  if (fp == NULL) {
-    fprintf(stderr, "Unable to open %s.\n", cFile);
-    exit(EXIT_INPUT);
-  }
+  INPUTTABLE *table;
 
-  while (fgets(cLine, LINE, fp) != NULL) {
-    iNumLines++;
+  table = GetInputTable(cFile);
 
+  for (iLine = 0; iLine < table->iNumLines; iLine++) {
     /* Check to see if line is too long. The maximum length of a line is set
        by LINE. If a carriage return is not found in the first LINE
        characters *and* is not preceded by a comment, the line is too long. */
     bComment = 0;
     bReturn  = 0;
-    for (iChar = 0; iChar < LINE && cLine[iChar] != '\0'; iChar++) {
-      if (cLine[iChar] == 35) { // 35 is ASCII code for #
+    for (iChar = 0; iChar < LINE && table->saLine[iLine][iChar] != '\0';
+         iChar++) {
+      if (table->saLine[iLine][iChar] == 35) { // 35 is ASCII code for #
         bComment = 1;
       }
       // Maybe unnecessary with the second conditional in the loop
       // initialization?
-      if (cLine[iChar] == 10) { // 10 is ASCII code for line feed
+      if (table->saLine[iLine][iChar] == 10) { // 10 is ASCII code for line feed
         bReturn = 1;
       }
     }
@@ -465,29 +619,25 @@ int iGetNumLines(char cFile[]) {
       if (iChar >= LINE) {
         fprintf(stderr,
                 "ERROR: Line %s:%d is longer than allowed (%d characters).\n",
-                cFile, iNumLines, LINE);
+                cFile, iLine + 1, LINE);
         bFileOK = 0;
       }
     }
   }
 
   if (!bFileOK) {
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
-  return iNumLines;
+  return table->iNumLines;
 }
 
 void InitializeInput(INFILE *input) {
   int iLine, iPos, bBlank;
-  FILE *fp;
   char cLine[LINE];
+  INPUTTABLE *table;
 
-  fp = fopen(input->cIn, "r");
-  if (fp == NULL) {
-    fprintf(stderr, "Unable to open %s.\n", input->cIn);
-    exit(EXIT_INPUT);
-  }
+  table            = GetInputTable(input->cIn);
   input->iNumLines = iGetNumLines(input->cIn);
   input->bLineOK   = malloc(input->iNumLines * sizeof(int));
   /*
@@ -500,11 +650,9 @@ void InitializeInput(INFILE *input) {
     input->bLineOK[iLine] = 0;
 
     /* Now find those lines that are comments or blank */
-    for (iPos = 0; iPos < LINE; iPos++) {
-      cLine[iPos] = '\0';
-    }
+    memset(cLine, '\0', LINE);
+    strcpy(cLine, table->saLine[iLine]);
 
-    fgets(cLine, LINE, fp);
     /* Check for # sign or blank line */
     if (CheckComment(cLine, LINE)) {
       /* Line is OK */
@@ -525,27 +673,25 @@ void InitializeInput(INFILE *input) {
 }
 
 void Unrecognized(FILES files) {
-  FILE *fp;
-  char cLine[LINE], cWord[NAMELEN];
+  char cWord[NAMELEN];
   int iFile, iLine, bExit = 0; /* Assume don't exit */
+  INPUTTABLE *table;
 
   for (iFile = 0; iFile < files.iNumInputs; iFile++) {
-    fp = fopen(files.Infile[iFile].cIn, "r");
+    table = GetInputTable(files.Infile[iFile].cIn);
 
-    iLine = 0;
-    while (fgets(cLine, LINE, fp) != NULL) {
+    for (iLine = 0; iLine < table->iNumLines; iLine++) {
       if (!files.Infile[iFile].bLineOK[iLine]) {
         /* Bad line */
-        sscanf(cLine, "%s", cWord);
+        sscanf(table->saLine[iLine], "%s", cWord);
         fprintf(stderr, "ERROR: Unrecognized option \"%s\" in %s, line %d.\n",
                 cWord, files.Infile[iFile].cIn, iLine + 1);
         bExit = 1;
       }
-      iLine++;
     }
   }
   if (bExit) {
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 }
 
@@ -578,7 +724,7 @@ void CheckDuplication(FILES *files, OPTIONS *options, char cFile[], int iLine,
     fprintf(stderr,
             "ERROR: CheckDuplication called, but options. bMultiFile = %d\n",
             options->bMultiFile);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   for (iFile = 0; iFile < files->iNumInputs; iFile++) {
@@ -592,7 +738,7 @@ void CheckDuplication(FILES *files, OPTIONS *options, char cFile[], int iLine,
       fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn,
               options->iLine[iFile]);
       fprintf(stderr, "\t%s, Line: %d\n", cFile, iLine);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
   }
 }
@@ -713,7 +859,7 @@ void ReadUnitMass(CONTROL *control, FILES *files, OPTIONS *options, int iFile) {
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[0].cIn,
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iMass =
@@ -811,7 +957,7 @@ void ReadUnitTime(CONTROL *control, FILES *files, OPTIONS *options, int iFile) {
         fprintf(stderr, "\t%s, Line: %d\n", options->cFile[0],
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iTime =
@@ -900,7 +1046,7 @@ void ReadUnitAngle(CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "\t%s, Line: %d\n", options->cFile[0],
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iAngle =
@@ -1005,7 +1151,7 @@ void ReadUnitLength(CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "\t%s, Line: %d\n", options->cFile[0],
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iLength =
@@ -1098,7 +1244,7 @@ void ReadUnitTemp(CONTROL *control, FILES *files, OPTIONS *options, int iFile) {
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[0].cIn,
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iTemp =
@@ -1173,7 +1319,7 @@ void ReadBodyFileNames(CONTROL *control, FILES *files, OPTIONS *options,
   } else {
     fprintf(stderr, "ERROR: Option %s is required in file %s.\n",
             options->cName, infile->cIn);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* With body files identified, must allocate space */
@@ -1191,6 +1337,8 @@ void ReadBodyFileNames(CONTROL *control, FILES *files, OPTIONS *options,
   files->Outfile             = malloc(iNumIndices * sizeof(OUTFILE));
   for (iIndex = 0; iIndex < iNumIndices; iIndex++) {
     memset(files->Outfile[iIndex].cOut, '\0', NAMELEN);
+    files->Outfile[iIndex].fp     = NULL;
+    files->Outfile[iIndex].fpGrid = NULL;
   }
 
   UpdateFoundOptionMulti(&files->Infile[0], options, lTmp, iNumLines, 0);
@@ -1456,6 +1604,39 @@ void ReadOutFile(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Output File Format */
+
+void ReadOutputFormat(BODY *body, CONTROL *control, FILES *files,
+                      OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (memcmp(sLower(cTmp), "t", 1) == 0) {
+      control->Io.iOutputFormat = OUTPUTTEXT;
+    } else if (memcmp(sLower(cTmp), "b", 1) == 0) {
+      control->Io.iOutputFormat = OUTPUTBINARY;
+    } else {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: Unknown argument to %s: %s.\n", options->cName,
+                cTmp);
+        fprintf(stderr, "Options are text or binary.\n");
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    if (!bOptionAlreadyFound(options->iLine, files->iNumInputs)) {
+      control->Io.iOutputFormat = OUTPUTTEXT;
+    }
+  }
+}
+
 /* Backward Eta */
 
 void ReadEta(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
@@ -1486,6 +1667,62 @@ void ReadEta(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Error tolerances of an RK45 step */
+
+void ReadTolerance(CONTROL *control, FILES *files, OPTIONS *options,
+                   double *dTolerance, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp <= 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be greater than 0.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    *dTolerance = dTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, dTolerance, files->iNumInputs);
+  }
+}
+
+void ReadRelTol(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+                SYSTEM *system, int iFile) {
+  ReadTolerance(control, files, options, &control->Evolve.dRelTol, iFile);
+}
+
+void ReadAbsTol(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+                SYSTEM *system, int iFile) {
+  ReadTolerance(control, files, options, &control->Evolve.dAbsTol, iFile);
+}
+
+/* Interpolate the output between steps? */
+
+void ReadDenseOutput(BODY *body, CONTROL *control, FILES *files,
+                     OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  int bTmp;
+
+  AddOptionBool(files->Infile[iFile].cIn, options->cName, &bTmp, &lTmp,
+                control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    control->Io.bDenseOutput = bTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultInt(options, &control->Io.bDenseOutput, files->iNumInputs);
+  }
+}
+
 /* Backward integration output interval */
 
 void ReadOutputTime(BODY *body, CONTROL *control, FILES *files,
@@ -1633,6 +1870,89 @@ void ReadColor(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Checkpoints */
+
+void ReadCheckpointFile(BODY *body, CONTROL *control, FILES *files,
+                        OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int i, lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    strcpy(files->cCheckpoint, cTmp);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    /* Assign Default */
+    if (iFile == files->iNumInputs - 1) {
+      for (i = 0; i < files->iNumInputs; i++) {
+        if (options->iLine[i] != -1) {
+          /* Was assigned, return */
+          return;
+        }
+      }
+    }
+    /* Wasn't entered, assign default */
+    sprintf(files->cCheckpoint, "%s.checkpoint", system->cName);
+  }
+}
+
+void ReadCheckpointInterval(BODY *body, CONTROL *control, FILES *files,
+                            OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp < 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s cannot be negative.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    /* Convert checkpoint interval to cgs */
+    control->Evolve.dCheckpointInterval =
+          dTmp * fdUnitsTime(control->Units[iFile].iTime);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, &control->Evolve.dCheckpointInterval,
+                        files->iNumInputs);
+  }
+}
+
+void ReadCheckpointWallTime(BODY *body, CONTROL *control, FILES *files,
+                            OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp < 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s cannot be negative.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    /* Seconds of wall clock, whatever the units */
+    control->Evolve.dCheckpointWallTime = dTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, &control->Evolve.dCheckpointWallTime,
+                        files->iNumInputs);
+  }
+}
+
 /*
  *
  * D
@@ -1773,6 +2093,58 @@ void ReadDoForward(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Freezing quiescent primary variables */
+
+void ReadFreezeTol(BODY *body, CONTROL *control, FILES *files,
+                   OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp < 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s cannot be negative.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    control->Evolve.dFreezeTol = dTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, &control->Evolve.dFreezeTol,
+                        files->iNumInputs);
+  }
+}
+
+void ReadFreezeWindow(BODY *body, CONTROL *control, FILES *files,
+                      OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  int iTmp;
+
+  AddOptionInt(files->Infile[iFile].cIn, options->cName, &iTmp, &lTmp,
+               control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (iTmp < 1) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be at least 1.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    control->Evolve.iFreezeWindow = iTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultInt(options, &control->Evolve.iFreezeWindow,
+                     files->iNumInputs);
+  }
+}
+
 void ReadGRCorr(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 SYSTEM *system, int iFile) {
   int lTmp = -1, bTmp;
@@ -2059,7 +2431,7 @@ void ReadHecc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dHecc = options->dDefault;
   }
@@ -2085,13 +2457,18 @@ void ReadIntegrationMethod(BODY *body, CONTROL *control, FILES *files,
                      control->Io.iVerbose);
     if (memcmp(sLower(cTmp), "e", 1) == 0) {
       control->Evolve.iOneStep = EULER;
+    } else if (memcmp(sLower(cTmp), "ro", 2) == 0) {
+      control->Evolve.iOneStep = ROSENBROCK;
+    } else if (memcmp(sLower(cTmp), "r", 1) == 0 && strstr(cTmp, "45")) {
+      control->Evolve.iOneStep = RUNGEKUTTA45;
     } else if (memcmp(sLower(cTmp), "r", 1) == 0) {
       control->Evolve.iOneStep = RUNGEKUTTA;
     } else {
       if (control->Io.iVerbose >= VERBERR) {
         fprintf(stderr, "ERROR: Unknown argument to %s: %s.\n", options->cName,
                 cTmp);
-        fprintf(stderr, "Options are Euler.\n");
+        fprintf(stderr, "Options are Euler, Runge-Kutta4, Runge-Kutta45 and "
+                        "Rosenbrock.\n");
       }
       LineExit(files->Infile[iFile].cIn, lTmp);
     }
@@ -2118,7 +2495,7 @@ void ReadKecc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dKecc = options->dDefault;
   }
@@ -2381,7 +2758,7 @@ void ReadLXUV(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   } else {
     if (iFile > 0) {
       body[iFile - 1].dLXUV = options->dDefault;
@@ -2590,6 +2967,75 @@ void ReadMinValue(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Multi-rate integration */
+
+void ReadMultiRate(BODY *body, CONTROL *control, FILES *files,
+                   OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  int bTmp;
+
+  AddOptionBool(files->Infile[iFile].cIn, options->cName, &bTmp, &lTmp,
+                control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    control->Evolve.bMultiRate = bTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultInt(options, &control->Evolve.bMultiRate, files->iNumInputs);
+  }
+}
+
+/*
+ *
+ * N
+ *
+ */
+
+/* Number of threads */
+
+void ReadNumThreads(BODY *body, CONTROL *control, FILES *files,
+                    OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  int iTmp;
+  char *cEnv, *cEnd;
+
+  AddOptionInt(files->Infile[iFile].cIn, options->cName, &iTmp, &lTmp,
+               control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (iTmp < 1) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be at least 1.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    control->Evolve.iNumThreads = iTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultInt(options, &control->Evolve.iNumThreads, files->iNumInputs);
+  }
+
+  /* The environment overrides the input files, e.g. to match a cluster job */
+  cEnv = getenv("VPLANET_NUM_THREADS");
+  if (cEnv != NULL && cEnv[0] != '\0') {
+    iTmp = (int)strtol(cEnv, &cEnd, 10);
+    if (*cEnd != '\0' || iTmp < 1) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr,
+                "ERROR: VPLANET_NUM_THREADS must be a positive integer, "
+                "not \"%s\".\n",
+                cEnv);
+      }
+      ExitVplanet(EXIT_INPUT);
+    }
+    control->Evolve.iNumThreads = iTmp;
+  }
+}
+
 /*
  *
  * O
@@ -2694,7 +3140,7 @@ void ReadOutputOrder(FILES *files, MODULE *module, OPTIONS *options,
                 "increase MAXARRAY in vplanet.h.\n",
                 files->Infile[iFile].cIn);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
 
     /* First remove and record negative signs */
@@ -3576,7 +4022,7 @@ void ReadXobl(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dXobl = options->dDefault;
   }
@@ -3600,7 +4046,7 @@ void ReadYobl(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dYobl = options->dDefault;
   }
@@ -3624,7 +4070,7 @@ void ReadZobl(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dZobl = options->dDefault;
   }
@@ -3642,6 +4088,9 @@ void ReadOptions(BODY **body, CONTROL *control, FILES *files, MODULE *module,
                  UPDATE **update, fnReadOption fnRead[], char infile[]) {
   int iBody;
 
+  /* Discard any input files read by a previous call */
+  FreeInputTables();
+
   /* Read options for files, units, verbosity, and system name. */
   ReadInitialOptions(body, control, files, module, options, output, system,
                      infile);
@@ -3664,6 +4113,9 @@ void ReadOptions(BODY **body, CONTROL *control, FILES *files, MODULE *module,
 
   /* Any unrecognized options? */
   Unrecognized(*files);
+
+  /* All options have been read, so the input text is no longer needed */
+  FreeInputTables();
 }
 
 /*
@@ -3740,6 +4192,24 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_OUTFILE].iFileType  = 2;
   fnRead[OPT_OUTFILE]             = &ReadOutFile;
 
+  sprintf(options[OPT_OUTPUTFORMAT].cName, "sOutputFormat");
+  sprintf(options[OPT_OUTPUTFORMAT].cDescr, "Format of Output Files");
+  sprintf(options[OPT_OUTPUTFORMAT].cDefault, "text");
+  sprintf(options[OPT_OUTPUTFORMAT].cValues, "text binary");
+  sprintf(options[OPT_OUTPUTFORMAT].cLongDescr,
+          "If set to text, each body's forward or backward file is a\n"
+          "whitespace-delimited ASCII table. If set to binary, the columns are\n"
+          "appended as raw doubles to a file with an additional .bin extension.\n"
+          "The data are preceded by an ASCII header that lists the number of\n"
+          "columns, the row stride in bytes, the byte order, and the name and\n"
+          "unit of each column. Binary output keeps full precision and ignores\n"
+          "iDigits and iSciNot. Climate grids are always written as text.");
+  options[OPT_OUTPUTFORMAT].iType      = 3;
+  options[OPT_OUTPUTFORMAT].iModuleBit = 0;
+  options[OPT_OUTPUTFORMAT].bNeg       = 0;
+  options[OPT_OUTPUTFORMAT].iFileType  = 2;
+  fnRead[OPT_OUTPUTFORMAT]             = &ReadOutputFormat;
+
   sprintf(options[OPT_ETA].cName, "dEta");
   sprintf(options[OPT_ETA].cDescr, "Variable Time Step Coefficient");
   sprintf(options[OPT_ETA].cDefault, "1");
@@ -3756,6 +4226,41 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
           "i.e. min(x/(dx/dt) where x represents the primary variables.",
           options[OPT_ETA].cName);
 
+  sprintf(options[OPT_RELTOL].cName, "dRelTol");
+  sprintf(options[OPT_RELTOL].cDescr,
+          "Relative Error Tolerance of an Adaptive Step");
+  sprintf(options[OPT_RELTOL].cDefault, "1e-6");
+  sprintf(options[OPT_RELTOL].cDimension, "nd");
+  options[OPT_RELTOL].dDefault   = 1e-6;
+  options[OPT_RELTOL].iType      = 2;
+  options[OPT_RELTOL].iModuleBit = 0;
+  options[OPT_RELTOL].bNeg       = 0;
+  options[OPT_RELTOL].iFileType  = 2;
+  fnRead[OPT_RELTOL]             = &ReadRelTol;
+  sprintf(options[OPT_RELTOL].cLongDescr,
+          "With sIntegrationMethod Runge-Kutta45 or Rosenbrock, each step is\n"
+          "retried with a smaller timestep until the estimated error of\n"
+          "every primary variable is less than dRelTol times its magnitude\n"
+          "plus dAbsTol times the largest magnitude it has reached. The next\n"
+          "timestep is then chosen from the error, but is never shorter than\n"
+          "the one Runge-Kutta4 would take with dEta.");
+
+  sprintf(options[OPT_ABSTOL].cName, "dAbsTol");
+  sprintf(options[OPT_ABSTOL].cDescr,
+          "Absolute Error Tolerance of an Adaptive Step");
+  sprintf(options[OPT_ABSTOL].cDefault, "1e-9");
+  sprintf(options[OPT_ABSTOL].cDimension, "nd");
+  options[OPT_ABSTOL].dDefault   = 1e-9;
+  options[OPT_ABSTOL].iType      = 2;
+  options[OPT_ABSTOL].iModuleBit = 0;
+  options[OPT_ABSTOL].bNeg       = 0;
+  options[OPT_ABSTOL].iFileType  = 2;
+  fnRead[OPT_ABSTOL]             = &ReadAbsTol;
+  sprintf(options[OPT_ABSTOL].cLongDescr,
+          "The error allowed in a primary variable that passes through or\n"
+          "near zero, as a fraction of the largest magnitude the variable has\n"
+          "reached. See dRelTol.");
+
   sprintf(options[OPT_OUTPUTTIME].cName, "dOutputTime");
   sprintf(options[OPT_OUTPUTTIME].cDescr, "Output Interval");
   sprintf(options[OPT_OUTPUTTIME].cDefault, "1 year");
@@ -3769,6 +4274,26 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_OUTPUTTIME].iFileType  = 2;
   fnRead[OPT_OUTPUTTIME]             = &ReadOutputTime;
 
+  sprintf(options[OPT_DENSEOUTPUT].cName, "bDenseOutput");
+  sprintf(options[OPT_DENSEOUTPUT].cDescr, "Interpolate the Output Between "
+                                           "Steps?");
+  sprintf(options[OPT_DENSEOUTPUT].cDefault, "0");
+  options[OPT_DENSEOUTPUT].iType      = 0;
+  options[OPT_DENSEOUTPUT].iModuleBit = 0;
+  options[OPT_DENSEOUTPUT].bNeg       = 0;
+  options[OPT_DENSEOUTPUT].iFileType  = 2;
+  fnRead[OPT_DENSEOUTPUT]             = &ReadDenseOutput;
+  sprintf(options[OPT_DENSEOUTPUT].cLongDescr,
+          "By default, every step with bVarDt ends no later than the next\n"
+          "output time, so with a dOutputTime shorter than the timescales of\n"
+          "the system, the output, not the physics, sets the timestep. With\n"
+          "bDenseOutput, the steps only stop at dStopTime, and each output\n"
+          "is interpolated between the steps around it, with the cubic that\n"
+          "matches the primary variables and their derivatives at both ends.\n"
+          "Explicit functions of time are evaluated at the output time. Other\n"
+          "properties that modules keep, e.g. the climate of POISE, are those\n"
+          "at the end of the step. Requires a Runge-Kutta integration method.");
+
   sprintf(options[OPT_STOPTIME].cName, "dStopTime");
   sprintf(options[OPT_STOPTIME].cDescr, "Integration Stop Time");
   sprintf(options[OPT_STOPTIME].cDefault, "10 years");
@@ -3827,6 +4352,55 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
    *
    */
 
+  sprintf(options[OPT_CHECKPOINTFILE].cName, "sCheckpointFile");
+  sprintf(options[OPT_CHECKPOINTFILE].cDescr, "Name of Checkpoint File");
+  sprintf(options[OPT_CHECKPOINTFILE].cDefault, "cSystemName.checkpoint");
+  options[OPT_CHECKPOINTFILE].iType      = 3;
+  options[OPT_CHECKPOINTFILE].iModuleBit = 0;
+  options[OPT_CHECKPOINTFILE].bNeg       = 0;
+  options[OPT_CHECKPOINTFILE].iFileType  = 2;
+  fnRead[OPT_CHECKPOINTFILE]             = &ReadCheckpointFile;
+  sprintf(options[OPT_CHECKPOINTFILE].cLongDescr,
+          "See dCheckpointInterval.");
+
+  sprintf(options[OPT_CHECKPOINTINTERVAL].cName, "dCheckpointInterval");
+  sprintf(options[OPT_CHECKPOINTINTERVAL].cDescr,
+          "Simulated Time between Checkpoints");
+  sprintf(options[OPT_CHECKPOINTINTERVAL].cDefault, "0 [no checkpoints]");
+  sprintf(options[OPT_CHECKPOINTINTERVAL].cDimension, "time");
+  options[OPT_CHECKPOINTINTERVAL].dDefault   = 0;
+  options[OPT_CHECKPOINTINTERVAL].iType      = 2;
+  options[OPT_CHECKPOINTINTERVAL].iModuleBit = 0;
+  options[OPT_CHECKPOINTINTERVAL].bNeg       = 0;
+  options[OPT_CHECKPOINTINTERVAL].iFileType  = 2;
+  fnRead[OPT_CHECKPOINTINTERVAL]             = &ReadCheckpointInterval;
+  sprintf(options[OPT_CHECKPOINTINTERVAL].cLongDescr,
+          "If positive, the state of the integration is written to\n"
+          "sCheckpointFile at the end of the first step after each\n"
+          "dCheckpointInterval of simulated time, and, with\n"
+          "dCheckpointWallTime, at the end of the first step after each\n"
+          "dCheckpointWallTime seconds of wall clock. Each checkpoint replaces\n"
+          "the previous one, which is kept until the new one is complete.\n"
+          "\"vplanet --restart <sCheckpointFile> vpl.in\" continues the\n"
+          "integration from the checkpoint, with the same input files, and\n"
+          "writes the same output as a run that was never interrupted. Only\n"
+          "the build of VPLanet that wrote a checkpoint can read it.\n"
+          "Checkpoints are not written if the output is kept in memory.");
+
+  sprintf(options[OPT_CHECKPOINTWALLTIME].cName, "dCheckpointWallTime");
+  sprintf(options[OPT_CHECKPOINTWALLTIME].cDescr,
+          "Seconds of Wall Clock between Checkpoints");
+  sprintf(options[OPT_CHECKPOINTWALLTIME].cDefault, "0 [no checkpoints]");
+  sprintf(options[OPT_CHECKPOINTWALLTIME].cDimension, "nd");
+  options[OPT_CHECKPOINTWALLTIME].dDefault   = 0;
+  options[OPT_CHECKPOINTWALLTIME].iType      = 2;
+  options[OPT_CHECKPOINTWALLTIME].iModuleBit = 0;
+  options[OPT_CHECKPOINTWALLTIME].bNeg       = 0;
+  options[OPT_CHECKPOINTWALLTIME].iFileType  = 2;
+  fnRead[OPT_CHECKPOINTWALLTIME]             = &ReadCheckpointWallTime;
+  sprintf(options[OPT_CHECKPOINTWALLTIME].cLongDescr,
+          "See dCheckpointInterval.");
+
   sprintf(options[OPT_COLOR].cName, "sColor");
   sprintf(options[OPT_COLOR].cDescr,
           "Hexadecimal color code for the body to be used in vplot");
@@ -3857,6 +4431,46 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_FORW].iFileType  = 2;
   fnRead[OPT_FORW]             = &ReadDoForward;
 
+  sprintf(options[OPT_FREEZETOL].cName, "dFreezeTol");
+  sprintf(options[OPT_FREEZETOL].cDescr,
+          "Largest Change of a Frozen Variable until dStopTime");
+  sprintf(options[OPT_FREEZETOL].cDefault, "0 [no freezing]");
+  sprintf(options[OPT_FREEZETOL].cDimension, "nd");
+  options[OPT_FREEZETOL].dDefault   = 0;
+  options[OPT_FREEZETOL].iType      = 2;
+  options[OPT_FREEZETOL].iModuleBit = 0;
+  options[OPT_FREEZETOL].bNeg       = 0;
+  options[OPT_FREEZETOL].iFileType  = 2;
+  fnRead[OPT_FREEZETOL]             = &ReadFreezeTol;
+  sprintf(options[OPT_FREEZETOL].cLongDescr,
+          "Many primary variables hardly change for long stretches of an\n"
+          "integration, e.g. the rotation of a tidally locked body, yet\n"
+          "their derivatives are evaluated at every stage of every step. If\n"
+          "dFreezeTol is positive, a primary variable whose derivatives would\n"
+          "change it by less than dFreezeTol times its magnitude before\n"
+          "dStopTime, at each of iFreezeWindow steps in a row, is frozen: its\n"
+          "derivatives are replaced by a tiny constant for as long as it had\n"
+          "been quiescent. It is then thawed for one step, and frozen again if\n"
+          "it still is, so the frozen periods double. All frozen variables\n"
+          "are thawed when a module switches its equations, e.g. when a body\n"
+          "tidally locks. Only variables with time derivatives are frozen,\n"
+          "and not those of RadHeat and ThermInt, whose powers are their\n"
+          "derivatives. The outputs of the derivatives of a frozen variable\n"
+          "are 0. The final log lists how often, and for how long, each\n"
+          "variable was frozen.");
+
+  sprintf(options[OPT_FREEZEWINDOW].cName, "iFreezeWindow");
+  sprintf(options[OPT_FREEZEWINDOW].cDescr,
+          "Number of Quiescent Steps before a Variable is Frozen");
+  sprintf(options[OPT_FREEZEWINDOW].cDefault, "10");
+  options[OPT_FREEZEWINDOW].iType      = 1;
+  options[OPT_FREEZEWINDOW].iModuleBit = 0;
+  options[OPT_FREEZEWINDOW].bNeg       = 0;
+  options[OPT_FREEZEWINDOW].iFileType  = 2;
+  fnRead[OPT_FREEZEWINDOW]             = &ReadFreezeWindow;
+  sprintf(options[OPT_FREEZEWINDOW].cLongDescr,
+          "See dFreezeTol.");
+
   sprintf(options[OPT_GRCORR].cName, "bGRCorr");
   sprintf(options[OPT_GRCORR].cDescr, "Use general relativity correction");
   sprintf(options[OPT_GRCORR].cDefault, "0");
@@ -4000,8 +4614,18 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
 
   sprintf(options[OPT_INTEGRATIONMETHOD].cName, "sIntegrationMethod");
   sprintf(options[OPT_INTEGRATIONMETHOD].cDescr,
-          "Integration Method: Euler, Runge-Kutta4 (Default = Runge-Kutta4)");
+          "Integration Method: Euler, Runge-Kutta4, Runge-Kutta45, Rosenbrock "
+          "(Default = Runge-Kutta4)");
   sprintf(options[OPT_INTEGRATIONMETHOD].cDefault, "Runge-Kutta4");
+  sprintf(options[OPT_INTEGRATIONMETHOD].cLongDescr,
+          "Runge-Kutta45 and Rosenbrock control the error of each step, see\n"
+          "dRelTol. Rosenbrock is implicit in the primary variables: each\n"
+          "step solves a linear system with their Jacobian, which is built\n"
+          "by finite differences, so it is stable for stiff problems, i.e.\n"
+          "when a fast process, such as a tidally damped variable or a\n"
+          "radiatively cooling magma ocean, limits the step of the other\n"
+          "methods far below the one the accuracy requires. It is only 2nd\n"
+          "order accurate, so on problems that are not stiff it is slower.");
   options[OPT_INTEGRATIONMETHOD].iType      = 3;
   options[OPT_INTEGRATIONMETHOD].iModuleBit = 0;
   options[OPT_INTEGRATIONMETHOD].bNeg       = 0;
@@ -4119,12 +4743,57 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
         "List of names of modules to be applied to the body. Spelling must be "
         "exact, but any capitalization works");
 
+  sprintf(options[OPT_MULTIRATE].cName, "bMultiRate");
+  sprintf(options[OPT_MULTIRATE].cDescr,
+          "Evaluate each Module's Derivatives at its Own Rate?");
+  sprintf(options[OPT_MULTIRATE].cDefault, "0");
+  options[OPT_MULTIRATE].iType      = 0;
+  options[OPT_MULTIRATE].iModuleBit = 0;
+  options[OPT_MULTIRATE].bNeg       = 0;
+  options[OPT_MULTIRATE].iFileType  = 2;
+  fnRead[OPT_MULTIRATE]             = &ReadMultiRate;
+  sprintf(options[OPT_MULTIRATE].cLongDescr,
+          "With bVarDt, the timestep is dEta times the shortest timescale of\n"
+          "any module, so the derivatives of every module are evaluated at the\n"
+          "rate of the fastest. With bMultiRate, the time derivatives of each\n"
+          "module form a rate class that is evaluated once every dEta times\n"
+          "its own timescale, and at least once per dOutputTime. The timescale\n"
+          "of a class is the shorter of that of its variables and that over\n"
+          "which its derivatives changed since its last evaluation. In between,\n"
+          "the derivatives are held at their value extrapolated to the middle\n"
+          "of the interval, so the slow modules are integrated to second order\n"
+          "in their own timestep while the faster modules take their steps. A\n"
+          "class is evaluated every step if its interval would be shorter than\n"
+          "two steps. All classes are evaluated again when a module switches\n"
+          "its equations, e.g. when a body tidally locks. Explicit functions of\n"
+          "time and SpiNBody are evaluated every time. This pays off when the\n"
+          "timescales of the modules differ by orders of magnitude.");
+
   /*
    *
    *   N
    *
    */
 
+  sprintf(options[OPT_NUMTHREADS].cName, "iNumThreads");
+  sprintf(options[OPT_NUMTHREADS].cDescr,
+          "Number of Threads that Evaluate the Derivatives");
+  sprintf(options[OPT_NUMTHREADS].cDefault, "1");
+  options[OPT_NUMTHREADS].iType      = 1;
+  options[OPT_NUMTHREADS].iModuleBit = 0;
+  options[OPT_NUMTHREADS].bNeg       = 0;
+  options[OPT_NUMTHREADS].iFileType  = 2;
+  fnRead[OPT_NUMTHREADS]             = &ReadNumThreads;
+  sprintf(options[OPT_NUMTHREADS].cLongDescr,
+          "The derivatives of all bodies are evaluated in parallel by this\n"
+          "many threads, which pays off for systems with many bodies or\n"
+          "expensive derivatives, such as multi-planet DistOrb and DistRot\n"
+          "systems. The results do not depend on the number of threads. The\n"
+          "environment variable VPLANET_NUM_THREADS overrides this option.\n"
+          "Requires a build with OpenMP, e.g. \"make parallel\", or\n"
+          "VPLANET_OPENMP=1 when building the Python package; otherwise\n"
+          "VPLanet runs on 1 thread.");
+
   /*
    *
    *   O
@@ -35,17 +35,25 @@
 #define OPT_BACK 110
 #define OPT_OUTFILE 120
 #define OPT_ETA 130
+#define OPT_RELTOL 132
+#define OPT_ABSTOL 134
 #define OPT_OUTPUTTIME 140
+#define OPT_DENSEOUTPUT 142
 #define OPT_STOPTIME 150
 #define OPT_TIMESTEP 160
 #define OPT_VARDT 170
 #define OPT_BODYNAME 180
+#define OPT_CHECKPOINTFILE 181
+#define OPT_CHECKPOINTINTERVAL 182
+#define OPT_CHECKPOINTWALLTIME 183
 
 #define OPT_COLOR 185
 
 #define OPT_DENSITY 190
 
 #define OPT_FORW 200
+#define OPT_FREEZETOL 205
+#define OPT_FREEZEWINDOW 206
 
 #define OPT_HALTMAXECC 320
 #define OPT_HALTMAXMUTUALINC 322
@@ -69,6 +77,8 @@
 #define OPT_MASS 520
 #define OPT_MASSRAD 525
 #define OPT_MINVALUE 530
+#define OPT_MULTIRATE 531
+#define OPT_NUMTHREADS 532
 
 #define OPT_ORBECC 535
 #define OPT_ORBMEANMOTION 540
@@ -86,6 +96,7 @@
 #define OPT_OUTDIGITS 570
 #define OPT_OUTPUTORDER 580
 #define OPT_GRIDOUTPUT 585
+#define OPT_OUTPUTFORMAT 587
 #define OPT_OUTSCINOT 590
 #define OPT_OVERWRITE 595
 
@@ -120,6 +131,10 @@
 /* @cond DOXYGEN_OVERRIDE */
 
 void GetWords(char cLine[],char[MAXARRAY][OPTLEN],int*,int*);
+void GetLine(char[], char[], char[], int *, int);
+void GetNextValidLine(char[], int, char[], int *);
+INPUTTABLE *GetInputTable(char[]);
+void FreeInputTables();
 
 void InitializeOptions(OPTIONS *, fnReadOption *);
 void ReadOptions(BODY **, CONTROL *, FILES *, MODULE *, OPTIONS *, OUTPUT *,
@@ -1909,6 +1909,10 @@ void LogIntegration(CONTROL *control, FILE *fp) {
     fprintf(fp, "Euler");
   } else if (control->Evolve.iOneStep == RUNGEKUTTA) {
     fprintf(fp, "Runge-Kutta4");
+  } else if (control->Evolve.iOneStep == RUNGEKUTTA45) {
+    fprintf(fp, "Runge-Kutta45");
+  } else if (control->Evolve.iOneStep == ROSENBROCK) {
+    fprintf(fp, "Rosenbrock");
   }
   fprintf(fp, "\n");
 
@@ -1919,6 +1923,8 @@ void LogIntegration(CONTROL *control, FILE *fp) {
     fprintf(fp, "Forward\n");
   }
 
+  fprintf(fp, "Threads: %d\n", control->Evolve.iNumThreads);
+
   fprintf(fp, "Time Step: ");
   fprintd(fp, control->Evolve.dTimeStep, control->Io.iSciNot,
           control->Io.iDigits);
@@ -1934,6 +1940,48 @@ void LogIntegration(CONTROL *control, FILE *fp) {
           control->Io.iDigits);
   fprintf(fp, "\n");
 
+  fprintf(fp, "Dense Output: ");
+  if (control->Io.bDenseOutput == 0) {
+    fprintf(fp, "No\n");
+  } else {
+    fprintf(fp, "Yes\n");
+  }
+
+  fprintf(fp, "Multi-rate: ");
+  if (control->Evolve.bMultiRate == 0) {
+    fprintf(fp, "No\n");
+  } else {
+    fprintf(fp, "Yes\n");
+  }
+
+  fprintf(fp, "Freeze Quiescent Variables: ");
+  if (control->Evolve.dFreezeTol == 0) {
+    fprintf(fp, "No\n");
+  } else {
+    fprintf(fp, "Yes\n");
+    fprintf(fp, "dFreezeTol: ");
+    fprintd(fp, control->Evolve.dFreezeTol, control->Io.iSciNot,
+            control->Io.iDigits);
+    fprintf(fp, "\n");
+    fprintf(fp, "iFreezeWindow: %d\n", control->Evolve.iFreezeWindow);
+  }
+
+  fprintf(fp, "Checkpoints: ");
+  if (control->Evolve.dCheckpointInterval == 0 &&
+      control->Evolve.dCheckpointWallTime == 0) {
+    fprintf(fp, "No\n");
+  } else {
+    fprintf(fp, "Yes\n");
+    fprintf(fp, "Checkpoint Interval: ");
+    fprintd(fp, control->Evolve.dCheckpointInterval, control->Io.iSciNot,
+            control->Io.iDigits);
+    fprintf(fp, "\n");
+    fprintf(fp, "Checkpoint Wall Time: ");
+    fprintd(fp, control->Evolve.dCheckpointWallTime, control->Io.iSciNot,
+            control->Io.iDigits);
+    fprintf(fp, "\n");
+  }
+
   fprintf(fp, "Use Variable Timestep: ");
   if (control->Evolve.bVarDt == 0) {
     fprintf(fp, "No\n");
@@ -1942,6 +1990,16 @@ void LogIntegration(CONTROL *control, FILE *fp) {
     fprintf(fp, "dEta: ");
     fprintd(fp, control->Evolve.dEta, control->Io.iSciNot, control->Io.iDigits);
     fprintf(fp, "\n");
+    if (bAdaptive(control)) {
+      fprintf(fp, "dRelTol: ");
+      fprintd(fp, control->Evolve.dRelTol, control->Io.iSciNot,
+              control->Io.iDigits);
+      fprintf(fp, "\n");
+      fprintf(fp, "dAbsTol: ");
+      fprintd(fp, control->Evolve.dAbsTol, control->Io.iSciNot,
+              control->Io.iDigits);
+      fprintf(fp, "\n");
+    }
   }
 }
 
@@ -1970,7 +2028,30 @@ void LogBodyRelations(CONTROL *control, FILE *fp, int iBody) {
     } else {
       fprintf(fp, "Unknown!\n");
       fprintf(stderr, "Unknown Mass-Radius Relationship!\n");
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
+    }
+  }
+}
+
+void LogFrozenVariables(CONTROL *control, UPDATE *update, FILE *fp,
+                        int iBody) {
+  /* How often, and for how long, each primary variable was frozen, see
+     dFreezeTol */
+  int iVar;
+  const char *cName;
+
+  if (control->Evolve.dFreezeTol == 0) {
+    return;
+  }
+  for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+    if (control->Evolve.iaFreezes[iBody][iVar] > 0) {
+      cName = sPrimaryVariableName(update, iBody, iVar);
+      fprintf(fp, "(Freezes%s) Number of Times %s was Frozen: %d\n", cName,
+              cName, control->Evolve.iaFreezes[iBody][iVar]);
+      fprintf(fp, "(FrozenTime%s) Time %s was Frozen [sec]: ", cName, cName);
+      fprintd(fp, control->Evolve.daFrozenTime[iBody][iVar],
+              control->Io.iSciNot, control->Io.iDigits);
+      fprintf(fp, "\n");
     }
   }
 }
@@ -1984,22 +2065,19 @@ void LogOutputOrder(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
   char cUnit[OUTLEN], cTmp[OUTLEN];
 
   for (iCol = 0; iCol < files->Outfile[iBody].iNumCols; iCol++) {
-    for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
-      if (memcmp(files->Outfile[iBody].caCol[iCol], output[iOut].cName,
-                 strlen(output[iOut].cName)) == 0) {
-        /* Match! */
-        dTmp = malloc(output[iOut].iNum * sizeof(double));
-        fnWrite[iOut](body, control, &output[iOut], system,
-                      &control->Units[iBody], update, iBody, dTmp, cUnit);
-        for (iSubOut = 0; iSubOut < output[iOut].iNum; iSubOut++) {
-          strcpy(cCol[iCol + iSubOut + iExtra],
-                 files->Outfile[iBody].caCol[iCol]);
-          sprintf(cTmp, "[%s]", cUnit);
-          strcat(cCol[iCol + iSubOut + iExtra], cTmp);
-        }
-        iExtra += (output[iOut].iNum - 1);
-        free(dTmp);
+    iOut = files->Outfile[iBody].iaCol[iCol];
+    if (iOut >= 0) {
+      dTmp = malloc(output[iOut].iNum * sizeof(double));
+      fnWrite[iOut](body, control, &output[iOut], system,
+                    &control->Units[iBody], update, iBody, dTmp, cUnit);
+      for (iSubOut = 0; iSubOut < output[iOut].iNum; iSubOut++) {
+        strcpy(cCol[iCol + iSubOut + iExtra],
+               files->Outfile[iBody].caCol[iCol]);
+        sprintf(cTmp, "[%s]", cUnit);
+        strcat(cCol[iCol + iSubOut + iExtra], cTmp);
       }
+      iExtra += (output[iOut].iNum - 1);
+      free(dTmp);
     }
   }
 
@@ -2019,22 +2097,19 @@ void LogGridOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
   char cUnit[OUTLEN], cTmp[OUTLEN];
 
   for (iCol = 0; iCol < files->Outfile[iBody].iNumGrid; iCol++) {
-    for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
-      if (memcmp(files->Outfile[iBody].caGrid[iCol], output[iOut].cName,
-                 strlen(output[iOut].cName)) == 0) {
-        /* Match! */
-        dTmp = malloc(output[iOut].iNum * sizeof(double));
-        fnWrite[iOut](body, control, &output[iOut], system,
-                      &control->Units[iBody], update, iBody, dTmp, cUnit);
-        for (iSubOut = 0; iSubOut < output[iOut].iNum; iSubOut++) {
-          strcpy(cCol[iCol + iSubOut + iExtra],
-                 files->Outfile[iBody].caGrid[iCol]);
-          sprintf(cTmp, "[%s]", cUnit);
-          strcat(cCol[iCol + iSubOut + iExtra], cTmp);
-        }
-        iExtra += (output[iOut].iNum - 1);
-        free(dTmp);
+    iOut = files->Outfile[iBody].iaGrid[iCol];
+    if (iOut >= 0) {
+      dTmp = malloc(output[iOut].iNum * sizeof(double));
+      fnWrite[iOut](body, control, &output[iOut], system,
+                    &control->Units[iBody], update, iBody, dTmp, cUnit);
+      for (iSubOut = 0; iSubOut < output[iOut].iNum; iSubOut++) {
+        strcpy(cCol[iCol + iSubOut + iExtra],
+               files->Outfile[iBody].caGrid[iCol]);
+        sprintf(cTmp, "[%s]", cUnit);
+        strcat(cCol[iCol + iSubOut + iExtra], cTmp);
       }
+      iExtra += (output[iOut].iNum - 1);
+      free(dTmp);
     }
   }
 
@@ -2073,6 +2148,12 @@ void LogOptions(CONTROL *control, FILES *files, MODULE *module, SYSTEM *system,
   fprintf(fp, "Crossover Decade for Scientific Notation: %d\n",
           control->Io.iSciNot);
   fprintf(fp, "Number of Digits After Decimal: %d\n", control->Io.iDigits);
+  fprintf(fp, "Output Format: ");
+  if (control->Io.iOutputFormat == OUTPUTBINARY) {
+    fprintf(fp, "Binary\n");
+  } else {
+    fprintf(fp, "Text\n");
+  }
 
   if (control->Evolve.bDoForward || control->Evolve.bDoBackward) {
     LogIntegration(control, fp);
@@ -2121,6 +2202,7 @@ void LogBody(BODY *body, CONTROL *control, FILES *files, MODULE *module,
       }
     }
     LogBodyRelations(control, fp, iBody);
+    LogFrozenVariables(control, update, fp, iBody);
     /* Log modules */
     for (iModule = 0; iModule < module->iNumModules[iBody]; iModule++) {
       module->fnLogBody[iBody][iModule](body, control, output, system, update,
@@ -2134,6 +2216,120 @@ void LogBody(BODY *body, CONTROL *control, FILES *files, MODULE *module,
   }
 }
 
+/*
+ * MEMORY OUTPUT
+ *
+ * A run that is given a MEMORYOUTPUT (see main_impl) writes no files: the
+ * log goes to a stream in memory and every row that would have gone to a
+ * forward, backward or climate file is appended to a growable array instead.
+ * These buffers are allocated outside of the run's tracked memory, so they
+ * are still there when the run returns, e.g. to be handed to Python. EndRun
+ * does not free them, even if the run ended early: the caller of main_impl
+ * releases them with FreeMemoryOutput whatever the run's status, so they must
+ * always be in a state that it can free.
+ */
+
+void InitializeMemoryOutput(MEMORYOUTPUT *memory, int iNumBodies) {
+  memory->Array = calloc(iNumBodies, sizeof(MEMORYARRAY));
+  memory->Grid  = calloc(iNumBodies, sizeof(MEMORYARRAY));
+  if (memory->Array == NULL || memory->Grid == NULL) {
+    fprintf(stderr, "ERROR: Unable to allocate memory for the output.\n");
+    ExitVplanet(EXIT_WRITE);
+  }
+  memory->iNumBodies = iNumBodies;
+}
+
+void AppendMemoryRow(MEMORYARRAY *array, double daRow[], int iNumCols) {
+  int iCol, iMaxRows;
+  double *daData;
+
+  /* Each column is contiguous, so growing means moving every column to its
+     place in a larger block. Doubling keeps the cost per row constant. */
+  if (array->iNumRows == array->iMaxRows) {
+    iMaxRows = (array->iMaxRows > 0) ? 2 * array->iMaxRows : 64;
+    daData   = (malloc)((size_t)iMaxRows * iNumCols * sizeof(double));
+    if (daData == NULL) {
+      fprintf(stderr, "ERROR: Unable to allocate memory for the output.\n");
+      ExitVplanet(EXIT_WRITE);
+    }
+    for (iCol = 0; iCol < array->iNumCols; iCol++) {
+      memcpy(daData + (size_t)iCol * iMaxRows,
+             array->daData + (size_t)iCol * array->iMaxRows,
+             array->iNumRows * sizeof(double));
+    }
+    (free)(array->daData);
+    array->daData   = daData;
+    array->iMaxRows = iMaxRows;
+  }
+
+  array->iNumCols = iNumCols;
+  for (iCol = 0; iCol < iNumCols; iCol++) {
+    array->daData[(size_t)iCol * array->iMaxRows + array->iNumRows] =
+          daRow[iCol];
+  }
+  array->iNumRows++;
+}
+
+/* Open the log for writing (cMode "w") or appending (cMode "a"). */
+FILE *OpenLog(FILES *files, char cMode[]) {
+  MEMORYOUTPUT *memory = MemoryOutput();
+
+  if (memory == NULL) {
+    return fopen(files->cLog, cMode);
+  }
+
+  if (cMode[0] == 'w' && memory->fpLog != NULL) {
+    (fclose)(memory->fpLog);
+    memory->fpLog = NULL;
+    (free)(memory->cLog);
+    memory->cLog     = NULL;
+    memory->iLogSize = 0;
+  }
+  if (memory->fpLog == NULL) {
+    memory->fpLog = OpenMemoryStream(&memory->cLog, &memory->iLogSize);
+    if (memory->fpLog == NULL) {
+      fprintf(stderr, "ERROR: Unable to open the log in memory.\n");
+      ExitVplanet(EXIT_WRITE);
+    }
+  }
+  return memory->fpLog;
+}
+
+/* Close the log, or, if it is in memory, bring cLog up to date. */
+void CloseLog(FILE *fp) {
+  MEMORYOUTPUT *memory = MemoryOutput();
+
+  if (memory == NULL) {
+    fclose(fp);
+    return;
+  }
+
+  FlushMemoryStream(fp, &memory->cLog, &memory->iLogSize);
+}
+
+/* Release everything a run left in memory. */
+void FreeMemoryOutput(MEMORYOUTPUT *memory) {
+  int iBody;
+
+  if (memory->fpLog != NULL) {
+    (fclose)(memory->fpLog);
+    memory->fpLog = NULL;
+  }
+  (free)(memory->cLog);
+  memory->cLog     = NULL;
+  memory->iLogSize = 0;
+
+  for (iBody = 0; iBody < memory->iNumBodies; iBody++) {
+    (free)(memory->Array[iBody].daData);
+    (free)(memory->Grid[iBody].daData);
+  }
+  (free)(memory->Array);
+  (free)(memory->Grid);
+  memory->Array      = NULL;
+  memory->Grid       = NULL;
+  memory->iNumBodies = 0;
+}
+
 void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
               OPTIONS *options, OUTPUT *output, SYSTEM *system, UPDATE *update,
               fnUpdateVariable ***fnUpdate, fnWriteOutput fnWrite[], int iEnd) {
@@ -2147,16 +2343,16 @@ void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
 
   if (iEnd == 0) {
     sprintf(cTime, "Input");
-    fp = fopen(files->cLog, "w");
+    fp = OpenLog(files, "w");
   } else if (iEnd == 1) {
     sprintf(cTime, "Final");
-    fp = fopen(files->cLog, "a");
+    fp = OpenLog(files, "a");
   } else if (iEnd == -1) {
     sprintf(cTime, "Initial");
-    fp = fopen(files->cLog, "w");
+    fp = OpenLog(files, "w");
   } else {
     fprintf(stderr, "ERROR: Unknown cTime in output.c:WriteLog.\n");
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   if (!iEnd) {
@@ -2182,22 +2378,62 @@ void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
       printf("Runtime = %d s\n", (int)dTotTime);
   }
   */
-  fclose(fp);
+  CloseLog(fp);
+}
+
+void WriteBinaryHeader(BODY *body, CONTROL *control, FILES *files,
+                       OUTPUT *output, SYSTEM *system, UPDATE *update,
+                       fnWriteOutput fnWrite[], FILE *fp, int iBody,
+                       int iNumCols) {
+  /* Binary output files begin with an ASCII header that describes the rows
+     of raw doubles that follow it. The header is padded so that the data
+     start on an 8-byte boundary, which allows them to be memory-mapped. */
+  int iOne = 1;
+  long lHeader;
+
+  fprintf(fp, "VPLANET BINARY OUTPUT\n");
+  fprintf(fp, "Version: %s\n", control->sGitVersion);
+  fprintf(fp, "Columns: %d\n", iNumCols);
+  fprintf(fp, "Row Stride: %d\n", (int)(iNumCols * sizeof(double)));
+  fprintf(fp, "Byte Order: ");
+  if (*(char *)&iOne == 1) {
+    fprintf(fp, "little\n");
+  } else {
+    fprintf(fp, "big\n");
+  }
+  LogOutputOrder(body, control, files, output, system, update, fnWrite, fp,
+                 iBody);
+  fprintf(fp, "End Header");
+
+  lHeader = ftell(fp) + 1;
+  while (lHeader % sizeof(double) != 0) {
+    fprintf(fp, " ");
+    lHeader++;
+  }
+  fprintf(fp, "\n");
 }
 
 void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
                  SYSTEM *system, UPDATE *update, fnWriteOutput *fnWrite,
                  double dTime, double dDt) {
-  int iBody, iCol, iOut, iSubOut, iExtra = 0, iGrid, iLat, jBody, j;
-  double dCol[NUMOPT], *dTmp, dGrid[NUMOPT];
+  int iBody, iCol, iOut = 0, iExtra = 0, iGrid, iLat, jBody, j;
+  double dCol[NUMOPT], dTmp[1], dGrid[NUMOPT];
   FILE *fp;
   char cUnit[OPTLEN], cPoiseGrid[3 * NAMELEN], cLaplaceFunc[3 * NAMELEN];
+  MEMORYOUTPUT *memory = MemoryOutput();
 
   /* Write out all data columns for each body. As some data may span more than
-     1 column, we search the input list sequentially, adding iExtra to the
-     total number of columns as we go. The calls to fnWrite return the column
-     value in the correct units, and output.iNum already contains the
-     number of columns. */
+     1 column, we step through the input list sequentially, adding iExtra to
+     the total number of columns as we go. The calls to fnWrite return the
+     column value in the correct units, and output.iNum already contains the
+     number of columns. The output index of each column was found in
+     VerifyOutputOrder, and the output files stay open until CloseOutput.
+     If the output is kept in memory, the rows are appended to arrays
+     instead. */
+
+  if (memory != NULL && memory->Array == NULL) {
+    InitializeMemoryOutput(memory, control->Evolve.iNumBodies);
+  }
 
   for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
 
@@ -2207,60 +2443,58 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
     }
 
     for (iCol = 0; iCol < files->Outfile[iBody].iNumCols; iCol++) {
-      for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
-        if (output[iOut].bGrid == 0 || output[iOut].bGrid == 2) {
-          if (memcmp(files->Outfile[iBody].caCol[iCol], output[iOut].cName,
-                     strlen(output[iOut].cName)) == 0) {
-            /* Match! */
-            dTmp = malloc(output[iOut].iNum * sizeof(double));
-            fnWrite[iOut](body, control, &output[iOut], system,
-                          &control->Units[iBody], update, iBody, dTmp, cUnit);
-            for (iSubOut = 0; iSubOut < output[iOut].iNum; iSubOut++) {
-              dCol[iCol + iSubOut + iExtra] = dTmp[iSubOut];
-            }
-            iExtra += (output[iOut].iNum - 1);
-            free(dTmp);
-            dTmp = NULL;
-          }
-        }
+      iOut = files->Outfile[iBody].iaCol[iCol];
+      if (iOut >= 0) {
+        fnWrite[iOut](body, control, &output[iOut], system,
+                      &control->Units[iBody], update, iBody,
+                      &dCol[iCol + iExtra], cUnit);
+        iExtra += (output[iOut].iNum - 1);
       }
     }
 
     /* Now write the columns */
-    if (files->Outfile[iBody].iNumCols > 0) {
-      fp = fopen(files->Outfile[iBody].cOut, "a");
+    if (files->Outfile[iBody].iNumCols > 0 && memory != NULL) {
+      AppendMemoryRow(&memory->Array[iBody], dCol,
+                      files->Outfile[iBody].iNumCols + iExtra);
+    } else if (files->Outfile[iBody].iNumCols > 0 &&
+               control->Io.iOutputFormat == OUTPUTBINARY) {
+      if (files->Outfile[iBody].fp == NULL) {
+        files->Outfile[iBody].fp = fopen(files->Outfile[iBody].cOut, "ab");
+        fseek(files->Outfile[iBody].fp, 0, SEEK_END);
+        if (ftell(files->Outfile[iBody].fp) == 0) {
+          WriteBinaryHeader(body, control, files, output, system, update,
+                            fnWrite, files->Outfile[iBody].fp, iBody,
+                            files->Outfile[iBody].iNumCols + iExtra);
+        }
+      }
+      fwrite(dCol, sizeof(double), files->Outfile[iBody].iNumCols + iExtra,
+             files->Outfile[iBody].fp);
+    } else if (files->Outfile[iBody].iNumCols > 0) {
+      if (files->Outfile[iBody].fp == NULL) {
+        files->Outfile[iBody].fp = fopen(files->Outfile[iBody].cOut, "a");
+      }
+      fp = files->Outfile[iBody].fp;
       for (iCol = 0; iCol < files->Outfile[iBody].iNumCols + iExtra; iCol++) {
-        // printf("%d %d\n",iBody,iCol);
-        // fflush(stdout);
         fprintd(fp, dCol[iCol], control->Io.iSciNot, control->Io.iDigits);
         fprintf(fp, " ");
       }
       fprintf(fp, "\n");
-      fclose(fp);
     }
 
     /* Grid outputs, currently only set up for POISE */
     if (body[iBody].bPoise) {
-      dTmp = malloc(1 * sizeof(double));
       for (iLat = 0; iLat < body[iBody].iNumLats; iLat++) {
         for (iGrid = 0; iGrid < files->Outfile[iBody].iNumGrid; iGrid++) {
-          for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
-            if (output[iOut].bGrid == 1 || output[iOut].bGrid == 2) {
-              if (memcmp(files->Outfile[iBody].caGrid[iGrid],
-                         output[iOut].cName, strlen(output[iOut].cName)) == 0) {
-                body[iBody].iWriteLat = iLat;
-                fnWrite[iOut](body, control, &output[iOut], system,
-                              &control->Units[iBody], update, iBody, dTmp,
-                              cUnit);
-                dGrid[iGrid] = *dTmp;
-              }
-            }
+          iOut = files->Outfile[iBody].iaGrid[iGrid];
+          if (iOut >= 0) {
+            body[iBody].iWriteLat = iLat;
+            fnWrite[iOut](body, control, &output[iOut], system,
+                          &control->Units[iBody], update, iBody, dTmp, cUnit);
+            dGrid[iGrid] = *dTmp;
           }
         }
         /* Now write the columns */
 
-        sprintf(cPoiseGrid, "%s.%s.Climate", system->cName, body[iBody].cName);
-
         if (control->Evolve.dTime == 0 && iLat == 0) {
           if (body[iBody].iClimateModel == SEA) {
             WriteDailyInsol(body, control, &output[iOut], system,
@@ -2281,11 +2515,19 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
               body[iBody].dSeasNextOutput = body[iBody].dSeasOutputTime;
             }
           }
-          fp = fopen(cPoiseGrid, "w");
-        } else {
-          fp = fopen(cPoiseGrid, "a");
         }
 
+        if (memory == NULL && files->Outfile[iBody].fpGrid == NULL) {
+          sprintf(cPoiseGrid, "%s.%s.Climate", system->cName,
+                  body[iBody].cName);
+          if (control->Evolve.dTime == 0) {
+            files->Outfile[iBody].fpGrid = fopen(cPoiseGrid, "w");
+          } else {
+            files->Outfile[iBody].fpGrid = fopen(cPoiseGrid, "a");
+          }
+        }
+        fp = files->Outfile[iBody].fpGrid;
+
         if (body[iBody].dSeasOutputTime != 0) {
           if (control->Evolve.dTime >= body[iBody].dSeasNextOutput &&
               iLat == 0) {
@@ -2308,15 +2550,18 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
           }
         }
 
+        if (memory != NULL) {
+          AppendMemoryRow(&memory->Grid[iBody], dGrid,
+                          files->Outfile[iBody].iNumGrid + iExtra);
+          continue;
+        }
         for (iGrid = 0; iGrid < files->Outfile[iBody].iNumGrid + iExtra;
              iGrid++) {
           fprintd(fp, dGrid[iGrid], control->Io.iSciNot, control->Io.iDigits);
           fprintf(fp, " ");
         }
         fprintf(fp, "\n");
-        fclose(fp);
       }
-      free(dTmp);
     }
   }
 
@@ -2429,6 +2674,28 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
   }
 }
 
+/**
+  Flush and close the output files that WriteOutput keeps open during the
+  integration. Must be called once the evolution has finished or halted.
+
+@param control A pointer to the CONTROL struct
+@param files A pointer to the FILES struct
+*/
+void CloseOutput(CONTROL *control, FILES *files) {
+  int iBody;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    if (files->Outfile[iBody].fp != NULL) {
+      fclose(files->Outfile[iBody].fp);
+      files->Outfile[iBody].fp = NULL;
+    }
+    if (files->Outfile[iBody].fpGrid != NULL) {
+      fclose(files->Outfile[iBody].fpGrid);
+      files->Outfile[iBody].fpGrid = NULL;
+    }
+  }
+}
+
 void InitializeOutput(OUTPUT *output, fnWriteOutput fnWrite[]) {
   int iOut, iBody, iModule;
 
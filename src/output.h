@@ -21,6 +21,11 @@
 #define EXIT_INT 5
 #define EXIT_OUTPUT 6
 
+/* Output File Format */
+
+#define OUTPUTTEXT 0
+#define OUTPUTBINARY 1
+
 /* Verbosity Level */
 
 #define VERBERR 1
@@ -118,6 +123,12 @@ void WriteLogEntry(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
 void InitializeOutputFunctions(MODULE *, OUTPUT *, int);
 void WriteOutput(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *, UPDATE *,
                  fnWriteOutput *, double, double);
+void CloseOutput(CONTROL *, FILES *);
+void InitializeMemoryOutput(MEMORYOUTPUT *, int);
+void AppendMemoryRow(MEMORYARRAY *, double[], int);
+FILE *OpenLog(FILES *, char[]);
+void CloseLog(FILE *);
+void FreeMemoryOutput(MEMORYOUTPUT *);
 void WriteLog(BODY *, CONTROL *, FILES *, MODULE *, OPTIONS *, OUTPUT *,
               SYSTEM *, UPDATE *, fnUpdateVariable ***, fnWriteOutput *, int);
 void InitializeOutput(OUTPUT *, fnWriteOutput *);
@@ -1659,7 +1659,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_COLDSTART].cName, options[OPT_FIXICELAT].cName,
                 options[OPT_ALBEDOZA].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1675,7 +1675,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_COLDSTART].cName, options[OPT_FIXICELAT].cName,
                 cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1690,7 +1690,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_COLDSTART].cName, options[OPT_ALBEDOZA].cName,
                 cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1705,7 +1705,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_FIXICELAT].cName, options[OPT_ALBEDOZA].cName,
                 cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1719,7 +1719,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_ALBEDOLAND].cName, options[OPT_ALBEDOWATER].cName,
                 cFile, options[OPT_SURFALBEDO].cName);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1732,7 +1732,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_SURFALBEDO].cName, cFile,
                 options[OPT_ALBEDOLAND].cName, options[OPT_ALBEDOWATER].cName);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -1746,7 +1746,7 @@ void VerifyIceSheets(BODY *body, OPTIONS *options, char cFile[], int iBody,
       fprintf(stderr, "ERROR: Cannot set %s in annual model in File:%s\n",
               options[OPT_ICESHEETS].cName, cFile);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
     // LCOV_EXCL_STOP
   }
 }
@@ -1762,7 +1762,7 @@ void VerifyOLR(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 in File:%s\n",
                 options[OPT_PLANCKA].cName, options[OPT_PLANCKB].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1774,7 +1774,7 @@ void VerifyOLR(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 in File:%s\n",
                 options[OPT_PCO2].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -1791,12 +1791,12 @@ void VerifyOrbitOblData(BODY *body,CONTROL *control,OPTIONS *options,\
       fprintf(stderr,"ERROR: Must set %s if using %s for file %s\n",\
         options[OPT_FILEORBITOBLDATA].cName,\
         options[OPT_READORBITOBLDATA].cName,body[iBody].cName);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     } else {
       fileorb = fopen(body[iBody].cFileOrbitOblData,"r");
       if (fileorb == NULL) {
         printf("ERROR: File %s not found.\n", body[iBody].cFileOrbitOblData);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
       iNLines = 0;
       while ((c = getc(fileorb)) != EOF) {
@@ -1855,22 +1855,22 @@ void VerifyOrbitOblData(BODY *body,CONTROL *control,OPTIONS *options,\
     body[iBody].iCurrentStep = 0;
     if (control->Evolve.bVarDt) {
       fprintf(stderr,"ERROR: Cannot use variable time step (%s = 1) if %s = 1\n",options[OPT_VARDT].cName,options[OPT_READORBITDATA].cName);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
     if (control->Evolve.bDoForward) {
       if (body[iBody].daTimeSeries[1] != control->Evolve.dTimeStep) {
         fprintf(stderr,"ERROR: Time step size (%s = 1) must match orbital data if %s = 1\n",options[OPT_TIMESTEP].cName,options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     } else if (control->Evolve.bDoBackward) {
       if (body[iBody].daTimeSeries[1] != -1*control->Evolve.dTimeStep) {
         fprintf(stderr,"ERROR: Time step size (%s = 1) must match orbital data if %s = 1\n",options[OPT_TIMESTEP].cName,options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     }
     if (iNLines < (control->Evolve.dStopTime/control->Evolve.dTimeStep+1) ) {
       fprintf(stderr,"ERROR: Input orbit data must at least as long as vplanet integration (%f years)\n",control->Evolve.dStopTime/YEARSEC);
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
     }
 
   }
@@ -2499,7 +2499,7 @@ void VerifyAstro(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 %s\n",
                 options[OPT_FORCEOBLIQ].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     } else {
       body[iBody].dObliq0 = body[iBody].dObliquity;
@@ -2519,7 +2519,7 @@ void VerifyAstro(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 %s\n",
                 options[OPT_FORCEECC].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     } else {
       body[iBody].dEcc0 = body[iBody].dEcc;
@@ -2552,7 +2552,7 @@ void VerifyDiffusion(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 "File:%s\n",
                 options[OPT_DIFFUSION].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
     if (body[iBody].bHadley) {
@@ -2563,7 +2563,7 @@ void VerifyDiffusion(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 "in File:%s\n",
                 cFile);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -2581,7 +2581,7 @@ void VerifySeasOutputTime(BODY *body, CONTROL *control, OPTIONS *options,
                 options[OPT_SEASOUTPUTTIME].cName, cFile,
                 options[OPT_OUTPUTTIME].cName);
       }
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -3314,15 +3314,7 @@ void WriteDailyInsol(BODY *body, CONTROL *control, OUTPUT *output,
   int iLat, iDay;
   double dTime;
 
-  struct stat st = {0};
-  if (stat("SeasonalClimateFiles", &st) == -1) {
-
-#ifdef _WIN32
-    mkdir("SeasonalClimateFiles");
-#else
-    mkdir("SeasonalClimateFiles", 0700);
-#endif
-  }
+  MakeRunDirectory("SeasonalClimateFiles");
 
   dTime = control->Evolve.dTime / fdUnitsTime(units->iTime);
 
@@ -3367,15 +3359,7 @@ void WritePlanckB(BODY *body, CONTROL *control, OUTPUT *output, SYSTEM *system,
   int iLat, iDay;
   double dTime;
 
-  struct stat st = {0};
-  if (stat("SeasonalClimateFiles", &st) == -1) {
-
-#ifdef _WIN32
-    mkdir("SeasonalClimateFiles");
-#else
-    mkdir("SeasonalClimateFiles", 0700);
-#endif
-  }
+  MakeRunDirectory("SeasonalClimateFiles");
 
   dTime = control->Evolve.dTime / fdUnitsTime(units->iTime);
 
@@ -3421,15 +3405,7 @@ void WriteSeasonalTemp(BODY *body, CONTROL *control, OUTPUT *output,
   int iLat, iDay;
   double dTime;
 
-  struct stat st = {0};
-  if (stat("SeasonalClimateFiles", &st) == -1) {
-
-#ifdef _WIN32
-    mkdir("SeasonalClimateFiles");
-#else
-    mkdir("SeasonalClimateFiles", 0700);
-#endif
-  }
+  MakeRunDirectory("SeasonalClimateFiles");
 
   dTime = control->Evolve.dTime / fdUnitsTime(units->iTime);
 
@@ -3478,15 +3454,7 @@ void WriteSeasonalFluxes(BODY *body, CONTROL *control, OUTPUT *output,
   int iLat, iDay;
   double dTime;
 
-  struct stat st = {0};
-  if (stat("SeasonalClimateFiles", &st) == -1) {
-
-#ifdef _WIN32
-    mkdir("SeasonalClimateFiles");
-#else
-    mkdir("SeasonalClimateFiles", 0700);
-#endif
-  }
+  MakeRunDirectory("SeasonalClimateFiles");
 
   dTime = control->Evolve.dTime / fdUnitsTime(units->iTime);
 
@@ -3574,15 +3542,7 @@ void WriteSeasonalIceBalance(BODY *body, CONTROL *control, OUTPUT *output,
   int iLat, iDay;
   double dTime;
 
-  struct stat st = {0};
-  if (stat("SeasonalClimateFiles", &st) == -1) {
-
-#ifdef _WIN32
-    mkdir("SeasonalClimateFiles");
-#else
-    mkdir("SeasonalClimateFiles", 0700);
-#endif
-  }
+  MakeRunDirectory("SeasonalClimateFiles");
 
   dTime = control->Evolve.dTime / fdUnitsTime(units->iTime);
 
@@ -4475,6 +4435,7 @@ void AddModulePoise(CONTROL *control, MODULE *module, int iBody, int iModule) {
         &InitializeUpdateTmpBodyPoise;
   module->fnCountHalts[iBody][iModule] = &CountHaltsPoise;
   module->fnLogBody[iBody][iModule]    = &LogBodyPoise;
+  module->fnCheckpoint[iBody][iModule] = &CheckpointPoise;
 
   module->fnReadOptions[iBody][iModule]       = &ReadOptionsPoise;
   module->fnVerify[iBody][iModule]            = &VerifyPoise;
@@ -4796,7 +4757,7 @@ void fvNorthIceCapLand(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvNorthIceCapLand.\n");
-  exit(EXIT_INT);
+  ExitVplanet(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -4842,7 +4803,7 @@ void fvNorthIceCapSea(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvNorthIceCapSea.\n");
-  exit(EXIT_INT);
+  ExitVplanet(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -4889,7 +4850,7 @@ void fvSouthIceCapLand(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvSouthIceCapLand.\n");
-  exit(EXIT_INT);
+  ExitVplanet(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -4935,7 +4896,7 @@ void fvSouthIceCapSea(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvSouthIceCapSea.\n");
-  exit(EXIT_INT);
+  ExitVplanet(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -5387,6 +5348,126 @@ void ForceBehaviorPoise(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
   }
 }
 
+void CheckpointPoise(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                     CHECKPOINT *ckpt, int iBody) {
+  /* Each call of the energy balance model starts from the climate the
+     previous one left, so carry the latitudinal grids across. */
+  int iNumLats = body[iBody].iNumLats;
+  int iLat, iGrid;
+
+  CheckpointInts(ckpt, &body[iBody].iNDays, 1);
+  CheckpointInts(ckpt, &body[iBody].iNStepInYear, 1);
+  CheckpointInts(ckpt, &body[iBody].bSnowball, 1);
+  CheckpointInts(ckpt, &body[iBody].bSkipSeas, 1);
+  CheckpointInts(ckpt, &body[iBody].iWriteLat, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dSeasNextOutput, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dSurfAlbedo, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dTGlobal, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dTGlobalTmp, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dAlbedoGlobal, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dAlbedoGlobalTmp, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dFluxInGlobal, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dFluxInGlobalTmp, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dFluxOutGlobal, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dFluxOutGlobalTmp, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dIceMassTot, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dIceFlowTot, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dIceBalanceTot, 1);
+  CheckpointDoubles(ckpt, &body[iBody].dAreaIceCov, 1);
+
+  double *daGrid[] = {body[iBody].daAnnualInsol, body[iBody].daPeakInsol,
+                      body[iBody].daFlux,        body[iBody].daFluxIn,
+                      body[iBody].daFluxOut,     body[iBody].daDivFlux,
+                      body[iBody].daIceHeight,   body[iBody].daIceFlow,
+                      body[iBody].daTGrad,       body[iBody].daDMidPt,
+                      body[iBody].daDeltaTempL,  body[iBody].daDeltaTempW,
+                      body[iBody].daEnergyResL,  body[iBody].daEnergyResW,
+                      body[iBody].daEnerResLAnn, body[iBody].daEnerResWAnn,
+                      body[iBody].daDIceHeightDy};
+  for (iGrid = 0; iGrid < (int)(sizeof(daGrid) / sizeof(daGrid[0]));
+       iGrid++) {
+    CheckpointDoubles(ckpt, daGrid[iGrid], iNumLats);
+  }
+  CheckpointDoubles(ckpt, body[iBody].daIceFlowMid, iNumLats + 1);
+
+  if (body[iBody].iClimateModel == ANN || body[iBody].bSkipSeasEnabled) {
+    double *daAnn[] = {body[iBody].daTempAnn,      body[iBody].daTmpTempAnn,
+                       body[iBody].daTempTerms,    body[iBody].daTmpTempTerms,
+                       body[iBody].daAlbedoAnn,    body[iBody].daPlanckAAnn,
+                       body[iBody].daPlanckBAnn,   body[iBody].daSourceF,
+                       body[iBody].daScaleAnn,     body[iBody].daUnitVAnn};
+    for (iGrid = 0; iGrid < (int)(sizeof(daAnn) / sizeof(daAnn[0]));
+         iGrid++) {
+      CheckpointDoubles(ckpt, daAnn[iGrid], iNumLats);
+    }
+    CheckpointDoubles(ckpt, body[iBody].daDiffusionAnn, iNumLats + 1);
+    CheckpointDoubles(ckpt, body[iBody].daLambdaAnn, iNumLats + 1);
+    CheckpointInts(ckpt, body[iBody].iaRowswapAnn, iNumLats);
+    for (iLat = 0; iLat < iNumLats; iLat++) {
+      CheckpointDoubles(ckpt, body[iBody].daMClim[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMDiffAnn[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMEulerAnn[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMEulerCopyAnn[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daInvMAnn[iLat], iNumLats);
+    }
+  }
+
+  if (body[iBody].iClimateModel == SEA) {
+    double *daSea[] = {
+          body[iBody].daTempLand,      body[iBody].daTempWater,
+          body[iBody].daTempLW,        body[iBody].daTempMaxLW,
+          body[iBody].daTempMaxLand,   body[iBody].daTempMaxWater,
+          body[iBody].daTempMinLW,     body[iBody].daTempAvg,
+          body[iBody].daTempAvgL,      body[iBody].daTempAvgW,
+          body[iBody].daFluxOutLand,   body[iBody].daFluxOutWater,
+          body[iBody].daFluxInLand,    body[iBody].daFluxInWater,
+          body[iBody].daFluxAvg,       body[iBody].daFluxInAvg,
+          body[iBody].daFluxOutAvg,    body[iBody].daDivFluxAvg,
+          body[iBody].daSeaIceHeight,  body[iBody].daSeaIceK,
+          body[iBody].daFluxSeaIce,    body[iBody].daAlbedoLand,
+          body[iBody].daAlbedoWater,   body[iBody].daAlbedoLW,
+          body[iBody].daAlbedoAvg,     body[iBody].daAlbedoAvgL,
+          body[iBody].daAlbedoAvgW,    body[iBody].daSourceL,
+          body[iBody].daSourceW,       body[iBody].daPlanckASea,
+          body[iBody].daPlanckBSea,    body[iBody].daPlanckBAvg,
+          body[iBody].daIceMassTmp,    body[iBody].daIceBalanceTmp,
+          body[iBody].daIceBalanceAvg, body[iBody].daIceFlowAvg,
+          body[iBody].daIceAccumTot,   body[iBody].daIceAblateTot,
+          body[iBody].daBedrockH,      body[iBody].daBedrockHEq,
+          body[iBody].daSedShear,      body[iBody].daBasalVel,
+          body[iBody].daBasalFlow,     body[iBody].daIcePropsTmp,
+          body[iBody].daIceGamTmp,     body[iBody].daIceBalanceAnnual,
+          body[iBody].daIceMass};
+    for (iGrid = 0; iGrid < (int)(sizeof(daSea) / sizeof(daSea[0]));
+         iGrid++) {
+      CheckpointDoubles(ckpt, daSea[iGrid], iNumLats);
+    }
+    CheckpointDoubles(ckpt, body[iBody].daDiffusionSea, iNumLats + 1);
+    CheckpointDoubles(ckpt, body[iBody].daLambdaSea, iNumLats + 1);
+    CheckpointDoubles(ckpt, body[iBody].daBasalFlowMid, iNumLats + 1);
+    CheckpointDoubles(ckpt, body[iBody].daIceSheetDiff, iNumLats + 1);
+    CheckpointDoubles(ckpt, body[iBody].daTmpTempSea, 2 * iNumLats);
+    CheckpointDoubles(ckpt, body[iBody].daSourceLW, 2 * iNumLats);
+    CheckpointDoubles(ckpt, body[iBody].daScaleSea, 2 * iNumLats);
+    CheckpointDoubles(ckpt, body[iBody].daUnitVSea, 2 * iNumLats);
+    CheckpointInts(ckpt, body[iBody].iaRowswapSea, 2 * iNumLats);
+    for (iLat = 0; iLat < iNumLats; iLat++) {
+      CheckpointDoubles(ckpt, body[iBody].daIceBalance[iLat],
+                        body[iBody].iNStepInYear);
+      CheckpointDoubles(ckpt, body[iBody].daMLand[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMWater[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMDiffSea[iLat], iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daIceSheetMat[iLat], iNumLats);
+    }
+    for (iLat = 0; iLat < 2 * iNumLats; iLat++) {
+      CheckpointDoubles(ckpt, body[iBody].daMEulerSea[iLat], 2 * iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMEulerCopySea[iLat], 2 * iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daMInit[iLat], 2 * iNumLats);
+      CheckpointDoubles(ckpt, body[iBody].daInvMSea[iLat], 2 * iNumLats);
+    }
+  }
+}
+
 
 /**
 Calculates eccentric anomaly from true anomaly
@@ -5891,7 +5972,7 @@ void PoiseAnnual(BODY *body, int iBody) {
     if (iIter >= iIterMax) {
       fprintf(stderr,
               "POISE solution not converged before max iterations reached.\n");
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
     if (body[iBody].bCalcAB == 1) {
@@ -7617,7 +7698,7 @@ void IceSheetTriDiag(BODY *body, int iBody) {
     // LCOV_EXCL_START
     if (bTmp == 0) {
       fprintf(stderr, "Ice sheet tri-diagonal solution failed\n");
-      exit(EXIT_INPUT);
+      ExitVplanet(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
     body[iBody].daIceHeight[iLat] = (body[iBody].daIcePropsTmp[iLat] -
@@ -255,6 +255,7 @@ void LogBodyPoise(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
 void PropsAuxPoise(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void ForceBehaviorPoise(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *, UPDATE *,
                         fnUpdateVariable ***, int, int);
+void CheckpointPoise(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *, int);
 void fvAlbedoAnnual(BODY *, int);
 void fvAlbedoSeasonal(BODY *, int, int);
 void fvAnnualInsolation(BODY *, int);
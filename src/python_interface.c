@@ -7,9 +7,10 @@
 
 #ifdef VPLANET_PYTHON_INTERFACE
 
-#include "vplanet.h"
+// Python.h must come first, and before vplanet.h redefines malloc and free
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include "vplanet.h"
 
 // Get the code version, passed in as a macro
 #ifndef VPLANET_VERSION
@@ -24,7 +25,8 @@
 #endif
 #endif
 
-int main_impl(int, const char *(*)[9]);
+int main_impl(int, const char *(*)[9], const char *, FILE *, MEMORYINPUT *,
+              MEMORYOUTPUT *);
 
 static PyObject *vplanet_core_version(PyObject *self, PyObject *args) {
   const char *version = VPLANET_VERSION_STRING;
@@ -33,35 +35,321 @@ static PyObject *vplanet_core_version(PyObject *self, PyObject *args) {
   return pVersion;
 }
 
-static PyObject *vplanet_core_run(PyObject *self, PyObject *args) {
+/* Append a (name, description, extra) tuple to pList for each entry of a
+   registry that is in use, i.e. whose name is not "null". */
+static int AppendRegistry(PyObject *pList, const char *cName,
+                          const char *cDescr, const char *cExtra) {
+  PyObject *pItem;
+  int iStatus;
+
+  if (memcmp(cName, "null", 4) == 0) {
+    return 0;
+  }
+  pItem = Py_BuildValue("(sss)", cName, cDescr, cExtra);
+  if (pItem == NULL) {
+    return -1;
+  }
+  iStatus = PyList_Append(pList, pItem);
+  Py_DECREF(pItem);
+  return iStatus;
+}
+
+/* vplanet_core.registry() returns the option and output registries that
+   the help message is made from, as two lists of tuples: (name,
+   description, default) for the options and (name, description, negative
+   unit) for the outputs. The negative unit is empty for outputs that have
+   no negative option. The registries are filled in exactly as at the start
+   of a run, so the memory they use is released by EndRun. */
+static PyObject *vplanet_core_registry(PyObject *self, PyObject *args) {
+  jmp_buf jExitPoint;
+  OPTIONS *options;
+  OUTPUT *output;
+  fnReadOption fnRead[MODULEOPTEND];
+  fnWriteOutput fnWrite[MODULEOUTEND];
+  PyObject *volatile pOptions = NULL;
+  PyObject *volatile pOutputs = NULL;
+  volatile int iError         = 0;
+  int iOpt, iOut;
+
+  pOptions = PyList_New(0);
+  pOutputs = PyList_New(0);
+  if (pOptions == NULL || pOutputs == NULL) {
+    Py_XDECREF(pOptions);
+    Py_XDECREF(pOutputs);
+    return NULL;
+  }
+
+  if (setjmp(jExitPoint) == 0) {
+    BeginRun(&jExitPoint, NULL, NULL, NULL, NULL);
+    options = malloc(MODULEOPTEND * sizeof(OPTIONS));
+    InitializeOptions(options, fnRead);
+    output = malloc(MODULEOUTEND * sizeof(OUTPUT));
+    InitializeOutput(output, fnWrite);
+
+    for (iOpt = 0; iOpt < MODULEOPTEND && !iError; iOpt++) {
+      iError = AppendRegistry(pOptions, options[iOpt].cName,
+                              options[iOpt].cDescr, options[iOpt].cDefault);
+    }
+    for (iOut = 0; iOut < MODULEOUTEND && !iError; iOut++) {
+      iError = AppendRegistry(pOutputs, output[iOut].cName,
+                              output[iOut].cDescr,
+                              output[iOut].bNeg ? output[iOut].cNeg : "");
+    }
+  }
+
+  if (EndRun() != 0 && !iError) {
+    PyErr_SetString(PyExc_RuntimeError, "Unable to initialize VPLANET.");
+    iError = 1;
+  }
+  if (iError) {
+    Py_DECREF(pOptions);
+    Py_DECREF(pOutputs);
+    return NULL;
+  }
+  return Py_BuildValue("(NN)", pOptions, pOutputs);
+}
+
+/* An output array of a run whose output was kept in memory. It takes over
+   the MEMORYARRAY's block of doubles and exposes it through the buffer
+   protocol as a 2-D array of shape (rows, columns) whose columns are
+   contiguous, so that numpy.asarray() wraps it without a copy. */
+typedef struct {
+  PyObject_HEAD double *daData;
+  Py_ssize_t iaShape[2];
+  Py_ssize_t iaStrides[2];
+} MemoryArrayObject;
+
+static int MemoryArray_getbuffer(PyObject *self, Py_buffer *view, int flags) {
+  MemoryArrayObject *array = (MemoryArrayObject *)self;
+
+  if ((flags & PyBUF_STRIDES) != PyBUF_STRIDES) {
+    PyErr_SetString(PyExc_BufferError, "vplanet arrays are strided.");
+    view->obj = NULL;
+    return -1;
+  }
+  view->obj = self;
+  Py_INCREF(self);
+  view->buf        = array->daData;
+  view->len        = array->iaShape[0] * array->iaShape[1] * sizeof(double);
+  view->readonly   = 0;
+  view->itemsize   = sizeof(double);
+  view->format     = (flags & PyBUF_FORMAT) ? "d" : NULL;
+  view->ndim       = 2;
+  view->shape      = array->iaShape;
+  view->strides    = array->iaStrides;
+  view->suboffsets = NULL;
+  view->internal   = NULL;
+  return 0;
+}
+
+static void MemoryArray_dealloc(PyObject *self) {
+  (free)(((MemoryArrayObject *)self)->daData);
+  Py_TYPE(self)->tp_free(self);
+}
+
+static PyBufferProcs MemoryArray_as_buffer = {MemoryArray_getbuffer, NULL};
+
+static PyTypeObject MemoryArrayType = {
+      PyVarObject_HEAD_INIT(NULL, 0).tp_name = "vplanet_core.MemoryArray",
+      .tp_basicsize                          = sizeof(MemoryArrayObject),
+      .tp_dealloc                            = MemoryArray_dealloc,
+      .tp_as_buffer                          = &MemoryArray_as_buffer,
+      .tp_flags                              = Py_TPFLAGS_DEFAULT,
+      .tp_new                                = NULL,
+};
+
+static PyObject *MemoryArrayFromRun(MEMORYARRAY *memarray) {
+  MemoryArrayObject *array;
+
+  if (memarray->iNumRows == 0) {
+    Py_RETURN_NONE;
+  }
+  array = PyObject_New(MemoryArrayObject, &MemoryArrayType);
+  if (array == NULL) {
+    return NULL;
+  }
+  array->daData       = memarray->daData;
+  array->iaShape[0]   = memarray->iNumRows;
+  array->iaShape[1]   = memarray->iNumCols;
+  array->iaStrides[0] = sizeof(double);
+  array->iaStrides[1] = memarray->iMaxRows * sizeof(double);
+  memarray->daData    = NULL;
+  return (PyObject *)array;
+}
+
+/* The (log, arrays) of a run whose output was kept in memory: the text of
+   the log and, for every body, its output and climate grid arrays (None if
+   the body has none). */
+static PyObject *MemoryOutputFromRun(MEMORYOUTPUT *memory) {
+  PyObject *pLog, *pArrays, *pBody;
+  int iBody;
+
+  if (memory->cLog != NULL) {
+    pLog = PyUnicode_DecodeUTF8(memory->cLog, memory->iLogSize, "replace");
+  } else {
+    pLog = PyUnicode_FromString("");
+  }
+  pArrays = PyList_New(memory->iNumBodies);
+  if (pLog == NULL || pArrays == NULL) {
+    Py_XDECREF(pLog);
+    Py_XDECREF(pArrays);
+    return NULL;
+  }
+  for (iBody = 0; iBody < memory->iNumBodies; iBody++) {
+    pBody = Py_BuildValue("(NN)", MemoryArrayFromRun(&memory->Array[iBody]),
+                          MemoryArrayFromRun(&memory->Grid[iBody]));
+    if (pBody == NULL) {
+      Py_DECREF(pLog);
+      Py_DECREF(pArrays);
+      return NULL;
+    }
+    PyList_SET_ITEM(pArrays, iBody, pBody);
+  }
+  return Py_BuildValue("(NN)", pLog, pArrays);
+}
+
+/* Point input at the names and texts in pItems, a list of (name, text)
+   pairs, which must outlive the run. Returns 0 with an exception set on
+   failure. */
+static int InputFromItems(PyObject *pItems, MEMORYINPUT *input) {
+  Py_ssize_t iFile, iNumFiles = PyList_GET_SIZE(pItems);
+
+  input->saFile = PyMem_Malloc((iNumFiles + 1) * sizeof(char *));
+  input->saText = PyMem_Malloc((iNumFiles + 1) * sizeof(char *));
+  if (input->saFile == NULL || input->saText == NULL) {
+    PyMem_Free(input->saFile);
+    PyMem_Free(input->saText);
+    PyErr_NoMemory();
+    return 0;
+  }
+  for (iFile = 0; iFile < iNumFiles; iFile++) {
+    PyObject *pItem       = PyList_GET_ITEM(pItems, iFile);
+    input->saFile[iFile] = PyUnicode_AsUTF8(PyTuple_GET_ITEM(pItem, 0));
+    input->saText[iFile] = PyUnicode_AsUTF8(PyTuple_GET_ITEM(pItem, 1));
+    if (input->saFile[iFile] == NULL || input->saText[iFile] == NULL) {
+      PyMem_Free(input->saFile);
+      PyMem_Free(input->saText);
+      return 0;
+    }
+  }
+  input->iNumFiles = iNumFiles;
+  return 1;
+}
+
+/* vplanet_core.run(*argv) runs vplanet and returns its EXIT_* status, like
+   the command line program. With keyword arguments, it runs in the
+   directory `path`, reads the input files named in the dict `inputs` from
+   their text there, and returns (status, errors, memory): `errors` is what
+   the run wrote to stderr if `capture` is true, and `memory` is the
+   (log, arrays) of the run if `to_memory` is true and the run succeeded. */
+static PyObject *vplanet_core_run(PyObject *self, PyObject *args,
+                                  PyObject *kwargs) {
 
-  // Get the options (built-in max of 9)
+  // Get the options (built-in max of 9), the directory to run in, whether
+  // to capture the errors and keep the output in memory, and the input
+  // files given in memory
+  static char *kwlist[] = {"", "", "", "", "", "", "", "", "", "path",
+                           "capture", "to_memory", "inputs", NULL};
   int argc = PyTuple_GET_SIZE(args);
+  int iStatus;
+  int bCapture  = 0;
+  int bToMemory = 0;
   const char *argv[9];
-  if (!PyArg_ParseTuple(args, "|sssssssss", &argv[0], &argv[1], &argv[2],
-                        &argv[3], &argv[4], &argv[5], &argv[6], &argv[7],
-                        &argv[8])) {
+  const char *cPath   = NULL;
+  FILE *fpError       = NULL;
+  char *cError        = NULL;
+  size_t iErrorSize   = 0;
+  MEMORYOUTPUT memory = {0};
+  MEMORYINPUT input   = {0};
+  PyObject *pInputs   = NULL;
+  PyObject *pItems    = NULL;
+  PyObject *pError, *pMemory;
+  if (!PyArg_ParseTupleAndKeywords(
+            args, kwargs, "|sssssssss$zppO!", kwlist, &argv[0], &argv[1],
+            &argv[2], &argv[3], &argv[4], &argv[5], &argv[6], &argv[7],
+            &argv[8], &cPath, &bCapture, &bToMemory, &PyDict_Type, &pInputs)) {
     return NULL;
   }
 
-  // Run vplanet
-  main_impl(argc, &argv);
+  // The run reads these strings without the GIL, so hold on to them
+  if (pInputs != NULL) {
+    pItems = PyMapping_Items(pInputs);
+    if (pItems == NULL || !InputFromItems(pItems, &input)) {
+      Py_XDECREF(pItems);
+      return NULL;
+    }
+  }
 
-  // Return None
-  Py_INCREF(Py_None);
-  return Py_None;
+  // This stream is ours, not the run's, so it is not tracked
+  if (bCapture) {
+    fpError = OpenMemoryStream(&cError, &iErrorSize);
+    if (fpError == NULL) {
+      PyMem_Free(input.saFile);
+      PyMem_Free(input.saText);
+      Py_XDECREF(pItems);
+      return PyErr_SetFromErrno(PyExc_OSError);
+    }
+  }
+
+  // Run vplanet; errors return here with a nonzero EXIT_* status. The run
+  // only touches its own (thread-local) state, so other Python threads,
+  // including other runs, may carry on in the meantime.
+  Py_BEGIN_ALLOW_THREADS;
+  iStatus = main_impl(argc, &argv, cPath, fpError, &input,
+                      bToMemory ? &memory : NULL);
+  Py_END_ALLOW_THREADS;
+
+  PyMem_Free(input.saFile);
+  PyMem_Free(input.saText);
+  Py_XDECREF(pItems);
+
+  if (kwargs == NULL || PyDict_Size(kwargs) == 0) {
+    return PyLong_FromLong(iStatus);
+  }
+
+  if (bCapture) {
+    FlushMemoryStream(fpError, &cError, &iErrorSize);
+    pError = PyUnicode_DecodeUTF8(cError ? cError : "", iErrorSize, "replace");
+    (fclose)(fpError);
+    (free)(cError);
+  } else {
+    pError = PyUnicode_FromString("");
+  }
+
+  if (bToMemory && iStatus == 0) {
+    pMemory = MemoryOutputFromRun(&memory);
+  } else {
+    Py_INCREF(Py_None);
+    pMemory = Py_None;
+  }
+  if (bToMemory) {
+    FreeMemoryOutput(&memory);
+  }
+
+  if (pError == NULL || pMemory == NULL) {
+    Py_XDECREF(pError);
+    Py_XDECREF(pMemory);
+    return NULL;
+  }
+  return Py_BuildValue("(iNN)", iStatus, pError, pMemory);
 }
 
 static PyMethodDef VplanetCoreMethods[] = {
-      {"run", vplanet_core_run, METH_VARARGS, NULL},
+      {"run", (PyCFunction)(void (*)(void))vplanet_core_run,
+       METH_VARARGS | METH_KEYWORDS, NULL},
       {"version", vplanet_core_version, METH_VARARGS, NULL},
+      {"registry", vplanet_core_registry, METH_NOARGS, NULL},
       {NULL, NULL, 0, NULL}};
 
 static struct PyModuleDef vplanet_core_module = {
       PyModuleDef_HEAD_INIT, "vplanet_core", NULL, -1, VplanetCoreMethods};
 
 PyMODINIT_FUNC PyInit_vplanet_core(void) {
-  PyObject *m = PyModule_Create(&vplanet_core_module);
+  PyObject *m;
+  if (PyType_Ready(&MemoryArrayType) < 0) {
+    return NULL;
+  }
+  m = PyModule_Create(&vplanet_core_module);
   if (m == NULL) {
     return NULL;
   }
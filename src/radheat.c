@@ -2959,7 +2959,7 @@ void fvRadheatExit(FILES *files, char cSpecies[16], int iFile) {
   fprintf(stderr, "ERROR: Radheat called, but no %s option provided.\n",
           cSpecies);
   fprintf(stderr, "\tFile: %s\n", files->Infile[iFile].cIn);
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
 
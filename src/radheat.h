@@ -296,7 +296,7 @@ void fvVerify235U(BODY *, OPTIONS *, SYSTEM *, UPDATE *, double, int);
 void fvPropsAuxRadheat(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void fvForceBehaviorRadheat(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *,
                             UPDATE *, fnUpdateVariable ***, int, int);
-void fvRadheatExit(FILES *, char *, int);
+NORETURN void fvRadheatExit(FILES *, char *, int);
 void fvVerifyRadheat(BODY *, CONTROL *, FILES *, OPTIONS *, OUTPUT *, SYSTEM *,
                      UPDATE *, int, int);
 void fvAssignRadheatDerivatives(BODY *, EVOLVE *, UPDATE *,
@@ -595,7 +595,7 @@ void VerifyLuminosity(BODY *body, CONTROL *control, OPTIONS *options,
                 "ERROR: If STELLAR model NONE is selected, then %s must be "
                 "set.\n",
                 options[OPT_LUMINOSITY].cName);
-        exit(EXIT_INPUT);
+        ExitVplanet(EXIT_INPUT);
       }
     }
   }
@@ -678,7 +678,7 @@ void VerifyRadGyra(BODY *body, CONTROL *control, OPTIONS *options,
                  "Proxima Cen stellar model.\n",
                  iBody);
         }
-        exit(1);
+        ExitVplanet(1);
       }
     }
 
@@ -702,7 +702,7 @@ void VerifyRadGyra(BODY *body, CONTROL *control, OPTIONS *options,
                "bEvolveRG = 0.\n",
                iBody);
       }
-      exit(1);
+      ExitVplanet(1);
     }
   }
 }
@@ -862,7 +862,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dLuminosity for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
   VerifyLuminosity(body, control, options, update, body[iBody].dAge, iBody);
 
@@ -873,7 +873,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dRadius for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   if (update[iBody].iNumRadGyra > 1) {
@@ -883,7 +883,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dRadGyra for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   VerifyRadius(body, control, options, update, body[iBody].dAge, iBody);
@@ -897,7 +897,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dTemperature for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
   VerifyTemperature(body, control, options, update, body[iBody].dAge, iBody);
   VerifyLostAngMomStellar(body, control, options, update, body[iBody].dAge,
@@ -1536,7 +1536,7 @@ double fdDJDtMagBrakingStellar(BODY *body, SYSTEM *system, int *iaBody) {
     } else {
       fprintf(stderr, "ERROR! Must set iWindModel to REINERS if using REINERTS "
                       "magnetic braking model!\n");
-      exit(1);
+      ExitVplanet(1);
     }
 
     return -dDJDt; // Return positive amount of lost angular momentum
@@ -1674,7 +1674,7 @@ double fdLuminosityFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 }
 
@@ -1697,7 +1697,7 @@ double fdRadiusFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 }
 
@@ -1720,7 +1720,7 @@ double fdRadGyraFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 }
 
@@ -1743,7 +1743,7 @@ double fdTemperatureFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    ExitVplanet(EXIT_INT);
   }
 }
 
@@ -1851,7 +1851,9 @@ void fvPropsAuxThermint(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
     body[iBody].dMeltfactorLMan =
           1.; // initialize to avoid fvvisc=visc/meltfactor crash.
   }
-  /* Loop through melt calculation once to get dependence of visc on melt. */
+  /* Loop through melt calculation once to get dependence of visc on melt.
+   * The Arrhenius viscosity and the shear modulus depend on TUMan, but not on
+   * the melt, so they are computed once, outside the loop. */
   int i = 0, nloop = 2;
   for (i = 0; i < nloop; i++) {
     body[iBody].dBLUMan         = fdBLUMan(body, iBody);
@@ -1864,15 +1866,14 @@ void fvPropsAuxThermint(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
     body[iBody].dFMeltLMan      = fdFMeltLMan(body, iBody);
     body[iBody].dMeltfactorUMan = fdMeltfactorUMan(body, iBody);
     body[iBody].dMeltfactorLMan = fdMeltfactorLMan(body, iBody);
-    body[iBody].dViscUManArr    = fdViscUManArr(body, iBody);
     body[iBody].dViscUMan       = fdViscUMan(body, iBody);
     body[iBody].dViscLMan       = fdViscLMan(body, iBody);
-    body[iBody].dShmodUMan      = fdShmodUMan(body, iBody);
 
     // printf("%d TUMan=%.4f BLUMan=%.5e TsolUMan=%.4f FMeltUMan=%.4f
     // MeltfactorUMan=%e ViscUMan=%e ShmodUMan=%e ImK2=%e
     // TidalPowMan=%e\n",i,body[iBody].dTUMan,body[iBody].dBLUMan,body[iBody].dTsolUMan,body[iBody].dFMeltUMan,body[iBody].dMeltfactorUMan,body[iBody].dViscUMan,body[iBody].dShmodUMan,body[iBody].dImK2,body[iBody].dTidalPowMan);
   }
+  body[iBody].dShmodUMan       = fdShmodUMan(body, iBody);
   body[iBody].dDepthMeltMan    = fdDepthMeltMan(body, iBody);
   body[iBody].dTDepthMeltMan   = fdTDepthMeltMan(body, iBody);
   body[iBody].dTJumpMeltMan    = fdTJumpMeltMan(body, iBody);
@@ -1949,6 +1950,48 @@ void fvForceBehaviorThermint(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
   }
 }
 
+void fvCheckpointThermint(BODY *body, EVOLVE *evolve, SYSTEM *system,
+                          CHECKPOINT *ckpt, int iBody) {
+  /* The melt and inner-core calculations in fvPropsAuxThermint start from
+     the values of the previous call, so carry all of them across. */
+  double *daAux[] = {&body[iBody].dTUMan,           &body[iBody].dTLMan,
+                     &body[iBody].dTCMB,            &body[iBody].dTJumpUMan,
+                     &body[iBody].dTJumpLMan,       &body[iBody].dSignTJumpUMan,
+                     &body[iBody].dSignTJumpLMan,   &body[iBody].dViscUManArr,
+                     &body[iBody].dViscUMan,        &body[iBody].dViscLMan,
+                     &body[iBody].dMeltfactorUMan,  &body[iBody].dMeltfactorLMan,
+                     &body[iBody].dBLUMan,          &body[iBody].dBLLMan,
+                     &body[iBody].dTsolUMan,        &body[iBody].dTliqUMan,
+                     &body[iBody].dTsolLMan,        &body[iBody].dTliqLMan,
+                     &body[iBody].dFMeltUMan,       &body[iBody].dFMeltLMan,
+                     &body[iBody].dShmodUMan,       &body[iBody].dDepthMeltMan,
+                     &body[iBody].dTDepthMeltMan,   &body[iBody].dTJumpMeltMan,
+                     &body[iBody].dMeltMassFluxMan, &body[iBody].dViscMMan,
+                     &body[iBody].dRayleighMan,     &body[iBody].dDynamViscos,
+                     &body[iBody].dHfluxUMan,       &body[iBody].dHfluxLMan,
+                     &body[iBody].dHfluxCMB,        &body[iBody].dHflowUMan,
+                     &body[iBody].dHflowLMan,       &body[iBody].dHflowCMB,
+                     &body[iBody].dHflowLatentMan,  &body[iBody].dHflowMeltMan,
+                     &body[iBody].dHflowSecMan,     &body[iBody].dHflowSurf,
+                     &body[iBody].dMassIC,          &body[iBody].dMassOC,
+                     &body[iBody].dChiOC,           &body[iBody].dChiIC,
+                     &body[iBody].dMassChiOC,       &body[iBody].dMassChiIC,
+                     &body[iBody].dDTChi,           &body[iBody].dRIC,
+                     &body[iBody].dDRICDTCMB,       &body[iBody].dMassICDot,
+                     &body[iBody].dHflowLatentIC,   &body[iBody].dPowerGravIC,
+                     &body[iBody].dThermConductOC,  &body[iBody].dHfluxCMBAd,
+                     &body[iBody].dHfluxCMBConv,    &body[iBody].dRICDot,
+                     &body[iBody].dGravICB,         &body[iBody].dCoreBuoyTherm,
+                     &body[iBody].dCoreBuoyCompo,   &body[iBody].dCoreBuoyTotal,
+                     &body[iBody].dMagMom,          &body[iBody].dPresSWind,
+                     &body[iBody].dMagPauseRad};
+  int iAux;
+
+  for (iAux = 0; iAux < (int)(sizeof(daAux) / sizeof(daAux[0])); iAux++) {
+    CheckpointDoubles(ckpt, daAux[iAux], 1);
+  }
+}
+
 void fvAssignThermintDerivatives(BODY *body, EVOLVE *evolve, UPDATE *update,
                                  fnUpdateVariable ***fnUpdate, int iBody) {
   fnUpdate[iBody][update[iBody].iTMan][0]  = &fdTDotMan;
@@ -4398,6 +4441,7 @@ void fvAddModuleThermint(CONTROL *control, MODULE *module, int iBody,
   module->fnCountHalts[iBody][iModule]        = &fvCountHaltsThermint;
   module->fnReadOptions[iBody][iModule]       = &fvReadOptionsThermint;
   module->fnLogBody[iBody][iModule]           = &fvLogBodyThermint;
+  module->fnCheckpoint[iBody][iModule]        = &fvCheckpointThermint;
   module->fnVerify[iBody][iModule]            = &fvVerifyThermint;
   module->fnAssignDerivatives[iBody][iModule] = &fvAssignThermintDerivatives;
   module->fnNullDerivatives[iBody][iModule]   = &fvNullThermintDerivatives;
@@ -5450,7 +5494,7 @@ double cubicroot(int type, BODY *body, int iBody) {
                   27.0 * pow(a, 2.0) * d; // cubic root component (wikip)
   if ((pow(delta1, 2.0) - 4.0 * cube(delta0)) < 0) {
     //        printf("imaginary cubic root!\n");
-    //        exit(1);
+    //        ExitVplanet(1);
     return 0; // imaginary root implies no intersection, no melt layer?
   }
   double croot =
@@ -5473,8 +5517,7 @@ double fdSolidusMan(double depth) {
   double aterm = (ASOLIDUS)*pow(r, 3.);
   double bterm = (BSOLIDUS)*pow(r, 2.);
   double cterm = (CSOLIDUS)*r;
-  return (ASOLIDUS)*pow(r, 3.) + (BSOLIDUS)*pow(r, 2.) + (CSOLIDUS)*r +
-         (DSOLIDUS);
+  return aterm + bterm + cterm + (DSOLIDUS);
 }
 /**
   Function compute temperature difference between solidus and geotherm at a
@@ -446,6 +446,7 @@ void fvPropsAuxThermint(BODY *, EVOLVE *, IO *, UPDATE *, int);
 /* Force Behavior */
 void fvForceBehaviorThermint(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *,
                              UPDATE *, fnUpdateVariable ***fnUpdate, int, int);
+void fvCheckpointThermint(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *, int);
 
 /* Output Functions */
 /* THERMINT */
@@ -64,7 +64,7 @@ void UpdateCopy(UPDATE *dest, UPDATE *src, int iNumBodies) {
 void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
                       UPDATE *update, fnUpdateVariable ****fnUpdate) {
   int iBody, iBodyPert, iVar, iEqn, iModule, iLat;
-  int iNum, iSubStep;
+  int iNum;
   int iFoo = 0; // Dummy variable needed for some typedef'd functions
 
   // Allocate the firt dimension of the Update matrix to be the number of bodies
@@ -176,7 +176,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     update[iBody].iaBody     = malloc(update[iBody].iNumVars * sizeof(int **));
 
     // May also have to allocate space for the temp UPDATE
-    if (control->Evolve.iOneStep == RUNGEKUTTA) {
+    if (bRungeKutta(control)) {
       control->Evolve.tmpUpdate[iBody].iaVar =
             malloc(update[iBody].iNumVars * sizeof(int));
       control->Evolve.tmpUpdate[iBody].iNumEqns =
@@ -196,8 +196,16 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       control->Evolve.tmpUpdate[iBody].iaBody =
             malloc(update[iBody].iNumVars * sizeof(int **));
     }
-    for (iSubStep = 0; iSubStep < 4; iSubStep++) {
-      control->Evolve.daDeriv[iSubStep][iBody] =
+    if (bAdaptive(control)) {
+      control->Evolve.daErrorScale[iBody] =
+            malloc(update[iBody].iNumVars * sizeof(double));
+    }
+    if (control->Io.bDenseOutput) {
+      control->Evolve.daDenseStart[iBody] =
+            malloc(update[iBody].iNumVars * sizeof(double));
+      control->Evolve.daDenseEnd[iBody] =
+            malloc(update[iBody].iNumVars * sizeof(double));
+      control->Evolve.daDenseBody[iBody] =
             malloc(update[iBody].iNumVars * sizeof(double));
     }
 
@@ -221,7 +229,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumVelX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dVelX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -261,7 +269,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumVelY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dVelY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -301,7 +309,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumVelZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dVelZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -342,7 +350,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPositionX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPositionX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -383,7 +391,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPositionY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPositionY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -424,7 +432,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPositionZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPositionZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -467,7 +475,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumWaterMassMOAtm * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dWaterMassMOAtm;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -508,7 +516,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumWaterMassSol * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dWaterMassSol;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -549,7 +557,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSurfTemp * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSurfTemp;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -590,7 +598,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSolidRadius * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSolidRadius;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -631,7 +639,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPotTemp * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPotTemp;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -672,7 +680,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMassMOAtm * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMassMOAtm;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -713,7 +721,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMassSol * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMassSol;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -754,7 +762,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumHydrogenMassSpace * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dHydrogenMassSpace;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -795,7 +803,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMassSpace * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMassSpace;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -836,7 +844,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCO2MassMOAtm * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCO2MassMOAtm;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -877,7 +885,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCO2MassSol * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCO2MassSol;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -922,7 +930,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum26AlCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d26AlNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -964,7 +972,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum26AlMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d26AlNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1006,7 +1014,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum40KCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d40KNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1048,7 +1056,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum40KMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d40KNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1090,7 +1098,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum40KCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d40KNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1132,7 +1140,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum232ThCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d232ThNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1174,7 +1182,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum232ThMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d232ThNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1216,7 +1224,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum232ThCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d232ThNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1258,7 +1266,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum235UCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d235UNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1300,7 +1308,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum235UMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d235UNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1342,7 +1350,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum235UCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d235UNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1384,7 +1392,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum238UCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d238UNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1426,7 +1434,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum238UMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d238UNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1468,7 +1476,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum238UCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d238UNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1510,7 +1518,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEnvelopeMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEnvelopeMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1558,7 +1566,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumDynEllip * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dDynEllip;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1599,7 +1607,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumHecc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dHecc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1640,7 +1648,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumKecc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dKecc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1682,7 +1690,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLuminosity * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLuminosity;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1722,7 +1730,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     malloc(update[iBody].iNumObl*sizeof(int)); update[iBody].iaModule[iVar] =
     malloc(update[iBody].iNumObl*sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
     &control->Evolve.tmpBody[iBody].dObliquity;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1762,7 +1770,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPinc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPinc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1803,7 +1811,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumQinc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dQinc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1845,7 +1853,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumRadius * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dRadius;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1886,7 +1894,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1927,7 +1935,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumRot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dRotRate;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1968,7 +1976,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSemi * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSemi;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2014,7 +2022,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSurfaceWaterMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSurfaceWaterMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2056,7 +2064,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2098,7 +2106,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMantleMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMantleMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2140,7 +2148,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumTemperature * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dTemperature;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2182,7 +2190,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumRadGyra * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dRadGyra;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2224,7 +2232,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumTCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dTCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2265,7 +2273,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumTMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dTMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2306,7 +2314,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumXobl * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dXobl;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2348,7 +2356,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumYobl * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dYobl;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2390,7 +2398,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumZobl * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dZobl;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2434,7 +2442,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPR * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPR;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2476,7 +2484,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2519,7 +2527,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPPhi * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPPhi;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2562,7 +2570,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPRDot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPRDot;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2605,7 +2613,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPZDot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPZDot;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2648,7 +2656,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPPhiDot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPPhiDot;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2698,7 +2706,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     //         update[iBody].iaModule[iVar] =
     //         malloc(update[iBody].iNumIceMass*sizeof(int));
     //
-    //         if (control->Evolve.iOneStep == RUNGEKUTTA) {
+    //         if (bRungeKutta(control)) {
     //
     //           control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
     //           &control->Evolve.tmpBody[iBody].daIceMass[iLat];
@@ -2740,7 +2748,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEccX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEccX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2781,7 +2789,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEccY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEccY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2822,7 +2830,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEccZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEccZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2864,7 +2872,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumAngMX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dAngMX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2906,7 +2914,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumAngMY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dAngMY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2948,7 +2956,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumAngMZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dAngMZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2996,7 +3004,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLXUV * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLXUV;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3038,7 +3046,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLostAngMom * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLostAngMom;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3080,7 +3088,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLostEng * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (bRungeKutta(control)) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLostEng;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3110,4 +3118,289 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     FinalizeUpdateMulti(body, control, module, update, fnUpdate, &iVar, iBody,
                         iFoo);
   }
+
+  InitializeEquations(control, update);
+  InitializeFrozenVariables(control, update);
+}
+
+void InitializeEquations(CONTROL *control, UPDATE *update) {
+  /* List the body, primary variable and equation of every process, so that
+     they can be evaluated in one loop, see fdGetUpdateInfo */
+  int iBody, iVar, iEqn, iEquation = 0;
+  EVOLVE *evolve = &(control->Evolve);
+
+  evolve->iNumEquations = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->iNumEquations += update[iBody].iNumEqns[iVar];
+    }
+  }
+  evolve->iaEquationBody = malloc(evolve->iNumEquations * sizeof(int));
+  evolve->iaEquationVar  = malloc(evolve->iNumEquations * sizeof(int));
+  evolve->iaEquationEqn  = malloc(evolve->iNumEquations * sizeof(int));
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        evolve->iaEquationBody[iEquation] = iBody;
+        evolve->iaEquationVar[iEquation]  = iVar;
+        evolve->iaEquationEqn[iEquation]  = iEqn;
+        iEquation++;
+      }
+    }
+  }
+
+  // Evolve groups them into rate classes, see InitializeRateClasses
+  evolve->iNumRateClasses = 0;
+}
+
+void InitializeFrozenVariables(CONTROL *control, UPDATE *update) {
+  /* Keep track of the primary variables that Evolve freezes, see
+     FreezeVariables. The log reports on them, so they must exist before the
+     integration starts. */
+  int iBody, iVar;
+  EVOLVE *evolve = &(control->Evolve);
+
+  evolve->iNumFrozen = 0;
+  if (evolve->dFreezeTol == 0) {
+    return;
+  }
+
+  evolve->iaFreezeCount  = malloc(evolve->iNumBodies * sizeof(int *));
+  evolve->baFrozen       = malloc(evolve->iNumBodies * sizeof(int *));
+  evolve->daQuiescentTime = malloc(evolve->iNumBodies * sizeof(double *));
+  evolve->daThawTime     = malloc(evolve->iNumBodies * sizeof(double *));
+  evolve->iaFreezes      = malloc(evolve->iNumBodies * sizeof(int *));
+  evolve->daFrozenTime   = malloc(evolve->iNumBodies * sizeof(double *));
+  evolve->fnFrozenUpdate =
+        malloc(evolve->iNumBodies * sizeof(fnUpdateVariable **));
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->iaFreezeCount[iBody] = malloc(update[iBody].iNumVars * sizeof(int));
+    evolve->baFrozen[iBody] = malloc(update[iBody].iNumVars * sizeof(int));
+    evolve->daQuiescentTime[iBody] =
+          malloc(update[iBody].iNumVars * sizeof(double));
+    evolve->daThawTime[iBody] = malloc(update[iBody].iNumVars * sizeof(double));
+    evolve->iaFreezes[iBody] = malloc(update[iBody].iNumVars * sizeof(int));
+    evolve->daFrozenTime[iBody] =
+          malloc(update[iBody].iNumVars * sizeof(double));
+    evolve->fnFrozenUpdate[iBody] =
+          malloc(update[iBody].iNumVars * sizeof(fnUpdateVariable *));
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->iaFreezeCount[iBody][iVar]  = 0;
+      evolve->baFrozen[iBody][iVar]        = 0;
+      evolve->daQuiescentTime[iBody][iVar] = 0;
+      evolve->daThawTime[iBody][iVar]      = 0;
+      evolve->iaFreezes[iBody][iVar]      = 0;
+      evolve->daFrozenTime[iBody][iVar]   = 0;
+      evolve->fnFrozenUpdate[iBody][iVar] = malloc(
+            update[iBody].iNumEqns[iVar] * sizeof(fnUpdateVariable));
+    }
+  }
+}
+
+const char *sPrimaryVariableName(UPDATE *update, int iBody, int iVar) {
+  /* The name of a primary variable, for the log, after the member of UPDATE
+     that holds its index */
+  if (iVar == update[iBody].iSemi) {
+    return "Semi";
+  }
+  if (iVar == update[iBody].iHecc) {
+    return "Hecc";
+  }
+  if (iVar == update[iBody].iKecc) {
+    return "Kecc";
+  }
+  if (iVar == update[iBody].iRot) {
+    return "Rot";
+  }
+  if (iVar == update[iBody].iRadius) {
+    return "Radius";
+  }
+  if (iVar == update[iBody].iMass) {
+    return "Mass";
+  }
+  if (iVar == update[iBody].iRadGyra) {
+    return "RadGyra";
+  }
+  if (iVar == update[iBody].iXobl) {
+    return "Xobl";
+  }
+  if (iVar == update[iBody].iYobl) {
+    return "Yobl";
+  }
+  if (iVar == update[iBody].iZobl) {
+    return "Zobl";
+  }
+  if (iVar == update[iBody].iDynEllip) {
+    return "DynEllip";
+  }
+  if (iVar == update[iBody].iPinc) {
+    return "Pinc";
+  }
+  if (iVar == update[iBody].iQinc) {
+    return "Qinc";
+  }
+  if (iVar == update[iBody].iLuminosity) {
+    return "Luminosity";
+  }
+  if (iVar == update[iBody].iTemperature) {
+    return "Temperature";
+  }
+  if (iVar == update[iBody].iLostAngMom) {
+    return "LostAngMom";
+  }
+  if (iVar == update[iBody].iLostEng) {
+    return "LostEng";
+  }
+  if (iVar == update[iBody].i26AlMan) {
+    return "26AlMan";
+  }
+  if (iVar == update[iBody].i26AlCore) {
+    return "26AlCore";
+  }
+  if (iVar == update[iBody].i40KMan) {
+    return "40KMan";
+  }
+  if (iVar == update[iBody].i40KCore) {
+    return "40KCore";
+  }
+  if (iVar == update[iBody].i40KCrust) {
+    return "40KCrust";
+  }
+  if (iVar == update[iBody].i232ThMan) {
+    return "232ThMan";
+  }
+  if (iVar == update[iBody].i232ThCore) {
+    return "232ThCore";
+  }
+  if (iVar == update[iBody].i232ThCrust) {
+    return "232ThCrust";
+  }
+  if (iVar == update[iBody].i235UMan) {
+    return "235UMan";
+  }
+  if (iVar == update[iBody].i235UCore) {
+    return "235UCore";
+  }
+  if (iVar == update[iBody].i235UCrust) {
+    return "235UCrust";
+  }
+  if (iVar == update[iBody].i238UMan) {
+    return "238UMan";
+  }
+  if (iVar == update[iBody].i238UCore) {
+    return "238UCore";
+  }
+  if (iVar == update[iBody].i238UCrust) {
+    return "238UCrust";
+  }
+  if (iVar == update[iBody].iTMan) {
+    return "TMan";
+  }
+  if (iVar == update[iBody].iTCore) {
+    return "TCore";
+  }
+  if (iVar == update[iBody].iSurfaceWaterMass) {
+    return "SurfaceWaterMass";
+  }
+  if (iVar == update[iBody].iEnvelopeMass) {
+    return "EnvelopeMass";
+  }
+  if (iVar == update[iBody].iOxygenMass) {
+    return "OxygenMass";
+  }
+  if (iVar == update[iBody].iOxygenMantleMass) {
+    return "OxygenMantleMass";
+  }
+  if (iVar == update[iBody].iLXUV) {
+    return "LXUV";
+  }
+  if (iVar == update[iBody].iVelX) {
+    return "VelX";
+  }
+  if (iVar == update[iBody].iVelY) {
+    return "VelY";
+  }
+  if (iVar == update[iBody].iVelZ) {
+    return "VelZ";
+  }
+  if (iVar == update[iBody].iPositionX) {
+    return "PositionX";
+  }
+  if (iVar == update[iBody].iPositionY) {
+    return "PositionY";
+  }
+  if (iVar == update[iBody].iPositionZ) {
+    return "PositionZ";
+  }
+  if (iVar == update[iBody].iCBPR) {
+    return "CBPR";
+  }
+  if (iVar == update[iBody].iCBPZ) {
+    return "CBPZ";
+  }
+  if (iVar == update[iBody].iCBPPhi) {
+    return "CBPPhi";
+  }
+  if (iVar == update[iBody].iCBPRDot) {
+    return "CBPRDot";
+  }
+  if (iVar == update[iBody].iCBPZDot) {
+    return "CBPZDot";
+  }
+  if (iVar == update[iBody].iCBPPhiDot) {
+    return "CBPPhiDot";
+  }
+  if (iVar == update[iBody].iEccX) {
+    return "EccX";
+  }
+  if (iVar == update[iBody].iEccY) {
+    return "EccY";
+  }
+  if (iVar == update[iBody].iEccZ) {
+    return "EccZ";
+  }
+  if (iVar == update[iBody].iAngMX) {
+    return "AngMX";
+  }
+  if (iVar == update[iBody].iAngMY) {
+    return "AngMY";
+  }
+  if (iVar == update[iBody].iAngMZ) {
+    return "AngMZ";
+  }
+  if (iVar == update[iBody].iWaterMassMOAtm) {
+    return "WaterMassMOAtm";
+  }
+  if (iVar == update[iBody].iWaterMassSol) {
+    return "WaterMassSol";
+  }
+  if (iVar == update[iBody].iSurfTemp) {
+    return "SurfTemp";
+  }
+  if (iVar == update[iBody].iPotTemp) {
+    return "PotTemp";
+  }
+  if (iVar == update[iBody].iSolidRadius) {
+    return "SolidRadius";
+  }
+  if (iVar == update[iBody].iOxygenMassMOAtm) {
+    return "OxygenMassMOAtm";
+  }
+  if (iVar == update[iBody].iOxygenMassSol) {
+    return "OxygenMassSol";
+  }
+  if (iVar == update[iBody].iHydrogenMassSpace) {
+    return "HydrogenMassSpace";
+  }
+  if (iVar == update[iBody].iOxygenMassSpace) {
+    return "OxygenMassSpace";
+  }
+  if (iVar == update[iBody].iCO2MassMOAtm) {
+    return "CO2MassMOAtm";
+  }
+  if (iVar == update[iBody].iCO2MassSol) {
+    return "CO2MassSol";
+  }
+  return "Unknown";
 }
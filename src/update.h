@@ -109,5 +109,8 @@ void InitializeUpdateTmpBody(BODY *, CONTROL *, MODULE *, UPDATE *, int);
 void UpdateCopy(UPDATE *, UPDATE *, int);
 void InitializeUpdate(BODY *, CONTROL *, MODULE *, UPDATE *,
                       fnUpdateVariable ****);
+void InitializeEquations(CONTROL *, UPDATE *);
+void InitializeFrozenVariables(CONTROL *, UPDATE *);
+const char *sPrimaryVariableName(UPDATE *, int, int);
 
 /* @endcond */
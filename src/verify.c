@@ -47,27 +47,28 @@ int bFileExists(const char *filename) {
   return 0;
 }
 
-void OverwriteExit(char cName[], char cFile[]) {
+NORETURN void OverwriteExit(char cName[], char cFile[]) {
   fprintf(stderr, "ERROR: %s is false and %s exists.\n", cName, cFile);
   fprintf(stderr, "\tOveride with \"-f\" on the command line.\n");
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
 /* XXX Should these be iLine+1? */
 void DoubleLineExit(char cFile1[], char cFile2[], int iLine1, int iLine2) {
   fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile1, iLine1 + 1);
   fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile2, iLine2 + 1);
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
-void VerifyOrbitExit(char cName1[], char cName2[], char cFile1[], char cFile2[],
-                     int iLine1, int iLine2, int iVerbose) {
+NORETURN void VerifyOrbitExit(char cName1[], char cName2[], char cFile1[],
+                              char cFile2[], int iLine1, int iLine2,
+                              int iVerbose) {
   if (iVerbose >= VERBERR) {
     fprintf(stderr, "ERROR: Cannot set both %s and %s.\n", cName1, cName2);
     fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile1, iLine1);
     fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile2, iLine2);
   }
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
 void VerifyBodyExit(char cName1[], char cName2[], char cFile[], int iLine1,
@@ -78,17 +79,18 @@ void VerifyBodyExit(char cName1[], char cName2[], char cFile[], int iLine1,
             cName2);
     fprintf(stderr, "\tFile: %s, Lines: %d and %d\n", cFile, iLine1, iLine2);
   }
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
 /** Print three lines that are in conflict
     Only called if iVerbose >= VERBERR
 */
 
-void TripleLineExit(char cFile[], int iLine1, int iLine2, int iLine3) {
+NORETURN void TripleLineExit(char cFile[], int iLine1, int iLine2,
+                             int iLine3) {
   fprintf(stderr, "\tFile: %s, Lines: %d, %d and %d.\n", cFile, iLine1, iLine2,
           iLine3);
-  exit(EXIT_INPUT);
+  ExitVplanet(EXIT_INPUT);
 }
 
 /* Do we need both these? */
@@ -101,9 +103,9 @@ void VerifyTripleExit(char cName1[], char cName2[], char cName3[], int iLine1,
   }
 }
 
-void VerifyTwoOfThreeExit(char cName1[], char cName2[], char cName3[],
-                          int iLine1, int iLine2, int iLine3, char cFile[],
-                          int iVerbose) {
+NORETURN void VerifyTwoOfThreeExit(char cName1[], char cName2[],
+                                   char cName3[], int iLine1, int iLine2,
+                                   int iLine3, char cFile[], int iVerbose) {
   if (iVerbose >= VERBERR) {
     fprintf(stderr, "ERROR: Can only set 2 of %s, %s, and %s.\n", cName1,
             cName2, cName3);
@@ -245,7 +247,7 @@ void VerifyOrbit(BODY *body, CONTROL *control, FILES files, OPTIONS *options,
     fprintf(stderr, "ERROR: Must set one of %s, %s or %s.\n",
             options[OPT_ORBSEMI].cName, options[OPT_ORBMEANMOTION].cName,
             options[OPT_ORBPER].cName);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* If Semi set, was anything else? */
@@ -356,6 +358,7 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
                        fnIntegrate *fnOneStep) {
   int iFile, iFile1, iFile2;
   char cTmp[OPTLEN];
+  char cPath[PATHLEN];
 
 
   // Initialize iDir to 0, i.e. assume no integrations requested to start
@@ -409,8 +412,35 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
     control->Evolve.iDir = 1;
   }
 
-  /* Check for file existence */
-  for (iFile = 0; iFile < files->iNumInputs - 1; iFile++) {
+  /* Binary output files get an extra extension */
+  if (control->Io.iOutputFormat == OUTPUTBINARY) {
+    for (iFile = 0; iFile < files->iNumInputs - 1; iFile++) {
+      if (files->Outfile[iFile].cOut[0] != '\0') {
+        if (strlen(files->Outfile[iFile].cOut) + strlen(".bin") >= NAMELEN) {
+          fprintf(stderr,
+                  "ERROR: Binary output file name %s.bin is longer than %d "
+                  "characters.\n",
+                  files->Outfile[iFile].cOut, NAMELEN - 1);
+          ExitVplanet(EXIT_INPUT);
+        }
+        strcat(files->Outfile[iFile].cOut, ".bin");
+      }
+    }
+  }
+
+  /* A restart continues the output files up to its checkpoint */
+  if (files->cRestart[0] != '\0' && MemoryOutput() != NULL) {
+    fprintf(stderr, "ERROR: Cannot restart from %s if the output is kept in "
+                    "memory.\n",
+            files->cRestart);
+    ExitVplanet(EXIT_INPUT);
+  }
+
+  /* Check for file existence, unless the output is kept in memory or
+     continued from a checkpoint */
+  for (iFile = 0; iFile < files->iNumInputs - 1 && MemoryOutput() == NULL &&
+                  files->cRestart[0] == '\0';
+       iFile++) {
     if (bFileExists(files->Outfile[iFile].cOut)) {
       if (!control->Io.bOverwrite) {
         OverwriteExit(options[OPT_OVERWRITE].cName, files->Outfile[iFile].cOut);
@@ -418,7 +448,8 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
       if (control->Io.iVerbose >= VERBINPUT) {
         fprintf(stderr, "WARNING: %s exists.\n", files->Outfile[iFile].cOut);
       }
-      unlink(files->Outfile[iFile].cOut);
+      RunPath(files->Outfile[iFile].cOut, cPath);
+      unlink(cPath);
     }
   }
 
@@ -473,6 +504,10 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
     *fnOneStep = &EulerStep;
   } else if (control->Evolve.iOneStep == RUNGEKUTTA) {
     *fnOneStep = &RungeKutta4Step;
+  } else if (control->Evolve.iOneStep == RUNGEKUTTA45) {
+    *fnOneStep = &RungeKutta45Step;
+  } else if (control->Evolve.iOneStep == ROSENBROCK) {
+    *fnOneStep = &RosenbrockStep;
   } else {
     /* Assign Default */
     strcpy(cTmp, options[OPT_INTEGRATIONMETHOD].cDefault);
@@ -491,6 +526,43 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
     }
   }
 
+  /* Without OpenMP, the pragmas that share the derivatives among the threads
+     are ignored */
+#ifndef _OPENMP
+  if (control->Evolve.iNumThreads > 1) {
+    if (control->Io.iVerbose >= VERBINPUT) {
+      fprintf(stderr,
+              "WARNING: %s = %d, but VPLanet was built without OpenMP, so it "
+              "runs on 1 thread.\n",
+              options[OPT_NUMTHREADS].cName, control->Evolve.iNumThreads);
+    }
+    control->Evolve.iNumThreads = 1;
+  }
+#endif
+
+  /* Output that is kept in memory cannot be continued from a checkpoint */
+  if (MemoryOutput() != NULL && (control->Evolve.dCheckpointInterval > 0 ||
+                                 control->Evolve.dCheckpointWallTime > 0)) {
+    if (control->Io.iVerbose >= VERBINPUT) {
+      fprintf(stderr,
+              "WARNING: The output is kept in memory, so no checkpoints are "
+              "written.\n");
+    }
+    control->Evolve.dCheckpointInterval = 0;
+    control->Evolve.dCheckpointWallTime = 0;
+  }
+
+  /* Dense output interpolates with the derivatives of the Runge-Kutta stages */
+  if (control->Io.bDenseOutput && control->Evolve.iOneStep == EULER) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: %s requires a Runge-Kutta %s.\n",
+              options[OPT_DENSEOUTPUT].cName,
+              options[OPT_INTEGRATIONMETHOD].cName);
+    }
+    LineExit(options[OPT_DENSEOUTPUT].cFile[0],
+             options[OPT_DENSEOUTPUT].iLine[0]);
+  }
+
   /* Make sure output interval is less than stop time */
   if (control->Evolve.dStopTime < control->Io.dOutputTime) {
     fprintf(stderr, "ERROR: %s < %s is not allowed.\n",
@@ -543,7 +615,7 @@ void VerifyMassRad(BODY *body, CONTROL *control, OPTIONS *options, char cFile[],
               options[OPT_MASS].cName, options[OPT_RADIUS].cName,
               options[OPT_DENSITY].cName);
     }
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* Were all set? */
@@ -554,7 +626,7 @@ void VerifyMassRad(BODY *body, CONTROL *control, OPTIONS *options, char cFile[],
                      options[OPT_DENSITY].cName, options[OPT_MASS].iLine[iFile],
                      options[OPT_RADIUS].iLine[iFile],
                      options[OPT_DENSITY].iLine[iFile], cFile, iVerbose);
-    exit(EXIT_INPUT);
+    ExitVplanet(EXIT_INPUT);
   }
 
   /* Was mass set? */
@@ -1093,6 +1165,46 @@ void VerifyAge(BODY *body, CONTROL *control, OPTIONS *options) {
     }
   }
 }
+
+/**
+  Resolve each body's output columns into indices of the output and fnWrite
+  arrays, so WriteOutput need not search all MODULEOUTEND outputs for every
+  column at every output step. Columns that do not resolve are set to -1.
+
+@param control A pointer to the CONTROL struct
+@param files A pointer to the FILES struct
+@param output A pointer to the OUTPUT struct
+*/
+void VerifyOutputOrder(CONTROL *control, FILES *files, OUTPUT *output) {
+  int iBody, iCol, iOut;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iCol = 0; iCol < files->Outfile[iBody].iNumCols; iCol++) {
+      files->Outfile[iBody].iaCol[iCol] = -1;
+      for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
+        if ((output[iOut].bGrid == 0 || output[iOut].bGrid == 2) &&
+            strcmp(files->Outfile[iBody].caCol[iCol], output[iOut].cName) ==
+                  0) {
+          files->Outfile[iBody].iaCol[iCol] = iOut;
+          break;
+        }
+      }
+    }
+
+    for (iCol = 0; iCol < files->Outfile[iBody].iNumGrid; iCol++) {
+      files->Outfile[iBody].iaGrid[iCol] = -1;
+      for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
+        if ((output[iOut].bGrid == 1 || output[iOut].bGrid == 2) &&
+            strcmp(files->Outfile[iBody].caGrid[iCol], output[iOut].cName) ==
+                  0) {
+          files->Outfile[iBody].iaGrid[iCol] = iOut;
+          break;
+        }
+      }
+    }
+  }
+}
+
 /**
 
  * Master Verify subroutine
@@ -1161,7 +1273,7 @@ void VerifyOptions(BODY *body, CONTROL *control, FILES *files, MODULE *module,
     }
 
     /* Must allocate memory in control struct for all perturbing bodies */
-    if (control->Evolve.iOneStep == RUNGEKUTTA) {
+    if (bRungeKutta(control)) {
       InitializeUpdateBodyPerts(control, update, iBody);
       InitializeUpdateTmpBody(body, control, module, update, iBody);
     }
@@ -1177,6 +1289,9 @@ void VerifyOptions(BODY *body, CONTROL *control, FILES *files, MODULE *module,
   // Initialize angular momentum and energy prior to logging/integration
   InitializeConstants(body, update, control, system, options);
 
+  // Map output columns to their write functions
+  VerifyOutputOrder(control, files, output);
+
   // Set next output time so logging does not contain a memory leak
   // control->Io.dNextOutput = control->Evolve.dTime + control->Io.dOutputTime;
 
@@ -7,11 +7,12 @@
 
 /* @cond DOXYGEN_OVERRIDE */
 
-void VerifyBodyExit(char[], char[], char[], int, int, int);
-void DoubleLineExit(char[], char[], int, int);
+NORETURN void VerifyBodyExit(char[], char[], char[], int, int, int);
+NORETURN void DoubleLineExit(char[], char[], int, int);
 void VerifyTripleExit(char[], char[], char[], int, int, int, char[], int);
 void VerifyOptions(BODY *, CONTROL *, FILES *, MODULE *, OPTIONS *, OUTPUT *,
                    SYSTEM *, UPDATE *, fnIntegrate *, fnUpdateVariable ****);
+void VerifyOutputOrder(CONTROL *, FILES *, OUTPUT *);
 void VerifyDynEllip(BODY *, CONTROL *, OPTIONS *, char[], int, int);
 int bFloatComparison(double, double);
 void fnNullDerivatives(BODY *, EVOLVE *, MODULE *, UPDATE *,
@@ -22,11 +22,11 @@ const double dTINY = 1. / DBL_MAX; // This is the smallest possibled double
 /* Do not change these values */
 
 /*!
-Actual implementation of the main function; called from in `int main()` below.
-We need this wrapper so we can call `main_impl` from Python.
+Read the input files, verify them, and perform the integration. Fatal errors
+call ExitVplanet, which returns control to main_impl.
 
  */
-int main_impl(int argc, char *argv[]) {
+void RunVplanet(int argc, char *argv[]) {
 #ifdef DEBUG
   //  feenableexcept(FE_INVALID | FE_OVERFLOW);
   _MM_SET_EXCEPTION_MASK(_MM_GET_EXCEPTION_MASK() & ~_MM_MASK_INVALID);
@@ -42,7 +42,7 @@ int main_impl(int argc, char *argv[]) {
   dStartTime = time(NULL);
   */
 
-  int iOption, iVerbose, iQuiet, iOverwrite;
+  int iOption, iVerbose, iQuiet, iOverwrite, iRestart;
   OPTIONS *options;
   OUTPUT *output;
   CONTROL control;
@@ -85,19 +85,31 @@ int main_impl(int argc, char *argv[]) {
   if (argc == 1) {
     fprintf(stderr,
             "Usage: %s [-v, -verbose] [-q, -quiet] [-h, -help] [-H, -Help] "
-            "<file>\n",
+            "[--restart <checkpoint>] <file>\n",
             argv[0]);
-    exit(EXIT_EXE);
+    ExitVplanet(EXIT_EXE);
   }
 
   iVerbose              = -1;
   iQuiet                = -1;
   iOverwrite            = -1;
+  iRestart              = -1;
   control.Io.iVerbose   = -1;
   control.Io.bOverwrite = -1;
+  files.cRestart[0]     = '\0';
 
   /* Check for flags */
   for (iOption = 1; iOption < argc; iOption++) {
+    if (strcmp(argv[iOption], "--restart") == 0) {
+      if (iOption + 1 >= argc) {
+        fprintf(stderr, "ERROR: --restart requires a checkpoint file.\n");
+        ExitVplanet(EXIT_EXE);
+      }
+      strcpy(files.cRestart, argv[iOption + 1]);
+      iRestart = iOption;
+      iOption++;
+      continue;
+    }
     if (memcmp(argv[iOption], "-v", 2) == 0) {
       control.Io.iVerbose = 5;
       iVerbose            = iOption;
@@ -120,12 +132,13 @@ int main_impl(int argc, char *argv[]) {
 
   if (iQuiet != -1 && iVerbose != -1) {
     fprintf(stderr, "ERROR: -v and -q cannot be set simultaneously.\n");
-    exit(EXIT_EXE);
+    ExitVplanet(EXIT_EXE);
   }
 
   /* Now identify input file, usually vpl.in */
   for (iOption = 1; iOption < argc; iOption++) {
-    if (iOption != iVerbose && iOption != iQuiet && iOption != iOverwrite) {
+    if (iOption != iVerbose && iOption != iQuiet && iOption != iOverwrite &&
+        iOption != iRestart && iOption != iRestart + 1) {
       strcpy(infile, argv[iOption]);
     }
   }
@@ -162,6 +175,7 @@ int main_impl(int argc, char *argv[]) {
   if (control.Evolve.bDoForward || control.Evolve.bDoBackward) {
     Evolve(body, &control, &files, &module, output, &system, update, fnUpdate,
            fnWrite, fnOneStep);
+    CloseOutput(&control, &files);
 
     /* If evolution performed, log final system parameters */
     if (control.Io.bLog) {
@@ -180,10 +194,36 @@ int main_impl(int argc, char *argv[]) {
     // printf("Total time: %.4e [sec]\n",
     // difftime(end.tv_usec,start.tv_usec)/1e6);
   }
-  exit(0);
+}
+
+/*!
+Actual implementation of the main function; called from in `int main()` below.
+We need this wrapper so we can call `main_impl` from Python. It never calls
+exit(): errors anywhere in the run jump back here, everything the run
+allocated or opened is released, and the EXIT_* status is returned.
+
+The run reads and writes its files in cDirectory and prints its errors to
+fpError (NULL for the current working directory and stderr). Input files
+named in input are read from its text instead of from disk. If memory is not
+NULL, the log and the output files are not written, but kept in memory; the
+caller must release them with FreeMemoryOutput. All of the run's state
+belongs to the calling thread, so several threads may be inside main_impl at
+once.
+
+ */
+int main_impl(int argc, char *argv[], const char *cDirectory, FILE *fpError,
+              MEMORYINPUT *input, MEMORYOUTPUT *memory) {
+  jmp_buf jExitPoint;
+
+  if (setjmp(jExitPoint) == 0) {
+    BeginRun(&jExitPoint, cDirectory, fpError, input, memory);
+    RunVplanet(argc, argv);
+  }
+
+  return EndRun();
 }
 
 
 int main(int argc, char *argv[]) {
-  main_impl(argc, argv);
+  return main_impl(argc, argv, NULL, NULL, NULL, NULL);
 }
@@ -10,6 +10,8 @@
 #include <ctype.h>
 #include <float.h>
 #include <math.h>
+#include <setjmp.h>
+#include <stdint.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -28,6 +30,21 @@
 #define M_PI 3.14159265358979323846
 #endif
 
+/* Run state (open files, memory, the random number generator, ...) is kept
+   per thread, so that Python can run several simulations at once. */
+#ifdef _MSC_VER
+#define THREADLOCAL __declspec(thread)
+#else
+#define THREADLOCAL __thread
+#endif
+
+/* ExitVplanet, and the functions that always call it, never return */
+#ifdef _MSC_VER
+#define NORETURN __declspec(noreturn)
+#else
+#define NORETURN __attribute__((noreturn))
+#endif
+
 /*! Top-level declarations */
 
 /* Implemented Moduules
@@ -105,6 +122,7 @@ extern const double dTINY;
    but I don't know how to do that. */
 #define LINE 2048         /* Maximum number of characters in a line */
 #define NAMELEN 100
+#define PATHLEN 1024 /* Maximum length of a file name with its directory */
 #define MAXFILES 128 /* Maximum number of input files */
 #define MAXARRAY                                                               \
   128 /* Maximum number of options in                                          \
@@ -126,21 +144,30 @@ This is necessary in order to add pointers to structs into typedef'd functions
 */
 
 typedef struct BODY BODY;
+typedef struct CHECKPOINT CHECKPOINT;
 typedef struct CONTROL CONTROL;
 typedef struct EVOLVE EVOLVE;
 typedef struct FILES FILES;
 typedef struct HALT HALT;
 typedef struct INFILE INFILE;
+typedef struct INPUTTABLE INPUTTABLE;
 typedef struct IO IO;
+typedef struct MEMORYARRAY MEMORYARRAY;
+typedef struct MEMORYINPUT MEMORYINPUT;
+typedef struct MEMORYOUTPUT MEMORYOUTPUT;
 typedef struct MODULE MODULE;
 typedef struct OPTIONS OPTIONS;
 typedef struct OUTFILE OUTFILE;
 typedef struct OUTPUT OUTPUT;
+typedef struct RUNSTATE RUNSTATE;
 typedef struct SYSTEM SYSTEM;
 typedef struct UNITS UNITS;
 typedef struct UPDATE UPDATE;
 typedef struct VERIFY VERIFY;
 
+/* The time derivative of a primary variable due to one process */
+typedef double (*fnUpdateVariable)(BODY *, SYSTEM *, int *);
+
 /*! \brief BODY contains all the physical parameters for every object in the
  * system.
  */
@@ -1656,8 +1683,87 @@ struct EVOLVE {
   int bFirstStep;    /**< Has the First Dtep Been Taken? */
   int iNumBodies;    /**< Number of Bodies to be Integrated */
   int iOneStep;      /**< Integration Method number */
+  int iNumThreads;   /**< Number of Threads that Evaluate the Derivatives */
+  int bUpdateCurrent; /**< Are the Derivatives in UPDATE Those of the Current
+                         State of the Bodies? */
+  int bReuseUpdate;   /**< May the Next Step Reuse Them? */
+  long iNumDerivEvals;  /**< Number of Evaluations of the Derivatives */
+  long iNumDerivReused; /**< Number of Evaluations Reused by the Next Step */
   double dCurrentDt; /**< Current timestep */
 
+  /* RK45 and ROSENBROCK */
+  double dRelTol;        /**< Relative Error Tolerance of a Step */
+  double dAbsTol;        /**< Absolute Error Tolerance of a Step, as a Fraction
+                            of the Largest Magnitude of the Variable */
+  double **daErrorScale; /**< Largest Magnitude of each Primary Variable */
+  double dNextDt;        /**< Step Size Proposed by the Error Control */
+  int bFSAL;             /**< Are the Last Stage's Derivatives Reusable? */
+  size_t iFSALUpdates;   /**< Fingerprint of fnUpdate for the Last Stage */
+
+  /* Dense output */
+  double dDenseTime;       /**< Time at the Start of the Step */
+  double dDenseDt;         /**< Length of the Step */
+  double *daDenseAge;      /**< Age of each Body at the Start of the Step */
+  double **daDenseStart;   /**< Primary Variables at the Start of the Step */
+  double **daDenseEnd;     /**< Primary Variables at the End of the Step */
+  int iDenseStage;         /**< Stage of the Derivatives at the End */
+  double *daDenseBodyAge;  /**< Age of each Body while the Output is
+                              Interpolated */
+  double **daDenseBody;    /**< Primary Variables while the Output is
+                              Interpolated */
+
+  /* Multi-rate */
+  int bMultiRate;             /**< Evaluate each Module at its Own Rate? */
+  int iNumRateClasses;        /**< Number of Modules with Derivatives to Hold */
+  int *iaRateClassModule;     /**< Module of each Rate Class */
+  int *iaEquationClass;       /**< Rate Class of each Equation, or -1 */
+  double *daEquationValue;    /**< Last Evaluation of each Equation */
+  double *daEquationPrev;     /**< Its Value when its Class was Last Scheduled */
+  double *daEquationHeld;     /**< Its Value while its Class is Held */
+  double *daEquationScale;    /**< Largest Magnitude it has Had */
+  int *baRateClassHeld;       /**< Are the Class's Derivatives Held? */
+  int *baRateClassPrev;       /**< Was the Class Scheduled Before? */
+  double *daRateClassTime;    /**< Time the Class was Last Scheduled */
+  double *daRateClassPeriod;  /**< Time Between Evaluations of the Class */
+  double *daRateClassNext;    /**< Time of the Next Evaluation of the Class */
+  long *iaRateClassEvals;     /**< Number of Evaluations of each Class */
+  size_t iRateClassUpdates;   /**< Fingerprint of fnUpdate when Last Selected */
+
+  /* Freezing quiescent primary variables */
+  double dFreezeTol;          /**< Largest Change of a Frozen Variable */
+  int iFreezeWindow;          /**< Quiescent Steps before it is Frozen */
+  int iNumFrozen;             /**< Number of Frozen Variables */
+  int **iaFreezeCount;        /**< Consecutive Quiescent Steps */
+  int **baFrozen;             /**< Is the Variable Frozen? */
+  double **daQuiescentTime;   /**< Time it Became Quiescent */
+  double **daThawTime;        /**< Time a Frozen Variable is Thawed */
+  int **iaFreezes;            /**< Number of Times it was Frozen */
+  double **daFrozenTime;      /**< Time it has Spent Frozen */
+  fnUpdateVariable ***fnFrozenUpdate; /**< Its Equations while it is Frozen */
+  size_t iFreezeUpdates;      /**< Fingerprint of fnUpdate before
+                                 ForceBehavior */
+
+  /* Checkpoints */
+  double dCheckpointInterval; /**< Simulated Time between Checkpoints */
+  double dCheckpointWallTime; /**< Seconds of Wall Clock between Checkpoints */
+  double dNextCheckpoint;     /**< Simulated Time of the Next Checkpoint */
+  double dLastCheckpointWall; /**< Wall Clock Time of the Last Checkpoint */
+
+  /* ROSENBROCK */
+  int iNumJacobianVars;      /**< Number of Integrated Primary Variables */
+  int **iaJacobianIndex;     /**< Row of each Primary Variable, or -1 */
+  int *iaJacobianBody;       /**< Body of each Row */
+  int *iaJacobianVar;        /**< Primary Variable of each Row */
+  int *iaJacobianColor;      /**< Evaluation that Computes each Column */
+  int iNumJacobianColors;    /**< Number of Evaluations for the Jacobian */
+  double **daJacobian;       /**< Derivatives of the Derivatives */
+  double **daIterationMatrix; /**< Identity - dt*d*Jacobian */
+  double **daLU;             /**< LU Decomposition of daIterationMatrix */
+  double *daLUScale;         /**< Scale of each Row of daLU */
+  int *iaLURowSwap;          /**< Row Swaps of daLU */
+  double *daTimeDeriv;       /**< Time Derivatives of the Derivatives */
+  double **daSlope;          /**< Slope of each Stage */
+
   // These are to store midpoint derivative info in RK4.
   BODY *tmpBody;     /**< Temporary BODY struct */
   UPDATE *tmpUpdate; /**< Temporary UPDATE struct */
@@ -1665,6 +1771,21 @@ struct EVOLVE {
                         Body #, second is the Primary variable number, third is
                         the equation number.  */
 
+  /* The processes of all bodies, in order, as one list */
+  int iNumEquations;   /**< Number of Processes of all Bodies */
+  int *iaEquationBody; /**< Body of each Process */
+  int *iaEquationVar;  /**< Primary Variable of each Process */
+  int *iaEquationEqn;  /**< Equation Number of each Process */
+
+  /* The primary variables of all bodies, in order, as one state vector */
+  int iNumStates;            /**< Number of Primary Variables of all Bodies */
+  double **pdState;          /**< Primary Variable of each State */
+  double **pdTmpState;       /**< Primary Variable of each State in tmpBody */
+  double **daStateDerivProc; /**< Processes of each State in tmpUpdate */
+  int *iaStateNumEqns;       /**< Number of Processes of each State */
+  int *baStateExplicit;      /**< Is the State an Explicit Function of Time? */
+  double **daStateDeriv;     /**< Derivative of each State at each Stage */
+
   // Module-specific parameters
   int *iNumModules; /**< Number of Modules per Primary Variable */
 
@@ -1697,6 +1818,7 @@ struct IO {
                    4=units; 5=all */
   double dOutputTime; /**< Integration Output Interval */
   double dNextOutput; /**< Time of next output */
+  int bDenseOutput;   /**< Interpolate the output between steps? */
 
   int bLog; /**< Write Log File? */
 
@@ -1705,7 +1827,8 @@ struct IO {
   int iSciNot; /**< Crossover Decade to Switch between Standard and Scientific
                   Notation */
 
-  int bOverwrite; /**< Allow files to be overwritten? */
+  int bOverwrite;    /**< Allow files to be overwritten? */
+  int iOutputFormat; /**< Format of the output files; text or binary */
 
   /* The following record whether an error message that should only be reported
      once has been printed. */
@@ -1727,7 +1850,6 @@ struct IO {
    halts, units, and the integration, including manipulating the UPDATE
    matrix through fnForceBehavior. */
 
-typedef double (*fnUpdateVariable)(BODY *, SYSTEM *, int *);
 typedef void (*fnPropsAuxModule)(BODY *, EVOLVE *, IO *, UPDATE *, int);
 typedef void (*fnForceBehaviorModule)(BODY *, MODULE *, EVOLVE *, IO *,
                                       SYSTEM *, UPDATE *, fnUpdateVariable ***,
@@ -1821,6 +1943,19 @@ struct INFILE {
   /* Array of Vapor pressure file */
 };
 
+/* The INPUTTABLE struct contains the text of an input file, read once,
+ * and a hash table of the lines that begin with each option name. */
+
+struct INPUTTABLE {
+  char cFile[NAMELEN]; /**< File Name */
+  int iNumLines;       /**< Number of Lines in File */
+  char **saLine;       /**< Text of each Line */
+  int iNumBuckets;     /**< Size of the Hash Table, a power of 2 */
+  char (*saKey)[OPTLEN]; /**< First Word of the Lines in each Bucket */
+  int *iaLine;           /**< First Line beginning with Key; -1 if empty */
+  int *iaDuplicate;      /**< Second Line beginning with Key; -1 if none */
+};
+
 /* The OUTFILE struct contains all the information
  * regarding the output files. */
 
@@ -1831,6 +1966,10 @@ struct OUTFILE {
   int bNeg[MODULEOUTEND];            /**< Use Negative Option Units? */
   int iNumGrid;                      /**< Number of grid outputs */
   char caGrid[MODULEOUTEND][OPTLEN]; /**< Gridded output name */
+  int iaCol[MODULEOUTEND];  /**< Index of each column's output/fnWrite */
+  int iaGrid[MODULEOUTEND]; /**< Index of each grid column's output/fnWrite */
+  FILE *fp;                 /**< Open handle to the output file */
+  FILE *fpGrid;             /**< Open handle to the climate grid file */
 };
 
 
@@ -1843,6 +1982,53 @@ struct FILES {
   char cLog[NAMELEN]; /**< Log File Name */
   INFILE *Infile;
   int iNumInputs; /**< Number of Input Files */
+  char cCheckpoint[NAMELEN]; /**< Checkpoint File Name */
+  char cRestart[NAMELEN];    /**< Checkpoint to Restart from, or "" */
+};
+
+/* The CHECKPOINT struct is the checkpoint file that is being written or read
+ * (see checkpoint.c). */
+
+struct CHECKPOINT {
+  FILE *fp;            /**< Stream of the Checkpoint File */
+  int bRead;           /**< Is it Read, rather than Written? */
+  char cFile[NAMELEN]; /**< Name of the Checkpoint File */
+  long lModules;       /**< Offset of the Modules' State in the File */
+};
+
+/* The MEMORYINPUT struct holds the text of input files that are not on
+ * disk (see main_impl). When an input file is read, its name is looked up
+ * here first. */
+
+struct MEMORYINPUT {
+  int iNumFiles;       /**< Number of Files */
+  const char **saFile; /**< Name of each File */
+  const char **saText; /**< Contents of each File */
+};
+
+/* The MEMORYARRAY struct holds the rows of one output file when the output
+ * is kept in memory. Column iCol occupies daData[iCol * iMaxRows] to
+ * daData[iCol * iMaxRows + iNumRows - 1]. */
+
+struct MEMORYARRAY {
+  int iNumCols;   /**< Number of Columns */
+  int iNumRows;   /**< Number of Rows Written */
+  int iMaxRows;   /**< Number of Rows Allocated for each Column */
+  double *daData; /**< The Columns, one after the other */
+};
+
+/* The MEMORYOUTPUT struct receives the output of a run that is kept in
+ * memory instead of being written to disk (see main_impl). Its buffers are
+ * not tracked, so they outlive the run; release them with
+ * FreeMemoryOutput. */
+
+struct MEMORYOUTPUT {
+  int iNumBodies;      /**< Number of Bodies with Arrays */
+  MEMORYARRAY *Array;  /**< Each Body's Forward or Backward Output */
+  MEMORYARRAY *Grid;   /**< Each Body's Climate Grid Output */
+  FILE *fpLog;         /**< Stream the Log is Written to */
+  char *cLog;          /**< Text of the Log */
+  size_t iLogSize;     /**< Length of the Log */
 };
 
 /* The OPTIONS struct contains all the information
@@ -2090,6 +2276,8 @@ typedef void (*fnLogBodyModule)(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
                                 fnWriteOutput *, FILE *, int);
 typedef void (*fnLogModule)(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
                             fnWriteOutput *, FILE *);
+typedef void (*fnCheckpointModule)(BODY *, EVOLVE *, SYSTEM *, CHECKPOINT *,
+                                   int);
 
 struct MODULE {
   int *iNumModules; /**< Number of Modules per Body */
@@ -2273,6 +2461,10 @@ struct MODULE {
   /*! These functions log module-specific data. */
   fnLogBodyModule **fnLogBody;
 
+  /*! These functions write or read the module-specific state of a
+      checkpoint. */
+  fnCheckpointModule **fnCheckpoint;
+
   /*! These functions read module-specific option. */
   fnReadOptionsModule **fnReadOptions;
 
@@ -2298,6 +2490,7 @@ typedef void (*fnIntegrate)(BODY *, CONTROL *, SYSTEM *, UPDATE *,
 
 /* Top-level files */
 #include "body.h"
+#include "checkpoint.h"
 #include "control.h"
 #include "evolve.h"
 #include "halt.h"
@@ -2322,3 +2515,17 @@ typedef void (*fnIntegrate)(BODY *, CONTROL *, SYSTEM *, UPDATE *,
 #include "spinbody.h"
 #include "stellar.h"
 #include "thermint.h"
+
+/* Memory and files are tracked for each run so that a run that ends early,
+   e.g. on an input error, can release them before returning to main_impl.
+   See TrackedMalloc in control.c. */
+#define malloc(iSize) TrackedMalloc(iSize)
+#define free(ptr) TrackedFree(ptr)
+#define fopen(cFile, cMode) TrackedFopen(cFile, cMode)
+#define fclose(fp) TrackedFclose(fp)
+
+/* Errors and warnings go to the stream of the current run, which is stderr
+   unless the caller of main_impl asked for something else. */
+static inline FILE *StandardError() { return stderr; }
+#undef stderr
+#define stderr ErrorStream()
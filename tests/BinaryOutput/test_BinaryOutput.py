@@ -0,0 +1,49 @@
+from benchmark import Benchmark, benchmark
+import astropy.units as u
+import numpy as np
+import os
+import pytest
+import re
+import shutil
+import vplanet
+
+
+@benchmark(
+    {
+        "earth.Time": {"index": -1, "value": 4.5e9, "unit": u.yr},
+        "earth.TMan": {"index": -1, "value": 2257.8509, "unit": u.K},
+        "earth.TCore": {"index": -1, "value": 4999.1318, "unit": u.K},
+        "earth.RIC": {"index": -1, "value": 1224.7839, "unit": u.km},
+        "earth.RadPowerTotal": {"index": -1, "value": 24.3829, "unit": u.TW},
+        "earth.MagMom": {"index": -1, "value": 1.009593},
+    }
+)
+class TestBinaryOutput(Benchmark):
+    pass
+
+
+def test_binary_after_text(tmp_path):
+    # A text run leaves earth.earth.forward behind, which a binary run in the
+    # same directory must not be read from
+    path = os.path.dirname(os.path.abspath(__file__))
+    for file in ("vpl.in", "sun.in", "earth.in"):
+        shutil.copy(os.path.join(path, file), str(tmp_path))
+    infile = str(tmp_path / "vpl.in")
+    with open(infile, "r") as f:
+        binary = f.read()
+    text = re.sub(r"(?m)^sOutputFormat.*$", "sOutputFormat text", binary)
+    text = re.sub(r"(?m)^dStopTime.*$", "dStopTime 1e8", text)
+    with open(infile, "w") as f:
+        f.write(text)
+    output = vplanet.run(infile, units=False, quiet=True, clobber=True)
+    assert output.earth.fwfile == "earth.earth.forward"
+    assert np.isclose(output.earth.Time[-1], 0.1)
+
+    with open(infile, "w") as f:
+        f.write(binary)
+    output = vplanet.run(infile, units=False, quiet=True, clobber=True)
+    assert os.path.exists(str(tmp_path / "earth.earth.forward"))
+    assert output.earth.fwfile == "earth.earth.forward.bin"
+    assert isinstance(output.earth._params.columns.data, np.memmap)
+    assert np.isclose(output.earth.Time[-1], 4.5)
+    assert np.array_equal(output.earth.TMan, output.earth._params.columns.data[:, 1])
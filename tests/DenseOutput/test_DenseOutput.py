@@ -0,0 +1,20 @@
+from benchmark import Benchmark, benchmark
+import astropy.units as u
+import pytest
+
+# The values are those of a Runge-Kutta4 run with dEta = 0.002, whose steps
+# stop at each output
+@benchmark(
+    {
+        "b.Time": {"index": 100, "value": 1e6, "unit": u.yr},
+        "b.SurfWaterMass": {"index": 100, "value": 9.916597, "unit": u.TO, "rtol": 1e-4},
+        "b.RotPer": {"index": 100, "value": 4.564679, "unit": u.day, "rtol": 1e-4},
+        "star.Luminosity": {"index": 500, "value": 0.020152, "unit": u.LSUN, "rtol": 1e-4},
+        "b.OxygenMass": {"index": 500, "value": 25.68125, "unit": u.bar, "rtol": 1e-4},
+        "b.Eccentricity": {"index": 500, "value": 0.096277, "rtol": 1e-4},
+        "log.final.b.SurfWaterMass": {"value": 9.426072, "unit": u.TO, "rtol": 1e-4},
+        "log.final.b.OxygenMass": {"value": 50.96615, "unit": u.bar, "rtol": 1e-4},
+    }
+)
+class TestDenseOutput(Benchmark):
+    pass
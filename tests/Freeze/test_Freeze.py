@@ -0,0 +1,18 @@
+from benchmark import Benchmark, benchmark
+import astropy.units as u
+import pytest
+
+# The values are those of the same run without dFreezeTol, except for the
+# number of times the star's rotation and the planet's orbit were frozen
+@benchmark(
+    {
+        "log.final.d.RotPer": {"value": 44.658583, "unit": u.days, "rtol": 1e-3},
+        "log.final.d.Obliquity": {"value": 0.328813, "unit": u.rad, "rtol": 1e-3},
+        "log.final.d.SemiMajorAxis": {"value": 3.268278e10, "unit": u.m, "rtol": 1e-3},
+        "log.final.d.LockTime": {"value": 2.887349e15, "unit": u.sec, "rtol": 1e-3},
+        "log.final.gl581.FreezesRot": {"value": 7},
+        "log.final.d.FreezesSemi": {"value": 7},
+    }
+)
+class TestFreeze(Benchmark):
+    pass
@@ -0,0 +1,96 @@
+import subprocess
+
+import numpy as np
+
+VPL = """sSystemName\tparse\t\t# System Name
+iVerbose\t1
+bOverwrite\t1
+
+saBodyFiles\tstar.in $\t# The host star
+\t\tplanet.in
+
+sUnitMass\tsolar
+sUnitLength\tAU
+sUnitTime\tYEARS
+sUnitAngle\td
+
+bDoLog\t1
+iDigits\t6
+bDoForward\t1
+bVarDt\t1
+dEta\t0.01
+dStopTime\t1e6
+dOutputTime\t1e5
+"""
+
+STAR = """sName\tstar
+saModules\teqtide
+dMass\t1.0
+dRadius\t-1.0
+dRotPeriod\t-30.0
+dObliquity\t0
+dRadGyra\t0.5
+dTidalQ\t1e6
+dK2\t0.5
+dMaxLockDiff\t0.1
+saTidePerts\tplanet
+saOutputOrder\tTime -RotPer
+"""
+
+PLANET = """sName\tplanet
+saModules\teqtide
+dMass\t-1.0
+dRadius\t-1.0
+dRotPeriod\t-1.0
+dObliquity\t23.5
+dRadGyra\t0.5
+dTidalQ\t100
+dK2\t0.3
+dMaxLockDiff\t0.1
+dSemi\t0.05
+dEcc\t0.1
+saTidePerts\tstar
+sTideModel\tp2
+
+# Continuation lines may be separated by comments and blank lines
+saOutputOrder\tTime $  # first line
+\t-RotPer $
+
+# a comment between continuation lines
+\tObli $
+\tSemim Eccentricity
+"""
+
+
+def _write(tmp_path, planet=PLANET):
+    (tmp_path / "vpl.in").write_text(VPL)
+    (tmp_path / "star.in").write_text(STAR)
+    (tmp_path / "planet.in").write_text(planet)
+
+
+def _run(tmp_path):
+    return subprocess.run(
+        ["vplanet", "vpl.in"], cwd=str(tmp_path), capture_output=True, text=True
+    )
+
+
+def test_continuation(tmp_path):
+    _write(tmp_path)
+    assert _run(tmp_path).returncode == 0
+    data = np.loadtxt(str(tmp_path / "parse.planet.forward"), ndmin=2)
+    assert data.shape[1] == 5
+    assert np.allclose(data[0, 2:], [23.5, 0.05, 0.1])
+
+
+def test_duplicate_option(tmp_path):
+    _write(tmp_path, PLANET + "dEcc\t0.2\n")
+    result = _run(tmp_path)
+    assert result.returncode != 0
+    assert "planet.in, lines: 12 and 23" in result.stderr
+
+
+def test_unrecognized_option(tmp_path):
+    _write(tmp_path, PLANET + "dNotAnOption\t1\n")
+    result = _run(tmp_path)
+    assert result.returncode != 0
+    assert 'Unrecognized option "dNotAnOption" in planet.in, line 23' in result.stderr
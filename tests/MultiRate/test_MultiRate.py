@@ -0,0 +1,17 @@
+from benchmark import Benchmark, benchmark
+import astropy.units as u
+import pytest
+
+# The values are those of a run with dEta = 5e-5, which evaluates every
+# module at every step
+@benchmark(
+    {
+        "log.final.tidalearth.TMan": {"value": 2799.455817, "unit": u.K, "rtol": 1e-3},
+        "log.final.tidalearth.TCore": {"value": 5500.224542, "unit": u.K, "rtol": 1e-3},
+        "log.final.tidalearth.PowerEqtide": {"value": 0.005338, "unit": u.TW, "rtol": 1e-3},
+        "log.final.tidalearth.Eccentricity": {"value": 0.490443, "rtol": 1e-3},
+        "log.final.tidalearth.SemiMajorAxis": {"value": 7.409425e09, "unit": u.m, "rtol": 1e-3},
+    }
+)
+class TestMultiRate(Benchmark):
+    pass
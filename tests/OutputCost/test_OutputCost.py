@@ -0,0 +1,33 @@
+import os
+import re
+import shutil
+import subprocess
+
+
+def _run(tmp_path, output_time):
+    """Run the case with the given dOutputTime; return the number of rows."""
+    path = os.path.abspath(os.path.dirname(__file__))
+    rundir = tmp_path / "{:.0e}".format(output_time)
+    rundir.mkdir()
+    for file in ("vpl.in", "sun.in", "earth.in"):
+        shutil.copy(os.path.join(path, file), str(rundir))
+    infile = str(rundir / "vpl.in")
+    with open(infile, "r") as f:
+        contents = f.read()
+    contents = re.sub(
+        "(?m)^dOutputTime.*$", "dOutputTime\t{:e}".format(output_time), contents
+    )
+    with open(infile, "w") as f:
+        f.write(contents)
+
+    subprocess.run(["vplanet", "vpl.in", "-q"], cwd=str(rundir), check=True)
+
+    with open(str(rundir / "earth.earth.forward"), "r") as f:
+        return len(f.readlines())
+
+
+def test_output_cost(tmp_path):
+    # Same 1000 fixed steps, written every step or only at the ends. The
+    # cost of a row is measured by tests/output_cost.py
+    assert _run(tmp_path, 1e5) == 1001
+    assert _run(tmp_path, 1e8) == 2
@@ -0,0 +1,18 @@
+from benchmark import Benchmark, benchmark
+import astropy.units as u
+import pytest
+
+# The values are those of a Runge-Kutta4 run with dEta = 0.002
+@benchmark(
+    {
+        "log.final.star.Luminosity": {"value": 0.012551, "unit": u.LSUN, "rtol": 1e-4},
+        "log.final.star.Radius": {"value": 2.791900e08, "unit": u.m, "rtol": 1e-4},
+        "log.final.b.OrbPeriod": {"value": 3.936445e05, "unit": u.sec, "rtol": 1e-4},
+        "log.final.b.Eccentricity": {"value": 0.092672, "rtol": 1e-4},
+        "log.final.b.RotPer": {"value": 4.55607, "unit": u.day, "rtol": 1e-4},
+        "log.final.b.SurfWaterMass": {"value": 9.426075, "unit": u.TO, "rtol": 1e-4},
+        "log.final.b.OxygenMass": {"value": 50.966158, "unit": u.bar, "rtol": 1e-4},
+    }
+)
+class TestRungeKutta45(Benchmark):
+    pass
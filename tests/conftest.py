@@ -12,18 +12,26 @@ sys.path.insert(1, os.path.abspath(os.path.dirname(__file__)))
 # Set to False to keep .log, .forward, etc files
 CLEAN_OUTPUTS = True
 
+# Set the VPLANET_TEST_CACHE environment variable to "readwrite" to cache the
+# outputs of the runs below between sessions (see `vplanet.run`). The cache
+# is keyed on the inputs and on the build of the C extension, so a rebuild
+# runs everything again
+CACHE = os.environ.get("VPLANET_TEST_CACHE", "off")
+
 
 @pytest.fixture(scope="module")
 def vplanet_output(request):
     path = os.path.abspath(os.path.dirname(request.fspath))
     infile = os.path.join(path, "vpl.in")
-    output = vplanet.run(infile, quiet=True, clobber=True)
+    output = vplanet.run(infile, quiet=True, clobber=True, cache=CACHE)
     yield output
     if CLEAN_OUTPUTS:
         for file in (
             glob.glob(f"{path}/*.log")
             + glob.glob(f"{path}/*.forward")
             + glob.glob(f"{path}/*.backward")
+            + glob.glob(f"{path}/*.forward.bin")
+            + glob.glob(f"{path}/*.backward.bin")
             + glob.glob(f"{path}/*.Climate")
         ):
             os.remove(file)
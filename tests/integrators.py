@@ -0,0 +1,92 @@
+"""
+Compare the Runge-Kutta45 and Rosenbrock integrators with Runge-Kutta4 on the
+test cases: the wall time of each run, and the largest relative difference
+between the final values in their logs and those of Runge-Kutta4. Run from
+this directory, with the names of the cases to compare as arguments, or none to
+compare all of them.
+
+"""
+import numpy as np
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+import vplanet
+
+METHODS = ["Runge-Kutta4", "Runge-Kutta45", "Rosenbrock"]
+
+
+def run(sub, method):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, sub)
+        shutil.copytree(
+            sub,
+            path,
+            ignore=shutil.ignore_patterns(
+                "*.py", "__pycache__", "*.log", "*.forward", "*.backward"
+            ),
+        )
+        infile = os.path.join(path, "vpl.in")
+        with open(infile, "r") as f:
+            text = re.sub(r"(?m)^\s*sIntegrationMethod.*$", "", f.read())
+        with open(infile, "w") as f:
+            f.write(text + "\nsIntegrationMethod %s\n" % method)
+        start = time.time()
+        output = vplanet.run(infile, units=False, quiet=True)
+        return time.time() - start, output.log
+
+
+def difference(log, reference):
+    # The largest difference between the final values, relative to the
+    # largest of the initial and final values, and its name. DeltaTime is the
+    # last timestep, so it differs by design, and the obliquity is compared,
+    # but not its components or their derivatives, which are undefined or 0
+    # once it has damped
+    worst = (0.0, "")
+    for body in reference.final.members:
+        for param in getattr(reference.final, body).members:
+            if param == "DeltaTime" or re.search("[XYZ]obl|PrecA", param):
+                continue
+            a = getattr(getattr(reference.final, body), param)
+            b = getattr(getattr(log.final, body), param, None)
+            c = getattr(getattr(reference.initial, body), param, 0.0)
+            if isinstance(a, float) and isinstance(b, float) and a != b:
+                diff = abs(a - b) / max(abs(a), abs(b), abs(c))
+                if diff > worst[0]:
+                    worst = (diff, body + "." + param)
+    return worst
+
+
+if len(sys.argv) > 1:
+    subdir = sys.argv[1:]
+else:
+    subdir = sorted(
+        f.name for f in os.scandir(".") if os.path.exists(f.path + "/vpl.in")
+    )
+
+print(
+    "%-24s %8s %8s %8s %8s %8s  %s"
+    % ("Test", "RK4 [s]", "RK45 [s]", "Diff", "Ros [s]", "Diff", "Worst")
+)
+speedups = {method: [] for method in METHODS[1:]}
+for sub in subdir:
+    try:
+        results = [run(sub, method) for method in METHODS]
+    except vplanet.VPLANETError:
+        print("%-24s failed" % sub)
+        continue
+    t4, log4 = results[0]
+    row = [sub, t4]
+    worst = (0.0, "")
+    for method, (t, log) in zip(METHODS[1:], results[1:]):
+        diff = difference(log, log4)
+        speedups[method].append(t4 / t)
+        row += [t, diff[0]]
+        worst = max(worst, diff)
+    print("%-24s %8.2f %8.2f %8.1e %8.2f %8.1e  %s" % tuple(row + [worst[1]]))
+
+for method in METHODS[1:]:
+    print("Median speedup of %s: %.2f" % (method, np.median(speedups[method])))
@@ -0,0 +1,50 @@
+"""
+Measure the cost of writing one row of the 73-column output of the OutputCost
+case, the same 1000 fixed steps of RadHeat and ThermInt written either every
+step or only at the ends. The cost is the difference between the wall times
+of the two runs, divided by the difference in their numbers of rows.
+Reopening the file and searching all outputs for every column cost ~1.5 ms
+per row; with open handles and a column map it is ~50 us. Run from any
+directory.
+
+"""
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+
+CASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "OutputCost")
+REPEATS = 3
+
+
+def wall_time(output_time, path):
+    # The fastest of several runs, which is the least disturbed by the rest
+    # of the machine; and the number of rows written
+    rundir = os.path.join(path, "{:.0e}".format(output_time))
+    os.mkdir(rundir)
+    for file in ("vpl.in", "sun.in", "earth.in"):
+        shutil.copy(os.path.join(CASE, file), rundir)
+    infile = os.path.join(rundir, "vpl.in")
+    with open(infile, "r") as f:
+        text = re.sub(
+            r"(?m)^dOutputTime.*$", "dOutputTime\t{:e}".format(output_time), f.read()
+        )
+    with open(infile, "w") as f:
+        f.write(text)
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run(["vplanet", "vpl.in", "-q"], cwd=rundir, check=True)
+        best = min(best, time.perf_counter() - start)
+    with open(os.path.join(rundir, "earth.earth.forward"), "r") as f:
+        nrows = len(f.readlines())
+    return best, nrows
+
+
+with tempfile.TemporaryDirectory() as path:
+    tfine, nfine = wall_time(1e5, path)
+    tcoarse, ncoarse = wall_time(1e8, path)
+print("%.1f us/row" % ((tfine - tcoarse) / (nfine - ncoarse) * 1e6))
@@ -0,0 +1,52 @@
+"""
+Measure how long vplanet.output.get_data takes to parse a synthetic 100k-row
+text output file, against the original parser, which made one pass over
+every line for each column. Run from any directory, with the number of rows
+as an argument, or none for 100000.
+
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from vplanet.output import get_data
+
+NCOLS = 10
+
+
+def get_columns_per_line(lines, ncols):
+    # The original parser
+    columns = []
+    for j in range(ncols):
+        array = []
+        for line in lines:
+            array.append(float(line.split()[j]))
+        columns.append(np.array(array))
+    return columns
+
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+np.random.seed(0)
+data = np.random.randn(nrows, NCOLS) * 10.0 ** np.random.randint(-5, 5, NCOLS)
+
+with tempfile.TemporaryDirectory() as tmp:
+    file = os.path.join(tmp, "bench.earth.forward")
+    np.savetxt(file, data, fmt="%.6e")
+
+    start = time.perf_counter()
+    with open(file, "r") as f:
+        get_columns_per_line(f.readlines(), NCOLS)
+    told = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_data(file)
+    tnew = time.perf_counter() - start
+
+print(
+    "Parsed {} rows x {} columns: old {:.3f} s, new {:.3f} s ({:.1f}x)".format(
+        nrows, NCOLS, told, tnew, told / tnew
+    )
+)
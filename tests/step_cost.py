@@ -0,0 +1,86 @@
+"""
+Measure the cost of one step of a two-body EqTide system, the TideLockCPL
+case with a fixed timestep and a single output, so that the per-step
+bookkeeping of the integrator, not the physics or the output, is what is
+timed. The cost is the difference between the wall times of two runs that
+differ only in their number of steps, divided by that difference. Run from
+any directory, with the integration methods to time as arguments, or none
+for Runge-Kutta4.
+
+"""
+import sys
+import tempfile
+import time
+
+import vplanet
+
+STEPS = 20000
+REPEATS = 5
+
+SYSTEM = {
+    "sSystemName": "gl581",
+    "iVerbose": 0,
+    "bOverwrite": True,
+    "sUnitMass": "solar",
+    "sUnitLength": "AU",
+    "sUnitTime": "YEARS",
+    "sUnitAngle": "d",
+    "bDoLog": False,
+    "bDoForward": True,
+    "bVarDt": False,
+    "dTimeStep": 1.0,
+}
+BODIES = {
+    "gl581": {
+        "saModules": ["eqtide"],
+        "dMass": 0.31,
+        "dRadius": 0.00131,
+        "dObliquity": 0,
+        "dRotPeriod": -94.2,
+        "dRadGyra": 0.5,
+        "dTidalQ": 1e6,
+        "dK2": 0.5,
+        "sTideModel": "p2",
+        "saTidePerts": ["d"],
+        "saOutputOrder": ["Time", "-RotPer"],
+    },
+    "d": {
+        "saModules": ["eqtide"],
+        "dMass": -5.6,
+        "sMassRad": "sotin07",
+        "dRadGyra": 0.5,
+        "dRotPeriod": -1,
+        "dObliquity": 23.5,
+        "dEcc": 0.38,
+        "dSemi": 0.21847,
+        "dTidalQ": 100,
+        "dK2": 0.3,
+        "saTidePerts": ["gl581"],
+        "dMaxLockDiff": 0.01,
+        "saOutputOrder": ["Time", "-RotPer", "Obliq"],
+    },
+}
+
+
+def wall_time(method, steps, path):
+    # The fastest of several runs, which is the least disturbed by the rest
+    # of the machine
+    system = dict(SYSTEM, sIntegrationMethod=method)
+    system["dStopTime"] = system["dOutputTime"] = steps * SYSTEM["dTimeStep"]
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        vplanet.run(
+            path + "/vpl.in", quiet=True, to_memory=True, system=system, bodies=BODIES
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+methods = sys.argv[1:] or ["Runge-Kutta4"]
+with tempfile.TemporaryDirectory() as path:
+    for method in methods:
+        cost = (
+            wall_time(method, 2 * STEPS, path) - wall_time(method, STEPS, path)
+        ) / STEPS
+        print("%-16s %8.3f us/step" % (method, cost * 1e6))
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+import numpy as np
+import pytest
+import vplanet
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "EarthInterior")
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = str(tmp_path / "cache")
+    monkeypatch.setattr(vplanet.cache, "CACHE_DIR", directory)
+    return directory
+
+
+def _copy_example(tmp_path):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    for file in ("vpl.in", "sun.in", "earth.in"):
+        shutil.copy(os.path.join(EXAMPLE, file), str(run_dir))
+    return str(run_dir / "vpl.in")
+
+
+def _outputs(infile):
+    path = os.path.dirname(infile)
+    return [file for file in os.listdir(path) if not file.endswith(".in")]
+
+
+def _remove_outputs(infile):
+    path = os.path.dirname(infile)
+    for file in _outputs(infile):
+        os.remove(os.path.join(path, file))
+
+
+def test_cache(tmp_path, cache_dir):
+    infile = _copy_example(tmp_path)
+    output = vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+    assert len(os.listdir(cache_dir)) == 1
+
+    # The second run comes from the cache, without running vplanet
+    _remove_outputs(infile)
+    cached = vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+    assert _outputs(infile) == []
+    assert np.array_equal(cached.earth.TMan, output.earth.TMan)
+    assert cached.earth.TMan.tags == output.earth.TMan.tags
+    assert cached.log.path == os.path.dirname(infile)
+    assert cached.path == os.path.dirname(infile)
+
+    # Comments and whitespace don't change the key...
+    with open(infile, "a") as f:
+        f.write("\n# A comment\n\n")
+    vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+    assert _outputs(infile) == []
+
+    # ...but the options and the units do
+    vplanet.run(infile, quiet=True, units=True, cache="readwrite")
+    assert len(os.listdir(cache_dir)) == 2
+    _remove_outputs(infile)
+    earth = os.path.join(os.path.dirname(infile), "earth.in")
+    with open(earth, "r") as f:
+        text = f.read()
+    with open(earth, "w") as f:
+        f.write(text.replace("dTMan", "dTMan 3500 #"))
+    changed = vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+    assert len(_outputs(infile)) > 0
+    assert changed.earth.TMan[0] != output.earth.TMan[0]
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_cache_elsewhere(tmp_path, cache_dir):
+    infile = _copy_example(tmp_path)
+    vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+
+    # The same inputs in another directory give the same result, which
+    # belongs to the new directory
+    other = tmp_path / "other"
+    shutil.copytree(os.path.dirname(infile), str(other))
+    _remove_outputs(str(other / "vpl.in"))
+    cached = vplanet.run(str(other / "vpl.in"), quiet=True, units=False, cache="read")
+    assert cached.path == cached.log.path == str(other)
+
+
+def test_cache_build(tmp_path, cache_dir, monkeypatch):
+    infile = _copy_example(tmp_path)
+    key = vplanet.cache.cache_key(infile)
+
+    # A rebuilt extension does not reuse the results of the old one
+    monkeypatch.setattr(vplanet.cache, "_build_id", lambda: b"rebuilt")
+    assert vplanet.cache.cache_key(infile) != key
+
+
+def test_cache_restart(tmp_path, cache_dir):
+    infile = _copy_example(tmp_path)
+    vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+
+    # A restart runs vplanet, which fails for want of a checkpoint, instead
+    # of returning the cached result
+    with pytest.raises(vplanet.VPLANETError):
+        vplanet.run(
+            infile,
+            quiet=True,
+            units=False,
+            in_process=True,
+            cache="readwrite",
+            restart="earth.checkpoint",
+        )
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cache_read(tmp_path, cache_dir):
+    infile = _copy_example(tmp_path)
+    vplanet.run(infile, quiet=True, units=False, cache="read")
+    assert not os.path.exists(cache_dir)
+
+
+def test_cache_evict(tmp_path, cache_dir, monkeypatch):
+    infile = _copy_example(tmp_path)
+    vplanet.run(infile, quiet=True, units=True, cache="readwrite")
+    size = os.path.getsize(os.path.join(cache_dir, os.listdir(cache_dir)[0]))
+
+    # Only the most recent result fits
+    monkeypatch.setattr(vplanet.cache, "CACHE_SIZE", size)
+    vplanet.run(infile, quiet=True, units=False, cache="readwrite")
+    key = vplanet.cache.cache_key(infile, units=False)
+    assert os.listdir(cache_dir) == [key + vplanet.cache.EXT]
+
+    vplanet.cache.evict()
+    assert os.listdir(cache_dir) == []
+
+
+def test_cache_dict_input(tmp_path, cache_dir):
+    from test_dict_input import SYSTEM, BODIES
+
+    infile = str(tmp_path / "vpl.in")
+    kwargs = dict(quiet=True, to_memory=True, units=False, cache="readwrite")
+    output = vplanet.run(infile, system=SYSTEM, bodies=BODIES, **kwargs)
+    cached = vplanet.run(infile, system=SYSTEM, bodies=BODIES, **kwargs)
+    assert np.array_equal(cached.earth.TMan, output.earth.TMan)
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cache_bad_mode(tmp_path, cache_dir):
+    infile = _copy_example(tmp_path)
+    with pytest.raises(ValueError):
+        vplanet.run(infile, quiet=True, cache="yes")
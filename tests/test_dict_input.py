@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import os
+
+import astropy.units as u
+import pytest
+import vplanet
+
+# The EarthInterior example, as dicts instead of .in files
+SYSTEM = {
+    "sSystemName": "earth",
+    "iVerbose": 5,
+    "bOverwrite": True,
+    "sUnitMass": "solar",
+    "sUnitLength": "aU",
+    "sUnitTime": "YEARS",
+    "sUnitAngle": "d",
+    "sUnitTemp": "K",
+    "bDoLog": True,
+    "iDigits": 6,
+    "dMinValue": 1e-10,
+    "bDoForward": True,
+    "bVarDt": True,
+    "dEta": 0.1,
+    "dStopTime": 4.5e9,
+    "dOutputTime": 1e7,
+}
+BODIES = {
+    "sun": {
+        "dMass": 1,
+        "dSemi": 0,
+        "dEcc": 0,
+        "dRadius": 0.00135,
+        "dLuminosity": 3.846e26,
+        "sStellarModel": "none",
+        "saModules": ["stellar"],
+    },
+    "earth": {
+        "saModules": ["radheat", "thermint"],
+        "dMass": -1.0,
+        "dRadius": -1.0,
+        "dRotPeriod": -1.0,
+        "dObliquity": 23.5,
+        "dRadGyra": 0.5,
+        "dEcc": 0.0167,
+        "dSemi": -1,
+        "dTMan": 3000,
+        "dTCore": 6000,
+        "saOutputOrder": ["-Time", "-TMan", "-TCore", "-RIC", "-RadPowerTotal"],
+    },
+}
+for isotope in ("40K", "232Th", "235U", "238U"):
+    for reservoir in ("Man", "Core", "Crust"):
+        BODIES["earth"]["d{}Power{}".format(isotope, reservoir)] = -1
+
+
+def test_dict_input(tmp_path):
+    infile = str(tmp_path / "vpl.in")
+    output = vplanet.run(
+        infile, quiet=True, to_memory=True, system=SYSTEM, bodies=BODIES
+    )
+
+    # Nothing at all was read from or written to disk
+    assert os.listdir(str(tmp_path)) == []
+
+    # Same answer as the example's input files
+    assert output.earth.TMan[-1].to(u.K).value == pytest.approx(2257.8509, rel=1e-6)
+    assert output.earth.TCore[-1].to(u.K).value == pytest.approx(4999.1318, rel=1e-6)
+    assert output.earth.RIC[-1].to(u.km).value == pytest.approx(1224.7839, rel=1e-6)
+    assert output.earth.RadPowerTotal[-1].to(u.TW).value == pytest.approx(
+        24.3829, rel=1e-5
+    )
+
+
+def test_dict_input_error(tmp_path):
+    bodies = {name: dict(options) for name, options in BODIES.items()}
+    bodies["earth"]["dNotAnOption"] = 1
+
+    # Errors name the logical files
+    with pytest.raises(
+        vplanet.VPLANETError, match='Unrecognized option "dNotAnOption" in earth.in'
+    ):
+        vplanet.run(
+            str(tmp_path / "vpl.in"),
+            quiet=True,
+            to_memory=True,
+            system=SYSTEM,
+            bodies=bodies,
+        )
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+import pytest
+
+# The most `import vplanet` may take, in seconds
+BUDGET = 0.3
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime needs 3.7")
+def test_import_time():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import vplanet"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    # Lines look like "import time: self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, time, name = line.split("|")
+            if time.strip().isdigit():
+                cumulative[name.strip()] = int(time) * 1e-6
+
+    # Nothing slow is imported up front
+    assert not any(name.startswith("astropy") for name in cumulative)
+    assert "vplanet.vplanet_help" not in cumulative
+    assert cumulative["vplanet"] < BUDGET
+
+
+def test_no_astropy():
+    # Importing vplanet does not import any part of astropy
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, vplanet; "
+            "assert not any(name.split('.')[0] == 'astropy' for name in sys.modules)",
+        ],
+        check=True,
+    )
+
+
+def test_lazy_attributes():
+    import vplanet
+
+    assert vplanet.Quantity.__name__ == "VPLANETQuantity"
+    assert "get_output" in dir(vplanet)
+    with pytest.raises(AttributeError):
+        vplanet.NotAnAttribute
+
+
+def test_custom_units():
+    # Our units are registered with astropy whenever it is imported
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import vplanet, sys; assert 'astropy' not in sys.modules; "
+            "import astropy.units as u; u.TO, u.LSUN, u.Unit('Earth Masses')",
+        ],
+        check=True,
+    )
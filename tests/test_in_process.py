@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+import numpy as np
+import pytest
+import vplanet
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "EarthInterior")
+
+
+def _copy_example(tmp_path):
+    for file in ("vpl.in", "sun.in", "earth.in"):
+        shutil.copy(os.path.join(EXAMPLE, file), str(tmp_path))
+    return str(tmp_path / "vpl.in")
+
+
+def test_in_process(tmp_path):
+    infile = _copy_example(tmp_path)
+    subprocess_output = vplanet.run(infile, quiet=True, clobber=True, units=False)
+
+    # Repeated runs in the same interpreter give the same answer
+    for _ in range(3):
+        output = vplanet.run(
+            infile, quiet=True, clobber=True, units=False, in_process=True
+        )
+        assert np.array_equal(output.earth.TMan, subprocess_output.earth.TMan)
+        assert np.array_equal(output.earth.RIC, subprocess_output.earth.RIC)
+
+
+def test_in_process_error(tmp_path):
+    infile = _copy_example(tmp_path)
+    with open(str(tmp_path / "earth.in"), "a") as f:
+        f.write("dNotAnOption 1\n")
+
+    # The error is raised with vplanet's message, and we're still alive
+    with pytest.raises(vplanet.VPLANETError, match='Unrecognized option "dNotAnOption"'):
+        vplanet.run(infile, quiet=True, clobber=True, in_process=True)
+
+    shutil.copy(os.path.join(EXAMPLE, "earth.in"), str(tmp_path))
+    output = vplanet.run(infile, quiet=True, clobber=True, units=False, in_process=True)
+    assert len(output.earth.TMan) > 0
+
+
+def test_in_process_error_threads(tmp_path):
+    # An error in a derivative, which the OpenMP threads evaluate when
+    # iNumThreads > 1, is raised without taking the interpreter with it
+    example = os.path.join(os.path.dirname(EXAMPLE), "MagneticBraking")
+    for file in ("vpl.in", "matt.in", "sk.in", "reiners.in"):
+        shutil.copy(os.path.join(example, file), str(tmp_path))
+    infile = str(tmp_path / "vpl.in")
+    with open(infile, "a") as f:
+        f.write("iNumThreads 4\n")
+    with open(str(tmp_path / "reiners.in"), "a") as f:
+        f.write("sWindModel none\n")
+
+    for _ in range(2):
+        with pytest.raises(vplanet.VPLANETError, match="Must set iWindModel"):
+            vplanet.run(infile, quiet=True, clobber=True, in_process=True)
+
+    shutil.copy(os.path.join(example, "reiners.in"), str(tmp_path))
+    output = vplanet.run(infile, quiet=True, clobber=True, units=False, in_process=True)
+    assert len(output.reiners.Time) > 0
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import subprocess
+import sys
+
+import vplanet
+from vplanet.log import get_log
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def _run_example(example, path):
+    for file in os.listdir(os.path.join(TESTS, example)):
+        if file.endswith(".in"):
+            shutil.copy(os.path.join(TESTS, example, file), str(path))
+    vplanet.run(str(path / "vpl.in"), quiet=True, units=False)
+    return str(path)
+
+
+def test_log_without_units(tmp_path):
+    path = _run_example("EarthInterior", tmp_path)
+
+    # Parsing a log without units does not need astropy
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from vplanet.log import get_log; "
+            "log = get_log(path=sys.argv[1], units=False); "
+            "assert isinstance(log.final.earth.TMan, float); "
+            "assert 'astropy' not in sys.modules",
+            path,
+        ],
+        check=True,
+    )
+
+    # Same values as with units
+    log = get_log(path=path, units=False)
+    assert log.final.earth.TMan == get_log(path=path).final.earth.TMan.value
+
+
+def test_log_final_only(tmp_path):
+    path = _run_example("EarthInterior", tmp_path)
+    log = get_log(path=path)
+    final = get_log(path=path, final_only=True)
+
+    # The final conditions are the same, and nothing else is parsed
+    assert final._body_names == log._body_names
+    for body in log.final.members:
+        for param in getattr(log.final, body).members:
+            assert str(getattr(getattr(final.final, body), param)) == str(
+                getattr(getattr(log.final, body), param)
+            )
+    assert final.header.members == []
+    assert final.initial.members == []
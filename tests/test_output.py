@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from vplanet.output import Body, get_columns, get_data, _Params
+import os
+import pickle
+import numpy as np
+
+
+def _get_columns_per_line(lines, ncols):
+    # The original parser: one pass over every line for each column
+    columns = []
+    for j in range(ncols):
+        array = []
+        for line in lines:
+            array.append(float(line.split()[j]))
+        columns.append(np.array(array))
+    return columns
+
+
+def test_get_data(tmp_path):
+
+    # A synthetic output file
+    nrows, ncols = 1000, 10
+    np.random.seed(0)
+    data = np.random.randn(nrows, ncols) * 10.0 ** np.random.randint(-5, 5, ncols)
+    file = str(tmp_path / "data.earth.forward")
+    np.savetxt(file, data, fmt="%.6e")
+    with open(file, "r") as f:
+        old = _get_columns_per_line(f.readlines(), ncols)
+    new = get_data(file)
+
+    # Same values as the original parser, and the columns are zero-copy views
+    assert new.shape == (nrows, ncols)
+    for j in range(ncols):
+        assert np.array_equal(old[j], new[:, j])
+        assert new[:, j].flags["C_CONTIGUOUS"]
+        assert np.shares_memory(new[:, j], new)
+
+
+def test_get_data_empty(tmp_path):
+    file = tmp_path / "empty.earth.forward"
+    file.write_text("")
+    assert get_data(str(file)) is None
+    assert get_data(str(tmp_path / "missing.earth.forward")) is None
+
+
+def test_lazy_columns(tmp_path):
+
+    # A synthetic output file with a dozen columns
+    nrows, ncols = 1000, 12
+    np.random.seed(0)
+    file = str(tmp_path / "lazy.earth.forward")
+    np.savetxt(file, np.random.randn(nrows, ncols), fmt="%.6e")
+    data = get_data(file)
+    outputorder = " ".join("Param{}[m]".format(j) for j in range(ncols))
+
+    # Nothing is read until a column is accessed
+    columns = get_columns(file)
+    params = _Params(outputorder, columns, units=False, body="earth")
+    body = Body()
+    for j, name in enumerate(params.names):
+        body._columns[name] = (params, j)
+    body._params = params
+    assert len(body) == ncols
+    assert body.members == params.names
+    assert columns.data is None and not columns._read
+
+    # Only the columns that are accessed are read, and they are kept
+    assert np.array_equal(body.Param3, data[:, 3])
+    assert body.Param3 is body[3]
+    assert body.Param3.tags["name"] == "Param3"
+    assert list(columns._read) == [3]
+    assert np.array_equal(body.Param7, data[:, 7])
+    assert columns.data is None
+
+    # Once more than a couple of columns are wanted, the whole file is read
+    assert np.array_equal(body.Param0, data[:, 0])
+    assert columns.data is not None
+    assert all(np.array_equal(body[j], data[:, j]) for j in range(ncols))
+
+    # Columns wanted together are read together
+    columns = get_columns(file)
+    params = _Params(outputorder, columns, units=False)
+    assert all(np.array_equal(a, data[:, 4 + k]) for k, a in enumerate(params[4:6]))
+    assert sorted(columns._read) == [4, 5] and columns.data is None
+    params[6:9]
+    assert columns.data is not None
+
+    # A pickled body does not need the file any more
+    body = Body()
+    body._params = params = _Params(outputorder, get_columns(file), units=False)
+    for j, name in enumerate(params.names):
+        body._columns[name] = (params, j)
+    pickled = pickle.dumps(body)
+    os.remove(file)
+    body = pickle.loads(pickled)
+    assert body.members == params.names
+    assert all(np.array_equal(body[j], data[:, j]) for j in range(ncols))
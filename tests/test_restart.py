@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+import numpy as np
+import pytest
+import vplanet
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def _copy_example(example, path, interval):
+    path.mkdir()
+    for file in os.listdir(os.path.join(TESTS, example)):
+        if file.endswith(".in"):
+            shutil.copy(os.path.join(TESTS, example, file), str(path))
+    with open(str(path / "vpl.in"), "a") as f:
+        f.write("\ndCheckpointInterval {}\n".format(interval))
+    return str(path / "vpl.in")
+
+
+@pytest.mark.parametrize(
+    "example,interval,checkpoint,body,param",
+    [
+        # Thermint iterates on the melt from its last values
+        ("EarthInterior", 1.7e9, "earth.checkpoint", "earth", "TMan"),
+        # Eqtide locks the spin and DistOrb keeps the Laplace coefficients
+        ("ApseLock", 40, "ApseLock.checkpoint", "b", "Eccentricity"),
+    ],
+)
+def test_restart(tmp_path, example, interval, checkpoint, body, param):
+    infile = _copy_example(example, tmp_path / "run", interval)
+    full = vplanet.run(infile, quiet=True, clobber=True, units=False)
+
+    # Carry on from the last checkpoint, as if the run had stopped there
+    for in_process in (False, True):
+        output = vplanet.run(
+            infile,
+            quiet=True,
+            units=False,
+            in_process=in_process,
+            restart=checkpoint,
+        )
+        assert np.array_equal(
+            getattr(getattr(output, body), param), getattr(getattr(full, body), param)
+        )
+        assert getattr(getattr(output.log.final, body), param) == getattr(
+            getattr(full.log.final, body), param
+        )
+
+
+def test_restart_truncated(tmp_path):
+    infile = _copy_example("EarthInterior", tmp_path / "run", 1.7e9)
+    vplanet.run(infile, quiet=True, clobber=True)
+    checkpoint = str(tmp_path / "run" / "earth.checkpoint")
+    with open(checkpoint, "rb") as f:
+        data = f.read()
+    with open(checkpoint, "wb") as f:
+        f.write(data[: len(data) // 2])
+
+    with pytest.raises(vplanet.VPLANETError, match="is truncated"):
+        vplanet.run(infile, quiet=True, in_process=True, restart="earth.checkpoint")
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+import re
+import shutil
+
+import numpy as np
+import pytest
+import vplanet
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def _copy_example(example, path):
+    path.mkdir()
+    for file in os.listdir(os.path.join(TESTS, example)):
+        if file.endswith(".in"):
+            shutil.copy(os.path.join(TESTS, example, file), str(path))
+    return str(path / "vpl.in")
+
+
+def test_run_many(tmp_path):
+    # GalaxyEffects draws random numbers, EarthInterior writes many rows
+    examples = ["GalaxyEffects", "EarthInterior"] * 2
+    infiles = [
+        _copy_example(example, tmp_path / "{}{}".format(example, i))
+        for i, example in enumerate(examples)
+    ]
+
+    # Runs in parallel threads give the same answer as runs one at a time
+    outputs = vplanet.run_many(infiles, workers=4, quiet=True, units=False)
+    for example, infile, output in zip(examples, infiles, outputs):
+        serial = vplanet.run(infile, quiet=True, clobber=True, units=False)
+        if example == "GalaxyEffects":
+            assert output.log.final.comp.Eccentricity == pytest.approx(
+                0.7052434592
+            )
+            assert np.array_equal(output.comp.Eccentricity, serial.comp.Eccentricity)
+        else:
+            assert np.array_equal(output.earth.TMan, serial.earth.TMan)
+
+
+def test_run_many_error(tmp_path):
+    infiles = [
+        _copy_example("EarthInterior", tmp_path / "run{}".format(i))
+        for i in range(3)
+    ]
+    with open(os.path.join(os.path.dirname(infiles[1]), "earth.in"), "a") as f:
+        f.write("dNotAnOption 1\n")
+
+    with pytest.raises(vplanet.VPLANETError, match='Unrecognized option "dNotAnOption"'):
+        vplanet.run_many(infiles, workers=3, quiet=True)
+
+    # The old name of the argument still works, with a warning
+    with pytest.warns(DeprecationWarning, match="max_workers"):
+        with pytest.raises(vplanet.VPLANETError):
+            vplanet.run_many(infiles, max_workers=3, quiet=True)
+
+
+def test_run_iter(tmp_path):
+    infiles = [
+        _copy_example("EarthInterior", tmp_path / "run{}".format(i)) for i in range(5)
+    ]
+
+    # One run fails and one never ends
+    with open(os.path.join(os.path.dirname(infiles[1]), "earth.in"), "a") as f:
+        f.write("dNotAnOption 1\n")
+    with open(infiles[2], "r") as f:
+        text = f.read()
+    with open(infiles[2], "w") as f:
+        f.write(re.sub(r"(?m)^dStopTime.*$", "dStopTime 4.5e13", text))
+
+    # The other runs carry on, and give the same answer as runs one at a time
+    results = dict(
+        vplanet.run_iter(
+            infiles, workers=2, chunksize=2, timeout=10, quiet=True, units=False
+        )
+    )
+    assert sorted(results) == sorted(infiles)
+    assert isinstance(results[infiles[1]], vplanet.VPLANETError)
+    assert 'Unrecognized option "dNotAnOption"' in str(results[infiles[1]])
+    assert isinstance(results[infiles[2]], vplanet.VPLANETError)
+    assert "timed out" in str(results[infiles[2]])
+    for infile in infiles[0:1] + infiles[3:]:
+        serial = vplanet.run(infile, quiet=True, clobber=True, units=False)
+        assert np.array_equal(results[infile].earth.TMan, serial.earth.TMan)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import numpy as np
+import pytest
+import vplanet
+from vplanet.store import Store
+from vplanet.sweeps import SweepResult
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def _result(runs, nsteps=50):
+    runs = np.asarray(runs)
+    tcore = 5000.0 + 10.0 * runs
+    series = [np.linspace(0, tcore[j], nsteps) for j in range(len(runs))]
+    series[0] = None
+    return SweepResult(
+        {"earth.dTCore": tcore, "earth.iVerbose": runs % 3},
+        {"earth.RIC": tcore / 5.0},
+        {"earth.TCore": series},
+        {0: "Error running VPLANET."},
+        runs=runs,
+    )
+
+
+def test_store(tmp_path):
+    store = Store(str(tmp_path / "store"), series_length=20)
+    store.append(_result(np.arange(0, 100)))
+    store.append(_result(np.arange(100, 150)))
+
+    # Columns are read back from the files, in the order they were added
+    store = Store(str(tmp_path / "store"))
+    assert len(store) == 150
+    assert store.params == ["earth.dTCore", "earth.iVerbose"]
+    assert store.final == ["earth.RIC"] and store.series == ["earth.TCore"]
+    assert np.array_equal(store["run"], np.arange(150))
+    assert np.array_equal(store["earth.RIC"], (5000.0 + 10.0 * np.arange(150)) / 5)
+    assert list(np.where(~store["ok"])[0]) == [0, 100]
+    assert store["earth.iVerbose"].dtype.kind == "i"
+
+    # Arrays are down-sampled, keeping their end points
+    assert store["earth.TCore"].shape == (150, 20)
+    assert np.all(np.isnan(store["earth.TCore"][0]))
+    assert store["earth.TCore"][1, 0] == 0 and store["earth.TCore"][1, -1] == 5010.0
+
+    # Queries on the swept options
+    rows = store.where({"earth.dTCore": (5100.0, 5200.0)})
+    assert list(store["run"][rows]) == list(range(10, 21))
+    rows = store.where({"earth.dTCore": (None, 5200.0), "earth.iVerbose": 1})
+    assert list(store["run"][rows]) == [1, 4, 7, 10, 13, 16, 19]
+    order, values = store._index("earth.dTCore")
+    assert np.array_equal(values, np.sort(store["earth.dTCore"]))
+    assert np.array_equal(values, store["earth.dTCore"][order])
+
+    # The index is brought up to date when rows are added
+    store.append(_result([150]))
+    assert list(store.where({"earth.dTCore": (6495.0, None)})) == [150]
+    with pytest.raises(ValueError, match="not a swept option"):
+        store.where({"earth.RIC": 1.0})
+    with pytest.raises(ValueError, match="do not match"):
+        store.append(SweepResult({"earth.dTCore": [1.0]}, {}, {}, {}))
+
+
+def test_store_interrupted(tmp_path):
+    store = Store(str(tmp_path / "store"))
+    store.append(_result(np.arange(10)))
+
+    # Rows that were written but not recorded are dropped
+    with open(str(tmp_path / "store" / "earth.RIC.bin"), "ab") as f:
+        f.write(b"\0" * 16)
+    store = Store(str(tmp_path / "store"))
+    assert len(store) == 10
+    store.append(_result(np.arange(10, 20)))
+    assert np.array_equal(store["run"], np.arange(20))
+    assert np.array_equal(store["earth.RIC"], (5000.0 + 10.0 * np.arange(20)) / 5)
+    with open(str(tmp_path / "store" / "meta.json")) as f:
+        assert json.load(f)["nrows"] == 20
+
+
+def test_sweep_store(tmp_path):
+    store = vplanet.sweep(
+        os.path.join(TESTS, "EarthInterior"),
+        {"earth.dTCore": [5500.0, 6000.0, 6500.0]},
+        final=["earth.RIC"],
+        series=["earth.TCore"],
+        workers=2,
+        store=str(tmp_path / "store"),
+    )
+    result = vplanet.sweep(
+        os.path.join(TESTS, "EarthInterior"),
+        {"earth.dTCore": [5500.0, 6000.0, 6500.0]},
+        final=["earth.RIC"],
+        workers=2,
+    )
+    order = np.argsort(store["run"])
+    assert np.array_equal(store["earth.dTCore"][order], result["earth.dTCore"])
+    assert np.array_equal(store["earth.RIC"][order], result["earth.RIC"])
+    assert store["earth.TCore"].shape == (3, 100)
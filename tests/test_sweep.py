@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import vplanet
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_sweep_grid(tmp_path):
+    template = os.path.join(TESTS, "EarthInterior")
+    result = vplanet.sweep(
+        template,
+        {"earth.dTCore": [5500.0, 6500.0], "vpl.dStopTime": [2e9, 4.5e9]},
+        final=["earth.RIC"],
+        series=["earth.TCore"],
+        workers=2,
+    )
+
+    # Every combination, first parameter slowest, and no files were written
+    assert len(result) == 4 and not result.errors
+    assert list(result["earth.dTCore"]) == [5500.0, 5500.0, 6500.0, 6500.0]
+    assert list(result["vpl.dStopTime"]) == [2e9, 4.5e9, 2e9, 4.5e9]
+    assert not any(f.endswith((".log", ".forward")) for f in os.listdir(template))
+
+    # Same answer as a run from files with the same options
+    for file in os.listdir(template):
+        if file.endswith(".in"):
+            shutil.copy(os.path.join(template, file), str(tmp_path))
+    with open(str(tmp_path / "earth.in"), "r") as f:
+        text = re.sub(r"(?m)^dTCore.*$", "dTCore 6500.0", f.read())
+    with open(str(tmp_path / "earth.in"), "w") as f:
+        f.write(text)
+    output = vplanet.run(str(tmp_path / "vpl.in"), quiet=True, units=False)
+    assert result["earth.RIC"][3] == output.log.final.earth.RIC
+    assert np.allclose(result["earth.TCore"][3], output.earth.TCore, rtol=1e-5)
+
+
+@pytest.mark.parametrize("sampler", ["random", "lhs"])
+def test_sweep_samplers(sampler):
+    result = vplanet.sweep(
+        os.path.join(TESTS, "EarthInterior"),
+        {"earth.dTCore": (5500.0, 6500.0), "vpl.dStopTime": (1e9, 2e9)},
+        sampler=sampler,
+        samples=8,
+        seed=42,
+        final=["earth.RIC"],
+        workers=2,
+    )
+    assert len(result) == 8 and np.all(result.ok)
+    assert np.all((result["earth.dTCore"] >= 5500) & (result["earth.dTCore"] <= 6500))
+    if sampler == "lhs":
+        # One run in each eighth of the range
+        strata = np.floor((result["vpl.dStopTime"] - 1e9) / 1e9 * 8)
+        assert sorted(strata) == list(range(8))
+    assert np.all(np.isfinite(result["earth.RIC"]))
+
+
+def test_sweep_errors():
+    result = vplanet.sweep(
+        os.path.join(TESTS, "EarthInterior"),
+        {"earth.dEcc": [0.0, 2.0]},
+        final=["earth.RIC"],
+        workers=2,
+    )
+    assert list(result.ok) == [True, False]
+    assert np.isnan(result["earth.RIC"][1])
+    with pytest.raises(ValueError, match="no body file"):
+        vplanet.sweep(os.path.join(TESTS, "EarthInterior"), {"mars.dTCore": [1.0]})
+
+
+def test_sweep_after_submodule_import():
+    # Importing the module of `sweep` first must not hide the function,
+    # which needs a fresh interpreter in which `vplanet.sweep` is unused
+    code = (
+        "from vplanet.sweeps import SweepResult; import vplanet; "
+        "result = vplanet.sweep({!r}, {{'earth.dTCore': [6000.0]}}, workers=1); "
+        "assert isinstance(result, SweepResult) and len(result) == 1"
+    ).format(os.path.join(TESTS, "EarthInterior"))
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+import numpy as np
+import pytest
+import vplanet
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def _copy_example(example, path):
+    for file in os.listdir(os.path.join(TESTS, example)):
+        if file.endswith(".in"):
+            shutil.copy(os.path.join(TESTS, example, file), str(path))
+    return str(path / "vpl.in")
+
+
+def test_to_memory(tmp_path):
+    infile = _copy_example("EarthInterior", tmp_path)
+    before = sorted(os.listdir(str(tmp_path)))
+    output = vplanet.run(infile, quiet=True, units=False, to_memory=True)
+
+    # No log or output files were written
+    assert sorted(os.listdir(str(tmp_path))) == before
+
+    # Same log and arrays as a run that writes files, to the precision of
+    # the files (six digits after the decimal point)
+    disk = vplanet.run(infile, quiet=True, units=False)
+    assert output.log.final.earth.TMan == disk.log.final.earth.TMan
+    assert [p.tags["name"] for p in output.earth] == [
+        p.tags["name"] for p in disk.earth
+    ]
+    for array, disk_array in zip(output.earth, disk.earth):
+        assert np.allclose(array, disk_array, rtol=1e-5, atol=1e-6)
+
+
+def test_to_memory_grid(tmp_path):
+    infile = _copy_example("IceBelts", tmp_path)
+    output = vplanet.run(infile, quiet=True, units=False, to_memory=True)
+    assert not os.path.exists(str(tmp_path / "icebelt.earth.Climate"))
+
+    disk = vplanet.run(infile, quiet=True, units=False)
+    assert output.log.final.earth.TotIceMass == disk.log.final.earth.TotIceMass
+    assert np.allclose(output.earth.TempLat, disk.earth.TempLat, rtol=1e-5, atol=1e-6)
+    assert np.allclose(output.earth.IceMass, disk.earth.IceMass, rtol=1e-5, atol=1e-6)
+
+
+def test_to_memory_error(tmp_path):
+    infile = _copy_example("EarthInterior", tmp_path)
+    with open(str(tmp_path / "earth.in"), "a") as f:
+        f.write("dNotAnOption 1\n")
+    with pytest.raises(vplanet.VPLANETError, match='Unrecognized option "dNotAnOption"'):
+        vplanet.run(infile, quiet=True, to_memory=True)
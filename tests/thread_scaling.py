@@ -0,0 +1,57 @@
+"""
+Measure how the wall time of the nine-body DistOrb and DistRot integration of
+the solar system (SSDistOrbDistRot) scales with the number of threads that
+evaluate the derivatives, iNumThreads. VPLanet must be built with OpenMP, e.g.
+VPLANET_OPENMP=1 python setup.py develop, or every run uses 1 thread. Run
+from this directory, with the numbers of threads to time as arguments, or none
+for powers of 2 up to the number of cores.
+
+"""
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+import vplanet
+
+SUB = "SSDistOrbDistRot"
+STOPTIME = 1e5
+
+
+def wall_time(threads, path):
+    infile = os.path.join(path, "vpl.in")
+    with open(infile, "r") as f:
+        text = re.sub(r"(?m)^\s*(iNumThreads|dStopTime|dOutputTime).*$", "", f.read())
+    with open(infile, "w") as f:
+        f.write(
+            text
+            + "\niNumThreads %d\ndStopTime %g\ndOutputTime %g\n"
+            % (threads, STOPTIME, STOPTIME)
+        )
+    start = time.perf_counter()
+    vplanet.run(infile, units=False, quiet=True, clobber=True)
+    return time.perf_counter() - start
+
+
+if len(sys.argv) > 1:
+    counts = [int(arg) for arg in sys.argv[1:]]
+else:
+    counts = [2 ** i for i in range(os.cpu_count().bit_length())]
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, SUB)
+    shutil.copytree(
+        SUB,
+        path,
+        ignore=shutil.ignore_patterns(
+            "*.py", "__pycache__", "*.log", "*.forward", "*.backward"
+        ),
+    )
+    print("%8s %10s %8s" % ("Threads", "Time [s]", "Speedup"))
+    serial = None
+    for threads in counts:
+        t = wall_time(threads, path)
+        serial = serial or t
+        print("%8d %10.2f %8.2f" % (threads, t, serial / t))
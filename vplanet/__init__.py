@@ -1,20 +1,83 @@
 # -*- coding: utf-8 -*-
+import importlib
+import importlib.abc
+import importlib.util
+import sys
 
 # Grab version from the C extension
 from .vplanet_core import version
 
 __version__ = version().decode("utf-8")
 
-# Grab the help info
-
-
 # Import the main interface
-from .wrapper import run, help, VPLANETError
+from .wrapper import run, run_many, run_iter, help, VPLANETError
 
 # Import the logger
 from .logger import logger
 
-# Import the rest of the user-facing stuff
-from .log import Log, LogBody, LogStage
-from .output import get_output, Output, Body
-from .quantity import VPLANETQuantity as Quantity
+# The rest of the user-facing stuff needs astropy, which takes longer to
+# import than a short run takes, so it is imported on first use
+_lazy = {
+    "Log": ("log", "Log"),
+    "LogBody": ("log", "LogBody"),
+    "LogStage": ("log", "LogStage"),
+    "get_output": ("output", "get_output"),
+    "Output": ("output", "Output"),
+    "Body": ("output", "Body"),
+    "Quantity": ("quantity", "VPLANETQuantity"),
+    "sweep": ("sweeps", "sweep"),
+    "SweepResult": ("sweeps", "SweepResult"),
+    "Store": ("store", "Store"),
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module, attr = _lazy[name]
+        value = getattr(importlib.import_module("." + module, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy))
+
+
+class _CustomUnitsFinder(importlib.abc.MetaPathFinder):
+    """
+    Register our custom units (``u.TO``, ``u.LSUN``, ...) with astropy as soon
+    as ``astropy.units`` is imported, which is what importing ``vplanet`` used
+    to do, and what scripts rely on. The finder is asked about every import,
+    so it returns at once for every other module, and removes itself the
+    first time it is used.
+
+    """
+
+    # The only module whose import we take part in
+    name = "astropy.units"
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != self.name:
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            exec_module = spec.loader.exec_module
+
+            def exec_and_register(module):
+                exec_module(module)
+                importlib.import_module(".custom_units", __name__)
+
+            spec.loader.exec_module = exec_and_register
+        return spec
+
+
+# Module-level __getattr__ needs Python 3.7
+if sys.version_info < (3, 7):
+    for _name in _lazy:
+        __getattr__(_name)
+elif "astropy.units" in sys.modules:
+    from . import custom_units
+else:
+    sys.meta_path.insert(0, _CustomUnitsFinder())
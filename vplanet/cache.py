@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+from . import vplanet_core as core
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+
+#: The directory in which results are cached. Defaults to the value of the
+#: ``VPLANET_CACHE_DIR`` environment variable, or ``~/.cache/vplanet``.
+CACHE_DIR = os.environ.get(
+    "VPLANET_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "vplanet")
+)
+
+#: The maximum total size of the cache in bytes. When a new result takes the
+#: cache above this size, the least recently used results are evicted.
+CACHE_SIZE = int(os.environ.get("VPLANET_CACHE_SIZE", 1024 ** 3))
+
+# The extension of the cached results
+EXT = ".pkl"
+
+
+def _logical_lines(text):
+    """
+    Split the text of an input file into its options, one per line, with
+    comments, blank lines and extra whitespace removed and ``$`` continuation
+    lines joined.
+
+    """
+    lines = []
+    line = []
+    for raw in text.splitlines():
+        words = raw.split("#", 1)[0].split()
+        if words and words[-1] == "$":
+            line += words[:-1]
+            continue
+        line += words
+        if line:
+            lines.append(" ".join(line))
+        line = []
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+
+def _normalize(text):
+    """
+    The text of an input file in a form that is the same for files that set
+    the same options, whatever their order, spacing or comments.
+
+    """
+    return "\n".join(sorted(_logical_lines(text)))
+
+
+def _body_files(text):
+    """
+    The names of the body files listed in the primary input file.
+
+    """
+    for line in _logical_lines(text):
+        words = line.split()
+        if words[0] == "saBodyFiles":
+            return words[1:]
+    return []
+
+
+@functools.lru_cache()
+def _build_id():
+    """
+    A hash of the C extension, which changes whenever it is rebuilt from
+    different code, even if the version number stays the same.
+
+    """
+    digest = hashlib.sha256()
+    with open(core.__file__, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def cache_key(infile, units=True, to_memory=False, inputs=None):
+    """
+    The key under which the results of a run are cached.
+
+    This is a hash of the normalized text of the primary input file and of
+    every file in its ``saBodyFiles``, together with the version and the
+    build of ``vplanet`` and the arguments that change the parsed output. Other files
+    that a run may read, such as an orbit data file, are not part of the key.
+
+    Args:
+        infile (str): The path to the primary input file.
+        units (bool, optional): Whether the output is unit-ful. Default True.
+        to_memory (bool, optional): Whether the output is kept in memory,
+            which keeps the full precision of the arrays. Default False.
+        inputs (dict, optional): The text of the input files, keyed by file
+            name, for runs that do not read them from disk. Default None.
+
+    Returns:
+        The key, a string of hexadecimal digits.
+
+    """
+    path = os.path.dirname(os.path.abspath(infile))
+
+    def read(file):
+        if inputs is not None and file in inputs:
+            return inputs[file]
+        with open(os.path.join(path, file), "r") as f:
+            return f.read()
+
+    primary = read(os.path.basename(infile))
+    digest = hashlib.sha256()
+    digest.update(core.version())
+    digest.update(_build_id())
+    digest.update(("\0%d\0%d\0" % (bool(units), bool(to_memory))).encode())
+    digest.update(_normalize(primary).encode())
+    for file in _body_files(primary):
+        digest.update(("\0%s\0" % file).encode())
+        digest.update(_normalize(read(file)).encode())
+    return digest.hexdigest()
+
+
+def load(key):
+    """
+    The ``vplanet.Output`` cached under ``key``, or None if there is none.
+
+    """
+    file = os.path.join(CACHE_DIR, key + EXT)
+    try:
+        with open(file, "rb") as f:
+            output = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    # Mark the result as recently used
+    try:
+        os.utime(file)
+    except OSError:
+        pass
+    return output
+
+
+def store(key, output):
+    """
+    Cache ``output`` under ``key``, then evict the least recently used results
+    until the cache fits in :py:data:`CACHE_SIZE`.
+
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Write to a temporary file first, so readers never see a partial result
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, os.path.join(CACHE_DIR, key + EXT))
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+    evict(CACHE_SIZE)
+
+
+def evict(size=0):
+    """
+    Remove the least recently used results until the cache takes up no more
+    than ``size`` bytes. By default, empty the cache.
+
+    """
+    entries = []
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if not name.endswith(EXT):
+            continue
+        try:
+            stat = os.stat(os.path.join(CACHE_DIR, name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+
+    total = sum(entry[1] for entry in entries)
+    for _, nbytes, name in sorted(entries):
+        if total <= size:
+            break
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except OSError:
+            pass
+        total -= nbytes
@@ -1,15 +1,46 @@
 # -*- coding: utf-8 -*-
-from .custom_units import custom_units
 from .logger import logger
-from .quantity import VPLANETQuantity as Quantity
+import functools
 import re
 import os
 from glob import glob
-import astropy.units as u
 import logging
 import numpy as np
 import warnings
 
+# Note that astropy is only imported when units are asked for
+
+
+# Units whose warnings have been reported
+_warned_units = set()
+
+# The patterns that are matched on every line
+_UNIT = re.compile(r"\[(.*?)\]")
+_NAME = re.compile(r"\((.*?)\)")
+_BODY = re.compile(r"BODY:\s(.*?)\s-")
+_SYSNAME = re.compile(r"^System Name:[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+_INT = re.compile(r"[-0-9]+")
+_FLOAT = re.compile(r"[-0-9.+e]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_unit(unit_str):
+    """
+    Parse a unit string, which is slow, so the result is cached: the log
+    repeats the same few units for every body.
+
+    Returns the `astropy.units` unit, whether the string could be parsed
+    at all, and the message of the warning that came up, if any.
+    """
+    import astropy.units as u
+
+    with warnings.catch_warnings(record=True) as w:
+        try:
+            unit = u.Unit(unit_str)
+        except ValueError:
+            return u.Unit(""), False, None
+    return unit, True, str(w[0].message) if len(w) else None
+
 
 def get_param_unit(param, file, line):
     """
@@ -17,37 +48,34 @@ def get_param_unit(param, file, line):
 
     Returns an `astropy.units` unit.
     """
-    groups = re.findall(r"\[(.*?)\]", param)
+    groups = _UNIT.findall(param)
     if len(groups):
         unit_str = groups[-1]
 
-        with warnings.catch_warnings(record=True) as w:
-            unit = u.Unit("")
-            try:
-                unit = u.Unit(unit_str)
-                assert len(w) == 0
-            except ValueError:
-                logger.error(
-                    "Error processing line {} of {}: ".format(line, file)
-                    + "Cannot interpret unit `{}`.".format(unit_str)
-                )
-            except AssertionError:
-                logger.warn(
-                    "Error processing line {} of {}: ".format(line, file)
-                    + str(w[0].message)
-                )
+        unit, valid, warning = _parse_unit(unit_str)
+        if not valid:
+            logger.error(
+                "Error processing line {} of {}: ".format(line, file)
+                + "Cannot interpret unit `{}`.".format(unit_str)
+            )
+        elif warning is not None and unit_str not in _warned_units:
+            # Only the first time, as when the warning came from astropy
+            _warned_units.add(unit_str)
+            logger.warn("Error processing line {} of {}: ".format(line, file) + warning)
 
         return unit
     else:
         # Dimensionless
-        return u.Unit("")
+        return _parse_unit("")[0]
 
 
-def get_param_name(param, file, line):
+@functools.lru_cache(maxsize=None)
+def _get_param_name(param):
     """
-    Grab the parameter name from a line in the log file.
+    The parameter name in the text before the colon on a line of the log.
+    The same text comes up for every body and every run, so the result is
+    cached.
 
-    Returns a string.
     """
     # Replace bad characters
     repl = [("#", "")]
@@ -55,7 +83,7 @@ def get_param_name(param, file, line):
         param = param.replace(a, b)
 
     # Search for a match
-    match = re.search(r"\((.*?)\)", param)
+    match = _NAME.search(param)
     if match:
         param = match.groups()[0]
         # If the param name starts with a number,
@@ -73,6 +101,15 @@ def get_param_name(param, file, line):
         return param
 
 
+def get_param_name(param, file, line):
+    """
+    Grab the parameter name from a line in the log file.
+
+    Returns a string.
+    """
+    return _get_param_name(param)
+
+
 def get_param_value(val, unit, file, line, units=True):
     """
     Grab the parameter value from a line in the log file.
@@ -88,9 +125,7 @@ def get_param_value(val, unit, file, line, units=True):
         return None
 
     # Check if int, float, or bool
-    int_chars = "-0123456789"
-    float_chars = int_chars + ".+e"
-    if all([c in int_chars for c in val]):
+    if _INT.fullmatch(val):
         try:
             val = int(val)
         except ValueError:
@@ -100,12 +135,13 @@ def get_param_value(val, unit, file, line, units=True):
             )
             # Return unprocessed string
             return val
-    elif all([c in float_chars for c in val]):
+    elif _FLOAT.fullmatch(val):
 
         if units:
+            from .quantity import VPLANETQuantity as Quantity
 
             try:
-                val = Quantity(float(val) * unit)
+                val = Quantity(float(val), unit)
             except ValueError:
                 logger.error(
                     "Error processing line {} of {}: ".format(line, file)
@@ -225,16 +261,97 @@ class LogBody(object):
         return [key for key in keys if not key.startswith("_")]
 
 
-def get_log(path=".", sysname=None, ext="log", units=True):
+def _get_params(obj, lines, file, units=True):
     """
+    Set the parameters on the ``(line number, line)`` pairs of ``lines`` as
+    attributes of ``obj``.
 
+    """
+    for i, line in lines:
+        try:
+            name_and_unit, value = line.split(":")
+            unit = get_param_unit(name_and_unit, file, i) if units else None
+            name = _get_param_name(name_and_unit)
+            value = get_param_value(value, unit, file, i, units=units)
+            setattr(obj, name, value)
+        except Exception as e:
+            raise ValueError("Error processing line {} of {}: ".format(i, file) + str(e))
+
+
+def _get_stage(stage, lines, file, units=True, body_names=None):
+    """
+    Add a :py:class:`LogBody` to ``stage`` for the system and for each body
+    in ``lines``, and set their parameters. The names of the bodies are
+    appended to ``body_names``, if given.
+
+    """
+    body = "system"
+    start = 0
+    for k, (i, line) in enumerate(lines + [(None, "BODY:")]):
+        if "BODY:" not in line:
+            continue
+
+        # The parameters of the body so far
+        logbody = LogBody()
+        logbody._name = body
+        setattr(stage, body, logbody)
+        _get_params(logbody, lines[start:k], file, units=units)
+        if i is None:
+            break
+
+        # The next body
+        try:
+            match = _BODY.search(line)
+            body = match.groups()[0]
+        except:
+            raise ValueError(
+                "Error processing line {} of {}: ".format(i, file)
+                + "Cannot understand body name."
+                + line
+            )
+        if body_names is not None:
+            body_names.append(body)
+        start = k + 1
+
+
+def get_log(
+    path=".", sysname=None, ext="log", units=True, text=None, final_only=False
+):
+    """Parse the ``.log`` file of a :py:obj:`vplanet` run.
+
+    Args:
+        path (str, optional): Path to the directory containing the log file.
+            Defaults to the current directory.
+        sysname (str, optional): System name. This is determined automatically,
+            unless there are multiple runs in the same :py:obj:`path`. Defaults
+            to None.
+        ext (str, optional): The extension of the log file. Defaults to ``log``.
+        units (bool, optional): Whether or not the values have astropy units.
+            If False, astropy is not used at all. Default is True.
+        text (str, optional): The text of the log of a run whose output was
+            kept in memory, in which case nothing is read from disk. Defaults
+            to None.
+        final_only (bool, optional): Parse only the final system properties,
+            which is all that is needed to compare the outcomes of many runs.
+            The header and the initial conditions are left empty. Default is
+            False.
+
+    Returns:
+        A :py:class:`Log` instance.
     """
     # Just in case!
     if ext.startswith("."):
         ext = ext[1:]
 
+    # The log of a run whose output was kept in memory
+    if text is not None:
+        if sysname is None:
+            match = _SYSNAME.search(text)
+            sysname = match.groups()[0] if match else ""
+        lf = "%s.%s" % (sysname, ext)
+
     # Look for the log file
-    if sysname is None:
+    elif sysname is None:
         lf = glob(os.path.abspath(os.path.join(path, "*.%s" % (ext))))
         if len(lf) > 1:
             raise Exception(
@@ -263,19 +380,28 @@ def get_log(path=".", sysname=None, ext="log", units=True):
             lf = lf[0]
 
     # Grab the contents
-    with open(lf, "r") as f:
-        lines = f.readlines()
+    if text is None:
+        with open(lf, "r") as f:
+            text = f.read()
 
     # Shorten the file name for logging
     lf = os.path.basename(lf)
 
+    # Skip straight to the final conditions, keeping count of the lines
+    offset = 0
+    if final_only:
+        start = text.find("FINAL SYSTEM PROPERTIES")
+        if start >= 0:
+            start = text.rfind("\n", 0, start) + 1
+            offset = text.count("\n", 0, start)
+            text = text[start:]
+
     # Remove newlines and blank lines
     header = []
     initial = []
     final = []
     stage = 0
-    for i, line in enumerate(lines):
-        line = line.replace("\n", "")
+    for i, line in enumerate(text.splitlines(), offset):
         if "INITIAL SYSTEM PROPERTIES" in line:
             stage = 1
         elif "FINAL SYSTEM PROPERTIES" in line:
@@ -297,77 +423,20 @@ def get_log(path=".", sysname=None, ext="log", units=True):
     log.path = os.path.abspath(path)
 
     # Process the header
-    for i, line in header:
-        try:
-            name_and_unit, value = line.split(":")
-            unit = get_param_unit(name_and_unit, lf, i)
-            name = get_param_name(name_and_unit, lf, i)
-            value = get_param_value(value, unit, lf, i, units=units)
-            setattr(log.header, name, value)
-        except Exception as e:
-            raise ValueError("Error processing line {} of {}: ".format(i, lf) + str(e))
+    if not final_only:
+        _get_params(log.header, header, lf, units=units)
 
     # Process the initial conditions
-    body = "system"
-    logbody = LogBody()
-    logbody._name = body
-    setattr(log.initial, body, logbody)
-    for i, line in initial:
-        if "BODY:" not in line:
-            try:
-                name_and_unit, value = line.split(":")
-                unit = get_param_unit(name_and_unit, lf, i)
-                name = get_param_name(name_and_unit, lf, i)
-                value = get_param_value(value, unit, lf, i, units=units)
-                setattr(getattr(log.initial, body), name, value)
-            except Exception as e:
-                raise ValueError(
-                    "Error processing line {} of {}: ".format(i, lf) + str(e)
-                )
-        else:
-            try:
-                match = re.search(r"BODY:\s(.*?)\s-", line)
-                body = match.groups()[0]
-            except:
-                raise ValueError(
-                    "Error processing line {} of {}: ".format(i, lf)
-                    + "Cannot understand body name."
-                    + line
-                )
-            logbody = LogBody()
-            logbody._name = body
-            setattr(log.initial, body, logbody)
-            log._body_names.append(body)
+    if not final_only:
+        _get_stage(log.initial, initial, lf, units=units, body_names=log._body_names)
 
     # Process the final conditions
-    body = "system"
-    logbody = LogBody()
-    logbody._name = body
-    setattr(log.final, body, logbody)
-    for i, line in final:
-        if "BODY:" not in line:
-            try:
-                name_and_unit, value = line.split(":")
-                unit = get_param_unit(name_and_unit, lf, i)
-                name = get_param_name(name_and_unit, lf, i)
-                value = get_param_value(value, unit, lf, i, units=units)
-                setattr(getattr(log.final, body), name, value)
-            except Exception as e:
-                raise ValueError(
-                    "Error processing line {} of {}: ".format(i, lf) + str(e)
-                )
-        else:
-            try:
-                match = re.search(r"BODY:\s(.*?)\s-", line)
-                body = match.groups()[0]
-            except:
-                raise ValueError(
-                    "Error processing line {} of {}: ".format(i, lf)
-                    + "Cannot understand body name."
-                    + line
-                )
-            logbody = LogBody()
-            logbody._name = body
-            setattr(log.final, body, logbody)
+    _get_stage(
+        log.final,
+        final,
+        lf,
+        units=units,
+        body_names=log._body_names if final_only else None,
+    )
 
     return log
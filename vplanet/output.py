@@ -5,6 +5,7 @@ from .log import get_log
 from .quantity import VPLANETQuantity as Quantity
 from .quantity import NumpyQuantity
 import numpy as np
+import functools
 import re
 import os
 import warnings
@@ -40,13 +41,19 @@ class Body(object):
     """A class containing the parameter arrays of a body in a ``vplanet`` run.
 
     These are populated from either a ``.forward``, a ``.backward``, or a 
-    ``.Climate`` file.
+    ``.Climate`` file. The columns are read when they are first accessed,
+    and kept from then on, so a script that uses only a few of them never
+    reads or converts the rest.
 
     """
 
     def __init__(self):
         self._name = ""
         self._params = []
+        self._gridparams = []
+
+        # The lazy columns, by attribute name
+        self._columns = {}
 
     def __getitem__(self, i):
         return self._params[i]
@@ -57,138 +64,364 @@ class Body(object):
     def __repr__(self):
         return "<vplanet.Body: %s>" % self._name
 
+    def __getattr__(self, name):
+        # Only called when ``name`` is not (yet) an attribute
+        columns = self.__dict__.get("_columns", {})
+        if name not in columns:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(type(self).__name__, name)
+            )
+        params, j = columns[name]
+        array = params[j]
+        setattr(self, name, array)
+        return array
+
+    def __dir__(self):
+        return sorted(set(super(Body, self).__dir__()) | set(self._columns))
+
+    def __getstate__(self):
+        # Pickles (e.g. in the cache) must not depend on the output files
+        for params in (self._params, self._gridparams):
+            params[:]
+        for name in self._columns:
+            getattr(self, name)
+        state = dict(self.__dict__)
+        state["_params"] = list(self._params)
+        state["_gridparams"] = list(self._gridparams)
+        state["_columns"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_columns", {})
+
     @property
     def members(self):
         """A list of all the properties of this object."""
-        keys = list(self.__dict__.keys())
+        keys = [key for key in self.__dict__.keys() if key not in self._columns]
+        keys += list(self._columns)
         return [key for key in keys if not key.startswith("_")]
 
 
+@functools.lru_cache()
+def _param_descriptions():
+    from . import vplanet_core as core
+
+    # The output registry of the C extension, which the help message is made
+    # from, so it always matches the version of ``vplanet`` in use
+    _, outputs = core.registry()
+    description = {}
+    for name, descr, _ in outputs:
+
+        # Remove periods
+        if descr.endswith("."):
+            descr = descr[:-1]
+
+        # Change "Time Rate of Change" to "Rate of Change"
+        if descr.lower().startswith("time rate of change"):
+            descr = descr[5:]
+
+        # Remove "Body's"
+        if descr.lower().startswith("body's"):
+            descr = descr[7:]
+
+        description[name] = descr
+
+    return description
+
+
 def get_param_descriptions():
     """
+    Return a dictionary of the descriptions of the output parameters,
+    keyed by parameter name.
+
+    The table is read from the C extension once per process.
 
     """
+    return dict(_param_descriptions())
 
-    # Get the help message
-    from .wrapper import help
 
-    help_msg = str(help())
+def get_binary_data(file):
+    """Memory-map a binary ``.forward.bin`` or ``.backward.bin`` file.
 
-    # Get only the output params
-    stroutput = help_msg.split("These options follow the argument saOutputOrder.")[1]
-    stroutput = [x for x in stroutput.split("\n") if len(x)]
-    description = {}
-    for out in stroutput:
-        if out.startswith("[-]"):
-            try:
-                n, d, _ = re.search(r"\[-\](.*) -- (.*). \[(.*)\]", out).groups()
-            except AttributeError:
-                raise ValueError(
-                    "Error parsing the following line in the log file: {}".format(out)
-                )
-            description.update({n: d})
+    These files are written by ``vplanet`` when ``sOutputFormat`` is
+    ``binary``. They start with an ASCII header terminated by an
+    ``End Header`` line, followed by rows of raw doubles. The data are not
+    read until they are accessed.
+
+    Args:
+        file (str): Path to the output file.
+
+    Returns:
+        A 2-D read-only ``numpy.memmap`` of shape ``(rows, columns)``, or
+        ``None`` if the file contains no rows.
+    """
+    header = {}
+    with open(file, "rb") as f:
+        for line in f:
+            line = line.decode("utf-8").strip()
+            if line.startswith("End Header"):
+                break
+            if ":" in line:
+                key, value = line.split(":", 1)
+                header[key.strip()] = value.strip()
         else:
-            try:
-                n, d = re.search("(.*) -- (.*).", out).groups()
-            except AttributeError:
-                raise ValueError(
-                    "Error parsing the following line in the log file: {}".format(out)
-                )
-            description.update({n: d})
+            raise ValueError("Invalid binary output file: {}.".format(file))
+        offset = f.tell()
 
-    # Format the entries a bit
-    for key, value in description.items():
+    ncols = int(header["Columns"])
+    stride = int(header["Row Stride"])
+    dtype = np.dtype("<f8" if header["Byte Order"] == "little" else ">f8")
+    if stride != ncols * dtype.itemsize:
+        raise ValueError("Unexpected row stride in {}.".format(file))
+    nrows = (os.path.getsize(file) - offset) // stride
+    if nrows == 0:
+        return None
+    return np.memmap(file, dtype=dtype, mode="r", offset=offset, shape=(nrows, ncols))
 
-        # Remove periods
-        if value.endswith("."):
-            description[key] = value[:-1]
 
-        # Change "Time Rate of Change" to "Rate of Change"
-        if value.lower().startswith("time rate of change"):
-            description[key] = value[5:]
+def get_data(file):
+    """Read a ``.forward``, ``.backward`` or ``.Climate`` file into memory.
 
-        # Remove "Body's"
-        if value.lower().startswith("body's"):
-            description[key] = value[7:]
+    The file is parsed in a single pass into a 2-D ``float64`` array with one
+    column per output parameter. The array is stored in column-major order so
+    that each column is a contiguous, zero-copy view. Binary output files
+    (see :py:func:`get_binary_data`) are memory-mapped instead.
 
-    return description
+    Args:
+        file (str): Path to the output file.
 
+    Returns:
+        A 2-D ``numpy`` array of shape ``(rows, columns)``, or ``None`` if the
+        file does not exist or is empty.
+    """
+    if not os.path.isfile(file) or os.path.getsize(file) == 0:
+        return None
+    if file.endswith(".bin"):
+        return get_binary_data(file)
+    with warnings.catch_warnings():
+        # Files that contain only whitespace are treated as empty
+        warnings.simplefilter("ignore", UserWarning)
+        data = np.loadtxt(file, dtype=np.float64, ndmin=2)
+    if data.size == 0:
+        return None
+    return np.asfortranarray(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_unit(unit_str):
+    """
+    Return the ``astropy`` unit for a unit string in an output file header.
+
+    Parsing a unit is slow compared to everything else we do with a column,
+    and the same few units appear in every run, so the result is cached. As
+    a consequence, a unit that cannot be parsed is reported only once.
 
-def get_params(outputorder, file, units=True, body=None):
     """
+    with warnings.catch_warnings(record=True) as w:
+        try:
+            unit = u.Unit(unit_str)
+            assert len(w) == 0
+        except ValueError as e:
+            logger.error("Error processing unit {}: ".format(unit_str) + (str(e)))
+            unit = u.Unit("")
+        except AssertionError:
+            logger.warn(
+                "Error processing unit {}: ".format(unit_str) + str(w[0].message)
+            )
+            unit = u.Unit("")
+    return unit
+
 
+class _Columns(object):
     """
-    # Get parameter descriptions from the vplanet help
-    description = get_param_descriptions()
-
-    # Get params and units
-    params_and_units = re.findall(r"(.*?)\[(.*?)\]", outputorder)
-
-    # Populate the params
-    params = []
-    for j, param in enumerate(params_and_units):
-
-        # Grab the array in the fwfile/bwfile
-        array = []
-        for line in file:
-            array.append(float(line.split()[j]))
-
-        # Get the name and units
-        name = param[0].replace(" ", "")
-        unit_str = param[1].replace(" ", "")
-
-        # If the param name starts with a number,
-        # add an underscore so we can make it a
-        # valid class property name
-        if any(name.startswith(str(n)) for n in range(10)):
-            name = "_" + name
-
-        # Process the unit
-        if units:
-            with warnings.catch_warnings(record=True) as w:
-                try:
-                    unit = u.Unit(unit_str)
-                    assert len(w) == 0
-                except ValueError as e:
-                    logger.error(
-                        "Error processing unit {}: ".format(unit_str) + (str(e))
-                    )
-                    unit = u.Unit("")
-                except AssertionError:
-                    logger.warn(
-                        "Error processing unit {}: ".format(unit_str)
-                        + str(w[0].message)
-                    )
-                    unit = u.Unit("")
+    The columns of an output file, read as they are needed.
 
-            # Make it into an astropy quantity with units
-            array = Quantity(np.array(array), unit=unit)
-            physical_type = unit.physical_type
+    Columns of binary files and of arrays already in memory are views, and
+    cost nothing until they are used. Text files are read only for the
+    columns asked for, until more than a couple of them have been: every
+    pass of ``np.loadtxt`` tokenizes every line, whichever columns it keeps,
+    so a single column costs nearly as much as the whole file.
 
-        else:
+    """
 
-            # Keep it as a numpy array with tags. We'll
-            # still keep track of the unit, but it's only
-            # a passive tag!
-            array = NumpyQuantity(np.array(array))
-            array.unit = unit_str
-            physical_type = None
-
-        # Tag it for plotting
-        array.tags = dict(
-            name=name,
-            description=description.get(name, name),
-            body=body,
-            physical_type=physical_type,
-        )
+    # The number of columns read on their own before the whole file is read
+    _MAXREAD = 2
+
+    def __init__(self, file=None, data=None, ncols=0):
+        self.file = file
+        self.data = data
+        self.ncols = ncols
+        self._read = {}
+
+    def __getitem__(self, j):
+        self.read([j])
+        if self.data is not None:
+            return self.data[:, j]
+        return self._read[j]
+
+    def read(self, js):
+        """Read the columns ``js`` that are not in memory yet, in one pass."""
+        if self.data is not None:
+            return
+        js = sorted(set(js) - set(self._read))
+        if not js:
+            return
+        if len(self._read) + len(js) > self._MAXREAD:
+            data = get_data(self.file)
+            self.data = np.empty((0, self.ncols)) if data is None else data
+            self._read = {}
+            return
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            data = np.loadtxt(self.file, dtype=np.float64, usecols=js, ndmin=2)
+        data = np.asfortranarray(data.reshape(-1, len(js)))
+        for k, j in enumerate(js):
+            self._read[j] = data[:, k]
+
+
+def get_columns(file):
+    """Open a ``.forward``, ``.backward`` or ``.Climate`` file without reading it.
+
+    Args:
+        file (str): Path to the output file.
+
+    Returns:
+        An object whose item ``j`` is column ``j`` of the file, read on
+        first access, or ``None`` if the file does not exist or is empty.
+    """
+    if not os.path.isfile(file) or os.path.getsize(file) == 0:
+        return None
+    if file.endswith(".bin"):
+        data = get_binary_data(file)
+        return None if data is None else _Columns(data=data)
+    with open(file) as f:
+        ncols = len(f.readline().split())
+    return _Columns(file=file, ncols=ncols)
+
+
+def _get_param(array, name, unit_str, units=True, body=None):
+    """
+    Wrap a column in a quantity tagged with its name, unit and description.
+
+    """
+    # Process the unit
+    if units:
+        unit = _parse_unit(unit_str)
+
+        # Make it into an astropy quantity with units
+        array = Quantity(array, unit=unit, copy=False)
+        physical_type = unit.physical_type
+
+    else:
+
+        # Keep it as a numpy array with tags. We'll
+        # still keep track of the unit, but it's only
+        # a passive tag!
+        array = NumpyQuantity(array)
+        array.unit = unit_str
+        physical_type = None
+
+    # Tag it for plotting
+    array.tags = dict(
+        name=name,
+        description=_param_descriptions().get(name, name),
+        body=body,
+        physical_type=physical_type,
+    )
+
+    return array
+
+
+class _Params(object):
+    """
+    The parameter arrays of an output file, in the order of its columns.
+
+    The names and units come from the output order in the log, so the
+    length and the names are known without touching the data. Each array
+    is read and wrapped on first access, then kept.
+
+    """
+
+    def __init__(self, outputorder, columns, units=True, body=None):
+        self.columns = columns
+        self.units = units
+        self.body = body
+        self.names = []
+        self.units_str = []
+
+        # Get params and units
+        for name, unit_str in re.findall(r"(.*?)\[(.*?)\]", outputorder):
+            name = name.replace(" ", "")
+
+            # If the param name starts with a number,
+            # add an underscore so we can make it a
+            # valid class property name
+            if any(name.startswith(str(n)) for n in range(10)):
+                name = "_" + name
 
-        # Add to the list
-        params.append(array)
+            self.names.append(name)
+            self.units_str.append(unit_str.replace(" ", ""))
+        self._arrays = [None] * len(self.names)
 
-    return params
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            js = range(*j.indices(len(self)))
+            self.columns.read([k for k in js if self._arrays[k] is None])
+            return [self[k] for k in js]
+        if j < 0:
+            j += len(self)
+        if not 0 <= j < len(self):
+            raise IndexError("parameter index out of range")
+        if self._arrays[j] is None:
+            self._arrays[j] = _get_param(
+                self.columns[j],
+                self.names[j],
+                self.units_str[j],
+                units=self.units,
+                body=self.body,
+            )
+        return self._arrays[j]
+
+    def __iter__(self):
+        for j in range(len(self)):
+            yield self[j]
+
+
+def get_params(outputorder, data, units=True, body=None):
+    """
+    Return the parameter arrays of an output file, given its output order
+    from the log and its data as a 2-D array with one column per parameter.
 
+    """
+    return list(_Params(outputorder, _Columns(data=data), units=units, body=body))
+
+
+def _output_file(log, file):
+    """
+    The name of the text or binary output file ``file`` of the run of
+    ``log``, or an empty string if there is none. An earlier run in the
+    other format may have left its file behind, so the format is taken from
+    the log; logs that do not give it prefer the text file.
 
-def get_arrays(log, units=True):
+    """
+    fmt = getattr(log.header, "OutputFormat", None)
+    if fmt == "Binary":
+        names = [file + ".bin"]
+    elif fmt == "Text":
+        names = [file]
+    else:
+        names = [file, file + ".bin"]
+    for name in names:
+        if os.path.exists(os.path.join(log.path, name)):
+            return name
+    return ""
+
+
+def get_arrays(log, units=True, arrays=None):
     """
 
     """
@@ -211,33 +444,48 @@ def get_arrays(log, units=True):
         # Grab the input file name
         body.infile = getattr(log.header, "BodyFile%d" % (i + 1))
 
+        # Output kept in memory: one (output, climate grid) pair per body
+        if arrays is not None:
+            fwdata, climdata = [
+                None if array is None else np.asarray(array) for array in arrays[i]
+            ]
+            body.fwfile = body.bwfile = body.climfile = ""
+            outputorder = getattr(log.initial, body._name).OutputOrder
+            if fwdata is not None:
+                body._params = _Params(
+                    outputorder, _Columns(data=fwdata), units=units, body=body._name
+                )
+            if climdata is not None:
+                gridorder = getattr(log.initial, body._name).GridOutputOrder
+                body._gridparams = _Params(
+                    gridorder, _Columns(data=climdata), units=units, body=body._name
+                )
+            output.bodies.append(body)
+            continue
+
         # Grab the output file names
-        body.fwfile = "%s.%s.forward" % (output.sysname, body._name)
-        if not os.path.exists(os.path.join(output.path, body.fwfile)):
-            body.fwfile = ""
-        body.bwfile = "%s.%s.backward" % (output.sysname, body._name)
-        if not os.path.exists(os.path.join(output.path, body.bwfile)):
-            body.bwfile = ""
+        body.fwfile = _output_file(
+            log, "%s.%s.forward" % (output.sysname, body._name)
+        )
+        body.bwfile = _output_file(
+            log, "%s.%s.backward" % (output.sysname, body._name)
+        )
         body.climfile = "%s.%s.Climate" % (output.sysname, body._name)
         if not os.path.exists(os.path.join(output.path, body.climfile)):
             body.climfile = ""
 
-        # Grab the forward arrays. Note that they may not exist for this body
-        try:
-            with open(os.path.join(output.path, body.fwfile), "r") as f:
-                fwfile = f.readlines()
-        except IOError:
-            fwfile = [""]
+        # Open the forward arrays. Note that they may not exist for this body
+        fwdata = None
+        if body.fwfile != "":
+            fwdata = get_columns(os.path.join(output.path, body.fwfile))
 
-        # Grab the backward arrays. Note that they may not exist for this body
-        try:
-            with open(os.path.join(output.path, body.bwfile), "r") as f:
-                bwfile = f.readlines()
-        except IOError:
-            bwfile = [""]
+        # Open the backward arrays. Note that they may not exist for this body
+        bwdata = None
+        if body.bwfile != "":
+            bwdata = get_columns(os.path.join(output.path, body.bwfile))
 
         # TODO: Add support for *both* fwfile and bwfile at the same time?
-        if fwfile != [""] and bwfile != [""]:
+        if fwdata is not None and bwdata is not None:
             logger.error(
                 "Both a fwfile and a bwfile were detected. "
                 + "Currently, vplanet can only handle one at a time. "
@@ -246,33 +494,31 @@ def get_arrays(log, units=True):
 
         # Now grab the output order and the params
         outputorder = getattr(log.initial, body._name).OutputOrder
-        if fwfile != [""]:
-            body._params = get_params(outputorder, fwfile, units=units, body=body._name)
-        elif bwfile != [""]:
-            body._params = get_params(outputorder, bwfile, units=units, body=body._name)
+        if fwdata is not None:
+            body._params = _Params(outputorder, fwdata, units=units, body=body._name)
+        elif bwdata is not None:
+            body._params = _Params(outputorder, bwdata, units=units, body=body._name)
 
         # Climate file
         if body.climfile != "":
-            # Grab the climate arrays...
+            # Open the climate arrays...
             try:
-                with open(os.path.join(output.path, body.climfile), "r") as f:
-                    climfile = f.readlines()
+                climdata = get_columns(os.path.join(output.path, body.climfile))
             except IOError:
                 raise Exception("Unable to open %s." % body.climfile)
 
-            # ... and the grid order
+            # ... and grab the grid order
             try:
                 gridorder = getattr(log.initial, body._name).GridOutputOrder
-                body._gridparams = get_params(
-                    gridorder, climfile, units=units, body=body._name
-                )
+                if climdata is not None:
+                    body._gridparams = _Params(
+                        gridorder, climdata, units=units, body=body._name
+                    )
             except:
                 logger.error(
                     "Unable to obtain grid output parameters from %s." % body.climfile
                 )
                 body._gridparams = []
-        else:
-            body._gridparams = []
 
         # Add the body
         output.bodies.append(body)
@@ -280,7 +526,7 @@ def get_arrays(log, units=True):
     return output
 
 
-def get_output(path=".", sysname=None, units=True):
+def get_output(path=".", sysname=None, units=True, memory=None):
     """Parse all of the output from a :py:obj:`vplanet` run.
     
     Args:
@@ -291,35 +537,39 @@ def get_output(path=".", sysname=None, units=True):
             the :py:obj:`vplanet` run. Defaults to the current directory.
         units (bool, optional): Whether or not the quantities returned by this 
             method have astropy units. Default is True.
+        memory (tuple, optional): The ``(log, arrays)`` of a run whose output
+            was kept in memory (see ``to_memory`` in :py:func:`vplanet.run`).
+            If given, nothing is read from disk. Defaults to None.
     
     Returns:
         A :py:class:`Output` instance containing all the information from the
         ``.log``, ``.forward``, and ``.backward`` output files.
     """
     # Get the log file and the arrays
-    log = get_log(sysname=sysname, path=path, units=units)
-    output = get_arrays(log, units=units)
+    if memory is not None:
+        text, arrays = memory
+        log = get_log(sysname=sysname, path=path, units=units, text=text)
+        output = get_arrays(log, units=units, arrays=arrays)
+    else:
+        log = get_log(sysname=sysname, path=path, units=units)
+        output = get_arrays(log, units=units)
 
     for body in output.bodies:
 
         # Make the body accessible as an attribute
         setattr(output, body._name, body)
 
-        # Make all the arrays accessible as attributes
-        for array in getattr(output, body._name)._params:
-            setattr(getattr(output, body._name), array.tags["name"], array)
+        # Make all the arrays accessible as attributes. They are read on
+        # first access
+        for j, name in enumerate(getattr(body._params, "names", [])):
+            body._columns[name] = (body._params, j)
 
         # Grid params
-        if len(getattr(output, body._name)._gridparams):
+        if len(body._gridparams):
 
             # Get the time array
-            iTime = np.argmax(
-                [
-                    array.tags["name"] == "Time"
-                    for array in getattr(output, body._name)._gridparams
-                ]
-            )
-            Time = getattr(output, body._name)._gridparams[iTime]
+            iTime = np.argmax([name == "Time" for name in body._gridparams.names])
+            Time = body._gridparams[iTime]
 
             # Get 2d array dimensions
             J = np.where(Time[1:] > Time[:-1])[0][0] + 1
@@ -331,9 +581,9 @@ def get_output(path=".", sysname=None, units=True):
                     )
                 )
 
-            for array in getattr(output, body._name)._gridparams:
-                if array.tags["name"] != "Time":
+            for j, name in enumerate(body._gridparams.names):
+                if name != "Time":
                     # We don't want to overwrite the time array!
-                    setattr(getattr(output, body._name), array.tags["name"], array)
+                    body._columns[name] = (body._gridparams, j)
 
     return output
@@ -264,9 +264,18 @@ class NumpyQuantity(np.ndarray):
         # see InfoArray.__array_finalize__ for comments
         if obj is None:
             return
-        self.tag = getattr(obj, "tags", {})
+        self.tags = getattr(obj, "tags", {})
         self.unit = getattr(obj, "unit", None)
 
     def __array_wrap__(self, out_arr, context=None):
         # Call the parent
         return np.ndarray.__array_wrap__(self, out_arr, context)
+
+    def __reduce__(self):
+        # Pickle the tags and the unit along with the array data
+        reconstruct, args, state = super().__reduce__()
+        return reconstruct, args, (state, self.tags, self.unit)
+
+    def __setstate__(self, state):
+        state, self.tags, self.unit = state
+        super().__setstate__(state)
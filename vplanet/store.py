@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import numpy as np
+
+# The version of the layout of a store on disk
+VERSION = 1
+
+# The file that describes a store
+META = "meta.json"
+
+
+class Store(object):
+    """A columnar store of the results of parameter sweeps.
+
+    A store is a directory with one binary file per column, holding one row
+    per run, and a ``meta.json`` file that describes them. The columns are
+    the sample index of each run (``run``), whether it succeeded (``ok``),
+    the swept options, the final log values and the arrays of the runs,
+    named as in :py:func:`vplanet.sweep`. Arrays are down-sampled to
+    ``series_length`` points when they are stored, and padded with ``nan``.
+
+    Results are added in bulk with :py:meth:`append`, for instance by
+    :py:func:`vplanet.sweep` as the runs finish. Reading a column maps its
+    file into memory, whatever the number of runs, and :py:meth:`where`
+    finds the runs in a range of the swept options with a sorted index, and
+    a sorted copy of the option, that are kept next to their columns.
+
+    Args:
+        path (str): The directory of the store. It is created on the first
+            :py:meth:`append` if it does not exist.
+        series_length (int, optional): The number of points to which arrays
+            are down-sampled. Only used when the store is created. Default
+            100.
+
+    """
+
+    def __init__(self, path, series_length=100):
+        self.path = os.path.abspath(path)
+        if os.path.exists(os.path.join(self.path, META)):
+            with open(os.path.join(self.path, META), "r") as f:
+                self._meta = json.load(f)
+            if self._meta["version"] != VERSION:
+                raise ValueError(
+                    "Unsupported version {} of the store in {}.".format(
+                        self._meta["version"], self.path
+                    )
+                )
+        else:
+            self._meta = dict(
+                version=VERSION,
+                nrows=0,
+                series_length=int(series_length),
+                columns={},
+                index={},
+            )
+
+    def __len__(self):
+        return self._meta["nrows"]
+
+    def __repr__(self):
+        return "<vplanet.Store: %s (%d runs)>" % (self.path, len(self))
+
+    def __contains__(self, name):
+        return name in self._meta["columns"]
+
+    def __getitem__(self, name):
+        if name not in self._meta["columns"]:
+            raise KeyError(name)
+        column = self._meta["columns"][name]
+        shape = (len(self),) + tuple(column["shape"])
+        if len(self) == 0:
+            return np.empty(shape, dtype=column["dtype"])
+        return np.memmap(
+            self._file(name), dtype=column["dtype"], mode="r", shape=shape
+        )
+
+    def _file(self, name, ext=".bin"):
+        return os.path.join(self.path, name + ext)
+
+    def _names(self, kind):
+        return [
+            name
+            for name, column in self._meta["columns"].items()
+            if column["kind"] == kind
+        ]
+
+    @property
+    def params(self):
+        """The names of the swept options."""
+        return self._names("param")
+
+    @property
+    def final(self):
+        """The names of the final log values."""
+        return self._names("final")
+
+    @property
+    def series(self):
+        """The names of the arrays."""
+        return self._names("series")
+
+    @property
+    def members(self):
+        """A list of all the columns of this store."""
+        return list(self._meta["columns"])
+
+    def _write_meta(self):
+        file = os.path.join(self.path, META)
+        with open(file + ".tmp", "w") as f:
+            json.dump(self._meta, f, indent=1)
+        os.replace(file + ".tmp", file)
+
+    def _downsample(self, array):
+        """
+        ``series_length`` evenly spaced points of ``array``, padded with
+        ``nan`` if it is shorter.
+
+        """
+        length = self._meta["series_length"]
+        row = np.full(length, np.nan)
+        if array is None:
+            return row
+        array = np.asarray(array, dtype=np.float64)
+        if len(array) > length:
+            array = array[np.linspace(0, len(array) - 1, length).round().astype(int)]
+        row[: len(array)] = array
+        return row
+
+    def append(self, result):
+        """Add the runs of a sweep to the store.
+
+        Args:
+            result (SweepResult): The results to add, e.g. the return value
+                of :py:func:`vplanet.sweep`. The first results added fix the
+                columns of the store, and later results must have the same.
+
+        """
+        nrows = len(result)
+        columns = {
+            "run": ("run", np.asarray(result.runs, dtype=np.int64)),
+            "ok": ("ok", result.ok),
+        }
+        for name, values in result.params.items():
+            values = np.asarray(values)
+            if values.dtype.kind not in "biuf":
+                raise TypeError(
+                    "Only numeric options can be stored, not {}.".format(name)
+                )
+            columns[name] = ("param", values)
+        for name, values in result.final.items():
+            columns[name] = ("final", np.asarray(values, dtype=np.float64))
+        for name, arrays in result.series.items():
+            columns[name] = (
+                "series",
+                np.array([self._downsample(array) for array in arrays]).reshape(
+                    nrows, self._meta["series_length"]
+                ),
+            )
+
+        # The first results fix the columns
+        if not self._meta["columns"]:
+            os.makedirs(self.path, exist_ok=True)
+            for name, (kind, values) in columns.items():
+                if os.sep in name or name.startswith("."):
+                    raise ValueError("Invalid column name {}.".format(name))
+                self._meta["columns"][name] = dict(
+                    kind=kind,
+                    dtype=values.dtype.newbyteorder("<").str,
+                    shape=list(values.shape[1:]),
+                )
+        elif set(columns) != set(self._meta["columns"]):
+            raise ValueError(
+                "The columns of the results do not match those of {}.".format(
+                    self.path
+                )
+            )
+
+        for name, (_, values) in columns.items():
+            column = self._meta["columns"][name]
+            values = np.ascontiguousarray(values, dtype=column["dtype"])
+
+            # Drop whatever an append that was interrupted left behind
+            size = len(self) * values.itemsize * int(np.prod(column["shape"]))
+            with open(self._file(name), "ab") as f:
+                f.truncate(size)
+                f.write(values.tobytes())
+
+        # The rows are only there once the description says so
+        self._meta["nrows"] += nrows
+        self._write_meta()
+
+    def _index(self, name):
+        """
+        The rows of the store in order of increasing ``name``, and the values
+        of ``name`` in that order, which are sorted again only if rows were
+        added since they last were. Both are mapped from files, so a search
+        reads contiguous values instead of gathering them from the column.
+
+        """
+        column = self._meta["columns"][name]
+        if column["kind"] != "param":
+            raise ValueError("{} is not a swept option.".format(name))
+        if self._meta["index"].get(name) != len(self) or not os.path.exists(
+            self._file(name, ".sorted")
+        ):
+            values = self[name]
+            order = np.argsort(values, kind="stable").astype(np.int64)
+            order.tofile(self._file(name, ".idx"))
+            np.asarray(values[order]).tofile(self._file(name, ".sorted"))
+            self._meta["index"][name] = len(self)
+            self._write_meta()
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=column["dtype"])
+        order = np.memmap(
+            self._file(name, ".idx"), dtype=np.int64, mode="r", shape=(len(self),)
+        )
+        values = np.memmap(
+            self._file(name, ".sorted"),
+            dtype=column["dtype"],
+            mode="r",
+            shape=(len(self),),
+        )
+        return order, values
+
+    def where(self, conditions):
+        """Find the runs with swept options in given ranges.
+
+        Args:
+            conditions (dict): The value of each option to match, or a
+                ``(low, high)`` pair of bounds that match inclusively, where
+                either bound may be None, keyed by the name of the option.
+
+        Returns:
+            The rows of the store that match all of the conditions, in
+            increasing order, as an array that can index any column.
+        """
+        rows = None
+        for name, value in conditions.items():
+            if isinstance(value, (tuple, list)):
+                low, high = value
+            else:
+                low = high = value
+            order, values = self._index(name)
+            start = 0 if low is None else np.searchsorted(values, low, "left")
+            stop = len(values) if high is None else np.searchsorted(values, high, "right")
+            match = np.sort(order[start:stop])
+            rows = match if rows is None else np.intersect1d(rows, match)
+        if rows is None:
+            return np.arange(len(self))
+        return rows
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+from .cache import _logical_lines
+from .store import Store
+from .wrapper import run, _run_pool
+import itertools
+import os
+import numpy as np
+
+# The number of runs of a sweep that are added to a store at a time
+STORE_BATCH = 1024
+
+
+class SweepResult(object):
+    """The results of a :py:func:`sweep`, with one row per run.
+
+    Each quantity is a column, which is indexed by its name as given to
+    :py:func:`sweep`, e.g. ``result["earth.dTCore"]`` or
+    ``result["earth.RIC"]``.
+
+    """
+
+    def __init__(self, params, final, series, errors, runs=None):
+        #: The value of each swept option in each run, by ``body.option``
+        self.params = params
+        #: The final value of each requested log entry, ``nan`` if the run failed
+        self.final = final
+        #: The requested arrays of each run, ``None`` if the run failed
+        self.series = series
+        #: The error message of each run that failed, by row
+        self.errors = errors
+        #: The index of each run in the order in which the runs were sampled
+        self.runs = np.arange(len(self)) if runs is None else runs
+
+    def __getitem__(self, name):
+        for columns in (self.params, self.final, self.series):
+            if name in columns:
+                return columns[name]
+        raise KeyError(name)
+
+    def __len__(self):
+        return len(next(iter(self.params.values()), []))
+
+    def __repr__(self):
+        return "<vplanet.SweepResult: %d runs, %d failed>" % (
+            len(self),
+            len(self.errors),
+        )
+
+    @property
+    def ok(self):
+        """A boolean mask of the runs that succeeded."""
+        mask = np.ones(len(self), dtype=bool)
+        mask[list(self.errors)] = False
+        return mask
+
+    @property
+    def members(self):
+        """A list of all the columns of this object."""
+        return list(self.params) + list(self.final) + list(self.series)
+
+
+def _read_options(file):
+    """
+    The options of an input file, as a dict of the text of their values.
+    Options with more than one value map to a list.
+
+    """
+    with open(file, "r") as f:
+        lines = _logical_lines(f.read())
+    options = {}
+    for line in lines:
+        words = line.split()
+        options[words[0]] = words[1] if len(words) == 2 else words[1:]
+    return options
+
+
+def _read_template(template_dir, infile):
+    """
+    The options of the primary input file and of each body file, keyed by
+    the name of the body file without its extension.
+
+    """
+    system = _read_options(os.path.join(template_dir, infile))
+    files = system.pop("saBodyFiles", [])
+    if isinstance(files, str):
+        files = [files]
+    bodies = {}
+    for file in files:
+        bodies[os.path.splitext(file)[0]] = _read_options(
+            os.path.join(template_dir, file)
+        )
+    return system, bodies
+
+
+def _sample(params, sampler, samples, seed):
+    """
+    The value of each parameter in each run, as a dict of arrays.
+
+    """
+    names = list(params)
+    if sampler == "grid":
+        grids = [np.atleast_1d(params[name]) for name in names]
+        index = np.array(list(itertools.product(*[range(len(g)) for g in grids])))
+        return {
+            name: grid[index[:, j]] for j, (name, grid) in enumerate(zip(names, grids))
+        }
+    elif sampler in ("random", "lhs"):
+        if samples is None:
+            raise ValueError("`samples` must be given for the %s sampler." % sampler)
+        bounds = np.array([params[name] for name in names], dtype=float)
+        if bounds.shape != (len(names), 2):
+            raise ValueError(
+                "Each parameter must be a (low, high) pair for the %s sampler."
+                % sampler
+            )
+        rng = np.random.default_rng(seed)
+        if sampler == "random":
+            x = rng.random((samples, len(names)))
+        else:
+            # One sample in each of ``samples`` strata of every parameter
+            strata = np.argsort(rng.random((samples, len(names))), axis=0)
+            x = (strata + rng.random((samples, len(names)))) / samples
+        values = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * x
+        return {name: values[:, j] for j, name in enumerate(names)}
+    else:
+        raise ValueError('`sampler` must be "grid", "lhs" or "random".')
+
+
+def _option_value(option, value):
+    """
+    A value of a swept option in the type that ``vplanet`` expects.
+
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if option.startswith(("i", "b")) and isinstance(value, float):
+        return int(round(value))
+    return value
+
+
+def _collect(output, final, series):
+    """
+    The requested final log entries and arrays of a run.
+
+    """
+    values = []
+    for name in final:
+        body, param = name.split(".", 1)
+        value = getattr(getattr(output.log.final, body), param)
+        try:
+            values.append(float(value))
+        except (TypeError, ValueError):
+            values.append(np.nan)
+    arrays = []
+    for name in series:
+        body, param = name.split(".", 1)
+        arrays.append(np.array(getattr(getattr(output, body), param)))
+    return values, arrays
+
+
+def _run_point(
+    infile, template=None, overrides=None, final=(), series=(), **kwargs
+):
+    """
+    Run one point of a sweep in memory, and return what :py:func:`_collect`
+    does. This runs in the worker processes of :py:func:`sweep`.
+
+    """
+    system, bodies = template
+    system = dict(system)
+    bodies = dict(bodies)
+    for (body, option), value in overrides.items():
+        if body is None:
+            system[option] = value
+        else:
+            bodies[body] = dict(bodies[body])
+            bodies[body][option] = value
+    output = run(infile, system=system, bodies=bodies, to_memory=True, **kwargs)
+    return _collect(output, final, series)
+
+
+def _gather(batch, values, final, series):
+    """
+    The :py:class:`SweepResult` of a batch of ``(run index, result)`` pairs
+    of a sweep.
+
+    """
+    runs = np.array([k for k, _ in batch], dtype=int)
+    results = {name: np.full(len(batch), np.nan) for name in final}
+    arrays = {name: [None] * len(batch) for name in series}
+    errors = {}
+    for j, (_, result) in enumerate(batch):
+        if isinstance(result, Exception):
+            errors[j] = str(result)
+            continue
+        for name, value in zip(final, result[0]):
+            results[name][j] = value
+        for name, array in zip(series, result[1]):
+            arrays[name][j] = array
+    params = {name: column[runs] for name, column in values.items()}
+    return SweepResult(params, results, arrays, errors, runs=runs)
+
+
+def sweep(
+    template_dir,
+    params,
+    sampler="grid",
+    samples=None,
+    seed=None,
+    final=(),
+    series=(),
+    infile="vpl.in",
+    workers=None,
+    chunksize=None,
+    timeout=None,
+    progress=False,
+    store=None,
+):
+    """Run a parameter sweep over a set of input files.
+
+    The input files in ``template_dir`` are read once. The options of each
+    run are the template's with the swept values in their place, and are
+    passed to ``vplanet`` in memory (see ``system`` and ``to_memory`` in
+    :py:func:`vplanet.run`), so no directories or files are made for the
+    runs. The runs are spread over a pool of processes (see
+    :py:func:`vplanet.run_iter`), and only the requested quantities of each
+    run are kept.
+
+    Args:
+        template_dir (str): The directory of the primary input file and the
+            body files.
+        params (dict): The options to sweep, keyed by ``body.option``, where
+            ``body`` is the name of a body file without its extension, or
+            that of the primary input file for its options, e.g.
+            ``"earth.dTCore"`` or ``"vpl.dStopTime"``. For the ``grid``
+            sampler, each value is a sequence of values; for the others, it
+            is a ``(low, high)`` pair. Options that are not in the template
+            are added to it.
+        sampler (str, optional): ``"grid"`` for every combination of the
+            values of the parameters, ``"random"`` for ``samples`` runs drawn
+            uniformly between the bounds of each parameter, or ``"lhs"`` for
+            a Latin hypercube of ``samples`` runs. Default ``"grid"``.
+        samples (int, optional): The number of runs of the ``random`` and
+            ``lhs`` samplers.
+        seed (int, optional): The seed of the ``random`` and ``lhs``
+            samplers.
+        final (list, optional): The final log entries to keep, as
+            ``body.param``, e.g. ``"earth.RIC"``.
+        series (list, optional): The output arrays to keep, as
+            ``body.param``, e.g. ``"earth.TCore"``.
+        infile (str, optional): The name of the primary input file in
+            ``template_dir``. Default ``vpl.in``.
+        workers (int, optional): The number of worker processes. Default is
+            the number of CPUs.
+        chunksize (int, optional): The number of runs handed to a worker at
+            a time. Default is a quarter of each worker's share of the runs.
+        timeout (float, optional): The time in seconds after which a run is
+            killed. Default None, for no limit.
+        progress (bool, optional): Show a progress bar? Default False.
+        store (str or Store, optional): A :py:class:`vplanet.store.Store`,
+            or the path of one, to which the results are appended in
+            batches as the runs finish, instead of being kept in memory.
+
+    Returns:
+        A :py:class:`SweepResult`, whose columns are the values of the
+        swept options, the ``final`` log entries and the ``series`` arrays
+        of every run, in the order in which the runs were sampled; or the
+        ``store``, if one is given. There, the runs are in the order in
+        which they finished, and their ``run`` column is the order in which
+        they were sampled.
+
+    """
+    template = _read_template(template_dir, infile)
+    system, bodies = template
+    primary = os.path.splitext(os.path.basename(infile))[0]
+
+    # The options of each run that differ from the template
+    values = _sample(params, sampler, samples, seed)
+    keys = []
+    for name in params:
+        body, _, option = name.partition(".")
+        if body == primary:
+            body = None
+        elif body not in bodies:
+            raise ValueError(
+                "Cannot sweep {}: there is no body file {}.in in {}.".format(
+                    name, body, template_dir
+                )
+            )
+        keys.append((body, option))
+    nruns = len(next(iter(values.values()), []))
+    path = os.path.join(template_dir, infile)
+    tasks = [
+        (
+            path,
+            dict(
+                overrides={
+                    key: _option_value(key[1], values[name][k])
+                    for key, name in zip(keys, params)
+                }
+            ),
+        )
+        for k in range(nruns)
+    ]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, nruns // (4 * workers))
+    kwargs = dict(
+        template=template,
+        final=list(final),
+        series=list(series),
+        quiet=True,
+        units=False,
+    )
+
+    # Run the sweep
+    if store is not None and not isinstance(store, Store):
+        store = Store(store)
+    batch = []
+    for k, result in _run_pool(
+        tasks,
+        workers=workers,
+        chunksize=chunksize,
+        timeout=timeout,
+        progress=progress,
+        kwargs=kwargs,
+        func=_run_point,
+    ):
+        batch.append((k, result))
+        if store is not None and len(batch) == STORE_BATCH:
+            store.append(_gather(batch, values, final, series))
+            batch = []
+
+    if store is not None:
+        if batch:
+            store.append(_gather(batch, values, final, series))
+        return store
+    return _gather(sorted(batch, key=lambda item: item[0]), values, final, series)
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
+import functools
 import subprocess
 
 
-_help = subprocess.check_output(["vplanet", "-h"]).decode("utf-8")
-_help_verbose = subprocess.check_output(["vplanet", "-H"]).decode("utf-8")
+@functools.lru_cache()
+def _get_help(flag):
+    """
+    The help message printed by ``vplanet <flag>``, fetched the first time
+    it is asked for.
+
+    """
+    return subprocess.check_output(["vplanet", flag]).decode("utf-8")
 
 
 class VPLANETHelp:
@@ -14,9 +21,9 @@ class VPLANETHelp:
 
     def __init__(self, verbose=False):
         if verbose:
-            self._help = _help_verbose
+            self._help = _get_help("-H")
         else:
-            self._help = _help
+            self._help = _get_help("-h")
 
     def __repr__(self):
         return self._help
@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 from . import vplanet_core as core
-from .output import get_output
+from . import cache as _cache
 import sys
 import subprocess
 import os
 import re
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 
 class VPLANETError(RuntimeError):
@@ -24,7 +28,91 @@ def _entry_point():
     return core.run(*sys.argv)
 
 
-def run(infile="vpl.in", verbose=False, quiet=False, clobber=False, units=True):
+def _run_in_process(args, path, to_memory=False, inputs=None):
+    """
+    Call the C extension directly, reading and writing files in ``path`` and
+    capturing everything ``vplanet`` writes to ``stderr``. The input files
+    named in ``inputs`` are read from the text given there instead of from
+    disk. Returns the exit status, the captured text and, if ``to_memory``,
+    the ``(log, arrays)`` of the run (None if it failed).
+
+    The C extension releases the GIL and keeps all of its state per thread,
+    so this may be called from several threads at once.
+
+    """
+    kwargs = dict(path=path, capture=True, to_memory=to_memory)
+    if inputs is not None:
+        kwargs["inputs"] = inputs
+    return core.run(*args, **kwargs)
+
+
+def _option_value(value):
+    """
+    Format an option value the way it would appear in an input file.
+
+    """
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    elif isinstance(value, float):
+        return repr(value)
+    else:
+        return str(value)
+
+
+def _input_text(options):
+    """
+    Write a dict of options as the text of an input file.
+
+    """
+    lines = []
+    for name, value in options.items():
+        if isinstance(value, (list, tuple)):
+            values = [_option_value(v) for v in value]
+        else:
+            values = [_option_value(value)]
+
+        # Long lists continue on the next line, as they would in a file
+        line = name
+        for item in values:
+            if len(line) + len(item) > 1000:
+                lines.append(line + " $")
+                line = ""
+            line = (line + " " + item).lstrip()
+        lines.append(line)
+
+    return "\n".join(lines) + "\n"
+
+
+def _inputs_from_dicts(infile, system, bodies):
+    """
+    The text of the primary input file and the body files for a run whose
+    options are given as dicts.
+
+    """
+    system = dict(system)
+    if "saBodyFiles" not in system:
+        system["saBodyFiles"] = ["{}.in".format(name) for name in bodies]
+    inputs = {os.path.basename(infile): _input_text(system)}
+    for name, options in bodies.items():
+        options = dict(options)
+        options.setdefault("sName", name)
+        inputs["{}.in".format(name)] = _input_text(options)
+    return inputs
+
+
+def run(
+    infile="vpl.in",
+    verbose=False,
+    quiet=False,
+    clobber=False,
+    units=True,
+    in_process=False,
+    to_memory=False,
+    system=None,
+    bodies=None,
+    cache="off",
+    restart=None,
+):
     """
     Run `vplanet` and return the output.
 
@@ -36,38 +124,97 @@ def run(infile="vpl.in", verbose=False, quiet=False, clobber=False, units=True):
             Default False.
         units (bool, optional): If True, returns unit-ful output. If False, the
             output arrays are standard ``numpy`` arrays. Default True.
+        in_process (bool, optional): If True, call the C extension directly
+            instead of spawning a ``vplanet`` subprocess. This avoids the cost
+            of starting a new process for every run. Default False.
+        to_memory (bool, optional): If True, run in process and keep the
+            log and the output arrays in memory instead of writing them to
+            disk. The arrays are handed to ``numpy`` without a copy, and
+            ``clobber`` is ignored, since nothing is overwritten. Files that
+            some modules write on request, such as POISE's seasonal climate
+            files, are still written. Default False.
+        system (dict, optional): The options of the primary input file, e.g.
+            ``{"sSystemName": "earth", "dStopTime": 1e6, ...}``. If given,
+            together with ``bodies``, the run reads no input files: the
+            options are passed to ``vplanet`` in memory, under the file
+            names ``infile`` and ``<body>.in``, which are the names that
+            appear in error messages. Implies ``in_process``. Default None.
+        bodies (dict, optional): The options of each body file, keyed by
+            body name, e.g. ``{"earth": {"dMass": -1.0, ...}, ...}``. The
+            body's ``sName`` and the system's ``saBodyFiles`` are filled in
+            unless they are given. Lists become space-separated values and
+            booleans become 1 or 0. Default None.
+        cache (str, optional): Whether to keep the output of the run in a
+            cache, keyed on a hash of the input files (see
+            :py:func:`vplanet.cache.cache_key`), and return it from there the
+            next time the same inputs are run. This is ``"readwrite"`` to use
+            and fill the cache, ``"read"`` to use the cache without adding to
+            it, or ``"off"``. When the output is not in the cache, ``vplanet``
+            is run even if a log file exists. Runs with ``restart`` do not
+            use the cache. The cache lives in ``vplanet.cache.CACHE_DIR``.
+            Default ``"off"``.
+        restart (str, optional): A checkpoint file, relative to the directory
+            of ``infile``, that a run with ``dCheckpointInterval`` or
+            ``dCheckpointWallTime`` wrote. The run carries on from it instead
+            of from the initial conditions, and gives the same output as an
+            uninterrupted run. The input files must be those of the run that
+            wrote the checkpoint, and ``vplanet`` must be the same build.
+            Implies ``clobber``. Default None.
 
     Returns:
         A ``vplanet.Output`` object containing the full output from the run.
 
     Raises:
         ``vplanet.VPLANETError``: If something goes wrong in the C extension.
-
-    .. note:: 
-    
-        We need to change the way vplanet exits on error in order to
-        return to the Python interpreter when it terminates. The current
-        hack is to spawn a subprocess so we don't terminate the current 
-        Python session.
+            When ``in_process`` is True, the message is the error that
+            ``vplanet`` printed.
 
     """
     # Determine the system name from the infile
     sysname = None
-    with open(infile, "r") as f:
-        lines = f.readlines()
-        for line in lines:
-            match = re.match("sSystemName[ \t\n]+(.*?)[ \t\n#]", line)
-            if match:
-                if len(match.groups()):
-                    sysname = match.groups()[0]
-                    break
+    inputs = None
+    if system is not None:
+        inputs = _inputs_from_dicts(infile, system, bodies or {})
+        sysname = system.get("sSystemName")
+        in_process = True
+    else:
+        with open(infile, "r") as f:
+            lines = f.readlines()
+            for line in lines:
+                match = re.match("sSystemName[ \t\n]+(.*?)[ \t\n#]", line)
+                if match:
+                    if len(match.groups()):
+                        sysname = match.groups()[0]
+                        break
 
-    # Does the log file exist?
+    # Is the output cached?
     path = os.path.abspath(os.path.dirname(infile))
+    key = None
+    if cache not in ("readwrite", "read", "off"):
+        raise ValueError('`cache` must be "readwrite", "read" or "off".')
+    elif restart is not None:
+        # The key does not cover the checkpoint the run carries on from
+        cache = "off"
+    elif cache != "off":
+        key = _cache.cache_key(infile, units=units, to_memory=to_memory, inputs=inputs)
+        output = _cache.load(key)
+        if output is not None:
+            output.path = output.log.path = path
+            return output
+
+        # Don't trust output files that may be stale
+        clobber = True
+
+    # A restart continues the output of the run that was interrupted
+    if restart is not None:
+        clobber = True
+
+    # Does the log file exist?
     log_exists = os.path.exists(os.path.join(path, "{}.log".format(sysname)))
 
     # Run vplanet
-    if clobber or not log_exists:
+    memory = None
+    if clobber or not log_exists or to_memory:
 
         # Parse kwargs
         args = ["vplanet", infile]
@@ -75,23 +222,294 @@ def run(infile="vpl.in", verbose=False, quiet=False, clobber=False, units=True):
             args += ["-v"]
         if quiet:
             args += ["-q"]
+        if restart is not None:
+            args += ["--restart", restart]
+
+        if in_process or to_memory:
 
-        # Spawn `vplanet` as a subprocess
-        error = False
-        try:
-            subprocess.check_output(args, cwd=path)
-        except subprocess.CalledProcessError as e:
-            error = True
-        if error:
-            raise VPLANETError("Error running VPLANET.")
+            # Errors in the C code return here instead of exiting
+            args[1] = os.path.basename(infile)
+            status, message, memory = _run_in_process(
+                args, path, to_memory=to_memory, inputs=inputs
+            )
+            if status != 0:
+                raise VPLANETError(message.strip() or "Error running VPLANET.")
+
+        else:
+
+            # Spawn `vplanet` as a subprocess
+            error = False
+            try:
+                subprocess.check_output(args, cwd=path)
+            except subprocess.CalledProcessError as e:
+                error = True
+            if error:
+                raise VPLANETError("Error running VPLANET.")
 
     # Grab the output
-    output = get_output(path=path, sysname=sysname, units=units)
+    from .output import get_output
+
+    output = get_output(path=path, sysname=sysname, units=units, memory=memory)
+    if cache == "readwrite":
+        _cache.store(key, output)
 
     # We're done!
     return output
 
 
+def run_many(infiles, workers=None, max_workers=None, **kwargs):
+    """
+    Run `vplanet` on several input files at once, in a pool of threads
+    within this process, and return their outputs.
+
+    Each run calls the C extension directly (see ``in_process`` in
+    :py:func:`run`), which releases the GIL while the simulation runs, so
+    ``workers`` runs proceed in parallel without forking. Each input file
+    should be in a directory of its own, since runs write their output next
+    to their input files.
+
+    Args:
+        infiles (list): The paths to the input files.
+        workers (int, optional): The number of runs to perform at once.
+            Default is the number of CPUs.
+        max_workers (int, optional): Deprecated alias of ``workers``.
+        kwargs: Passed on to :py:func:`run` for every run.
+
+    Returns:
+        A list of ``vplanet.Output`` objects, in the order of ``infiles``.
+
+    Raises:
+        ``vplanet.VPLANETError``: If any of the runs fails. The other runs are
+            allowed to finish first.
+
+    See :py:func:`run_iter` for large batches, which should not stop at the
+    first failure or on a run that never ends.
+
+    """
+    if max_workers is not None:
+        warnings.warn(
+            "The `max_workers` argument of `run_many` is deprecated; "
+            "use `workers` instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if workers is None:
+            workers = max_workers
+    kwargs["in_process"] = True
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run, infile, **kwargs) for infile in infiles]
+        return [future.result() for future in futures]
+
+
+def _pool_worker(conn, kwargs, func=None):
+    """
+    A worker process of :py:func:`_run_pool`: run the chunks of runs that
+    are sent down ``conn``, until it sends None, and send back when each run
+    starts and its result. The runs are made with ``func``, which takes the
+    arguments of :py:func:`run`, and defaults to :py:func:`run` itself.
+
+    """
+    kwargs["in_process"] = True
+    func = func or run
+    while True:
+        chunk = conn.recv()
+        if chunk is None:
+            break
+        for index, infile, task_kwargs in chunk:
+            conn.send(("start", index))
+            try:
+                result = func(infile, **dict(kwargs, **task_kwargs))
+            except VPLANETError as e:
+                result = e
+            except Exception as e:
+                result = VPLANETError("{}: {}".format(type(e).__name__, e))
+            try:
+                conn.send(("done", index, result))
+            except Exception as e:
+                conn.send(("done", index, VPLANETError("Cannot return output: %s" % e)))
+
+
+def run_iter(
+    infiles, workers=None, chunksize=1, timeout=None, progress=False, **kwargs
+):
+    """
+    Run `vplanet` on many input files in a pool of processes, and yield the
+    result of each run as soon as it finishes.
+
+    Each worker process runs its input files one after the other, calling
+    the C extension directly (see ``in_process`` in :py:func:`run`), and
+    sends the output back. A run that fails does not stop the others: its
+    error is yielded in place of its output. A worker that takes longer
+    than ``timeout`` on a run, or that dies, is killed and replaced, and the
+    rest of its chunk is handed out again. Each input file should be in a
+    directory of its own, since runs write their output next to their input
+    files.
+
+    The workers are started with the ``spawn`` method of
+    :py:mod:`multiprocessing`, so a script that calls this must do so under
+    ``if __name__ == "__main__":``.
+
+    Args:
+        infiles (list): The paths to the input files.
+        workers (int, optional): The number of worker processes. Default is
+            the number of CPUs.
+        chunksize (int, optional): The number of input files handed to a
+            worker at a time. Larger chunks cost less communication for
+            many short runs. Default 1.
+        timeout (float, optional): The time in seconds after which a run is
+            killed. Default None, for no limit.
+        progress (bool, optional): Show a ``tqdm`` progress bar? Default False.
+        kwargs: Passed on to :py:func:`run` for every run.
+
+    Yields:
+        ``(infile, result)`` pairs in the order in which the runs finish,
+        where ``result`` is a ``vplanet.Output`` object, or the
+        ``vplanet.VPLANETError`` of a run that failed or timed out.
+
+    """
+    infiles = list(infiles)
+    for index, result in _run_pool(
+        [(infile, {}) for infile in infiles],
+        workers=workers,
+        chunksize=chunksize,
+        timeout=timeout,
+        progress=progress,
+        kwargs=kwargs,
+    ):
+        yield infiles[index], result
+
+
+def _run_pool(
+    tasks,
+    workers=None,
+    chunksize=1,
+    timeout=None,
+    progress=False,
+    kwargs=None,
+    func=None,
+):
+    """
+    The engine of :py:func:`run_iter`. Each of ``tasks`` is an ``(infile,
+    kwargs)`` pair, whose kwargs are passed to :py:func:`run` on top of
+    ``kwargs``. Yields the index of each task and its result as the runs
+    finish. See :py:func:`_pool_worker` for ``func``, which must be
+    importable by the workers.
+
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+    from tqdm import tqdm
+
+    kwargs = dict(kwargs or {})
+    tasks = [(index, infile, task) for index, (infile, task) in enumerate(tasks)]
+    chunksize = max(1, int(chunksize))
+    chunks = deque(
+        tasks[k : k + chunksize] for k in range(0, len(tasks), chunksize)
+    )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(chunks)))
+
+    # Workers are spawned, so they never inherit the state of our threads
+    context = multiprocessing.get_context("spawn")
+    pool = {}
+
+    def feed(conn):
+        # Hand the worker on ``conn`` its next chunk, or let it exit
+        pool[conn]["chunk"] = chunks.popleft() if chunks else []
+        conn.send(pool[conn]["chunk"] or None)
+
+    def start():
+        conn, child = context.Pipe()
+        process = context.Process(
+            target=_pool_worker, args=(child, kwargs, func), daemon=True
+        )
+        process.start()
+        child.close()
+        pool[conn] = dict(process=process, chunk=[], start=None)
+        feed(conn)
+
+    def stop(conn, reason):
+        # Kill the worker on ``conn``, and blame the run it was on
+        worker = pool.pop(conn)
+        worker["process"].terminate()
+        worker["process"].join()
+        conn.close()
+        failed = []
+        if worker["chunk"]:
+            index, infile, _ = worker["chunk"][0]
+            failed.append((index, VPLANETError(reason.format(infile=infile))))
+            if len(worker["chunk"]) > 1:
+                chunks.appendleft(worker["chunk"][1:])
+        if chunks:
+            start()
+        return failed
+
+    bar = tqdm(total=len(tasks), disable=not progress, unit="run")
+    try:
+        for _ in range(workers):
+            start()
+        remaining = len(tasks)
+        while remaining:
+
+            # Wait for a message, a worker to die, or the next deadline
+            wait_for = None
+            if timeout is not None:
+                starts = [w["start"] for w in pool.values() if w["start"] is not None]
+                if starts:
+                    wait_for = max(0, min(starts) + timeout - time.monotonic())
+            sentinels = {w["process"].sentinel: conn for conn, w in pool.items()}
+            ready = wait(list(pool) + list(sentinels), timeout=wait_for)
+
+            results = []
+            for conn in set(sentinels.get(obj, obj) for obj in ready):
+                if conn not in pool:
+                    continue
+                worker = pool[conn]
+                try:
+                    while conn.poll():
+                        message = conn.recv()
+                        if message[0] == "start":
+                            worker["start"] = time.monotonic()
+                        else:
+                            results.append(message[1:])
+                            worker["chunk"] = worker["chunk"][1:]
+                            worker["start"] = None
+                            if not worker["chunk"]:
+                                feed(conn)
+                except (EOFError, OSError):
+                    worker["process"].join()
+                if not worker["process"].is_alive():
+                    results += stop(
+                        conn,
+                        "The worker running {infile} exited with code %s."
+                        % worker["process"].exitcode,
+                    )
+
+            # Kill the runs that are out of time
+            if timeout is not None:
+                now = time.monotonic()
+                for conn, worker in list(pool.items()):
+                    if worker["start"] is not None and now - worker["start"] > timeout:
+                        results += stop(
+                            conn, "The run of {infile} timed out after %g s." % timeout
+                        )
+
+            for index, result in results:
+                remaining -= 1
+                bar.update()
+                yield index, result
+
+    finally:
+        bar.close()
+        for conn, worker in pool.items():
+            worker["process"].terminate()
+            worker["process"].join()
+            conn.close()
+
+
 def help(verbose=False):
     from .vplanet_help import VPLANETHelp
 